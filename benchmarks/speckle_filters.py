@@ -0,0 +1,96 @@
+"""
+Benchmark the vectorized speckle filters against the per-pixel reference implementation.
+
+The reference functions are the moving window callbacks the speckle filters used with scipy's
+`generic_filter` before they were vectorized. Both versions are run on the same random array with
+nodata pixels, the largest difference between their outputs is checked and the timings are printed.
+
+Run from the repository root in an environment with eis_toolkit installed:
+    python benchmarks/speckle_filters.py --shape 1000 --size 5
+"""
+
+import argparse
+import time
+from numbers import Number
+
+import numpy as np
+from scipy.ndimage import generic_filter
+
+from eis_toolkit.raster_processing.filters.speckle import _lee_additive_noise, _lee_enhanced
+
+
+def _lee_additive_noise_reference(window: np.ndarray, add_noise_var: Number) -> Number:
+    p_center = window[window.shape[0] // 2]
+    if np.isnan(p_center):
+        return np.nan
+
+    local_var = np.nanvar(window)
+    local_mean = np.nanmean(window)
+    weight = local_var / (local_var + add_noise_var)
+    return local_mean + weight * (p_center - local_mean)
+
+
+def _lee_enhanced_reference(window: np.ndarray, n_looks: int, damping_factor: Number) -> Number:
+    p_center = window[window.shape[0] // 2]
+    if np.isnan(p_center):
+        return np.nan
+
+    local_sd = np.nanstd(window)
+    local_mean = np.nanmean(window)
+
+    noise_sd = np.sqrt(1 / n_looks)
+    variation = local_sd / local_mean if (local_sd != 0 and local_mean != 0) else 0
+    noise_sd_max = np.sqrt(1 + 2 / n_looks)
+
+    exponent = -damping_factor * (variation - noise_sd) / (noise_sd_max - variation) if noise_sd_max != variation else 0
+    weight = np.exp(exponent)
+
+    if variation <= noise_sd:
+        return local_mean
+    elif variation < noise_sd_max:
+        return (local_mean * weight) + p_center * (1 - weight)
+    return p_center
+
+
+FILTERS = {
+    "lee_additive_noise": (_lee_additive_noise, _lee_additive_noise_reference, (0.25,)),
+    "lee_enhanced": (_lee_enhanced, _lee_enhanced_reference, (1, 1.0)),
+}
+
+
+def _timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shape", type=int, default=1000, help="Height and width of the test array.")
+    parser.add_argument("--size", type=int, default=5, help="Size of the filter window.")
+    parser.add_argument("--nodata-fraction", type=float, default=0.01, help="Fraction of nodata pixels.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random test array.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    array = rng.gamma(4.0, 25.0, size=(args.shape, args.shape))
+    array[rng.random(array.shape) < args.nodata_fraction] = np.nan
+    kernel = np.ones((args.size, args.size))
+
+    print(f"Array {args.shape} x {args.shape}, window {args.size} x {args.size}")
+    for name, (vectorized, reference, parameters) in FILTERS.items():
+        result, vectorized_time = _timed(vectorized, array, kernel, *parameters)
+        expected, reference_time = _timed(
+            lambda: generic_filter(array, reference, footprint=kernel, extra_arguments=parameters)
+        )
+        max_difference = np.nanmax(np.abs(result - expected))
+        assert np.array_equal(np.isnan(result), np.isnan(expected))
+        print(
+            f"{name}: per-pixel {reference_time:.2f} s, vectorized {vectorized_time:.3f} s, "
+            f"speedup {reference_time / vectorized_time:.0f}x, max difference {max_difference:.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
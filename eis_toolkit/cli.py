@@ -100,6 +100,13 @@ class MergeStrategy(str, Enum):
     add = "add"
 
 
+class DistanceComputationMethod(str, Enum):
+    """Distance computation methods."""
+
+    vector = "vector"
+    transform = "transform"
+
+
 class VectorDensityStatistic(str, Enum):
     """Vector density statistic."""
 
@@ -707,19 +714,38 @@ def focal_filter_cli(
     method: FocalFilterMethod = FocalFilterMethod.mean,
     size: int = 3,
     shape: Annotated[FocalFilterShape, typer.Option(case_sensitive=False)] = FocalFilterShape.circle,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Apply a basic focal filter to the input raster."""
-    from eis_toolkit.raster_processing.filters.focal import focal_filter
+    """
+    Apply a basic focal filter to the input raster.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.filters.focal import focal_filter, focal_filter_windowed
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = focal_filter(raster=raster, method=method, size=size, shape=get_enum_values(shape))
+        if block_size is not None:
+            focal_filter_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                method=method,
+                size=size,
+                shape=get_enum_values(shape),
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = focal_filter(raster=raster, method=method, size=size, shape=get_enum_values(shape))
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image, 1)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image, 1)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Focal filter applied, output raster written to {output_raster}.")
@@ -733,19 +759,38 @@ def gaussian_filter_cli(
     sigma: float = 1.0,
     truncate: float = 4.0,
     size: int = None,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Apply a gaussian filter to the input raster."""
-    from eis_toolkit.raster_processing.filters.focal import gaussian_filter
+    """
+    Apply a gaussian filter to the input raster.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.filters.focal import gaussian_filter, gaussian_filter_windowed
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = gaussian_filter(raster=raster, sigma=sigma, truncate=truncate, size=size)
+        if block_size is not None:
+            gaussian_filter_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                sigma=sigma,
+                truncate=truncate,
+                size=size,
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = gaussian_filter(raster=raster, sigma=sigma, truncate=truncate, size=size)
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image, 1)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image, 1)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Gaussial filter applied, output raster written to {output_raster}.")
@@ -762,21 +807,41 @@ def mexican_hat_filter_cli(
     direction: Annotated[
         MexicanHatFilterDirection, typer.Option(case_sensitive=False)
     ] = MexicanHatFilterDirection.circular,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Apply a mexican hat filter to the input raster."""
-    from eis_toolkit.raster_processing.filters.focal import mexican_hat_filter
+    """
+    Apply a mexican hat filter to the input raster.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.filters.focal import mexican_hat_filter, mexican_hat_filter_windowed
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = mexican_hat_filter(
-            raster=raster, sigma=sigma, truncate=truncate, size=size, direction=get_enum_values(direction)
-        )
+        if block_size is not None:
+            mexican_hat_filter_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                sigma=sigma,
+                truncate=truncate,
+                size=size,
+                direction=get_enum_values(direction),
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = mexican_hat_filter(
+                raster=raster, sigma=sigma, truncate=truncate, size=size, direction=get_enum_values(direction)
+            )
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image, 1)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image, 1)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Mexican hat filter applied, output raster written to {output_raster}.")
@@ -1205,33 +1270,44 @@ def unify_rasters_cli(
     output_directory: OUTPUT_DIR_OPTION,
     resampling_method: Annotated[ResamplingMethods, typer.Option(case_sensitive=False)] = ResamplingMethods.nearest,
     same_extent: bool = False,
+    num_threads: int = 1,
+    n_workers: int = None,
 ):
-    """Unify rasters to match the base raster."""
-    from eis_toolkit.raster_processing.unifying import unify_raster_grids
+    """
+    Unify rasters to match the base raster.
+
+    The rasters are warped straight to the output files, optionally with several GDAL warp threads per raster
+    and several rasters in parallel worker threads.
+
+    Each output keeps the data type and nodata value of its source raster, or the base raster nodata if the
+    source has none. Earlier versions wrote the outputs with the data type and nodata of the base raster.
+    """
+    from eis_toolkit.raster_processing.unifying import unify_raster_grids_windowed
 
     typer.echo("Progress: 10%")
 
+    out_rasters_dict = {}
+    for raster_to_unify in rasters_to_unify:
+        in_raster_name = os.path.splitext(os.path.split(raster_to_unify)[1])[0]
+        output_raster_name = f"{in_raster_name}_unified"
+        out_rasters_dict[output_raster_name] = str(output_directory.joinpath(output_raster_name + ".tif"))
+
     with rasterio.open(base_raster) as raster:
         to_unify = [rasterio.open(rstr) for rstr in rasters_to_unify]  # Open all rasters to be unified
         typer.echo("Progress: 25%")
 
-        unified = unify_raster_grids(
-            base_raster=raster,
-            rasters_to_unify=to_unify,
-            resampling_method=get_enum_values(resampling_method),
-            same_extent=same_extent,
-        )
-        [rstr.close() for rstr in to_unify]  # Close all rasters
-    typer.echo("Progress: 75%")
-
-    out_rasters_dict = {}
-    for i, (out_image, out_meta) in enumerate(unified[1:]):  # Skip writing base raster
-        in_raster_name = os.path.splitext(os.path.split(rasters_to_unify[i - 1])[1])[0]
-        output_raster_name = f"{in_raster_name}_unified"
-        output_raster_path = output_directory.joinpath(output_raster_name + ".tif")
-        with rasterio.open(output_raster_path, "w", **out_meta) as dst:
-            dst.write(out_image)
-        out_rasters_dict[output_raster_name] = str(output_raster_path)
+        try:
+            unify_raster_grids_windowed(
+                base_raster=raster,
+                rasters_to_unify=to_unify,
+                output_rasters=[Path(path) for path in out_rasters_dict.values()],
+                resampling_method=get_enum_values(resampling_method),
+                same_extent=same_extent,
+                num_threads=num_threads,
+                n_workers=n_workers,
+            )
+        finally:
+            [rstr.close() for rstr in to_unify]  # Close all rasters
     typer.echo("Progress: 100%")
 
     json_str = json.dumps(out_rasters_dict)
@@ -1244,20 +1320,31 @@ def unify_rasters_cli(
 def unique_combinations_cli(
     input_rasters: INPUT_FILES_ARGUMENT,
     output_raster: OUTPUT_FILE_OPTION,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Get combinations of raster values between rasters."""
-    from eis_toolkit.raster_processing.unique_combinations import unique_combinations
+    """
+    Get combinations of raster values between rasters.
+
+    If block size is given, the rasters are processed block by block without loading them into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.unique_combinations import unique_combinations, unique_combinations_windowed
 
     typer.echo("Progress: 10%")
     rasters = [rasterio.open(rstr) for rstr in input_rasters]
 
     typer.echo("Progress: 25%")
-    out_image, out_meta = unique_combinations(rasters)
+    if block_size is not None:
+        unique_combinations_windowed(rasters, output_raster, block_size=block_size, n_workers=n_workers)
+    else:
+        out_image, out_meta = unique_combinations(rasters)
     [rstr.close() for rstr in rasters]
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dst:
-        dst.write(out_image, 1)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dst:
+            dst.write(out_image, 1)
 
     typer.echo(f"Writing results to {output_raster}.")
     typer.echo("Getting unique combinations completed.")
@@ -1289,6 +1376,47 @@ def extract_window_cli(
     typer.echo(f"Windowing completed, writing raster to {output_raster}")
 
 
+# EXTRACT WINDOWS
+@app.command()
+def extract_windows_cli(
+    input_rasters: INPUT_FILES_ARGUMENT,
+    geometries: INPUT_FILE_OPTION,
+    output_file: OUTPUT_FILE_OPTION,
+    height: int = typer.Option(),
+    width: int = typer.Option(),
+    block_size: int = 1024,
+    n_workers: int = None,
+):
+    """
+    Extract windows around center points from rasters to a .npy or an HDF5 file.
+
+    The windows are written as an array with shape (points, bands, height, width).
+    """
+    from eis_toolkit.raster_processing.windowing import extract_windows
+
+    typer.echo("Progress: 10%")
+
+    geodataframe = gpd.read_file(geometries)
+    rasters = [rasterio.open(raster) for raster in input_rasters]
+    typer.echo("Progress: 25%")
+
+    try:
+        extract_windows(
+            rasters,
+            geodataframe,
+            height,
+            width,
+            output_file=output_file,
+            block_size=block_size,
+            n_workers=n_workers,
+        )
+    finally:
+        [raster.close() for raster in rasters]
+    typer.echo("Progress: 100%")
+
+    typer.echo(f"Windowing completed, writing windows to {output_file}")
+
+
 # SURFACE DERIVATIVES - CLASSIFY ASPECT
 @app.command()
 def classify_aspect_cli(
@@ -1296,21 +1424,39 @@ def classify_aspect_cli(
     output_raster: OUTPUT_FILE_OPTION,
     unit: Annotated[AngleUnits, typer.Option(case_sensitive=False)] = AngleUnits.radians,
     num_classes: int = 8,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Classify an aspect raster data set."""
-    from eis_toolkit.raster_processing.derivatives.classification import classify_aspect
+    """
+    Classify an aspect raster data set.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.derivatives.classification import classify_aspect, classify_aspect_windowed
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, class_mapping, out_meta = classify_aspect(
-            raster=raster, unit=get_enum_values(unit), num_classes=num_classes
-        )
+        if block_size is not None:
+            class_mapping, _ = classify_aspect_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                unit=get_enum_values(unit),
+                num_classes=num_classes,
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, class_mapping, out_meta = classify_aspect(
+                raster=raster, unit=get_enum_values(unit), num_classes=num_classes
+            )
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dst:
-        dst.write(out_image, 1)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dst:
+            dst.write(out_image, 1)
     json_str = json.dumps(class_mapping)
     typer.echo("Progress: 100%")
     typer.echo(f"Results: {json_str}")
@@ -1378,25 +1524,106 @@ def surface_derivatives_cli(
     typer.echo(f"Calculating first and/or second order surface attributes completed, writing raster to {output_raster}")
 
 
+@app.command()
+def surface_parameters_cli(
+    input_raster: INPUT_FILE_OPTION,
+    output_raster: OUTPUT_FILE_OPTION,
+    parameters: Annotated[List[SurfaceParameter], typer.Option(case_sensitive=False)],
+    scaling_factor: Optional[float] = 1.0,
+    slope_tolerance: Optional[float] = 0.0,
+    slope_gradient_unit: Annotated[SlopeGradientUnit, typer.Option(case_sensitive=False)] = SlopeGradientUnit.radians,
+    slope_direction_unit: Annotated[AngleUnits, typer.Option(case_sensitive=False)] = AngleUnits.radians,
+    method: Annotated[FirstOrderMethod, typer.Option(case_sensitive=False)] = FirstOrderMethod.Young,
+    block_size: int = None,
+    n_workers: int = None,
+):
+    """
+    Calculate first and second order surface attributes into one multiband raster.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.derivatives.parameters import surface_parameters, surface_parameters_windowed
+
+    parameters = get_enum_values(parameters)
+    typer.echo("Progress: 10%")
+
+    with rasterio.open(input_raster) as raster:
+        typer.echo("Progress: 25%")
+        if block_size is not None:
+            surface_parameters_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                parameters=parameters,
+                scaling_factor=scaling_factor,
+                slope_tolerance=slope_tolerance,
+                slope_gradient_unit=get_enum_values(slope_gradient_unit),
+                slope_direction_unit=get_enum_values(slope_direction_unit),
+                method=get_enum_values(method),
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = surface_parameters(
+                raster=raster,
+                parameters=parameters,
+                scaling_factor=scaling_factor,
+                slope_tolerance=slope_tolerance,
+                slope_gradient_unit=get_enum_values(slope_gradient_unit),
+                slope_direction_unit=get_enum_values(slope_direction_unit),
+                method=get_enum_values(method),
+            )
+    typer.echo("Progress: 75%")
+
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image)
+            dest.descriptions = tuple(parameters)
+    typer.echo("Progress: 100%")
+
+    typer.echo(f"Calculating surface attributes completed, writing raster to {output_raster}")
+
+
 @app.command()
 def reclassify_with_manual_breaks_cli(
     input_raster: INPUT_FILE_OPTION,
     output_raster: OUTPUT_FILE_OPTION,
     breaks: Annotated[List[int], typer.Option()],
     bands: Annotated[List[int], typer.Option()] = None,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Classify raster with manual breaks."""
-    from eis_toolkit.raster_processing.reclassify import reclassify_with_manual_breaks
+    """
+    Classify raster with manual breaks.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.reclassify import (
+        reclassify_with_manual_breaks,
+        reclassify_with_manual_breaks_windowed,
+    )
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = reclassify_with_manual_breaks(raster=raster, breaks=breaks, bands=bands)
+        if block_size is not None:
+            reclassify_with_manual_breaks_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                breaks=breaks,
+                bands=bands,
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = reclassify_with_manual_breaks(raster=raster, breaks=breaks, bands=bands)
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Reclassification with manual breaks completed, writing raster to {output_raster}")
@@ -1408,19 +1635,42 @@ def reclassify_with_defined_intervals_cli(
     output_raster: OUTPUT_FILE_OPTION,
     interval_size: int = typer.Option(),
     bands: Annotated[List[int], typer.Option()] = None,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Classify raster with defined intervals."""
-    from eis_toolkit.raster_processing.reclassify import reclassify_with_defined_intervals
+    """
+    Classify raster with defined intervals.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.reclassify import (
+        reclassify_with_defined_intervals,
+        reclassify_with_defined_intervals_windowed,
+    )
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = reclassify_with_defined_intervals(raster=raster, interval_size=interval_size, bands=bands)
+        if block_size is not None:
+            reclassify_with_defined_intervals_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                interval_size=interval_size,
+                bands=bands,
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = reclassify_with_defined_intervals(
+                raster=raster, interval_size=interval_size, bands=bands
+            )
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Reclassification with defined intervals completed, writing raster to {output_raster}")
@@ -1432,21 +1682,42 @@ def reclassify_with_equal_intervals_cli(
     output_raster: OUTPUT_FILE_OPTION,
     number_of_intervals: int = typer.Option(),
     bands: Annotated[List[int], typer.Option()] = None,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Classify raster with equal intervals."""
-    from eis_toolkit.raster_processing.reclassify import reclassify_with_equal_intervals
+    """
+    Classify raster with equal intervals.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.reclassify import (
+        reclassify_with_equal_intervals,
+        reclassify_with_equal_intervals_windowed,
+    )
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = reclassify_with_equal_intervals(
-            raster=raster, number_of_intervals=number_of_intervals, bands=bands
-        )
+        if block_size is not None:
+            reclassify_with_equal_intervals_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                number_of_intervals=number_of_intervals,
+                bands=bands,
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = reclassify_with_equal_intervals(
+                raster=raster, number_of_intervals=number_of_intervals, bands=bands
+            )
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Reclassification with equal intervals completed, writing raster to {output_raster}")
@@ -1458,21 +1729,39 @@ def reclassify_with_quantiles_cli(
     output_raster: OUTPUT_FILE_OPTION,
     number_of_quantiles: int = typer.Option(),
     bands: Annotated[List[int], typer.Option()] = None,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Classify raster with quantiles."""
-    from eis_toolkit.raster_processing.reclassify import reclassify_with_quantiles
+    """
+    Classify raster with quantiles.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.reclassify import reclassify_with_quantiles, reclassify_with_quantiles_windowed
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = reclassify_with_quantiles(
-            raster=raster, number_of_quantiles=number_of_quantiles, bands=bands
-        )
+        if block_size is not None:
+            reclassify_with_quantiles_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                number_of_quantiles=number_of_quantiles,
+                bands=bands,
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = reclassify_with_quantiles(
+                raster=raster, number_of_quantiles=number_of_quantiles, bands=bands
+            )
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Reclassification with quantiles completed, writing raster to {output_raster}")
@@ -1484,21 +1773,42 @@ def reclassify_with_natural_breaks_cli(
     output_raster: OUTPUT_FILE_OPTION,
     number_of_classes: int = typer.Option(),
     bands: Annotated[List[int], typer.Option()] = None,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Classify raster with natural breaks (Jenks Caspall)."""
-    from eis_toolkit.raster_processing.reclassify import reclassify_with_natural_breaks
+    """
+    Classify raster with natural breaks (Jenks Caspall, or Fisher-Jenks when processed by blocks).
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.reclassify import (
+        reclassify_with_natural_breaks,
+        reclassify_with_natural_breaks_windowed,
+    )
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = reclassify_with_natural_breaks(
-            raster=raster, number_of_classes=number_of_classes, bands=bands
-        )
+        if block_size is not None:
+            reclassify_with_natural_breaks_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                number_of_classes=number_of_classes,
+                bands=bands,
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = reclassify_with_natural_breaks(
+                raster=raster, number_of_classes=number_of_classes, bands=bands
+            )
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Reclassification with natural breaks completed, writing raster to {output_raster}")
@@ -1510,21 +1820,42 @@ def reclassify_with_geometrical_intervals_cli(
     output_raster: OUTPUT_FILE_OPTION,
     number_of_classes: int = typer.Option(),
     bands: Annotated[List[int], typer.Option()] = None,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Classify raster with geometrical intervals."""
-    from eis_toolkit.raster_processing.reclassify import reclassify_with_geometrical_intervals
+    """
+    Classify raster with geometrical intervals.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.reclassify import (
+        reclassify_with_geometrical_intervals,
+        reclassify_with_geometrical_intervals_windowed,
+    )
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = reclassify_with_geometrical_intervals(
-            raster=raster, number_of_classes=number_of_classes, bands=bands
-        )
+        if block_size is not None:
+            reclassify_with_geometrical_intervals_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                number_of_classes=number_of_classes,
+                bands=bands,
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = reclassify_with_geometrical_intervals(
+                raster=raster, number_of_classes=number_of_classes, bands=bands
+            )
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Reclassification with geometric intervals completed, writing raster to {output_raster}")
@@ -1536,21 +1867,42 @@ def reclassify_with_standard_deviation_cli(
     output_raster: OUTPUT_FILE_OPTION,
     number_of_intervals: int = typer.Option(),
     bands: Annotated[List[int], typer.Option()] = None,
+    block_size: int = None,
+    n_workers: int = None,
 ):
-    """Classify raster with standard deviation."""
-    from eis_toolkit.raster_processing.reclassify import reclassify_with_standard_deviation
+    """
+    Classify raster with standard deviation.
+
+    If block size is given, the raster is processed block by block without loading it into memory,
+    optionally in parallel worker processes.
+    """
+    from eis_toolkit.raster_processing.reclassify import (
+        reclassify_with_standard_deviation,
+        reclassify_with_standard_deviation_windowed,
+    )
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = reclassify_with_standard_deviation(
-            raster=raster, number_of_intervals=number_of_intervals, bands=bands
-        )
+        if block_size is not None:
+            reclassify_with_standard_deviation_windowed(
+                raster=raster,
+                output_raster=output_raster,
+                number_of_intervals=number_of_intervals,
+                bands=bands,
+                block_size=block_size,
+                n_workers=n_workers,
+            )
+        else:
+            out_image, out_meta = reclassify_with_standard_deviation(
+                raster=raster, number_of_intervals=number_of_intervals, bands=bands
+            )
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image)
+    if block_size is None:
+        with rasterio.open(output_raster, "w", **out_meta) as dest:
+            dest.write(out_image)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Reclassification with standard deviation completed, writing raster to {output_raster}")
@@ -1606,6 +1958,8 @@ def idw_interpolation_cli(
     resolution: float = typer.Option(),
     power: float = 2.0,
     extent: Tuple[float, float, float, float] = (None, None, None, None),  # TODO Change this
+    search_radius: Optional[float] = None,
+    n_neighbors: Optional[int] = None,
 ):
     """Apply inverse distance weighting (IDW) interpolation to input vector file."""
     from eis_toolkit.vector_processing.idw_interpolation import idw
@@ -1624,6 +1978,8 @@ def idw_interpolation_cli(
         resolution=(resolution, resolution),
         extent=extent,
         power=power,
+        search_radius=search_radius,
+        n_neighbors=n_neighbors,
     )
     typer.echo("Progress: 75%")
 
@@ -1653,9 +2009,12 @@ def kriging_interpolation_cli(
     variogram_model: Annotated[VariogramModel, typer.Option(case_sensitive=False)] = VariogramModel.linear,
     coordinates_type: Annotated[CoordinatesType, typer.Option(case_sensitive=False)] = CoordinatesType.geographic,
     method: Annotated[KrigingMethod, typer.Option(case_sensitive=False)] = KrigingMethod.ordinary,
+    n_closest_points: Optional[int] = None,
+    variogram_sample_size: Optional[int] = None,
+    n_workers: Optional[int] = None,
 ):
     """Apply kriging interpolation to input vector file."""
-    from eis_toolkit.vector_processing.kriging_interpolation import kriging
+    from eis_toolkit.vector_processing.kriging_interpolation import kriging, kriging_windowed
 
     typer.echo("Progress: 10%")
 
@@ -1665,27 +2024,43 @@ def kriging_interpolation_cli(
     geodataframe = gpd.read_file(input_vector)
     typer.echo("Progress: 25%")
 
-    out_image, out_meta = kriging(
-        data=geodataframe,
-        target_column=target_column,
-        resolution=(resolution, resolution),
-        extent=extent,
-        variogram_model=get_enum_values(variogram_model),
-        coordinates_type=get_enum_values(coordinates_type),
-        method=get_enum_values(method),
-    )
+    if n_closest_points is not None:
+        kriging_windowed(
+            data=geodataframe,
+            target_column=target_column,
+            resolution=(resolution, resolution),
+            output_raster=output_raster,
+            extent=extent,
+            variogram_model=get_enum_values(variogram_model),
+            coordinates_type=get_enum_values(coordinates_type),
+            method=get_enum_values(method),
+            n_closest_points=n_closest_points,
+            variogram_sample_size=variogram_sample_size,
+            n_workers=n_workers,
+        )
+    else:
+        out_image, out_meta = kriging(
+            data=geodataframe,
+            target_column=target_column,
+            resolution=(resolution, resolution),
+            extent=extent,
+            variogram_model=get_enum_values(variogram_model),
+            coordinates_type=get_enum_values(coordinates_type),
+            method=get_enum_values(method),
+        )
     typer.echo("Progress: 75%")
 
-    out_meta.update(
-        {
-            "count": 1,
-            "driver": "GTiff",
-            "dtype": "float32",
-        }
-    )
+    if n_closest_points is None:
+        out_meta.update(
+            {
+                "count": 1,
+                "driver": "GTiff",
+                "dtype": "float32",
+            }
+        )
 
-    with rasterio.open(output_raster, "w", **out_meta) as dst:
-        dst.write(out_image, 1)
+        with rasterio.open(output_raster, "w", **out_meta) as dst:
+            dst.write(out_image, 1)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Kriging interpolation completed, writing raster to {output_raster}.")
@@ -1831,6 +2206,7 @@ def distance_computation_cli(
     input_raster: INPUT_FILE_OPTION,
     geometries: INPUT_FILE_OPTION,
     output_raster: OUTPUT_FILE_OPTION,
+    method: Annotated[DistanceComputationMethod, typer.Option(case_sensitive=False)] = DistanceComputationMethod.vector,
 ):
     """Calculate distance from raster cell to nearest geometry."""
     from eis_toolkit.vector_processing.distance_computation import distance_computation
@@ -1843,7 +2219,7 @@ def distance_computation_cli(
     geodataframe = gpd.read_file(geometries)
     typer.echo("Progress: 25%")
 
-    out_image = distance_computation(profile, geodataframe)
+    out_image = distance_computation(profile, geodataframe, get_enum_values(method))
     typer.echo("Progress: 75%")
 
     with rasterio.open(output_raster, "w", **profile) as dst:
@@ -2193,20 +2569,33 @@ def predict_with_trained_model_cli(
     input_rasters: INPUT_FILES_ARGUMENT,
     model_file: INPUT_FILE_OPTION,
     output_raster: OUTPUT_FILE_OPTION,
+    block_size: int = None,
+    predict_probabilities: bool = False,
 ):
     """Train and optionally validate a Gradient boosting regressor model using Sklearn."""
     from eis_toolkit.prediction.machine_learning_general import (
         load_model,
         predict,
+        predict_raster,
         prepare_data_for_ml,
         reshape_predictions,
     )
 
+    model = load_model(model_file)
+
+    if block_size is not None:
+        typer.echo("Progress: 30%")
+        predict_raster(
+            model, input_rasters, output_raster, predict_probabilities=predict_probabilities, block_size=block_size
+        )
+        typer.echo("Progress: 100%")
+        typer.echo("Predicting completed")
+        return
+
     X, _, reference_profile, nodata_mask = prepare_data_for_ml(input_rasters)
 
     typer.echo("Progress: 30%")
 
-    model = load_model(model_file)
     predictions = predict(X, model)
     predictions_reshaped = reshape_predictions(
         predictions, reference_profile["height"], reference_profile["width"], nodata_mask
@@ -2581,6 +2970,168 @@ def plr_transform_cli(input_vector: INPUT_FILE_OPTION, output_vector: OUTPUT_FIL
     typer.echo(f"PLR transform completed, output saved to {output_vector}")
 
 
+# CODA - ALR TRANSFORM RASTER
+@app.command()
+def alr_transform_raster_cli(
+    input_rasters: INPUT_FILES_ARGUMENT,
+    output_raster: OUTPUT_FILE_OPTION,
+    denominator_band: int = None,
+    keep_denominator_band: bool = False,
+    block_size: int = 1024,
+    n_workers: int = None,
+):
+    """Perform an additive logratio transformation on raster data block by block."""
+    from eis_toolkit.transformations.coda.alr import alr_transform_raster
+
+    typer.echo("Progress: 10%")
+
+    rasters = [rasterio.open(rstr) for rstr in input_rasters]
+    typer.echo("Progress: 25%")
+
+    try:
+        alr_transform_raster(
+            rasters=rasters,
+            output_raster=output_raster,
+            denominator_band=denominator_band,
+            keep_denominator_band=keep_denominator_band,
+            block_size=block_size,
+            n_workers=n_workers,
+        )
+    finally:
+        [rstr.close() for rstr in rasters]
+
+    typer.echo("Progress: 100%")
+    typer.echo(f"ALR transform completed, output saved to {output_raster}")
+
+
+# CODA - CLR TRANSFORM RASTER
+@app.command()
+def clr_transform_raster_cli(
+    input_rasters: INPUT_FILES_ARGUMENT,
+    output_raster: OUTPUT_FILE_OPTION,
+    block_size: int = 1024,
+    n_workers: int = None,
+):
+    """Perform a centered logratio transformation on raster data block by block."""
+    from eis_toolkit.transformations.coda.clr import clr_transform_raster
+
+    typer.echo("Progress: 10%")
+
+    rasters = [rasterio.open(rstr) for rstr in input_rasters]
+    typer.echo("Progress: 25%")
+
+    try:
+        clr_transform_raster(
+            rasters=rasters,
+            output_raster=output_raster,
+            block_size=block_size,
+            n_workers=n_workers,
+        )
+    finally:
+        [rstr.close() for rstr in rasters]
+
+    typer.echo("Progress: 100%")
+    typer.echo(f"CLR transform completed, output saved to {output_raster}")
+
+
+# CODA - SINGLE ILR TRANSFORM RASTER
+@app.command()
+def single_ilr_transform_raster_cli(
+    input_rasters: INPUT_FILES_ARGUMENT,
+    output_raster: OUTPUT_FILE_OPTION,
+    subcomposition_1: Annotated[List[int], typer.Option()],
+    subcomposition_2: Annotated[List[int], typer.Option()],
+    block_size: int = 1024,
+    n_workers: int = None,
+):
+    """Perform a single isometric logratio transformation on raster bands block by block."""
+    from eis_toolkit.transformations.coda.ilr import single_ilr_transform_raster
+
+    typer.echo("Progress: 10%")
+
+    rasters = [rasterio.open(rstr) for rstr in input_rasters]
+    typer.echo("Progress: 25%")
+
+    try:
+        single_ilr_transform_raster(
+            rasters=rasters,
+            output_raster=output_raster,
+            subcomposition_1=subcomposition_1,
+            subcomposition_2=subcomposition_2,
+            block_size=block_size,
+            n_workers=n_workers,
+        )
+    finally:
+        [rstr.close() for rstr in rasters]
+
+    typer.echo("Progress: 100%")
+    typer.echo(f"Single ILR transform completed, output saved to {output_raster}")
+
+
+# CODA - PAIRWISE LOGRATIO TRANSFORM RASTER
+@app.command()
+def pairwise_logratio_raster_cli(
+    input_rasters: INPUT_FILES_ARGUMENT,
+    output_raster: OUTPUT_FILE_OPTION,
+    numerator_band: int = typer.Option(),
+    denominator_band: int = typer.Option(),
+    block_size: int = 1024,
+    n_workers: int = None,
+):
+    """Perform a pairwise logratio transformation on the given raster bands block by block."""
+    from eis_toolkit.transformations.coda.pairwise import pairwise_logratio_raster
+
+    typer.echo("Progress: 10%")
+
+    rasters = [rasterio.open(rstr) for rstr in input_rasters]
+    typer.echo("Progress: 25%")
+
+    try:
+        pairwise_logratio_raster(
+            rasters=rasters,
+            output_raster=output_raster,
+            numerator_band=numerator_band,
+            denominator_band=denominator_band,
+            block_size=block_size,
+            n_workers=n_workers,
+        )
+    finally:
+        [rstr.close() for rstr in rasters]
+
+    typer.echo("Progress: 100%")
+    typer.echo(f"Pairwise logratio transform completed, output saved to {output_raster}")
+
+
+# CODA - PLR TRANSFORM RASTER
+@app.command()
+def plr_transform_raster_cli(
+    input_rasters: INPUT_FILES_ARGUMENT,
+    output_raster: OUTPUT_FILE_OPTION,
+    block_size: int = 1024,
+    n_workers: int = None,
+):
+    """Perform a pivot logratio transformation on raster data block by block."""
+    from eis_toolkit.transformations.coda.plr import plr_transform_raster
+
+    typer.echo("Progress: 10%")
+
+    rasters = [rasterio.open(rstr) for rstr in input_rasters]
+    typer.echo("Progress: 25%")
+
+    try:
+        plr_transform_raster(
+            rasters=rasters,
+            output_raster=output_raster,
+            block_size=block_size,
+            n_workers=n_workers,
+        )
+    finally:
+        [rstr.close() for rstr in rasters]
+
+    typer.echo("Progress: 100%")
+    typer.echo(f"PLR transform completed, output saved to {output_raster}")
+
+
 # BINARIZE
 @app.command()
 def binarize_cli(
@@ -12,6 +12,7 @@ from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
 
 from eis_toolkit.exceptions import EmptyDataException, InvalidColumnException, InvalidParameterValueException
 from eis_toolkit.utilities.checks.dataframe import check_columns_valid
+from eis_toolkit.utilities.raster_stack import RasterStack
 
 SCALERS = {"standard": StandardScaler, "min_max": MinMaxScaler, "robust": RobustScaler}
 
@@ -72,7 +73,7 @@ def _compute_pca(
 
 @beartype
 def compute_pca(
-    data: Union[np.ndarray, pd.DataFrame, gpd.GeoDataFrame],
+    data: Union[np.ndarray, pd.DataFrame, gpd.GeoDataFrame, RasterStack],
     number_of_components: int,
     columns: Optional[Sequence[str]] = None,
     scaler_type: Literal["standard", "min_max", "robust"] = "standard",
@@ -88,7 +89,8 @@ def compute_pca(
     If input data is a Numpy array, interpretation of the data depends on its dimensions.
     If array is 3D, it is interpreted as a multiband raster/stacked rasters format (bands, rows, columns).
     If array is 2D, it is interpreted as table-like data, where each column represents a variable/raster band
-    and each row a data point (similar to a Dataframe).
+    and each row a data point (similar to a Dataframe). A raster stack is read into a 3D array with its
+    nodata converted to NaN.
 
     Args:
         data: Input data for PCA.
@@ -119,6 +121,9 @@ def compute_pca(
     if number_of_components < 1:
         raise InvalidParameterValueException("The number of principal components should be >= 1.")
 
+    if isinstance(data, RasterStack):
+        data = data.read()
+
     # Get feature matrix (Numpy array) from various input types
     if isinstance(data, np.ndarray):
         feature_matrix = data
@@ -4,10 +4,13 @@ from beartype.typing import Sequence, Union
 
 from eis_toolkit.exceptions import InvalidDatasetException, InvalidParameterValueException
 from eis_toolkit.utilities.miscellaneous import stack_raster_arrays
+from eis_toolkit.utilities.raster_stack import RasterStack
 
 
-def _prepare_data_for_fuzzy_overlay(data: Union[Sequence[np.ndarray], np.ndarray]) -> np.ndarray:
-    if isinstance(data, Sequence):
+def _prepare_data_for_fuzzy_overlay(data: Union[Sequence[np.ndarray], np.ndarray, RasterStack]) -> np.ndarray:
+    if isinstance(data, RasterStack):
+        data = data.read()
+    elif isinstance(data, Sequence):
         data = stack_raster_arrays(data)
     if (data.ndim == 3 and data.shape[0] < 2) or data.ndim == 2:
         raise InvalidDatasetException("At least 2 arrays/raster bands are needed for fuzzy overlay.")
@@ -17,11 +20,11 @@ def _prepare_data_for_fuzzy_overlay(data: Union[Sequence[np.ndarray], np.ndarray
 
 
 @beartype
-def and_overlay(data: Union[Sequence[np.ndarray], np.ndarray]) -> np.ndarray:
+def and_overlay(data: Union[Sequence[np.ndarray], np.ndarray, RasterStack]) -> np.ndarray:
     """Compute an 'and' overlay operation with fuzzy logic.
 
     Args:
-        data: The input data as a series of 2D/3D Numpy arrays or as a 3D Numpy array.
+        data: The input data as a series of 2D/3D Numpy arrays, as a 3D Numpy array or as a raster stack.
             All found 2D arrays are overlayed. Input data should contain at least 2D Numpy
             arrays and data should be in the range [0, 1].
 
@@ -38,11 +41,11 @@ def and_overlay(data: Union[Sequence[np.ndarray], np.ndarray]) -> np.ndarray:
 
 
 @beartype
-def or_overlay(data: Union[Sequence[np.ndarray], np.ndarray]) -> np.ndarray:
+def or_overlay(data: Union[Sequence[np.ndarray], np.ndarray, RasterStack]) -> np.ndarray:
     """Compute an 'or' overlay operation with fuzzy logic.
 
     Args:
-        data: The input data as a series of 2D/3D Numpy arrays or as a 3D Numpy array.
+        data: The input data as a series of 2D/3D Numpy arrays, as a 3D Numpy array or as a raster stack.
             All found 2D arrays are overlayed. Input data should contain at least 2D Numpy
             arrays and data should be in the range [0, 1].
 
@@ -58,11 +61,11 @@ def or_overlay(data: Union[Sequence[np.ndarray], np.ndarray]) -> np.ndarray:
 
 
 @beartype
-def product_overlay(data: Union[Sequence[np.ndarray], np.ndarray]) -> np.ndarray:
+def product_overlay(data: Union[Sequence[np.ndarray], np.ndarray, RasterStack]) -> np.ndarray:
     """Compute a 'product' overlay operation with fuzzy logic.
 
     Args:
-        data: The input data as a series of 2D/3D Numpy arrays or as a 3D Numpy array.
+        data: The input data as a series of 2D/3D Numpy arrays, as a 3D Numpy array or as a raster stack.
             All found 2D arrays are overlayed. Input data should contain at least 2D Numpy
             arrays and data should be in the range [0, 1].
 
@@ -78,11 +81,11 @@ def product_overlay(data: Union[Sequence[np.ndarray], np.ndarray]) -> np.ndarray
 
 
 @beartype
-def sum_overlay(data: Union[Sequence[np.ndarray], np.ndarray]) -> np.ndarray:
+def sum_overlay(data: Union[Sequence[np.ndarray], np.ndarray, RasterStack]) -> np.ndarray:
     """Compute a 'sum' overlay operation with fuzzy logic.
 
     Args:
-        data: The input data as a series of 2D/3D Numpy arrays or as a 3D Numpy array.
+        data: The input data as a series of 2D/3D Numpy arrays, as a 3D Numpy array or as a raster stack.
             All found 2D arrays are overlayed. Input data should contain at least 2D Numpy
             arrays and data should be in the range [0, 1].
 
@@ -98,11 +101,11 @@ def sum_overlay(data: Union[Sequence[np.ndarray], np.ndarray]) -> np.ndarray:
 
 
 @beartype
-def gamma_overlay(data: Union[Sequence[np.ndarray], np.ndarray], gamma: float = 0.5) -> np.ndarray:
+def gamma_overlay(data: Union[Sequence[np.ndarray], np.ndarray, RasterStack], gamma: float = 0.5) -> np.ndarray:
     """Compute a 'gamma' overlay operation with fuzzy logic.
 
     Args:
-        data: The input data as a series of 2D/3D Numpy arrays or as a 3D Numpy array.
+        data: The input data as a series of 2D/3D Numpy arrays, as a 3D Numpy array or as a raster stack.
             All found 2D arrays are overlayed. Input data should contain at least 2D Numpy
             arrays and data should be in the range [0, 1].
         gamma: The gamma parameter. With gamma value of 0, the result will be the same as 'product' overlay.
@@ -28,7 +28,9 @@ from eis_toolkit.exceptions import (
     NonMatchingParameterLengthsException,
     NonMatchingRasterMetadataException,
 )
+from eis_toolkit.utilities.blockwise import get_block_output_profile, get_block_windows, write_raster_by_blocks
 from eis_toolkit.utilities.checks.raster import check_raster_grids
+from eis_toolkit.utilities.raster_stack import RasterStack
 from eis_toolkit.vector_processing.rasterize_vector import rasterize_vector
 
 SPLIT = "split"
@@ -183,9 +185,132 @@ def reshape_predictions(
     return predictions_reshaped
 
 
+def _predict_batch(
+    data: np.ndarray, model: Union[BaseEstimator, keras.Model], predict_probabilities: bool
+) -> np.ndarray:
+    if isinstance(model, keras.Model):
+        return model.predict(data, verbose=0)
+
+    if predict_probabilities:
+        probabilities = model.predict_proba(data)
+        # Only the probability of the positive class for binary classifiers
+        return probabilities[:, 1] if probabilities.shape[1] == 2 else probabilities
+
+    return model.predict(data)
+
+
+def _predict_block(
+    feature_blocks: List[np.ndarray],
+    nodata_values: List[Optional[Number]],
+    model: Union[BaseEstimator, keras.Model],
+    predict_probabilities: bool,
+    batch_size: int,
+    count: int,
+) -> np.ndarray:
+    height, width = feature_blocks[0].shape[1:]
+    reshaped_blocks = [block.reshape(block.shape[0], -1).T for block in feature_blocks]
+    X = np.concatenate(reshaped_blocks, axis=1)
+
+    nodata_mask = np.zeros(len(X), dtype=bool)
+    for block, nodata in zip(reshaped_blocks, nodata_values):
+        if nodata is not None:
+            nodata_mask |= (block == nodata).any(axis=1)
+    if np.issubdtype(X.dtype, np.floating):
+        nodata_mask |= np.isnan(X).any(axis=1)
+
+    predictions = np.full((len(X), count), np.nan, dtype=np.float32)
+    valid_indices = np.flatnonzero(~nodata_mask)
+    for start in range(0, len(valid_indices), batch_size):
+        batch_indices = valid_indices[start : start + batch_size]  # noqa: E203
+        batch_predictions = _predict_batch(X[batch_indices], model, predict_probabilities)
+        predictions[batch_indices] = batch_predictions.reshape(len(batch_indices), count)
+
+    return predictions.T.reshape(count, height, width)
+
+
+def _iterate_prediction_tasks(
+    rasters: List[rasterio.io.DatasetReader],
+    windows: List[Tuple[rasterio.windows.Window, rasterio.windows.Window]],
+    model: Union[BaseEstimator, keras.Model],
+    predict_probabilities: bool,
+    batch_size: int,
+    count: int,
+):
+    nodata_values = [raster.nodata for raster in rasters]
+    for _, window in windows:
+        feature_blocks = [raster.read(window=window) for raster in rasters]
+        yield _predict_block, (feature_blocks, nodata_values, model, predict_probabilities, batch_size, count), window
+
+
 @beartype
-def prepare_data_for_ml(
+def predict_raster(
+    model: Union[BaseEstimator, keras.Model],
     feature_raster_files: Sequence[Union[str, os.PathLike]],
+    output_raster: Path,
+    predict_probabilities: bool = False,
+    block_size: int = 1024,
+    batch_size: int = 65536,
+) -> dict:
+    """
+    Predict with a trained model block by block and write the predictions to a GeoTIFF.
+
+    The features are read window by window in the same order as in `prepare_data_for_ml`: all bands of
+    the first feature raster, then all bands of the second one and so on. Cells with nodata or NaN in any
+    feature are left out of the prediction and written as nodata. Only one block of features is in memory
+    at a time, so the feature rasters can be larger than the available memory.
+
+    Probabilities of binary classifiers are written as a single band with the probability of the positive
+    class. Other classifiers get one band per class and Keras models one band per model output.
+
+    Args:
+        model: Trained classifier or regressor. Can be any machine learning model trained with
+            EIS Toolkit (Sklearn and Keras models).
+        feature_raster_files: List of filepaths of feature/evidence rasters. Files should only include
+            raster that have the same grid properties and extent.
+        output_raster: Path of the output GeoTIFF.
+        predict_probabilities: Whether to predict class probabilities instead of classes with a Sklearn
+            classifier. Keras models always predict their outputs. Defaults to False.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        batch_size: Maximum number of cells predicted with one call of the model. Defaults to 65536.
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: Probabilities are predicted with a model that does not predict them
+            or the batch size is not positive.
+        NonMatchingRasterMetadataException: Input feature rasters don't have same grid properties.
+    """
+    if batch_size < 1:
+        raise InvalidParameterValueException("Batch size must be a positive integer.")
+
+    if isinstance(model, keras.Model):
+        count = int(model.output_shape[-1])
+    elif predict_probabilities:
+        if not hasattr(model, "predict_proba"):
+            raise InvalidParameterValueException("Model does not predict probabilities.")
+        count = 1 if len(model.classes_) == 2 else len(model.classes_)
+    else:
+        count = 1
+
+    rasters = [rasterio.open(file) for file in feature_raster_files]
+    try:
+        if not check_raster_grids([raster.profile for raster in rasters], same_extent=True):
+            raise NonMatchingRasterMetadataException("Input feature rasters should have same grid properties.")
+
+        out_profile = get_block_output_profile(rasters[0], count=count, dtype="float32")
+        windows = get_block_windows(rasters[0].height, rasters[0].width, block_size)
+        block_tasks = _iterate_prediction_tasks(rasters, windows, model, predict_probabilities, batch_size, count)
+
+        return write_raster_by_blocks(output_raster, out_profile, block_tasks)
+    finally:
+        for raster in rasters:
+            raster.close()
+
+
+@beartype
+def prepare_data_for_ml(
+    feature_raster_files: Union[Sequence[Union[str, os.PathLike]], RasterStack],
     label_file: Optional[Union[str, os.PathLike]] = None,
 ) -> Tuple[np.ndarray, Optional[np.ndarray], rasterio.profiles.Profile, Any]:
     """
@@ -197,8 +322,8 @@ def prepare_data_for_ml(
     - Create a nodata mask using all feature rasters and labels, and mask nodata cells out
 
     Args:
-        feature_raster_files: List of filepaths of feature/evidence rasters. Files should only include
-            raster that have the same grid properties and extent.
+        feature_raster_files: List of filepaths of feature/evidence rasters or a raster stack of them.
+            Files should only include raster that have the same grid properties and extent.
         label_file: Filepath to label (deposits) data. File can be either a vector file or raster file.
             If a vector file is provided, it will be rasterized into similar grid as feature rasters. If
             a raster file is provided, it needs to have same grid properties and extent as feature rasters.
@@ -214,34 +339,25 @@ def prepare_data_for_ml(
         NonMatchingRasterMetadataException: Input feature rasters don't have same grid properties.
     """
 
-    def _read_and_stack_feature_raster(filepath: Union[str, os.PathLike]) -> Tuple[np.ndarray, dict]:
-        """Read all bands of raster file with feature/evidence data in a stack."""
-        with rasterio.open(filepath) as src:
-            raster_data = np.stack([src.read(i) for i in range(1, src.count + 1)])
-            profile = src.profile
-        return raster_data, profile
-
-    # Read and stack feature rasters
-    feature_data, profiles = zip(*[_read_and_stack_feature_raster(file) for file in feature_raster_files])
-    if not check_raster_grids(profiles, same_extent=True):
-        raise NonMatchingRasterMetadataException("Input feature rasters should have same grid properties.")
-
-    reference_profile = profiles[0]
-    nodata_values = [profile["nodata"] for profile in profiles]
+    # Read the bands of the feature rasters straight into the feature matrix
+    if isinstance(feature_raster_files, RasterStack):
+        feature_data = feature_raster_files.read(nodata_to_nan=False)
+        reference_profile = feature_raster_files.profile
+        nodata_values = feature_raster_files.nodata
+    else:
+        with RasterStack(feature_raster_files) as stack:
+            feature_data = stack.read(nodata_to_nan=False)
+            reference_profile = stack.profile
+            nodata_values = stack.nodata
 
     # Reshape feature rasters for ML and create mask
-    reshaped_data = []
+    X = feature_data.reshape(feature_data.shape[0], -1).T
     nodata_mask = None
 
-    for raster, nodata in zip(feature_data, nodata_values):
-        raster_reshaped = raster.reshape(raster.shape[0], -1).T
-        reshaped_data.append(raster_reshaped)
-
+    for band, nodata in enumerate(nodata_values):
         if nodata is not None:
-            raster_mask = (raster_reshaped == nodata).any(axis=1)
-            nodata_mask = raster_mask if nodata_mask is None else nodata_mask | raster_mask
-
-    X = np.concatenate(reshaped_data, axis=1)
+            band_mask = X[:, band] == nodata
+            nodata_mask = band_mask if nodata_mask is None else nodata_mask | band_mask
 
     if label_file is not None:
         # Check label file type and process accordingly
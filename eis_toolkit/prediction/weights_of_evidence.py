@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 from numbers import Number
 
 import geopandas as gpd
@@ -5,9 +6,16 @@ import numpy as np
 import pandas as pd
 import rasterio
 from beartype import beartype
-from beartype.typing import Dict, List, Literal, Optional, Sequence, Tuple
-
-from eis_toolkit.exceptions import ClassificationFailedException, InvalidColumnException, InvalidParameterValueException
+from beartype.typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+from eis_toolkit.exceptions import (
+    ClassificationFailedException,
+    InvalidColumnException,
+    InvalidParameterValueException,
+    NonMatchingParameterLengthsException,
+    NonMatchingRasterMetadataException,
+)
+from eis_toolkit.utilities.checks.raster import check_raster_grids
 from eis_toolkit.vector_processing.rasterize_vector import rasterize_vector
 
 CLASS_COLUMN = "Class"
@@ -65,64 +73,86 @@ def _read_and_preprocess_evidence(
     return array
 
 
-def _calculate_metrics_for_class(
-    deposits: np.ndarray, evidence: np.ndarray
-) -> Tuple[float, float, float, float, float, float, float, float, float, float, float]:
-    """Calculate weights/metrics for given data."""
-    A = np.sum(np.logical_and(deposits == 1, evidence == 1))
-    B = np.sum(np.logical_and(deposits == 1, evidence == 0))
-    C = np.sum(np.logical_and(deposits == 0, evidence == 1))
-    D = np.sum(np.logical_and(deposits == 0, evidence == 0))
+def _class_counts(deposits: np.ndarray, evidence: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count the deposit and non-deposit pixels of each evidence class with a single bincount."""
+    classes, class_codes = np.unique(evidence, return_inverse=True)
+
+    # Pixels that are neither deposit (1) nor non-deposit (0) are counted in a third, discarded bin
+    deposit_flags = np.where(deposits == 1, 1, np.where(deposits == 0, 0, 2))
+
+    counts = np.bincount(class_codes.ravel() * 3 + deposit_flags.ravel(), minlength=len(classes) * 3)
+    counts = counts.reshape(len(classes), 3)
+
+    return classes, counts[:, 1], counts[:, 0]
 
-    # If data has no deposits or every evidence pixel has a deposit
-    if A == 0 or C + D == 0:
-        return A, B, C, D, 0, 0, 0, 0, 0, 0, 0
 
-    p_A_nominator = A
-    p_C_nominator = C
-    B_adjusted = B
-    D_adjusted = D
+def _calculate_metrics(
+    A: np.ndarray, B: np.ndarray, C: np.ndarray, D: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate weights/metrics for classes with the given deposit and non-deposit pixel counts."""
+    # Classes with no deposits or with every evidence pixel having a deposit get zero metrics
+    valid = np.logical_and(A != 0, C + D != 0)
 
-    if B == 0:
-        p_A_nominator -= 0.99
-        B_adjusted = 0.99
+    p_A_nominator = np.where(B == 0, A - 0.99, A)
+    p_C_nominator = np.where(D == 0, C - 0.99, C)
+    B_adjusted = np.where(B == 0, 0.99, B)
+    D_adjusted = np.where(D == 0, 0.99, D)
 
-    if D == 0:
-        p_C_nominator -= 0.99
-        D_adjusted = 0.99
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p_A = p_A_nominator / (A + B)  # probability of presence of evidence given the presence of mineral deposit
+        p_C = p_C_nominator / (C + D)  # probability of presence of evidence given the absence of mineral deposit
 
-    p_A = p_A_nominator / (A + B)  # probability of presence of evidence given the presence of mineral deposit
-    p_C = p_C_nominator / (C + D)  # probability of presence of evidence given the absence of mineral deposit
+        # Calculate metrics
+        w_plus = np.where(p_C != 0, np.log(p_A / p_C), 0.0)
+        w_minus = np.log((1 - p_A) / (1 - p_C))
+        contrast = w_plus - w_minus
 
-    # Calculate metrics
-    w_plus = np.log(p_A / p_C) if p_C != 0 else 0  # Check
-    w_minus = np.log((1 - p_A) / (1 - p_C))
-    contrast = w_plus - w_minus
+        # Calculate signifigance metrics
+        s_w_plus = np.sqrt((1 / p_A_nominator) + (1 / p_C_nominator))
+        s_w_minus = np.sqrt((1 / B_adjusted) + (1 / D_adjusted))
 
-    # Calculate signifigance metrics
-    s_w_plus = np.sqrt((1 / p_A_nominator) + (1 / p_C_nominator))
-    s_w_minus = np.sqrt((1 / B_adjusted) + (1 / D_adjusted))
+        s_contrast = np.sqrt(s_w_plus**2 + s_w_minus**2)
+        studentized_contrast = contrast / s_contrast
 
-    s_contrast = np.sqrt(s_w_plus**2 + s_w_minus**2)
-    studentized_contrast = contrast / s_contrast
+    metrics = (w_plus, s_w_plus, w_minus, s_w_minus, contrast, s_contrast, studentized_contrast)
+    return tuple(np.where(valid, metric, 0.0) for metric in metrics)
 
-    return A, B, C, D, w_plus, s_w_plus, w_minus, s_w_minus, contrast, s_contrast, studentized_contrast
+
+def _weights_dataframe(classes: np.ndarray, A: np.ndarray, B: np.ndarray, C: np.ndarray, D: np.ndarray) -> pd.DataFrame:
+    """Create the weights dataframe for classes with the given deposit and non-deposit pixel counts."""
+    w_plus, s_w_plus, w_minus, s_w_minus, contrast, s_contrast, studentized_contrast = _calculate_metrics(A, B, C, D)
+
+    return pd.DataFrame(
+        {
+            CLASS_COLUMN: classes,
+            PIXEL_COUNT_COLUMN: A + C,
+            DEPOSIT_COUNT_COLUMN: A,
+            WEIGHT_PLUS_COLUMN: np.round(w_plus, 4),
+            WEIGHT_S_PLUS_COLUMN: np.round(s_w_plus, 4),
+            WEIGHT_MINUS_COLUMN: np.round(w_minus, 4),
+            WEIGHT_S_MINUS_COLUMN: np.round(s_w_minus, 4),
+            CONTRAST_COLUMN: np.round(contrast, 4),
+            S_CONTRAST_COLUMN: np.round(s_contrast, 4),
+            STUDENTIZED_CONTRAST_COLUMN: np.round(studentized_contrast, 4),
+        }
+    )
 
 
-def _unique_weights(deposits: np.ndarray, evidence: np.ndarray) -> dict:
+def _unique_weights(deposits: np.ndarray, evidence: np.ndarray) -> pd.DataFrame:
     """Calculate unique weights for each class."""
-    classes = np.unique(evidence)
-    return {cls: _calculate_metrics_for_class(deposits, evidence == cls) for cls in classes}
+    classes, deposit_counts, no_deposit_counts = _class_counts(deposits, evidence)
+    A, C = deposit_counts, no_deposit_counts
+    return _weights_dataframe(classes, A, deposit_counts.sum() - A, C, no_deposit_counts.sum() - C)
 
 
-def _cumulative_weights(deposits: np.ndarray, evidence: np.ndarray, ascending: bool = True) -> dict:
+def _cumulative_weights(deposits: np.ndarray, evidence: np.ndarray, ascending: bool = True) -> pd.DataFrame:
     """Calculate cumulative weights (ascending or descending) for each class."""
-    classes = sorted(np.unique(evidence), reverse=not ascending)
-    cumulative_classes = [classes[: i + 1] for i in range(len(classes))]
-    return {
-        cls[i]: _calculate_metrics_for_class(deposits, np.isin(evidence, cls))
-        for i, cls in enumerate(cumulative_classes)
-    }
+    classes, deposit_counts, no_deposit_counts = _class_counts(deposits, evidence)
+    if not ascending:
+        classes, deposit_counts, no_deposit_counts = classes[::-1], deposit_counts[::-1], no_deposit_counts[::-1]
+
+    A, C = np.cumsum(deposit_counts), np.cumsum(no_deposit_counts)
+    return _weights_dataframe(classes, A, deposit_counts.sum() - A, C, no_deposit_counts.sum() - C)
 
 
 def _generalized_classes_categorical(df: pd.DataFrame, studentized_contrast_threshold: Number) -> pd.DataFrame:
@@ -229,16 +259,66 @@ def _generate_arrays_from_metrics(
     evidence: np.ndarray, df: pd.DataFrame, metrics_to_include: List[str]
 ) -> Dict[str, np.ndarray]:
     """Generate arrays for defined metrics."""
+    classes = df[CLASS_COLUMN].to_numpy()
+    order = np.argsort(classes, kind="stable")
+    sorted_classes = classes[order]
+
+    # Look up the dataframe row of each evidence pixel, pixels of unknown classes (nodata) are left out
+    row_index = np.clip(np.searchsorted(sorted_classes, evidence), 0, len(sorted_classes) - 1)
+    known_class = sorted_classes[row_index] == evidence
+    known_rows = order[row_index[known_class]]
+
     array_dict = {}
     for metric in metrics_to_include:
         metric_array = np.full(evidence.shape, np.nan)
-        for _, row in df.iterrows():
-            mask = np.isin(evidence, row[CLASS_COLUMN])
-            metric_array[mask] = row[metric]
+        metric_array[known_class] = df[metric].to_numpy(dtype=np.float64)[known_rows]
         array_dict[metric] = metric_array
     return array_dict
 
 
+def _calculate_weights(
+    evidence_array: np.ndarray,
+    deposit_array: np.ndarray,
+    weights_type: str,
+    studentized_contrast_threshold: Number,
+    metrics_to_arrays: Sequence[str],
+) -> Tuple[pd.DataFrame, dict, int, int]:
+    """Calculate the weights and metric arrays for preprocessed evidence and rasterized deposits."""
+    # Mask NaN out of the array
+    nodata_mask = np.isnan(evidence_array)
+    masked_evidence_array = evidence_array[~nodata_mask]
+    masked_deposit_array = deposit_array[~nodata_mask]
+
+    # 2. WofE calculations, creating a DataFrame of the calculated metrics
+    if weights_type == "unique" or weights_type == "categorical":
+        weights_df = _unique_weights(masked_deposit_array, masked_evidence_array)
+    elif weights_type == "ascending":
+        weights_df = _cumulative_weights(masked_deposit_array, masked_evidence_array, ascending=True)
+    elif weights_type == "descending":
+        weights_df = _cumulative_weights(masked_deposit_array, masked_evidence_array, ascending=False)
+    else:
+        raise InvalidParameterValueException(
+            "Expected weights_type to be one of unique, categorical, ascending or descending."
+        )
+
+    # 3. If we use cumulative weights type, calculate generalized classes and weights
+    if weights_type == "categorical":
+        weights_df = _generalized_classes_categorical(weights_df, studentized_contrast_threshold)
+        weights_df = _generalized_weights_categorical(weights_df, masked_deposit_array)
+    elif weights_type == "ascending" or weights_type == "descending":
+        weights_df = _generalized_classes_cumulative(weights_df, studentized_contrast_threshold)
+        weights_df = _generalized_weights_cumulative(weights_df, masked_deposit_array)
+
+    # 4. Generate arrays for desired metrics
+    arrays_dict = _generate_arrays_from_metrics(evidence_array, weights_df, metrics_to_arrays)
+
+    # Return nr. of deposit pixels  and nr. of all evidence pixels for to be used in calculate responses
+    nr_of_deposits = int(np.sum(masked_deposit_array == 1))
+    nr_of_pixels = int(np.size(masked_evidence_array))
+
+    return weights_df, arrays_dict, nr_of_deposits, nr_of_pixels
+
+
 @beartype
 def weights_of_evidence_calculate_weights(
     evidential_raster: rasterio.io.DatasetReader,
@@ -305,58 +385,9 @@ def weights_of_evidence_calculate_weights(
         geodataframe=deposits, default_value=1.0, base_raster_profile=raster_meta, fill_value=0.0
     )
 
-    # Mask NaN out of the array
-    nodata_mask = np.isnan(evidence_array)
-    masked_evidence_array = evidence_array[~nodata_mask]
-    masked_deposit_array = deposit_array[~nodata_mask]
-
-    # 2. WofE calculations
-    if weights_type == "unique" or weights_type == "categorical":
-        wofe_weights = _unique_weights(masked_deposit_array, masked_evidence_array)
-    elif weights_type == "ascending":
-        wofe_weights = _cumulative_weights(masked_deposit_array, masked_evidence_array, ascending=True)
-    elif weights_type == "descending":
-        wofe_weights = _cumulative_weights(masked_deposit_array, masked_evidence_array, ascending=False)
-    else:
-        raise InvalidParameterValueException(
-            "Expected weights_type to be one of unique, categorical, ascending or descending."
-        )
-
-    # 3. Create DataFrame based on calculated metrics
-    df_entries = []
-    for cls, metrics in wofe_weights.items():
-        metrics = [round(metric, 4) if isinstance(metric, np.floating) else metric for metric in metrics]
-        A, _, C, _, w_plus, s_w_plus, w_minus, s_w_minus, contrast, s_contrast, studentized_contrast = metrics
-        df_entries.append(
-            {
-                CLASS_COLUMN: cls,
-                PIXEL_COUNT_COLUMN: A + C,
-                DEPOSIT_COUNT_COLUMN: A,
-                WEIGHT_PLUS_COLUMN: w_plus,
-                WEIGHT_S_PLUS_COLUMN: s_w_plus,
-                WEIGHT_MINUS_COLUMN: w_minus,
-                WEIGHT_S_MINUS_COLUMN: s_w_minus,
-                CONTRAST_COLUMN: contrast,
-                S_CONTRAST_COLUMN: s_contrast,
-                STUDENTIZED_CONTRAST_COLUMN: studentized_contrast,
-            }
-        )
-    weights_df = pd.DataFrame(df_entries)
-
-    # 4. If we use cumulative weights type, calculate generalized classes and weights
-    if weights_type == "categorical":
-        weights_df = _generalized_classes_categorical(weights_df, studentized_contrast_threshold)
-        weights_df = _generalized_weights_categorical(weights_df, masked_deposit_array)
-    elif weights_type == "ascending" or weights_type == "descending":
-        weights_df = _generalized_classes_cumulative(weights_df, studentized_contrast_threshold)
-        weights_df = _generalized_weights_cumulative(weights_df, masked_deposit_array)
-
-    # 5. Generate arrays for desired metrics
-    arrays_dict = _generate_arrays_from_metrics(evidence_array, weights_df, metrics_to_arrays)
-
-    # Return nr. of deposit pixels  and nr. of all evidence pixels for to be used in calculate responses
-    nr_of_deposits = int(np.sum(masked_deposit_array == 1))
-    nr_of_pixels = int(np.size(masked_evidence_array))
+    weights_df, arrays_dict, nr_of_deposits, nr_of_pixels = _calculate_weights(
+        evidence_array, deposit_array, weights_type, studentized_contrast_threshold, metrics_to_arrays
+    )
 
     return weights_df, arrays_dict, raster_meta, nr_of_deposits, nr_of_pixels
 
@@ -408,3 +439,111 @@ def weights_of_evidence_calculate_responses(
 
     confidence_array = posterior_probabilities / posterior_probabilities_std
     return posterior_probabilities, posterior_probabilities_std, confidence_array
+
+
+@beartype
+def weights_of_evidence_batch(
+    evidential_rasters: Sequence[rasterio.io.DatasetReader],
+    deposits: gpd.GeoDataFrame,
+    raster_nodata: Optional[Number] = None,
+    weights_types: Union[
+        Literal["unique", "categorical", "ascending", "descending"],
+        Sequence[Literal["unique", "categorical", "ascending", "descending"]],
+    ] = "unique",
+    studentized_contrast_threshold: Number = 1,
+    n_workers: Optional[int] = None,
+) -> Tuple[List[pd.DataFrame], List[dict], dict, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate weights of spatial associations for several evidential rasters and the posterior probabilities.
+
+    The deposits are rasterized only once for all evidential rasters. The weights of each evidential raster
+    are the same as with weights_of_evidence_calculate_weights with the default arrays to generate. The
+    posterior probabilities are calculated with weights_of_evidence_calculate_responses, using the deposit
+    and evidence pixels that have data in every evidential raster.
+
+    Args:
+        evidential_rasters: The evidential rasters. Must have the same grid.
+        deposits: Vector data representing the mineral deposits or occurences point data.
+        raster_nodata: If nodata value of rasters is wanted to specify manually. Optional parameter, defaults to None
+            (nodata from raster metadata is used).
+        weights_types: Weights type used for all evidential rasters, or one weights type for each evidential raster.
+            Accepted values are 'unique', 'categorical', 'ascending' and 'descending'. Defaults to 'unique'.
+        studentized_contrast_threshold: Studentized contrast threshold value used with 'categorical', 'ascending' and
+            'descending' weight types. Defaults to 1.
+        n_workers: Number of worker processes calculating the weights of different evidential rasters in parallel.
+            Defaults to None, which calculates them sequentially in the calling process.
+
+    Returns:
+        List of dataframes with weights of spatial association, one for each evidential raster.
+        List of dictionaries of arrays for the default metrics, one for each evidential raster.
+        Raster metadata.
+        Array of posterior probabilites.
+        Array of standard deviations in the posterior probability calculations.
+        Array of confidence of the prospectivity values obtained in the posterior probability array.
+
+    Raises:
+        ClassificationFailedException: Unable to create generalized classes with the given
+            studentized_contrast_threshold.
+        InvalidParameterValueException: No evidential rasters are given or the number of workers is not positive.
+        NonMatchingParameterLengthsException: Number of weights types does not match the number of evidential rasters.
+        NonMatchingRasterMetadataException: Evidential rasters do not have the same grid.
+    """
+    if len(evidential_rasters) == 0:
+        raise InvalidParameterValueException("Expected at least one evidential raster.")
+
+    if n_workers is not None and n_workers < 1:
+        raise InvalidParameterValueException("Number of workers must be a positive integer.")
+
+    if isinstance(weights_types, str):
+        weights_types = [weights_types] * len(evidential_rasters)
+    elif len(weights_types) != len(evidential_rasters):
+        raise NonMatchingParameterLengthsException("Expected one weights type for each evidential raster.")
+
+    raster_metas = [evidential_raster.meta for evidential_raster in evidential_rasters]
+    if not check_raster_grids(raster_metas, same_extent=True):
+        raise NonMatchingRasterMetadataException("Input evidential rasters should have the same grid properties.")
+    raster_meta = raster_metas[0]
+
+    # Rasterize deposits once for all evidential rasters
+    deposit_array, _ = rasterize_vector(
+        geodataframe=deposits, default_value=1.0, base_raster_profile=raster_meta, fill_value=0.0
+    )
+
+    evidence_arrays = [
+        _read_and_preprocess_evidence(evidential_raster, raster_nodata) for evidential_raster in evidential_rasters
+    ]
+    metrics_to_arrays = [
+        DEFAULT_METRICS_UNIQUE if weights_type == "unique" else DEFAULT_METRICS_CUMULATIVE
+        for weights_type in weights_types
+    ]
+    arguments = [
+        (evidence_array, deposit_array, weights_type, studentized_contrast_threshold, metrics)
+        for evidence_array, weights_type, metrics in zip(evidence_arrays, weights_types, metrics_to_arrays)
+    ]
+
+    if n_workers is None or n_workers == 1:
+        results = [_calculate_weights(*args) for args in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_calculate_weights, *zip(*arguments)))
+
+    weights_dfs = [weights_df for weights_df, _, _, _ in results]
+    arrays_dicts = [arrays_dict for _, arrays_dict, _, _ in results]
+
+    # Prior probability from the pixels with data in every evidential raster
+    common_data_mask = np.logical_not(np.any([np.isnan(evidence_array) for evidence_array in evidence_arrays], axis=0))
+    nr_of_deposits = int(np.sum(deposit_array[common_data_mask] == 1))
+    nr_of_pixels = int(np.sum(common_data_mask))
+
+    posterior_probabilities, posterior_probabilities_std, confidence_array = weights_of_evidence_calculate_responses(
+        arrays_dicts, nr_of_deposits, nr_of_pixels
+    )
+
+    return (
+        weights_dfs,
+        arrays_dicts,
+        raster_meta,
+        posterior_probabilities,
+        posterior_probabilities_std,
+        confidence_array,
+    )
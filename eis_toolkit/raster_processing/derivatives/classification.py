@@ -1,36 +1,38 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import rasterio
 from beartype import beartype
-from beartype.typing import Literal
+from beartype.typing import Literal, Optional
 
 from eis_toolkit.exceptions import InvalidParameterValueException, InvalidRasterBandException
+from eis_toolkit.utilities.blockwise import get_block_output_profile, process_raster_bands_by_blocks
 
 
-@beartype
-def _classify_aspect(
-    raster: rasterio.io.DatasetReader,
+def _classify_aspect_array(
+    aspect: np.ndarray,
+    nodata: Optional[Number],
     unit: Literal["degrees", "radians"],
     num_classes: Number,
-) -> tuple[np.ndarray, dict, dict]:
+) -> np.ndarray:
     """
-    Classify an aspect raster data set into directional classes.
+    Classify aspect data into directional classes.
 
     Args:
-        raster: Input raster.
-        unit: The unit of the input raster. Either "degrees" or "radians".
+        aspect: Aspect data.
+        nodata: Nodata value of the aspect data.
+        unit: The unit of the aspect data. Either "degrees" or "radians".
         num_classes: The number of classes for discretization. Either 8 or 16 classes allowed.
 
     Returns:
-        The classified aspect raster, a class mapping dictionary and the updated metadata.
+        The classified aspect data.
     """
-    aspect = raster.read()
-    aspect = np.squeeze(aspect) if aspect.ndim >= 3 else aspect
     out_nodata = -9999
 
     mask_nd = np.equal(aspect, -1)
-    mask_nodata = np.equal(aspect, raster.nodata)
+    mask_nodata = np.equal(aspect, nodata)
 
     if np.issubdtype(aspect.dtype, np.integer):
         aspect = aspect.astype(float)
@@ -41,6 +43,15 @@ def _classify_aspect(
     # Adjust the array to rotate 22.5 degrees counter-clockwise
     aspect = (aspect + np.pi / num_classes) % (2 * np.pi)
 
+    # Determine index to each value in the aspect array
+    out_array = np.digitize(aspect, np.linspace(0, 2 * np.pi, num_classes + 1))
+    out_array = np.where(mask_nd, -1, out_array)
+    out_array = np.where(mask_nodata, out_nodata, out_array)
+
+    return out_array.astype(np.result_type(np.int8, out_nodata))
+
+
+def _aspect_class_mapping(num_classes: Number) -> dict:
     if num_classes == 8:
         dir_classes = np.array(["N", "NE", "E", "SE", "S", "SW", "W", "NW", "ND"])
     elif num_classes == 16:
@@ -48,21 +59,49 @@ def _classify_aspect(
             ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE", "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW", "ND"]
         )
 
-    # Determine index to each value in the aspect array
-    out_array = np.digitize(aspect, np.linspace(0, 2 * np.pi, num_classes + 1))
-    out_array = np.where(mask_nd, -1, out_array)
-    out_array = np.where(mask_nodata, out_nodata, out_array)
-    out_array = out_array.astype(np.result_type(np.int8, out_nodata))
-
     out_mapping = {direction: i + 1 for i, direction in enumerate(dir_classes[:num_classes])}
     out_mapping["ND"] = -1
 
+    return out_mapping
+
+
+@beartype
+def _classify_aspect(
+    raster: rasterio.io.DatasetReader,
+    unit: Literal["degrees", "radians"],
+    num_classes: Number,
+) -> tuple[np.ndarray, dict, dict]:
+    """
+    Classify an aspect raster data set into directional classes.
+
+    Args:
+        raster: Input raster.
+        unit: The unit of the input raster. Either "degrees" or "radians".
+        num_classes: The number of classes for discretization. Either 8 or 16 classes allowed.
+
+    Returns:
+        The classified aspect raster, a class mapping dictionary and the updated metadata.
+    """
+    aspect = raster.read()
+    aspect = np.squeeze(aspect) if aspect.ndim >= 3 else aspect
+
+    out_array = _classify_aspect_array(aspect, raster.nodata, unit, num_classes)
+    out_mapping = _aspect_class_mapping(num_classes)
+
     out_meta = raster.meta.copy()
-    out_meta.update({"dtype": out_array.dtype.name, "nodata": out_nodata})
+    out_meta.update({"dtype": out_array.dtype.name, "nodata": -9999})
 
     return out_array, out_mapping, out_meta
 
 
+def _check_classify_aspect_parameters(raster: rasterio.io.DatasetReader, num_classes: int) -> None:
+    if raster.count > 1:
+        raise InvalidRasterBandException("Only one-band raster supported.")
+
+    if num_classes != 8 and num_classes != 16:
+        raise InvalidParameterValueException("Only 8 or 16 classes allowed for classification!")
+
+
 @beartype
 def classify_aspect(
     raster: rasterio.io.DatasetReader,
@@ -105,11 +144,49 @@ def classify_aspect(
         InvalidParameterValueException: Invalid number of classes requested.
         InvalidRasterBandException: Input raster has more than one band.
     """
+    _check_classify_aspect_parameters(raster, num_classes)
 
-    if raster.count > 1:
-        raise InvalidRasterBandException("Only one-band raster supported.")
+    return _classify_aspect(raster, unit, num_classes)
 
-    if num_classes != 8 and num_classes != 16:
-        raise InvalidParameterValueException("Only 8 or 16 classes allowed for classification!")
 
-    return _classify_aspect(raster, unit, num_classes)
+@beartype
+def classify_aspect_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    unit: Literal["radians", "degrees"] = "radians",
+    num_classes: int = 8,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> tuple[dict, dict]:
+    """
+    Classify an aspect raster data set block by block and write the result to a GeoTIFF.
+
+    The classes are the same as in classify_aspect. Memory use depends only on the block size.
+
+    Args:
+        raster: The input raster data.
+        output_raster: Path of the output GeoTIFF.
+        unit: The unit of the input raster. Either "degrees" or "radians"
+        num_classes: The number of classes for discretization. Either 8 or 16 classes allowed.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        A class mapping dictionary and the metadata of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: Invalid number of classes requested.
+        InvalidRasterBandException: Input raster has more than one band.
+    """
+    _check_classify_aspect_parameters(raster, num_classes)
+
+    band_function = partial(_classify_aspect_array, nodata=raster.nodata, unit=unit, num_classes=num_classes)
+    out_profile = get_block_output_profile(raster, count=1, dtype=np.result_type(np.int8, -9999).name)
+    out_profile.update({"nodata": -9999})
+
+    out_profile = process_raster_bands_by_blocks(
+        raster, output_raster, [1], [band_function], out_profile, block_size, n_workers
+    )
+
+    return _aspect_class_mapping(num_classes), out_profile
@@ -1,4 +1,6 @@
+from functools import cache, partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import rasterio
@@ -12,11 +14,14 @@ from eis_toolkit.exceptions import (
 )
 from eis_toolkit.raster_processing.derivatives.partial_derivatives import _coefficients
 from eis_toolkit.raster_processing.derivatives.utilities import _scale_raster, _set_flat_pixels
+from eis_toolkit.utilities.blockwise import get_block_output_profile, process_raster_by_blocks
 from eis_toolkit.utilities.checks.raster import check_quadratic_pixels
 from eis_toolkit.utilities.conversions import convert_rad_to_deg, convert_rad_to_rise
 from eis_toolkit.utilities.miscellaneous import reduce_ndim
 from eis_toolkit.utilities.nodata import nan_to_nodata, nodata_to_nan
 
+SECOND_ORDER_PARAMETERS = ("planc", "profc", "profc_min", "profc_max", "longc", "crosc", "rot", "K", "genc", "tangc")
+
 
 def _divide(
     numerator: np.ndarray,
@@ -36,65 +41,201 @@ def _divide(
     return numerator / np.where(denumerator < minimum, minimum, denumerator)
 
 
-def _first_order(
-    parameter: str,
-    coefficients: tuple[np.ndarray, np.ndarray],
-) -> np.ndarray:
-    """
-    Calculate the first order surface attributes slope (gradient) and aspect (slope direction).
+def _surface_parameters(
+    parameters: Sequence[str],
+    coefficients: tuple[np.ndarray, np.ndarray, Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]],
+) -> dict:
+    """Calculate surface attributes from shared partial derivatives.
+
+    Terms shared by several attributes, such as p² + q², are calculated once and reused.
 
     Args:
-        parameter: The surface parameter to calculate.
-        coefficients: The coefficients used in the calculation.
+        parameters: The surface parameters to calculate.
+        coefficients: The partial derivatives p, q, r, s, t. Only p and q are needed for first order attributes.
 
     Returns:
-        The calculated surface attribute.
+        The calculated surface attributes in radians for the gradient and aspect.
     """
-    p, q = coefficients
+    p, q, r, s, t = coefficients
 
-    if parameter == "G":
-        return np.arctan(np.sqrt(p**2 + q**2))
-    elif parameter == "A":
-        return np.pi + np.arctan2(p, q)
+    @cache
+    def p_squared():
+        return p**2
+
+    @cache
+    def q_squared():
+        return q**2
+
+    @cache
+    def pq():
+        return p * q
+
+    @cache
+    def gradient_squared():
+        return p_squared() + q_squared()
+
+    @cache
+    def gradient_cubed():
+        return np.sqrt(np.power(gradient_squared(), 3))
+
+    @cache
+    def plan_numerator():
+        return -2 * (q_squared() * r - pq() * s + p_squared() * t)
+
+    @cache
+    def profile_numerator():
+        return -2 * (p_squared() * r + pq() * s + q_squared() * t)
+
+    @cache
+    def min_max_root():
+        return np.sqrt(np.square(r - t) + s**2)
+
+    formulas = {
+        "G": lambda: np.arctan(np.sqrt(gradient_squared())),
+        "A": lambda: np.pi + np.arctan2(p, q),
+        "planc": lambda: _divide(plan_numerator(), gradient_cubed()),
+        "profc": lambda: _divide(
+            profile_numerator(), gradient_squared() * np.sqrt(np.power(1 + gradient_squared(), 3))
+        ),
+        "profc_min": lambda: -r - t - min_max_root(),
+        "profc_max": lambda: -r - t + min_max_root(),
+        "longc": lambda: _divide(profile_numerator(), gradient_squared()),
+        "crosc": lambda: _divide(plan_numerator(), gradient_squared()),
+        "rot": lambda: _divide((p_squared() - q_squared()) * s - pq() * (r - t), gradient_cubed()),
+        "K": lambda: (r * t - s**2) / np.square(1 + gradient_squared()),
+        "genc": lambda: -2 * (r + t),
+        "tangc": lambda: _divide(plan_numerator(), gradient_squared() * np.sqrt(1 + gradient_squared())),
+    }
+
+    return {parameter: formulas[parameter]() for parameter in parameters}
+
+
+def _check_surface_raster(raster: rasterio.io.DatasetReader, scaling_factor: Number) -> None:
+    """Check that the raster and scaling factor are valid for calculating surface attributes."""
+    if raster.count > 1:
+        raise InvalidRasterBandException("Only one-band raster supported.")
 
+    if check_quadratic_pixels(raster) is False:
+        raise NonSquarePixelSizeException("Processing requires quadratic pixel dimensions.")
 
-def _second_order_basic_set(
-    parameter: str,
-    coefficients: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray],
-) -> np.ndarray:
-    """Calculate the second order surface attributes (curvatures).
+    if scaling_factor <= 0:
+        raise InvalidParameterValueException("Value must be greater than 0.")
 
-    Args:
-        parameter: The surface parameter to calculate.
-        coefficients: The coefficients used in the calculation.
 
-    Returns:
-        The calculated surface attribute.
-    """
-    p, q, r, s, t = coefficients
+def _check_surface_parameters(parameters: Sequence[str], method: str) -> None:
+    """Check that the parameters can be calculated together with the method."""
+    if len(parameters) == 0:
+        raise InvalidParameterValueException("At least one surface parameter must be given.")
+
+    if method == "Horn" and any(parameter in SECOND_ORDER_PARAMETERS for parameter in parameters):
+        raise InvalidParameterValueException("The Horn method supports only first order parameters.")
+
+
+def _read_surface(raster: rasterio.io.DatasetReader) -> np.ndarray:
+    """Read the raster data with nodata as NaN."""
+    raster_array = reduce_ndim(raster.read())
+    return nodata_to_nan(raster_array, nodata_value=raster.nodata)
+
+
+def _surface_coefficients(
+    raster_array: np.ndarray, cellsize: Number, scaling_factor: Number, method: str
+) -> tuple[np.ndarray, np.ndarray, Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]]:
+    """Calculate the partial derivatives of the raster data, with q pointing north for Horn."""
+    raster_array = _scale_raster(raster_array, scaling_factor)
+
+    p, q, r, s, t = _coefficients(raster_array, cellsize, method)
+    q = -q if method == "Horn" else q
+
+    return p, q, r, s, t
+
+
+def _derive_surface_parameters(
+    parameters: Sequence[str],
+    coefficients: tuple[np.ndarray, np.ndarray, Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]],
+    slope_tolerance: Number,
+    slope_gradient_unit: str,
+    slope_direction_unit: str,
+) -> dict:
+    """Calculate surface attributes with units and flat pixels applied, sharing the slope gradient between them."""
+    p, q, *_ = coefficients
+    gradient_parameters = list(parameters) if slope_tolerance == 0 or "G" in parameters else ["G", *parameters]
+    surface_parameters = _surface_parameters(gradient_parameters, coefficients)
+    slope_gradient = surface_parameters["G"] if slope_tolerance > 0 else (p, q)
+
+    out_dict = {}
+    out_nodata = -9999
+    for parameter in parameters:
+        out_array = surface_parameters[parameter]
+
+        if (parameter == "G" and slope_gradient_unit == "degrees") or (
+            parameter == "A" and slope_direction_unit == "degrees"
+        ):
+            out_array = convert_rad_to_deg(out_array)
+        elif parameter == "G" and slope_gradient_unit == "rise":
+            out_array = convert_rad_to_rise(out_array)
 
-    if parameter == "planc":
-        return _divide(-2 * (q**2 * r - p * q * s + p**2 * t), np.sqrt(np.power(p**2 + q**2, 3)))
-    elif parameter == "profc":
-        return _divide(
-            -2 * (p**2 * r + p * q * s + q**2 * t), (p**2 + q**2) * (np.sqrt(np.power(1 + p**2 + q**2, 3)))
+        out_array = (
+            _set_flat_pixels(out_array, slope_gradient, slope_tolerance, parameter) if parameter != "G" else out_array
         )
-    elif parameter == "profc_min":
-        return -r - t - np.sqrt(np.square(r - t) + s**2)
-    elif parameter == "profc_max":
-        return -r - t + np.sqrt(np.square(r - t) + s**2)
-    elif parameter == "longc":
-        return _divide(-2 * (p**2 * r + p * q * s + q**2 * t), p**2 + q**2)
-    elif parameter == "crosc":
-        return _divide(-2 * (q**2 * r - p * q * s + p**2 * t), p**2 + q**2)
-    elif parameter == "rot":
-        return _divide((p**2 - q**2) * s - p * q * (r - t), np.sqrt(np.power(p**2 + q**2, 3)))
-    elif parameter == "K":
-        return (r * t - s**2) / np.square(1 + p**2 + q**2)
-    elif parameter == "genc":
-        return -2 * (r + t)
-    elif parameter == "tangc":
-        return _divide(-2 * (q**2 * r - p * q * s + p**2 * t), (p**2 + q**2) * np.sqrt(1 + p**2 + q**2))
+
+        out_dict[parameter] = nan_to_nodata(out_array, nodata_value=out_nodata).astype(np.float32)
+
+    return out_dict
+
+
+def _surface_parameters_block(
+    block: np.ndarray,
+    parameters: Sequence[str],
+    cellsize: Number,
+    scaling_factor: Number,
+    slope_tolerance: Number,
+    slope_gradient_unit: str,
+    slope_direction_unit: str,
+    method: str,
+) -> np.ndarray:
+    coefficients = _surface_coefficients(block, cellsize, scaling_factor, method)
+    out_arrays = _derive_surface_parameters(
+        parameters, coefficients, slope_tolerance, slope_gradient_unit, slope_direction_unit
+    )
+    return np.stack([out_arrays[parameter] for parameter in parameters])
+
+
+def _surface_parameters_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    parameters: Sequence[str],
+    scaling_factor: Number,
+    slope_tolerance: Number,
+    slope_gradient_unit: str,
+    slope_direction_unit: str,
+    method: str,
+    block_size: int,
+    n_workers: Optional[int],
+) -> dict:
+    """Write the surface attributes block by block as bands of one GeoTIFF, named after the parameters."""
+    block_function = partial(
+        _surface_parameters_block,
+        parameters=list(parameters),
+        cellsize=raster.res[0],
+        scaling_factor=scaling_factor,
+        slope_tolerance=slope_tolerance,
+        slope_gradient_unit=slope_gradient_unit,
+        slope_direction_unit=slope_direction_unit,
+        method=method,
+    )
+
+    out_profile = get_block_output_profile(raster, count=len(parameters), dtype="float32")
+    out_profile.update({"nodata": -9999})
+
+    # The 3x3 kernels of all methods need a one pixel halo
+    out_profile = process_raster_by_blocks(
+        raster, output_raster, block_function, 1, block_size, out_profile=out_profile, n_workers=n_workers
+    )
+
+    with rasterio.open(output_raster, "r+") as dst:
+        dst.descriptions = tuple(parameters)
+
+    return out_profile
 
 
 @beartype
@@ -128,49 +269,17 @@ def first_order(
         NonSquarePixelSizeException: Pixel dimensions do not have same length.
         InvalidParameterValueException: Wrong input parameters provided.
     """
-    if raster.count > 1:
-        raise InvalidRasterBandException("Only one-band raster supported.")
+    _check_surface_raster(raster, scaling_factor)
 
-    if check_quadratic_pixels(raster) is False:
-        raise NonSquarePixelSizeException("Processing requires quadratic pixel dimensions.")
-
-    if scaling_factor <= 0:
-        raise InvalidParameterValueException("Value must be greater than 0.")
-
-    raster_array = raster.read()
-    raster_array = reduce_ndim(raster_array)
-    raster_array = nodata_to_nan(raster_array, nodata_value=raster.nodata)
-    raster_array = _scale_raster(raster_array, scaling_factor)
-
-    cellsize = raster.res[0]
-    p, q, *_ = _coefficients(raster_array, cellsize, method)
-    q = -q if method == "Horn" else q
-
-    slope_gradient = _first_order("G", (p, q)) if slope_tolerance > 0 else (p, q)
+    coefficients = _surface_coefficients(_read_surface(raster), raster.res[0], scaling_factor, method)
+    out_arrays = _derive_surface_parameters(
+        parameters, coefficients, slope_tolerance, slope_gradient_unit, slope_direction_unit
+    )
 
     out_dict = {}
-    out_nodata = -9999
-    for parameter in parameters:
-        out_array = (
-            slope_gradient
-            if parameter == "G" and isinstance(slope_gradient, np.ndarray)
-            else _first_order(parameter, (p, q))
-        )
-
-        if (parameter == "G" and slope_gradient_unit == "degrees") or (
-            parameter == "A" and slope_direction_unit == "degrees"
-        ):
-            out_array = convert_rad_to_deg(out_array)
-        elif parameter == "G" and slope_gradient_unit == "rise":
-            out_array = convert_rad_to_rise(out_array)
-
-        out_array = (
-            _set_flat_pixels(out_array, slope_gradient, slope_tolerance, parameter) if parameter != "G" else out_array
-        )
-
-        out_array = nan_to_nodata(out_array, nodata_value=out_nodata).astype(np.float32)
+    for parameter, out_array in out_arrays.items():
         out_meta = raster.meta.copy()
-        out_meta.update({"dtype": out_array.dtype.name, "nodata": out_nodata})
+        out_meta.update({"dtype": out_array.dtype.name, "nodata": -9999})
         out_dict[parameter] = (out_array, out_meta)
 
     return out_dict
@@ -228,32 +337,274 @@ def second_order_basic_set(
         NonSquarePixelSizeException: Pixel dimensions do not have same length.
         InvalidParameterValueException: Wrong input parameters provided.
     """
-    if raster.count > 1:
-        raise InvalidRasterBandException("Only one-band raster supported.")
+    _check_surface_raster(raster, scaling_factor)
 
-    if check_quadratic_pixels(raster) is False:
-        raise NonSquarePixelSizeException("Processing requires quadratic pixel dimensions.")
-
-    if scaling_factor <= 0:
-        raise InvalidParameterValueException("Value must be greater than 0.")
-
-    raster_array = raster.read()
-    raster_array = reduce_ndim(raster_array)
-    raster_array = nodata_to_nan(raster_array, nodata_value=raster.nodata)
-    raster_array = _scale_raster(raster_array, scaling_factor)
-
-    cellsize = raster.res[0]
-    p, q, r, s, t = _coefficients(raster_array, cellsize, method)
-    slope_gradient = _first_order("G", (p, q)) if slope_tolerance > 0 else (p, q)
+    coefficients = _surface_coefficients(_read_surface(raster), raster.res[0], scaling_factor, method)
+    out_arrays = _derive_surface_parameters(parameters, coefficients, slope_tolerance, "radians", "radians")
 
     out_dict = {}
-    out_nodata = -9999
-    for parameter in parameters:
-        out_array = _second_order_basic_set(parameter, (p, q, r, s, t))
-        out_array = _set_flat_pixels(out_array, slope_gradient, slope_tolerance, parameter)
-        out_array = nan_to_nodata(out_array, nodata_value=out_nodata).astype(np.float32)
+    for parameter, out_array in out_arrays.items():
         out_meta = raster.meta.copy()
-        out_meta.update({"dtype": out_array.dtype.name, "nodata": out_nodata})
+        out_meta.update({"dtype": out_array.dtype.name, "nodata": -9999})
         out_dict[parameter] = (out_array, out_meta)
 
     return out_dict
+
+
+@beartype
+def surface_parameters(
+    raster: rasterio.io.DatasetReader,
+    parameters: Sequence[
+        Literal[
+            "G",
+            "A",
+            "planc",
+            "profc",
+            "profc_min",
+            "profc_max",
+            "longc",
+            "crosc",
+            "rot",
+            "K",
+            "genc",
+            "tangc",
+        ]
+    ],
+    scaling_factor: Optional[Number] = 1,
+    slope_tolerance: Optional[Number] = 0,
+    slope_gradient_unit: Literal["degrees", "radians", "rise"] = "radians",
+    slope_direction_unit: Literal["degrees", "radians"] = "radians",
+    method: Literal["Horn", "Evans", "Young", "Zevenbergen"] = "Young",
+) -> tuple[np.ndarray, dict]:
+    """Calculate first and second order surface attributes into one multiband array.
+
+    The partial derivatives are calculated once and shared by all the requested attributes, instead of
+    once for each call of `first_order` and `second_order_basic_set`. The results equal those of the
+    separate functions with the same method.
+
+    Args:
+        raster: Input raster.
+        parameters: List of surface parameters to be calculated, in the order of the output bands.
+        scaling_factor: Scaling factor to be applied to the raster data set. Default to 1.
+        slope_tolerance: Tolerance value for flat pixels. Default to 0.
+        slope_gradient_unit: Unit of the slope gradient parameter. Default to radians.
+        slope_direction_unit: Unit of the slope direction parameter. Default to radians.
+        method: Method for calculating the coefficients. The Horn (1981) method supports only the first order
+            parameters. Default to the Young (1978) method.
+
+    Returns:
+        The surface attributes as bands of one array and the updated metadata.
+
+    Raises:
+        InvalidRasterBandException: Raster has more than one band.
+        NonSquarePixelSizeException: Pixel dimensions do not have same length.
+        InvalidParameterValueException: Wrong input parameters provided.
+    """
+    _check_surface_raster(raster, scaling_factor)
+    _check_surface_parameters(parameters, method)
+
+    coefficients = _surface_coefficients(_read_surface(raster), raster.res[0], scaling_factor, method)
+    out_arrays = _derive_surface_parameters(
+        parameters, coefficients, slope_tolerance, slope_gradient_unit, slope_direction_unit
+    )
+
+    out_array = np.stack([out_arrays[parameter] for parameter in parameters])
+    out_meta = raster.meta.copy()
+    out_meta.update({"count": len(parameters), "dtype": out_array.dtype.name, "nodata": -9999})
+
+    return out_array, out_meta
+
+
+@beartype
+def first_order_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    parameters: Sequence[Literal["G", "A"]],
+    scaling_factor: Optional[Number] = 1,
+    slope_tolerance: Optional[Number] = 0,
+    slope_gradient_unit: Literal["degrees", "radians", "rise"] = "radians",
+    slope_direction_unit: Literal["degrees", "radians"] = "radians",
+    method: Literal["Horn", "Evans", "Young", "Zevenbergen"] = "Horn",
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """Calculate the first order surface attributes block by block and write them to a GeoTIFF.
+
+    Blocks are read with a one pixel halo, so the output matches first_order while memory use depends only
+    on the block size. The attributes are written as bands of one tiled and compressed GeoTIFF in the order
+    of the parameters, with the parameter names as band descriptions.
+
+    Args:
+        raster: Input raster.
+        output_raster: Path of the output GeoTIFF.
+        parameters: List of surface parameters to be calculated.
+        scaling_factor: Scaling factor to be applied to the raster data set. Default to 1.
+        slope_tolerance: Tolerance value for flat pixels. Default to 0.
+        slope_gradient_unit: Unit of the slope gradient parameter. Default to radians.
+        slope_direction_unit: Unit of the slope direction parameter. Default to radians.
+        method: Method for calculating the coefficients. Default to the Horn (1981) method.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: Raster has more than one band.
+        NonSquarePixelSizeException: Pixel dimensions do not have same length.
+        InvalidParameterValueException: Wrong input parameters provided.
+    """
+    _check_surface_raster(raster, scaling_factor)
+    _check_surface_parameters(parameters, method)
+
+    return _surface_parameters_windowed(
+        raster,
+        output_raster,
+        parameters,
+        scaling_factor,
+        slope_tolerance,
+        slope_gradient_unit,
+        slope_direction_unit,
+        method,
+        block_size,
+        n_workers,
+    )
+
+
+@beartype
+def second_order_basic_set_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    parameters: Sequence[
+        Literal[
+            "planc",
+            "profc",
+            "profc_min",
+            "profc_max",
+            "longc",
+            "crosc",
+            "rot",
+            "K",
+            "genc",
+            "tangc",
+        ]
+    ],
+    scaling_factor: Optional[Number] = 1,
+    slope_tolerance: Optional[Number] = 0,
+    method: Literal["Evans", "Young", "Zevenbergen"] = "Young",
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """Calculate the second order surface attributes block by block and write them to a GeoTIFF.
+
+    Blocks are read with a one pixel halo, so the output matches second_order_basic_set while memory use
+    depends only on the block size. The attributes are written as bands of one tiled and compressed GeoTIFF
+    in the order of the parameters, with the parameter names as band descriptions.
+
+    Args:
+        raster: Input raster.
+        output_raster: Path of the output GeoTIFF.
+        parameters: List of surface parameters to be calculated.
+        scaling_factor: Scaling factor to be applied to the raster data set. Default to 1.
+        slope_tolerance: Tolerance value for flat pixels. Default to 0.
+        method: Method for calculating the coefficients. Default to the Young (1978) method.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: Raster has more than one band.
+        NonSquarePixelSizeException: Pixel dimensions do not have same length.
+        InvalidParameterValueException: Wrong input parameters provided.
+    """
+    _check_surface_raster(raster, scaling_factor)
+    _check_surface_parameters(parameters, method)
+
+    return _surface_parameters_windowed(
+        raster,
+        output_raster,
+        parameters,
+        scaling_factor,
+        slope_tolerance,
+        "radians",
+        "radians",
+        method,
+        block_size,
+        n_workers,
+    )
+
+
+@beartype
+def surface_parameters_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    parameters: Sequence[
+        Literal[
+            "G",
+            "A",
+            "planc",
+            "profc",
+            "profc_min",
+            "profc_max",
+            "longc",
+            "crosc",
+            "rot",
+            "K",
+            "genc",
+            "tangc",
+        ]
+    ],
+    scaling_factor: Optional[Number] = 1,
+    slope_tolerance: Optional[Number] = 0,
+    slope_gradient_unit: Literal["degrees", "radians", "rise"] = "radians",
+    slope_direction_unit: Literal["degrees", "radians"] = "radians",
+    method: Literal["Horn", "Evans", "Young", "Zevenbergen"] = "Young",
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """Calculate first and second order surface attributes block by block and write them to a GeoTIFF.
+
+    Blocks are read with a one pixel halo, so the output matches surface_parameters while memory use depends
+    only on the block size. The parameter names are written as band descriptions.
+
+    Args:
+        raster: Input raster.
+        output_raster: Path of the output GeoTIFF.
+        parameters: List of surface parameters to be calculated, in the order of the output bands.
+        scaling_factor: Scaling factor to be applied to the raster data set. Default to 1.
+        slope_tolerance: Tolerance value for flat pixels. Default to 0.
+        slope_gradient_unit: Unit of the slope gradient parameter. Default to radians.
+        slope_direction_unit: Unit of the slope direction parameter. Default to radians.
+        method: Method for calculating the coefficients. The Horn (1981) method supports only the first order
+            parameters. Default to the Young (1978) method.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: Raster has more than one band.
+        NonSquarePixelSizeException: Pixel dimensions do not have same length.
+        InvalidParameterValueException: Wrong input parameters provided.
+    """
+    _check_surface_raster(raster, scaling_factor)
+    _check_surface_parameters(parameters, method)
+
+    return _surface_parameters_windowed(
+        raster,
+        output_raster,
+        parameters,
+        scaling_factor,
+        slope_tolerance,
+        slope_gradient_unit,
+        slope_direction_unit,
+        method,
+        block_size,
+        n_workers,
+    )
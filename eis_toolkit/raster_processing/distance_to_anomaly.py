@@ -8,7 +8,8 @@ import numpy as np
 import rasterio
 from beartype import beartype
 from beartype.typing import Literal, Optional, Tuple, Union
-from rasterio import profiles
+from rasterio import profiles, transform
+from scipy.ndimage import distance_transform_edt
 
 from eis_toolkit.exceptions import EmptyDataException, InvalidParameterValueException
 from eis_toolkit.utilities.checks.raster import check_raster_profile
@@ -49,6 +50,10 @@ def distance_to_anomaly(
     marked as anomalous (criteria text of "outside"). If anomaly_raster_profile does
     contain "nodata" key, np.nan is assumed to correspond to nodata values.
 
+    The distances are computed with a Euclidean distance transform of the
+    anomaly mask that uses the cell size of the raster, without creating
+    geometries of the anomalous cells.
+
     Args:
         anomaly_raster_profile: The raster profile in which the distances
             to the nearest anomalous value are determined.
@@ -220,8 +225,31 @@ def _distance_to_anomaly(
             )
         )
 
-    cols = np.arange(anomaly_raster_data.shape[1])
-    rows = np.arange(anomaly_raster_data.shape[0])
+    raster_transform = anomaly_raster_profile["transform"]
+    if not _has_orthogonal_axes(raster_transform):
+        return _distance_to_anomaly_points(
+            anomaly_raster_profile=anomaly_raster_profile, data_fits_criteria=data_fits_criteria
+        )
+
+    # Distances between cell centers along the rows and the columns of the raster
+    cell_sizes = (np.hypot(raster_transform.b, raster_transform.e), np.hypot(raster_transform.a, raster_transform.d))
+
+    return distance_transform_edt(np.logical_not(data_fits_criteria), sampling=cell_sizes)
+
+
+def _has_orthogonal_axes(raster_transform: transform.Affine) -> bool:
+    return np.isclose(
+        raster_transform.a * raster_transform.b + raster_transform.d * raster_transform.e,
+        0.0,
+        atol=1e-9 * abs(raster_transform.determinant),
+    )
+
+
+def _distance_to_anomaly_points(
+    anomaly_raster_profile: Union[profiles.Profile, dict], data_fits_criteria: np.ndarray
+) -> np.ndarray:
+    cols = np.arange(data_fits_criteria.shape[1])
+    rows = np.arange(data_fits_criteria.shape[0])
 
     all_points_by_rows = [
         row_points(row=row, cols=cols[data_fits_criteria[row]], raster_transform=anomaly_raster_profile["transform"])
@@ -1,44 +1,60 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import rasterio
 from beartype import beartype
-from beartype.typing import Optional, Sequence
+from beartype.typing import List, Optional, Sequence
 
-from eis_toolkit.exceptions import NonMatchingParameterLengthsException
+from eis_toolkit.exceptions import InvalidParameterValueException, NonMatchingParameterLengthsException
+from eis_toolkit.utilities.point_sampling import sample_raster_points
+
+
+def _band_column_names(
+    raster: rasterio.io.DatasetReader, raster_index: int, raster_column_names: Optional[Sequence[str]]
+) -> List[str]:
+    if raster_column_names is not None:
+        base_name = str(raster_column_names[raster_index])
+    else:
+        base_name = os.path.splitext(raster.name)[0].rsplit("/", 1)[-1]
+
+    if raster.count > 1:
+        return [base_name + "_" + str(band_number + 1) for band_number in range(raster.count)]
+    return [base_name]
 
 
 def _extract_values_from_raster(
     raster_list: Sequence[rasterio.io.DatasetReader],
     geodataframe: gpd.GeoDataFrame,
     raster_column_names: Optional[Sequence[str]],
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
 ) -> pd.DataFrame:
 
-    data_frame = pd.DataFrame()
+    x = geodataframe.geometry.x.to_numpy()
+    y = geodataframe.geometry.y.to_numpy()
 
-    points = geodataframe["geometry"].apply(lambda point: (point.xy[0][0], point.xy[1][0]))
+    columns = {"x": x, "y": y}
 
-    data_frame["x"] = points.apply(lambda point: (point[0]))
-    data_frame["y"] = points.apply(lambda point: (point[1]))
+    def _sample_reopened(raster: rasterio.io.DatasetReader) -> np.ndarray:
+        # Datasets are not safe to share between threads, so each worker reads through its own handle
+        with rasterio.open(raster.name) as worker_raster:
+            return sample_raster_points(worker_raster, x, y, block_size)
 
-    for i, raster in enumerate(raster_list):
-        raster_values = [value for value in raster.sample(zip(data_frame["x"], data_frame["y"]))]
+    # GDAL releases the GIL while reading, so rasters are sampled in parallel threads
+    if n_workers is None or n_workers == 1:
+        raster_values = [sample_raster_points(raster, x, y, block_size) for raster in raster_list]
+    else:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            raster_values = list(executor.map(_sample_reopened, raster_list))
 
-        for band_number in range(raster.count):
-            if raster_column_names is not None:
-                if raster.count > 1:
-                    band_column_name = str(raster_column_names[i]) + "_" + str(band_number + 1)
-                else:
-                    band_column_name = str(raster_column_names[i])
-            else:
-                if raster.count > 1:
-                    band_column_name = os.path.splitext(raster.name)[0].rsplit("/", 1)[-1] + "_" + str(band_number + 1)
-                else:
-                    band_column_name = os.path.splitext(raster.name)[0].rsplit("/", 1)[-1]
-            data_frame[band_column_name] = [array[band_number] for array in raster_values]
+    for i, (raster, values) in enumerate(zip(raster_list, raster_values)):
+        for band_column_name, band_values in zip(_band_column_names(raster, i, raster_column_names), values):
+            columns[band_column_name] = band_values
 
-    return data_frame
+    return pd.DataFrame(columns, index=geodataframe.index)
 
 
 @beartype
@@ -46,6 +62,8 @@ def extract_values_from_raster(
     raster_list: Sequence[rasterio.io.DatasetReader],
     geodataframe: gpd.GeoDataFrame,
     raster_column_names: Optional[Sequence[str]] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
 ) -> pd.DataFrame:
     """Extract raster values using point data to a DataFrame.
 
@@ -53,16 +71,24 @@ def extract_values_from_raster(
        and file_name_bandnumber for multiband files. If custom column names are given, there
        should be column names for each raster provided in the raster list.
 
+       The points are grouped by raster block and each block with points is read only once.
+       Points outside a raster get its nodata value, or 0 if the raster has no nodata value.
+
     Args:
         raster_list: List to extract values from.
         geodataframe: Object to extract values with.
         raster_column_names: List of optional column names for bands.
+        block_size: Height and width of the raster blocks the points are grouped by in pixels. Defaults to 1024.
+        n_workers: Number of worker threads sampling the rasters. Each thread opens its own handle to the
+            raster it samples, so the rasters need to be readable again by their name. Defaults to None,
+            which samples the rasters sequentially through the given datasets.
 
     Returns:
         Dataframe with x & y coordinates and the values from the raster file(s) as columns.
 
     Raises:
         NonMatchingParameterLengthsException: raster_list and raster_columns_names have different lengths.
+        InvalidParameterValueException: Block size or number of workers is not positive.
     """
     if raster_column_names == []:
         raster_column_names = None
@@ -70,8 +96,18 @@ def extract_values_from_raster(
     if raster_column_names is not None and len(raster_list) != len(raster_column_names):
         raise NonMatchingParameterLengthsException("Raster list and raster columns names have different lengths.")
 
+    if block_size < 1:
+        raise InvalidParameterValueException("Block size must be a positive integer.")
+
+    if n_workers is not None and n_workers < 1:
+        raise InvalidParameterValueException("Number of workers must be a positive integer.")
+
     data_frame = _extract_values_from_raster(
-        raster_list=raster_list, geodataframe=geodataframe, raster_column_names=raster_column_names
+        raster_list=raster_list,
+        geodataframe=geodataframe,
+        raster_column_names=raster_column_names,
+        block_size=block_size,
+        n_workers=n_workers,
     )
 
     return data_frame
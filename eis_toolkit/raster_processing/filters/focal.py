@@ -1,4 +1,6 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import rasterio
@@ -11,6 +13,7 @@ from eis_toolkit.raster_processing.filters.utilities import (
     _apply_generic_filter,
     _check_inputs,
 )
+from eis_toolkit.utilities.blockwise import process_raster_by_blocks
 from eis_toolkit.utilities.miscellaneous import cast_array_to_float, reduce_ndim
 from eis_toolkit.utilities.nodata import nan_to_nodata, nodata_to_nan
 
@@ -169,3 +172,150 @@ def mexican_hat_filter(
     out_meta = raster.meta.copy()
 
     return out_array, out_meta
+
+
+@beartype
+def focal_filter_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    method: Literal["mean", "median"] = "mean",
+    size: int = 3,
+    shape: Literal["square", "circle"] = "circle",
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a basic focal filter to the input raster block by block and write the result to a GeoTIFF.
+
+    Blocks are read with a halo of the kernel radius, so the output matches focal_filter
+    while memory use depends only on the block size.
+
+    Args:
+        raster: The input raster dataset.
+        output_raster: Path of the output GeoTIFF.
+        method: The method to use for filtering. Can be either "mean" or "median". Default to "mean".
+        size: The size of the filter window. E.g., 3 means a 3x3 window. Default to 3.
+        shape: The shape of the filter window. Can be either "square" or "circle". Default to "circle".
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: If the input raster has more than one band.
+        InvalidParameterValueException: If the filter size is smaller than 3.
+            If the filter size is not an odd number.
+            If the block size or the number of workers is not positive.
+    """
+    _check_inputs(raster, size)
+
+    kernel = _basic_kernel(size, shape)
+
+    if method == "mean":
+        block_function = partial(_apply_correlated_filter, kernel=kernel)
+    elif method == "median":
+        block_function = partial(_apply_generic_filter, filter_fn=_focal_median, kernel=kernel)
+
+    return process_raster_by_blocks(
+        raster, output_raster, block_function, kernel.shape[0] // 2, block_size, n_workers=n_workers
+    )
+
+
+@beartype
+def gaussian_filter_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    sigma: Number = 1,
+    truncate: Number = 4,
+    size: Optional[int] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a gaussian filter to the input raster block by block and write the result to a GeoTIFF.
+
+    Blocks are read with a halo of the kernel radius, so the output matches gaussian_filter
+    while memory use depends only on the block size.
+
+    Args:
+        raster: The input raster dataset.
+        output_raster: Path of the output GeoTIFF.
+        sigma: The standard deviation of the gaussian kernel.
+        truncate: The truncation factor for the gaussian kernel based on the sigma value.
+            Only if size is not given. Default to 4.0.
+        size: The size of the filter window. E.g., 3 means a 3x3 window.
+            If size is not None, it overrides the dynamic size calculation based on sigma and truncate.
+            Default to None.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: If the input raster has more than one band.
+        InvalidParameterValueException: If the filter size is smaller than 3.
+            If the filter size is not an odd number.
+            If the resulting radius is smaller than 1.
+            If the block size or the number of workers is not positive.
+    """
+    _check_inputs(raster, size, sigma, truncate)
+
+    kernel = _gaussian_kernel(sigma, truncate, size)
+    block_function = partial(_apply_correlated_filter, kernel=kernel)
+
+    return process_raster_by_blocks(
+        raster, output_raster, block_function, kernel.shape[0] // 2, block_size, n_workers=n_workers
+    )
+
+
+@beartype
+def mexican_hat_filter_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    sigma: Number = 1,
+    truncate: Number = 4,
+    size: Optional[int] = None,
+    direction: Literal["rectangular", "circular"] = "circular",
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a mexican hat filter to the input raster block by block and write the result to a GeoTIFF.
+
+    Blocks are read with a halo of the kernel radius, so the output matches mexican_hat_filter
+    while memory use depends only on the block size.
+
+    Args:
+        raster: The input raster dataset.
+        output_raster: Path of the output GeoTIFF.
+        sigma: The standard deviation.
+        truncate: The truncation factor. Default to 4.0.
+        size: The size of the filter window. E.g., 3 means a 3x3 window. Default to None.
+        direction: The direction of calculating the kernel values.
+            Can be either "rectangular" or "circular". Default to "circular".
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: If the input raster has more than one band.
+        InvalidParameterValueException: If the filter size is smaller than 3.
+            If the filter size is not an odd number.
+            If the resulting radius is smaller than 1.
+            If the block size or the number of workers is not positive.
+    """
+    _check_inputs(raster, size, sigma, truncate)
+
+    kernel = _mexican_hat_kernel(sigma, truncate, size, direction)
+    block_function = partial(_apply_correlated_filter, kernel=kernel)
+
+    return process_raster_by_blocks(
+        raster, output_raster, block_function, kernel.shape[0] // 2, block_size, n_workers=n_workers
+    )
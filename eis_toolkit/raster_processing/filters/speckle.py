@@ -1,245 +1,235 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import rasterio
 from beartype import beartype
+from beartype.typing import Optional
 
-from eis_toolkit.raster_processing.filters.utilities import _apply_generic_filter, _check_inputs
+from eis_toolkit.raster_processing.filters.utilities import _check_inputs, _iterate_kernel_offsets, _local_moments
+from eis_toolkit.utilities.blockwise import process_raster_by_blocks
 from eis_toolkit.utilities.miscellaneous import cast_array_to_float, reduce_ndim
 from eis_toolkit.utilities.nodata import nan_to_nodata, nodata_to_nan
 
 
 @beartype
-def _lee_additive_noise(window: np.ndarray, add_noise_var: Number) -> Number:
+def _lee_additive_noise(array: np.ndarray, kernel: np.ndarray, add_noise_var: Number) -> np.ndarray:
     """
-    Calculate the weighted value for a Lee filter (additive noise) from a window of pixels.
+    Calculate the weighted values for a Lee filter (additive noise) for the whole array.
 
     Args:
-        window: The moving window of pixels.
+        array: The input array.
+        kernel: The footprint of the moving window.
         add_noise_var: The variance of the additive noise.
 
     Returns:
-        The filtered value.
+        The filtered array.
     """
-    p_center = window[window.shape[0] // 2]
-
-    if not np.isnan(p_center):
-        local_var = np.nanvar(window)
-        local_mean = np.nanmean(window)
+    local_mean, local_var = _local_moments(array, kernel)
 
+    with np.errstate(divide="ignore", invalid="ignore"):
         weight = local_var / (local_var + add_noise_var)
-        weighted_value = local_mean + weight * (p_center - local_mean)
-    else:
-        weighted_value = np.nan
+        weighted_array = local_mean + weight * (array - local_mean)
 
-    return weighted_value
+    return np.where(np.isnan(array), np.nan, weighted_array)
 
 
 @beartype
-def _lee_multiplicative_noise(window: np.ndarray, mult_noise_mean: Number, n_looks: int) -> Number:
+def _lee_multiplicative_noise(
+    array: np.ndarray, kernel: np.ndarray, mult_noise_mean: Number, n_looks: int
+) -> np.ndarray:
     """
-    Calculate the weighted value for a Lee filter (multiplicative noise) from a window of pixels.
+    Calculate the weighted values for a Lee filter (multiplicative noise) for the whole array.
 
     Args:
-        window: The moving window of pixels.
+        array: The input array.
+        kernel: The footprint of the moving window.
         mult_noise_mean: The mean of the multiplicative noise.
         n_looks: Number of looks to estimate the noise variation.
 
     Returns:
-        The filtered value.
+        The filtered array.
     """
-    p_center = window[window.shape[0] // 2]
-
-    if not np.isnan(p_center):
-        local_var = np.nanvar(window)
-        local_mean = np.nanmean(window)
+    local_mean, local_var = _local_moments(array, kernel)
 
-        mult_noise_var = 1 / n_looks
+    mult_noise_var = 1 / n_looks
 
-        numerator = mult_noise_mean * local_var
-        denumerator = (mult_noise_var * local_mean**2) + (local_var * mult_noise_mean**2)
+    numerator = mult_noise_mean * local_var
+    denumerator = (mult_noise_var * local_mean**2) + (local_var * mult_noise_mean**2)
 
-        weight = numerator / denumerator if (numerator != 0 and denumerator != 0) else 0
-        weighted_value = local_mean + weight * (p_center - (mult_noise_mean * local_mean))
-    else:
-        weighted_value = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = np.where((numerator != 0) & (denumerator != 0), numerator / denumerator, 0)
+        weighted_array = local_mean + weight * (array - (mult_noise_mean * local_mean))
 
-    return weighted_value
+    return np.where(np.isnan(array), np.nan, weighted_array)
 
 
 @beartype
 def _lee_additive_multiplicative_noise(
-    window: np.ndarray, add_noise_var: Number, add_noise_mean: Number, mult_noise_mean: Number
-) -> Number:
+    array: np.ndarray, kernel: np.ndarray, add_noise_var: Number, add_noise_mean: Number, mult_noise_mean: Number
+) -> np.ndarray:
     """
-    Calculate the weighted value for a Lee filter (additive and multiplicative noise) from a window of pixels.
+    Calculate the weighted values for a Lee filter (additive and multiplicative noise) for the whole array.
 
     Args:
-        window: The moving window of pixels.
+        array: The input array.
+        kernel: The footprint of the moving window.
         add_noise_var: The variance of the additive noise.
         add_noise_mean: The mean of the additive noise.
         mult_noise_mean: The mean of the multiplicative noise.
 
     Returns:
-        The filtered value.
+        The filtered array.
     """
-    p_center = window[window.shape[0] // 2]
+    local_mean, local_var = _local_moments(array, kernel)
+    local_sd = np.sqrt(local_var)
 
-    if not np.isnan(p_center):
-        local_var = np.nanvar(window)
-        local_sd = np.nanstd(window)
-        local_mean = np.nanmean(window)
-
-        mult_noise_var = np.power((local_sd / local_mean), 2) if (local_sd != 0 and local_mean != 0) else 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mult_noise_var = np.where((local_sd != 0) & (local_mean != 0), np.power(local_sd / local_mean, 2), 0)
         weight = (mult_noise_mean * local_var) / (
             (mult_noise_var * local_mean**2) + (local_var * mult_noise_mean**2) + add_noise_var
         )
-        weighted_value = local_mean + weight * (p_center - (mult_noise_mean * local_mean) - add_noise_mean)
-    else:
-        weighted_value = np.nan
+        weighted_array = local_mean + weight * (array - (mult_noise_mean * local_mean) - add_noise_mean)
 
-    return weighted_value
+    return np.where(np.isnan(array), np.nan, weighted_array)
 
 
 @beartype
-def _lee_enhanced(window: np.ndarray, n_looks: int, damping_factor: Number) -> Number:
+def _lee_enhanced(array: np.ndarray, kernel: np.ndarray, n_looks: int, damping_factor: Number) -> np.ndarray:
     """
-    Calculate the weighted value for a Lee enhanced filter from a window of pixels.
+    Calculate the weighted values for a Lee enhanced filter for the whole array.
 
     Args:
-        window: The moving window of pixels.
+        array: The input array.
+        kernel: The footprint of the moving window.
         n_looks: Number of looks to estimate the noise variation.
         damping_factor: Damping effect on filtering.
 
     Returns:
-        The filtered value.
+        The filtered array.
     """
-    p_center = window[window.shape[0] // 2]
-
-    if not np.isnan(p_center):
-        local_sd = np.nanstd(window)
-        local_mean = np.nanmean(window)
+    local_mean, local_var = _local_moments(array, kernel)
+    local_sd = np.sqrt(local_var)
 
-        noise_sd = np.sqrt(1 / n_looks)
-        variation = local_sd / local_mean if (local_sd != 0 and local_mean != 0) else 0
-        noise_sd_max = np.sqrt(1 + 2 / n_looks)
+    noise_sd = np.sqrt(1 / n_looks)
+    noise_sd_max = np.sqrt(1 + 2 / n_looks)
 
-        exponent = (
-            -damping_factor * (variation - noise_sd) / (noise_sd_max - variation) if noise_sd_max != variation else 0
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        variation = np.where((local_sd != 0) & (local_mean != 0), local_sd / local_mean, 0)
+        exponent = np.where(
+            noise_sd_max != variation, -damping_factor * (variation - noise_sd) / (noise_sd_max - variation), 0
         )
         weight = np.exp(exponent)
 
-        if variation <= noise_sd:
-            weighted_value = local_mean
-        elif noise_sd < variation < noise_sd_max:
-            weighted_value = (local_mean * weight) + p_center * (1 - weight)
-        elif variation >= noise_sd_max:
-            weighted_value = p_center
-    else:
-        weighted_value = np.nan
+        weighted_array = np.select(
+            [variation <= noise_sd, variation < noise_sd_max],
+            [local_mean, (local_mean * weight) + array * (1 - weight)],
+            default=array,
+        )
 
-    return weighted_value
+    return np.where(np.isnan(array), np.nan, weighted_array)
 
 
-def _gamma(window: np.ndarray, n_looks: int) -> np.ndarray:
+@beartype
+def _gamma(array: np.ndarray, kernel: np.ndarray, n_looks: int) -> np.ndarray:
     """
-    Calculate the weighted value for a Gamma filter from a window of pixels.
+    Calculate the weighted values for a Gamma filter for the whole array.
 
     Args:
-        window: The moving window of pixels.
+        array: The input array.
+        kernel: The footprint of the moving window.
         n_looks: Number of looks to estimate the noise variation.
 
     Returns:
-        The filtered value.
+        The filtered array.
     """
-    p_center = window[window.shape[0] // 2]
+    local_mean, local_var = _local_moments(array, kernel)
+    local_sd = np.sqrt(local_var)
 
-    if not np.isnan(p_center):
-        local_sd = np.nanstd(window)
-        local_mean = np.nanmean(window)
+    noise_sd = np.sqrt(1 / n_looks)
+    noise_sd_max = np.sqrt(2) * noise_sd
 
-        noise_sd = np.sqrt(1 / n_looks)
-        variation = local_sd / local_mean if (local_sd != 0 and local_mean != 0) else 0
-        noise_sd_max = np.sqrt(2) * noise_sd
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variation = np.where((local_sd != 0) & (local_mean != 0), local_sd / local_mean, 0)
 
         factor_a = (1 + noise_sd**2) / (variation**2 - noise_sd**2)
         factor_b = factor_a - (n_looks - 1)
-        factor_d = local_mean**2 * factor_b**2 + 4 * factor_a * n_looks * local_mean * p_center
+        factor_d = local_mean**2 * factor_b**2 + 4 * factor_a * n_looks * local_mean * array
 
-        if variation <= noise_sd:
-            weighted_value = local_mean
-        elif noise_sd < variation < noise_sd_max:
-            weighted_value = (factor_b * local_mean + np.sqrt(factor_d)) / (2 * factor_a)
-        elif variation >= noise_sd_max:
-            weighted_value = p_center
-    else:
-        weighted_value = np.nan
+        weighted_array = np.select(
+            [variation <= noise_sd, variation < noise_sd_max],
+            [local_mean, (factor_b * local_mean + np.sqrt(factor_d)) / (2 * factor_a)],
+            default=array,
+        )
 
-    return weighted_value
+    return np.where(np.isnan(array), np.nan, weighted_array)
 
 
 @beartype
-def _frost(window: np.ndarray, damping_factor: Number) -> Number:
+def _frost(array: np.ndarray, kernel: np.ndarray, damping_factor: Number) -> np.ndarray:
     """
-    Calculate the weighted value for a Frost filter from a window of pixels.
+    Calculate the weighted values for a Frost filter for the whole array.
+
+    The weights depend on the distance to the center value, so they are accumulated
+    over the kernel offsets instead of a single convolution.
 
     Args:
-        window: The moving window of pixels.
+        array: The input array.
+        kernel: The footprint of the moving window.
         damping_factor: Damping effect on filtering.
 
     Returns:
-        The filtered value.
+        The filtered array.
     """
-    p_center = window[window.shape[0] // 2]
+    local_mean, local_var = _local_moments(array, kernel)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled_var = np.where((local_var != 0) & (local_mean != 0), local_var / local_mean**2, 0)
+    factor_b = damping_factor * scaled_var
 
-    if not np.isnan(p_center):
-        s_dist = np.abs(window - p_center)
-        local_var = np.nanvar(window)
-        local_mean = np.nanmean(window)
+    weighted_sum = np.zeros(array.shape)
+    weights_sum = np.zeros(array.shape)
 
-        scaled_var = local_var / local_mean**2 if (local_var != 0 and local_mean != 0) else 0
-        factor_b = damping_factor * scaled_var
-        array_weights = np.exp(-factor_b * s_dist)
+    for neighbours in _iterate_kernel_offsets(array, kernel):
+        valid = ~np.isnan(neighbours)
+        weights = np.exp(-factor_b * np.abs(neighbours - array))
+        weighted_sum += np.where(valid, neighbours * weights, 0)
+        weights_sum += np.where(valid, weights, 0)
 
-        weighted_array = window * array_weights
-        weighted_value = np.nansum(weighted_array) / np.nansum(array_weights)
-    else:
-        weighted_value = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weighted_array = weighted_sum / weights_sum
 
-    return weighted_value
+    return np.where(np.isnan(array), np.nan, weighted_array)
 
 
 @beartype
-def _kuan(window: np.ndarray, n_looks: int) -> Number:
+def _kuan(array: np.ndarray, kernel: np.ndarray, n_looks: int) -> np.ndarray:
     """
-    Calculate the weighted value for a Kuan filter from a window of pixels.
+    Calculate the weighted values for a Kuan filter for the whole array.
 
     Args:
-        window: The moving window of pixels.
+        array: The input array.
+        kernel: The footprint of the moving window.
         n_looks: Number of looks to estimate the noise variation.
 
     Returns:
-        The filtered value.
+        The filtered array.
     """
-    p_center = window[window.shape[0] // 2]
+    local_mean, local_var = _local_moments(array, kernel)
+    local_sd = np.sqrt(local_var)
 
-    if not np.isnan(p_center):
-        local_sd = np.nanstd(window)
-        local_mean = np.nanmean(window)
+    noise_sd = np.sqrt(1 / n_looks)
 
-        noise_sd = np.sqrt(1 / n_looks)
-        variation = local_sd / local_mean if (local_sd != 0 and local_mean != 0) else 0
-
-        if variation <= noise_sd:
-            weight = 0
-        else:
-            weight = (1 - (noise_sd**2 / variation**2)) / (1 + noise_sd**2) if variation != 0 else 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variation = np.where((local_sd != 0) & (local_mean != 0), local_sd / local_mean, 0)
+        weight = np.where(
+            (variation <= noise_sd) | (variation == 0), 0, (1 - (noise_sd**2 / variation**2)) / (1 + noise_sd**2)
+        )
 
-        weighted_value = (p_center * weight) + local_mean * (1 - weight)
-    else:
-        weighted_value = np.nan
+    weighted_array = (array * weight) + local_mean * (1 - weight)
 
-    return weighted_value
+    return np.where(np.isnan(array), np.nan, weighted_array)
 
 
 @beartype
@@ -275,7 +265,7 @@ def lee_additive_noise_filter(
     raster_array = reduce_ndim(raster_array)
 
     raster_array = nodata_to_nan(raster_array, raster.nodata)
-    out_array = _apply_generic_filter(raster_array, _lee_additive_noise, kernel, add_noise_var)
+    out_array = _lee_additive_noise(raster_array, kernel, add_noise_var)
     out_array = nan_to_nodata(out_array, raster.nodata)
 
     out_array = cast_array_to_float(out_array, cast_float=True)
@@ -320,7 +310,7 @@ def lee_multiplicative_noise_filter(
     raster_array = reduce_ndim(raster_array)
     raster_array = nodata_to_nan(raster_array, raster.nodata)
 
-    out_array = _apply_generic_filter(raster_array, _lee_multiplicative_noise, kernel, mult_noise_mean, n_looks)
+    out_array = _lee_multiplicative_noise(raster_array, kernel, mult_noise_mean, n_looks)
     out_array = nan_to_nodata(out_array, raster.nodata)
 
     out_array = cast_array_to_float(out_array, cast_float=True)
@@ -366,9 +356,7 @@ def lee_additive_multiplicative_noise_filter(
     raster_array = reduce_ndim(raster_array)
     raster_array = nodata_to_nan(raster_array, raster.nodata)
 
-    out_array = _apply_generic_filter(
-        raster_array, _lee_additive_multiplicative_noise, kernel, add_noise_var, add_noise_mean, mult_noise_mean
-    )
+    out_array = _lee_additive_multiplicative_noise(raster_array, kernel, add_noise_var, add_noise_mean, mult_noise_mean)
 
     out_array = nan_to_nodata(out_array, raster.nodata)
     out_array = cast_array_to_float(out_array, cast_float=True)
@@ -418,7 +406,7 @@ def lee_enhanced_filter(
     raster_array = reduce_ndim(raster_array)
     raster_array = nodata_to_nan(raster_array, raster.nodata)
 
-    out_array = _apply_generic_filter(raster_array, _lee_enhanced, kernel, n_looks, damping_factor)
+    out_array = _lee_enhanced(raster_array, kernel, n_looks, damping_factor)
     out_array = nan_to_nodata(out_array, raster.nodata)
 
     out_array = cast_array_to_float(out_array, cast_float=True)
@@ -463,7 +451,7 @@ def gamma_filter(
     raster_array = reduce_ndim(raster_array)
     raster_array = nodata_to_nan(raster_array, raster.nodata)
 
-    out_array = _apply_generic_filter(raster_array, _gamma, kernel, n_looks)
+    out_array = _gamma(raster_array, kernel, n_looks)
     out_array = nan_to_nodata(out_array, raster.nodata)
 
     out_array = cast_array_to_float(out_array, cast_float=True)
@@ -508,7 +496,7 @@ def frost_filter(
     raster_array = reduce_ndim(raster_array)
     raster_array = nodata_to_nan(raster_array, raster.nodata)
 
-    out_array = _apply_generic_filter(raster_array, _frost, kernel, damping_factor)
+    out_array = _frost(raster_array, kernel, damping_factor)
     out_array = nan_to_nodata(out_array, raster.nodata)
 
     out_array = cast_array_to_float(out_array, cast_float=True)
@@ -553,10 +541,334 @@ def kuan_filter(
     raster_array = reduce_ndim(raster_array)
     raster_array = nodata_to_nan(raster_array, raster.nodata)
 
-    out_array = _apply_generic_filter(raster_array, _kuan, kernel, n_looks)
+    out_array = _kuan(raster_array, kernel, n_looks)
     out_array = nan_to_nodata(out_array, raster.nodata)
 
     out_array = cast_array_to_float(out_array, cast_float=True)
     out_meta = raster.meta.copy()
 
     return out_array, out_meta
+
+
+@beartype
+def lee_additive_noise_filter_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    size: int = 3,
+    add_noise_var: Number = 0.25,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a Lee filter considering additive noise components block by block and write the result to a GeoTIFF.
+
+    Blocks are read with a halo of the window radius, so the output matches lee_additive_noise_filter
+    while memory use depends only on the block size.
+
+    Args:
+        raster: The input raster dataset.
+        output_raster: Path of the output GeoTIFF.
+        size: The size of the filter window.
+            E.g., 3 means a 3x3 window. Default to 3.
+        add_noise_var: The additive noise variation. Default to 0.25.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: If the input raster has more than one band.
+        InvalidParameterValueException: If the filter size is smaller than 3.
+            If the filter size is not an odd number.
+            If the block size or the number of workers is not positive.
+    """
+    _check_inputs(raster, size)
+
+    kernel = np.ones((size, size))
+    block_function = partial(_lee_additive_noise, kernel=kernel, add_noise_var=add_noise_var)
+
+    return process_raster_by_blocks(raster, output_raster, block_function, size // 2, block_size, n_workers=n_workers)
+
+
+@beartype
+def lee_multiplicative_noise_filter_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    size: int = 3,
+    mult_noise_mean: Number = 1,
+    n_looks: int = 1,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a Lee filter considering multiplicative noise components block by block and write the result to a GeoTIFF.
+
+    Blocks are read with a halo of the window radius, so the output matches lee_multiplicative_noise_filter
+    while memory use depends only on the block size.
+
+    Args:
+        raster: The input raster dataset.
+        output_raster: Path of the output GeoTIFF.
+        size: The size of the filter window.
+            E.g., 3 means a 3x3 window. Default to 3.
+        mult_noise_mean: The multiplative noise mean. Default to 1.
+        n_looks: Number of looks to estimate the noise variation.
+            Higher values result in higher smoothing. Default to 1.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: If the input raster has more than one band.
+        InvalidParameterValueException: If the filter size is smaller than 3.
+            If the filter size is not an odd number.
+            If the block size or the number of workers is not positive.
+    """
+    _check_inputs(raster, size, n_looks=n_looks)
+
+    kernel = np.ones((size, size))
+    block_function = partial(_lee_multiplicative_noise, kernel=kernel, mult_noise_mean=mult_noise_mean, n_looks=n_looks)
+
+    return process_raster_by_blocks(raster, output_raster, block_function, size // 2, block_size, n_workers=n_workers)
+
+
+@beartype
+def lee_additive_multiplicative_noise_filter_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    size: int = 3,
+    add_noise_var: Number = 0.25,
+    add_noise_mean: Number = 0,
+    mult_noise_mean: Number = 1,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a Lee filter considering additive and multiplicative noise block by block and write the result to a GeoTIFF.
+
+    Blocks are read with a halo of the window radius, so the output matches lee_additive_multiplicative_noise_filter
+    while memory use depends only on the block size.
+
+    Args:
+        raster: The input raster dataset.
+        output_raster: Path of the output GeoTIFF.
+        size: The size of the filter window.
+            E.g., 3 means a 3x3 window. Default to 3.
+        add_noise_var: The additive noise variation. Default to 0.25.
+        add_noise_mean: The additive noise mean. Default to 0.
+        mult_noise_mean: The multiplative noise mean. Default to 1.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: If the input raster has more than one band.
+        InvalidParameterValueException: If the filter size is smaller than 3.
+            If the filter size is not an odd number.
+            If the block size or the number of workers is not positive.
+    """
+    _check_inputs(raster, size)
+
+    kernel = np.ones((size, size))
+    block_function = partial(
+        _lee_additive_multiplicative_noise,
+        kernel=kernel,
+        add_noise_var=add_noise_var,
+        add_noise_mean=add_noise_mean,
+        mult_noise_mean=mult_noise_mean,
+    )
+
+    return process_raster_by_blocks(raster, output_raster, block_function, size // 2, block_size, n_workers=n_workers)
+
+
+@beartype
+def lee_enhanced_filter_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    size: int = 3,
+    n_looks: int = 1,
+    damping_factor: Number = 1.0,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply an enhanced Lee filter block by block and write the result to a GeoTIFF.
+
+    Blocks are read with a halo of the window radius, so the output matches lee_enhanced_filter
+    while memory use depends only on the block size.
+
+    Args:
+        raster: The input raster dataset.
+        output_raster: Path of the output GeoTIFF.
+        size: The size of the filter window.
+            E.g., 3 means a 3x3 window. Default to 3.
+        n_looks: Number of looks to estimate the noise variation.
+            Higher values result in higher smoothing.
+            Low values may result in focal mean filtering.
+            Default to 1.
+        damping_factor: Extent of exponential damping effect on filtering.
+            Larger damping values preserve edges better but smooths less.
+            Smaller values produce more smoothing.
+            Default to 1.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: If the input raster has more than one band.
+        InvalidParameterValueException: If the filter size is smaller than 3.
+            If the filter size is not an odd number.
+            If the block size or the number of workers is not positive.
+    """
+    _check_inputs(raster, size, n_looks=n_looks, damping_factor=damping_factor)
+
+    kernel = np.ones((size, size))
+    block_function = partial(_lee_enhanced, kernel=kernel, n_looks=n_looks, damping_factor=damping_factor)
+
+    return process_raster_by_blocks(raster, output_raster, block_function, size // 2, block_size, n_workers=n_workers)
+
+
+@beartype
+def gamma_filter_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    size: int = 3,
+    n_looks: int = 1,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a Gamma filter block by block and write the result to a GeoTIFF.
+
+    Blocks are read with a halo of the window radius, so the output matches gamma_filter
+    while memory use depends only on the block size.
+
+    Args:
+        raster: The input raster dataset.
+        output_raster: Path of the output GeoTIFF.
+        size: The size of the filter window.
+            E.g., 3 means a 3x3 window. Default to 3.
+        n_looks: Number of looks to estimate the noise variation.
+            Higher values result in higher smoothing.
+            Low values may result in focal mean filtering.
+            Default to 1.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: If the input raster has more than one band.
+        InvalidParameterValueException: If the filter size is smaller than 3.
+            If the filter size is not an odd number.
+            If the block size or the number of workers is not positive.
+    """
+    _check_inputs(raster, size, n_looks=n_looks)
+
+    kernel = np.ones((size, size))
+    block_function = partial(_gamma, kernel=kernel, n_looks=n_looks)
+
+    return process_raster_by_blocks(raster, output_raster, block_function, size // 2, block_size, n_workers=n_workers)
+
+
+@beartype
+def frost_filter_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    size: int = 3,
+    damping_factor: Number = 1.0,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a Frost filter block by block and write the result to a GeoTIFF.
+
+    Blocks are read with a halo of the window radius, so the output matches frost_filter
+    while memory use depends only on the block size.
+
+    Args:
+        raster: The input raster dataset.
+        output_raster: Path of the output GeoTIFF.
+        size: The size of the filter window.
+            E.g., 3 means a 3x3 window. Default to 3.
+        damping_factor: Extent of exponential damping effect on filtering.
+            Larger damping values preserve edges better but smooths less.
+            Smaller values produce more smoothing.
+            Default to 1.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: If the input raster has more than one band.
+        InvalidParameterValueException: If the filter size is smaller than 3.
+            If the filter size is not an odd number.
+            If the block size or the number of workers is not positive.
+    """
+    _check_inputs(raster, size, damping_factor=damping_factor)
+
+    kernel = np.ones((size, size))
+    block_function = partial(_frost, kernel=kernel, damping_factor=damping_factor)
+
+    return process_raster_by_blocks(raster, output_raster, block_function, size // 2, block_size, n_workers=n_workers)
+
+
+@beartype
+def kuan_filter_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    size: int = 3,
+    n_looks: int = 1,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a Kuan filter block by block and write the result to a GeoTIFF.
+
+    Blocks are read with a halo of the window radius, so the output matches kuan_filter
+    while memory use depends only on the block size.
+
+    Args:
+        raster: The input raster dataset.
+        output_raster: Path of the output GeoTIFF.
+        size: The size of the filter window.
+            E.g., 3 means a 3x3 window. Default to 3.
+        n_looks: Number of looks to estimate the noise variation.
+            Higher values result in higher smoothing.
+            Low values may result in focal mean filtering.
+            Default to 1.
+        block_size: Height and width of the processed blocks in pixels. Default to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Default to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: If the input raster has more than one band.
+        InvalidParameterValueException: If the filter size is smaller than 3.
+            If the filter size is not an odd number.
+            If the block size or the number of workers is not positive.
+    """
+    _check_inputs(raster, size, n_looks=n_looks)
+
+    kernel = np.ones((size, size))
+    block_function = partial(_kuan, kernel=kernel, n_looks=n_looks)
+
+    return process_raster_by_blocks(raster, output_raster, block_function, size // 2, block_size, n_workers=n_workers)
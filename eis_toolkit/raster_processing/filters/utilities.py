@@ -3,7 +3,7 @@ from numbers import Number
 import numpy as np
 import rasterio
 from beartype import beartype
-from beartype.typing import Callable, Optional
+from beartype.typing import Callable, Iterator, Optional
 from scipy.ndimage import correlate, generic_filter
 
 from eis_toolkit.exceptions import InvalidParameterValueException, InvalidRasterBandException
@@ -43,6 +43,70 @@ def _apply_correlated_filter(array: np.ndarray, kernel: np.ndarray) -> np.ndarra
     return correlate(array, kernel) / np.sum(kernel)
 
 
+@beartype
+def _local_moments(array: np.ndarray, kernel: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the NaN-aware local mean and variance for every pixel of the input array at once.
+
+    The moments are derived from footprint convolutions of the valid pixel count, x and x².
+    Edges are handled in the same way as in scipy's generic filter ("reflect" mode), so the
+    results match np.nanmean and np.nanvar computed for each moving window separately.
+
+    Args:
+        array: The input array.
+        kernel: The kernel or footprint defining the moving window. Non-zero cells belong to the window.
+
+    Returns:
+        The local mean and the local variance arrays.
+    """
+    footprint = (kernel != 0).astype(np.float64)
+    valid = ~np.isnan(array)
+
+    # Shift values by the global mean to limit cancellation errors in E[x²] - E[x]²
+    shift = np.nanmean(array) if np.any(valid) else 0.0
+    centered = np.where(valid, array - shift, 0.0).astype(np.float64)
+
+    count = correlate(valid.astype(np.float64), footprint, mode="reflect")
+    sum_x = correlate(centered, footprint, mode="reflect")
+    sum_x2 = correlate(centered**2, footprint, mode="reflect")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_x = sum_x / count
+        mean_x2 = sum_x2 / count
+        variance = mean_x2 - mean_x**2
+
+    # Remove round-off residue so that constant windows get exactly zero variance
+    variance[variance <= 8 * np.finfo(np.float64).eps * mean_x2] = 0.0
+
+    return mean_x + shift, variance
+
+
+@beartype
+def _iterate_kernel_offsets(array: np.ndarray, kernel: np.ndarray) -> Iterator[np.ndarray]:
+    """
+    Iterate over the input array shifted by each offset of the kernel footprint.
+
+    Each yielded array holds, for every pixel, the neighbour at one offset of the moving window.
+    Edges are padded in the same way as in scipy's generic filter ("reflect" mode).
+
+    Args:
+        array: The input array.
+        kernel: The kernel or footprint defining the moving window. Non-zero cells belong to the window.
+
+    Yields:
+        The shifted arrays with the same shape as the input array.
+    """
+    radius_y, radius_x = kernel.shape[0] // 2, kernel.shape[1] // 2
+    padded = np.pad(
+        array,
+        ((radius_y, kernel.shape[0] - radius_y - 1), (radius_x, kernel.shape[1] - radius_x - 1)),
+        mode="symmetric",
+    )
+
+    for row, col in zip(*np.nonzero(kernel)):
+        yield padded[row : row + array.shape[0], col : col + array.shape[1]]  # noqa: E203
+
+
 @beartype
 def _check_filter_size(sigma: Optional[Number], truncate: Optional[Number], size: Optional[int]):
     """
@@ -1,13 +1,22 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import mapclassify as mc
 import numpy as np
 import rasterio
 from beartype import beartype
-from beartype.typing import Optional, Sequence, Tuple
+from beartype.typing import Callable, List, Optional, Sequence, Tuple
 
 from eis_toolkit.exceptions import InvalidParameterValueException, InvalidRasterBandException
+from eis_toolkit.utilities.blockwise import get_block_output_profile, get_block_windows, process_raster_bands_by_blocks
 from eis_toolkit.utilities.checks.raster import check_raster_bands
+from eis_toolkit.utilities.streaming_statistics import raster_band_statistics, sketch_percentile, sketch_weighted_values
+
+# Nodata value of the block-wise reclassification outputs
+RECLASSIFY_NODATA = -9999
+# Maximum number of histogram bins the block-wise natural breaks are optimized over
+NATURAL_BREAKS_BINS = 1024
 
 
 def _reclassify_with_manual_breaks(  # type: ignore[no-any-unimported]
@@ -280,62 +289,92 @@ def reclassify_with_natural_breaks(  # type: ignore[no-any-unimported]
     return out_image, out_meta
 
 
-def _reclassify_with_geometrical_intervals(
-    band: np.ndarray, number_of_classes: int, nodata_value: Number
+def _geometrical_interval_widths(
+    median_value: Number,
+    min_value: Number,
+    max_value: Number,
+    below_median: Number,
+    above_median: Number,
+    number_of_classes: int,
 ) -> np.ndarray:
+    """Get the widths of the geometrical intervals around the median.
 
-    # nan_value is either a set integer (e.g. -9999) or np.nan
-    mask = band == nodata_value
-    masked_array = np.ma.masked_array(data=band, mask=mask)
-
-    median_value = np.ma.median(masked_array)
-    max_value = masked_array.max()
-    min_value = masked_array.min()
-
-    values_out = np.ma.zeros_like(masked_array)
+    Args:
+        median_value: Median of the data.
+        min_value: Minimum of the data.
+        max_value: Maximum of the data.
+        below_median: Largest value below the median.
+        above_median: Smallest value above the median.
+        number_of_classes: The number of classes.
 
+    Returns:
+        The distances from the median to the class edges, starting from the edge of the middle class.
+    """
     # Determine the tail with larger length
     if (median_value - min_value) < (max_value - median_value):  # Large end tail longer
-        tail_values = masked_array[np.ma.where((masked_array > median_value))]
         range_tail = max_value - median_value
-        tail_values = tail_values - median_value + range_tail / 1000.0
+        min_tail = above_median - median_value + range_tail / 1000.0
+        max_tail = max_value - median_value + range_tail / 1000.0
     else:  # Small end tail longer
-        tail_values = masked_array[np.ma.where((masked_array < median_value))]
         range_tail = median_value - min_value
-        tail_values = tail_values - min_value + range_tail / 1000.0
-
-    min_tail = np.ma.min(tail_values)
-    max_tail = np.ma.max(tail_values)
+        min_tail = min_value - min_value + range_tail / 1000.0
+        max_tail = below_median - min_value + range_tail / 1000.0
 
     # number of classes
     factor = (max_tail / min_tail) ** (1 / number_of_classes)
 
     interval_index = 1
-    break_points_tail = [min_tail]
     break_points = [min_tail]
     width = [0]
 
     while break_points[-1] < max_tail:
         interval_index += 1
         break_points.append(min_tail * factor ** (interval_index - 1))
-        break_points_tail.append(break_points[-1])
-        width.append(break_points_tail[-1] - break_points_tail[0])
-    k = 0
+        width.append(break_points[-1] - break_points[0])
+
+    # The outermost class on each side extends over the last width
+    last_class = max(len(width) - 3, 0) + 1
+    return np.array(width[1 : last_class + 1])  # noqa: E203
+
+
+def _classify_geometrical_intervals(band: np.ndarray, median_value: Number, widths: np.ndarray) -> np.ndarray:
+    """Assign the geometrical interval classes, negative below the median and positive above it."""
+    number_of_edges = len(widths)
 
-    for j in range(1, len(width) - 2):
-        values_out[
-            np.ma.where(((median_value + width[j]) < masked_array) & ((masked_array <= (median_value + width[j + 1]))))
-        ] = (j + 1)
-        values_out[
-            np.ma.where(((median_value - width[j]) > masked_array) & ((masked_array >= (median_value - width[j + 1]))))
-        ] = (-j - 1)
-        k = j
+    # Number of class edges between the median and each value
+    above_edges = np.searchsorted(median_value + widths, band, side="left")
+    below_edges = np.searchsorted(-(median_value - widths), -band, side="left")
 
-    values_out[np.ma.where(((median_value + width[k + 1]) < masked_array))] = k + 1
-    values_out[np.ma.where(((median_value - width[k + 1]) > masked_array))] = -k - 1
-    values_out[np.ma.where(median_value == masked_array)] = 0
+    above_classes = np.where(above_edges == 0, 0, np.minimum(above_edges + 1, number_of_edges))
+    below_classes = np.where(below_edges == 0, 0, np.minimum(below_edges + 1, number_of_edges))
 
-    output = np.array(values_out)
+    classes = np.where(band > median_value, above_classes, 0)
+    return np.where(band < median_value, -below_classes, classes)
+
+
+def _reclassify_with_geometrical_intervals(
+    band: np.ndarray, number_of_classes: int, nodata_value: Number
+) -> np.ndarray:
+
+    # nan_value is either a set integer (e.g. -9999) or np.nan
+    valid = band != nodata_value
+    values = band[valid]
+
+    median_value = np.median(values)
+    below_median = values[values < median_value]
+    above_median = values[values > median_value]
+
+    widths = _geometrical_interval_widths(
+        median_value,
+        np.min(values),
+        np.max(values),
+        np.max(below_median) if below_median.size > 0 else np.nan,
+        np.min(above_median) if above_median.size > 0 else np.nan,
+        number_of_classes,
+    )
+
+    output = np.zeros_like(band)
+    output[valid] = _classify_geometrical_intervals(values, median_value, widths)
 
     return output
 
@@ -386,13 +425,12 @@ def reclassify_with_geometrical_intervals(  # type: ignore[no-any-unimported]
 def _reclassify_with_standard_deviation(  # type: ignore[no-any-unimported]
     band: np.ndarray,
     number_of_intervals: int,
+    mean: Optional[Number] = None,
+    stddev: Optional[Number] = None,
 ) -> np.ndarray:
 
-    band_statistics = []
-
-    stddev = np.nanstd(band)
-    mean = np.nanmean(band)
-    band_statistics.append((mean, stddev))
+    stddev = np.nanstd(band) if stddev is None else stddev
+    mean = np.nanmean(band) if mean is None else mean
     interval_size = 2 * stddev / number_of_intervals
 
     classified = np.empty_like(band)
@@ -451,3 +489,487 @@ def reclassify_with_standard_deviation(  # type: ignore[no-any-unimported]
         out_image[i] = _reclassify_with_standard_deviation(band_data, number_of_intervals)
 
     return out_image, out_meta
+
+
+def _get_bands(raster: rasterio.io.DatasetReader, bands: Optional[Sequence[int]]) -> List[int]:
+    if bands is None or len(bands) == 0:
+        return list(range(1, raster.count + 1))
+
+    if not check_raster_bands(raster, bands):
+        raise InvalidRasterBandException(f"Input raster does not contain all selected bands: {bands}.")
+    return list(bands)
+
+
+def _nodata_mask(band_block: np.ndarray, nodata: Optional[Number]) -> np.ndarray:
+    mask = np.isnan(band_block) if np.issubdtype(band_block.dtype, np.floating) else np.zeros(band_block.shape, bool)
+    if nodata is not None:
+        mask |= band_block == nodata
+    return mask
+
+
+def _reclassify_block(band_block: np.ndarray, nodata: Optional[Number], breaks: np.ndarray) -> np.ndarray:
+    out_block = np.digitize(band_block, breaks).astype(np.float64)
+    out_block[_nodata_mask(band_block, nodata)] = np.nan
+    return out_block
+
+
+def _reclassify_with_standard_deviation_block(
+    band_block: np.ndarray, nodata: Optional[Number], number_of_intervals: int, mean: Number, stddev: Number
+) -> np.ndarray:
+    out_block = _reclassify_with_standard_deviation(band_block, number_of_intervals, mean, stddev).astype(np.float64)
+    out_block[_nodata_mask(band_block, nodata)] = np.nan
+    return out_block
+
+
+def _reclassify_with_geometrical_intervals_block(
+    band_block: np.ndarray, nodata: Optional[Number], median_value: Number, widths: np.ndarray
+) -> np.ndarray:
+    out_block = _classify_geometrical_intervals(band_block, median_value, widths).astype(np.float64)
+    out_block[_nodata_mask(band_block, nodata)] = np.nan
+    return out_block
+
+
+def _median_neighbors(
+    raster: rasterio.io.DatasetReader, bands: List[int], medians: Sequence[Number], block_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Stream the largest value below and the smallest value above the median of each band."""
+    below_median = np.full(len(bands), -np.inf)
+    above_median = np.full(len(bands), np.inf)
+
+    for _, window in get_block_windows(raster.height, raster.width, block_size):
+        block = raster.read(bands, window=window)
+        for i, band_block in enumerate(block):
+            values = band_block[~_nodata_mask(band_block, raster.nodata)]
+            below, above = values[values < medians[i]], values[values > medians[i]]
+            if below.size > 0:
+                below_median[i] = max(below_median[i], np.max(below))
+            if above.size > 0:
+                above_median[i] = min(above_median[i], np.min(above))
+
+    below_median[np.isinf(below_median)] = np.nan
+    above_median[np.isinf(above_median)] = np.nan
+    return below_median, above_median
+
+
+def _reclassify_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    bands: List[int],
+    band_function: Callable[[dict], Callable[[np.ndarray], np.ndarray]],
+    block_size: int,
+    n_workers: Optional[int],
+) -> dict:
+    """Reclassify the bands in two windowed passes.
+
+    The first pass streams the statistics and quantile sketch of each band. The band function turns the
+    statistics into the function classifying the blocks of the band in the second pass.
+    """
+    band_statistics = raster_band_statistics(raster, bands, block_size=block_size)
+    band_functions = [band_function(statistics) for statistics in band_statistics]
+
+    out_profile = get_block_output_profile(raster, count=len(bands), dtype="int32")
+    out_profile.update({"nodata": RECLASSIFY_NODATA})
+
+    return process_raster_bands_by_blocks(
+        raster, output_raster, bands, band_functions, out_profile, block_size, n_workers
+    )
+
+
+def _fisher_jenks(values: np.ndarray, weights: np.ndarray, number_of_classes: int) -> np.ndarray:
+    """Find the classes of sorted weighted values with the least within-class sum of squared deviations.
+
+    Fisher's dynamic programming is exact, with memory and time quadratic in the number of values.
+
+    Returns:
+        Index of the last value in each class.
+    """
+    number_of_values = len(values)
+    number_of_classes = min(number_of_classes, number_of_values)
+
+    # Center the values to limit cancellation in the sums of squares
+    values = values - np.average(values, weights=weights)
+    cumulative_weights = np.concatenate([[0], np.cumsum(weights)])
+    cumulative_sums = np.concatenate([[0], np.cumsum(weights * values)])
+    cumulative_squares = np.concatenate([[0], np.cumsum(weights * values**2)])
+
+    # Sum of squared deviations of a class from value i to value j
+    first, last = np.triu_indices(number_of_values)
+    class_weights = cumulative_weights[last + 1] - cumulative_weights[first]
+    class_sums = cumulative_sums[last + 1] - cumulative_sums[first]
+    deviations = np.full((number_of_values, number_of_values), np.inf)
+    deviations[first, last] = cumulative_squares[last + 1] - cumulative_squares[first] - class_sums**2 / class_weights
+
+    cost = deviations[0]
+    class_starts = np.zeros((number_of_classes, number_of_values), dtype=int)
+    for class_index in range(1, number_of_classes):
+        # Last class starts from value i, the previous classes end at value i - 1
+        total = cost[:-1, np.newaxis] + deviations[1:]
+        class_starts[class_index] = np.argmin(total, axis=0) + 1
+        cost = np.min(total, axis=0)
+        cost[:class_index] = np.inf
+
+    class_ends = [number_of_values - 1]
+    for class_index in range(number_of_classes - 1, 0, -1):
+        class_ends.append(class_starts[class_index, class_ends[-1]] - 1)
+
+    return np.array(class_ends[::-1])
+
+
+def _natural_breaks_from_statistics(statistics: dict, number_of_classes: int, number_of_bins: int) -> np.ndarray:
+    """Get the upper bounds of natural breaks classes from the quantile sketch of a band.
+
+    Bands with at most number_of_bins distinct sketch values are classified by the values, other bands by
+    a histogram of number_of_bins bins.
+    """
+    if statistics["count"] == 0:
+        return np.array([])
+
+    values, weights = sketch_weighted_values(statistics)
+    unique_values, inverse = np.unique(values, return_inverse=True)
+
+    if len(unique_values) <= number_of_bins:
+        bin_values, bin_weights, upper_bounds = unique_values, np.bincount(inverse, weights), unique_values
+    else:
+        bin_weights, edges = np.histogram(
+            values, bins=number_of_bins, range=(statistics["min"], statistics["max"]), weights=weights
+        )
+        nonempty = bin_weights > 0
+        bin_values = ((edges[:-1] + edges[1:]) / 2)[nonempty]
+        bin_weights, upper_bounds = bin_weights[nonempty], edges[1:][nonempty]
+
+    return upper_bounds[_fisher_jenks(bin_values, bin_weights, number_of_classes)]
+
+
+def _defined_intervals_from_statistics(statistics: dict, interval_size: int) -> np.ndarray:
+    """Get the edges np.histogram would give for the band."""
+    first_edge, last_edge = statistics["min"], statistics["max"]
+    if first_edge == last_edge:
+        first_edge, last_edge = first_edge - 0.5, last_edge + 0.5
+    return np.linspace(first_edge, last_edge, interval_size + 1)
+
+
+@beartype
+def reclassify_with_manual_breaks_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    breaks: Sequence[int],
+    bands: Optional[Sequence[int]] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """Classify raster with manual breaks block by block and write the result to a GeoTIFF.
+
+    If bands are not given, all bands are used for classification. The classes are written as int32 with
+    nodata -9999, which is also the class of nodata pixels.
+
+    Args:
+        raster: Raster to be classified.
+        output_raster: Path of the output GeoTIFF.
+        breaks: List of break values for the classification.
+        bands: Selected bands from multiband raster. Indexing begins from one. Defaults to None.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: All selected bands are not contained in the input raster.
+    """
+    bands = _get_bands(raster, bands)
+
+    band_function = partial(_reclassify_block, nodata=raster.nodata, breaks=np.asarray(breaks))
+    out_profile = get_block_output_profile(raster, count=len(bands), dtype="int32")
+    out_profile.update({"nodata": RECLASSIFY_NODATA})
+
+    return process_raster_bands_by_blocks(
+        raster, output_raster, bands, [band_function] * len(bands), out_profile, block_size, n_workers
+    )
+
+
+@beartype
+def reclassify_with_defined_intervals_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    interval_size: int,
+    bands: Optional[Sequence[int]] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """Classify raster with defined intervals block by block and write the result to a GeoTIFF.
+
+    The interval edges are computed from the band minimum and maximum streamed in a first pass. Unlike
+    in reclassify_with_defined_intervals, nodata is left out of the edges and written as nodata -9999.
+
+    Args:
+        raster: Raster to be classified.
+        output_raster: Path of the output GeoTIFF.
+        interval_size: The number of units in each interval.
+        bands: Selected bands from multiband raster. Indexing begins from one. Defaults to None.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: All selected bands are not contained in the input raster.
+        InvalidParameterValueException: Interval size is less than 1.
+    """
+    bands = _get_bands(raster, bands)
+
+    if interval_size < 1:
+        raise InvalidParameterValueException("Interval size must be 1 or more.")
+
+    def band_function(statistics: dict) -> Callable[[np.ndarray], np.ndarray]:
+        breaks = _defined_intervals_from_statistics(statistics, interval_size)
+        return partial(_reclassify_block, nodata=raster.nodata, breaks=breaks)
+
+    return _reclassify_windowed(raster, output_raster, bands, band_function, block_size, n_workers)
+
+
+@beartype
+def reclassify_with_equal_intervals_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    number_of_intervals: int,
+    bands: Optional[Sequence[int]] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """Classify raster with equal intervals block by block and write the result to a GeoTIFF.
+
+    The percentiles are taken from a quantile sketch streamed in a first pass. They are exact for bands with
+    up to 16384 valid values and approximate beyond. Unlike in reclassify_with_equal_intervals, nodata is
+    left out of the percentiles and written as nodata -9999.
+
+    Args:
+        raster: Raster to be classified.
+        output_raster: Path of the output GeoTIFF.
+        number_of_intervals: The number of intervals.
+        bands: Selected bands from multiband raster. Indexing begins from one. Defaults to None.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: All selected bands are not contained in the input raster.
+        InvalidParameterValueException: Number of intervals is less than 2.
+    """
+    bands = _get_bands(raster, bands)
+
+    if number_of_intervals < 2:
+        raise InvalidParameterValueException("Number of intervals must be 2 or more.")
+
+    def band_function(statistics: dict) -> Callable[[np.ndarray], np.ndarray]:
+        percentiles = np.linspace(0, 100, number_of_intervals)
+        breaks = np.array([sketch_percentile(statistics, percentile) for percentile in percentiles])
+        return partial(_reclassify_block, nodata=raster.nodata, breaks=breaks)
+
+    return _reclassify_windowed(raster, output_raster, bands, band_function, block_size, n_workers)
+
+
+@beartype
+def reclassify_with_quantiles_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    number_of_quantiles: int,
+    bands: Optional[Sequence[int]] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """Classify raster with quantiles block by block and write the result to a GeoTIFF.
+
+    The quantiles are taken from a quantile sketch streamed in a first pass. They are exact for bands with
+    up to 16384 valid values and approximate beyond. Unlike in reclassify_with_quantiles, nodata is left out
+    of the quantiles and written as nodata -9999.
+
+    Args:
+        raster: Raster to be classified.
+        output_raster: Path of the output GeoTIFF.
+        number_of_quantiles: The number of quantiles.
+        bands: Selected bands from multiband raster. Indexing begins from one. Defaults to None.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: All selected bands are not contained in the input raster.
+        InvalidParameterValueException: Number of quantiles is less than 2.
+    """
+    bands = _get_bands(raster, bands)
+
+    if number_of_quantiles < 2:
+        raise InvalidParameterValueException("Number of quantiles must be 2 or more.")
+
+    def band_function(statistics: dict) -> Callable[[np.ndarray], np.ndarray]:
+        percentiles = [i * 100 / number_of_quantiles for i in range(number_of_quantiles)]
+        breaks = np.array([sketch_percentile(statistics, percentile) for percentile in percentiles])
+        return partial(_reclassify_block, nodata=raster.nodata, breaks=breaks)
+
+    return _reclassify_windowed(raster, output_raster, bands, band_function, block_size, n_workers)
+
+
+@beartype
+def reclassify_with_natural_breaks_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    number_of_classes: int,
+    bands: Optional[Sequence[int]] = None,
+    number_of_bins: int = NATURAL_BREAKS_BINS,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """Classify raster with natural breaks (Fisher-Jenks) block by block and write the result to a GeoTIFF.
+
+    A quantile sketch of each band is streamed in a first pass and summarized as a weighted histogram.
+    The optimal Jenks classes of the histogram bins are found with Fisher's algorithm. Bands with at most
+    number_of_bins distinct values are classified exactly by the values. Otherwise the class bounds are
+    bin edges, so their resolution is the band range divided by the number of bins.
+
+    Unlike reclassify_with_natural_breaks, which uses the Jenks-Caspall heuristic, the classes are optimal.
+    Nodata is left out of the classes and written as nodata -9999.
+
+    Args:
+        raster: Raster to be classified.
+        output_raster: Path of the output GeoTIFF.
+        number_of_classes: The number of classes.
+        bands: Selected bands from multiband raster. Indexing begins from one. Defaults to None.
+        number_of_bins: Maximum number of histogram bins. Memory and time of the optimization grow with its
+            square. Defaults to 1024.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: All selected bands are not contained in the input raster.
+        InvalidParameterValueException: Number of classes is less than 2 or number of bins is less than
+            the number of classes.
+    """
+    bands = _get_bands(raster, bands)
+
+    if number_of_classes < 2:
+        raise InvalidParameterValueException("Number of classes must be 2 or more.")
+
+    if number_of_bins < number_of_classes:
+        raise InvalidParameterValueException("Number of bins must be at least the number of classes.")
+
+    def band_function(statistics: dict) -> Callable[[np.ndarray], np.ndarray]:
+        breaks = _natural_breaks_from_statistics(statistics, number_of_classes, number_of_bins)
+        return partial(_reclassify_block, nodata=raster.nodata, breaks=breaks)
+
+    return _reclassify_windowed(raster, output_raster, bands, band_function, block_size, n_workers)
+
+
+@beartype
+def reclassify_with_geometrical_intervals_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    number_of_classes: int,
+    bands: Optional[Sequence[int]] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """Classify raster with geometrical intervals block by block and write the result to a GeoTIFF.
+
+    The median, minimum and maximum are streamed in a first pass and the values next to the median in a
+    second one. The median is taken from a quantile sketch, which is exact for bands with up to 16384 valid
+    values and approximate beyond. Nodata is written as nodata -9999 instead of class 0.
+
+    Args:
+        raster: Raster to be classified.
+        output_raster: Path of the output GeoTIFF.
+        number_of_classes: The number of classes. The true number of classes is at most double the amount,
+            depending how symmetrical the input data is.
+        bands: Selected bands from multiband raster. Indexing begins from one. Defaults to None.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: All selected bands are not contained in the input raster.
+        InvalidParameterValueException: Number of classes is less than 2.
+    """
+    bands = _get_bands(raster, bands)
+
+    if number_of_classes < 2:
+        raise InvalidParameterValueException("Number of classes must be 2 or more.")
+
+    band_statistics = raster_band_statistics(raster, bands, block_size=block_size)
+    medians = [sketch_percentile(statistics, 50) for statistics in band_statistics]
+    below_median, above_median = _median_neighbors(raster, bands, medians, block_size)
+
+    band_functions = []
+    for i, statistics in enumerate(band_statistics):
+        widths = _geometrical_interval_widths(
+            medians[i], statistics["min"], statistics["max"], below_median[i], above_median[i], number_of_classes
+        )
+        band_functions.append(
+            partial(
+                _reclassify_with_geometrical_intervals_block,
+                nodata=raster.nodata,
+                median_value=medians[i],
+                widths=widths,
+            )
+        )
+
+    out_profile = get_block_output_profile(raster, count=len(bands), dtype="int32")
+    out_profile.update({"nodata": RECLASSIFY_NODATA})
+
+    return process_raster_bands_by_blocks(
+        raster, output_raster, bands, band_functions, out_profile, block_size, n_workers
+    )
+
+
+@beartype
+def reclassify_with_standard_deviation_windowed(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    number_of_intervals: int,
+    bands: Optional[Sequence[int]] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """Classify raster with standard deviation block by block and write the result to a GeoTIFF.
+
+    The mean and standard deviation are streamed in a first pass. Unlike in
+    reclassify_with_standard_deviation, nodata is left out of them and written as nodata -9999.
+
+    Args:
+        raster: Raster to be classified.
+        output_raster: Path of the output GeoTIFF.
+        number_of_intervals: The number of intervals.
+        bands: Selected bands from multiband raster. Indexing begins from one. Defaults to None.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The metadata of the written output raster.
+
+    Raises:
+        InvalidRasterBandException: All selected bands are not contained in the input raster.
+        InvalidParameterValueException: Number of intervals is less than 2.
+    """
+    bands = _get_bands(raster, bands)
+
+    if number_of_intervals < 2:
+        raise InvalidParameterValueException("Number of intervals must be 2 or more.")
+
+    def band_function(statistics: dict) -> Callable[[np.ndarray], np.ndarray]:
+        return partial(
+            _reclassify_with_standard_deviation_block,
+            nodata=raster.nodata,
+            number_of_intervals=number_of_intervals,
+            mean=statistics["mean"],
+            stddev=statistics["std"],
+        )
+
+    return _reclassify_windowed(raster, output_raster, bands, band_function, block_size, n_workers)
@@ -1,12 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Number
+from pathlib import Path
+
 import numpy as np
 import rasterio
 from beartype import beartype
-from beartype.typing import List, Literal, Sequence, Tuple
+from beartype.typing import List, Literal, Optional, Sequence, Tuple
 from rasterio import warp
+from rasterio.dtypes import in_dtype_range
 from rasterio.enums import Resampling
 
-from eis_toolkit.exceptions import InvalidParameterValueException
+from eis_toolkit.exceptions import InvalidParameterValueException, NonMatchingParameterLengthsException
 from eis_toolkit.raster_processing.resampling import RESAMPLE_METHOD_MAP
+from eis_toolkit.utilities.blockwise import TILE_SIZE, get_block_output_profile
+
+
+def _unified_grid(
+    base_raster: rasterio.io.DatasetReader, raster: rasterio.io.DatasetReader, same_extent: bool
+) -> Tuple[warp.Affine, int, int]:
+    """Get the transform, width and height of a raster unified with the base raster grid."""
+    dst_crs = base_raster.crs
+    dst_resolution = (base_raster.transform.a, abs(base_raster.transform.e))
+
+    if same_extent:
+        return base_raster.transform, base_raster.width, base_raster.height
+
+    # If we unify without clipping, things are more complicated and we need to
+    # calculate corner coordinates, width and height, and snap the grid to nearest corner
+    dst_transform, dst_width, dst_height = warp.calculate_default_transform(
+        raster.crs, dst_crs, raster.width, raster.height, *raster.bounds, resolution=dst_resolution
+    )
+    # The created transform might not be aligned with the base raster grid, so
+    # we still need to snap/align the transformation to closest grid corner
+    x_distance_to_grid = dst_transform.c % dst_resolution[0]
+    y_distance_to_grid = dst_transform.f % dst_resolution[1]
+
+    if x_distance_to_grid > dst_resolution[0] / 2:  # Snap towards right
+        c = dst_transform.c - x_distance_to_grid + dst_resolution[0]
+    else:  # Snap towards left
+        c = dst_transform.c - x_distance_to_grid
+
+    if y_distance_to_grid > dst_resolution[1] / 2:  # Snap towards up
+        f = dst_transform.f - y_distance_to_grid + dst_resolution[1]
+    else:  # Snap towards bottom
+        f = dst_transform.f - y_distance_to_grid
+
+    # Create new transform with updated corner coordinates
+    dst_transform = warp.Affine(
+        dst_transform.a,  # Pixel size x
+        dst_transform.b,  # Shear parameter
+        c,  # Up-left corner x-coordinate
+        dst_transform.d,  # Shear parameter
+        dst_transform.e,  # Pixel size y
+        f,  # Up-left corner y-coordinate
+    )
+
+    return dst_transform, dst_width, dst_height
 
 
 def _unify_raster_grids(
@@ -17,50 +66,16 @@ def _unify_raster_grids(
 ) -> List[Tuple[np.ndarray, dict]]:
 
     dst_crs = base_raster.crs
-    dst_width = base_raster.width
-    dst_height = base_raster.height
-    dst_transform = base_raster.transform
-    dst_resolution = (base_raster.transform.a, abs(base_raster.transform.e))
 
     out_rasters = [(base_raster.read(), base_raster.meta.copy())]
-    out_meta = base_raster.meta.copy()
 
     for raster in rasters_to_unify:
+        dst_transform, dst_width, dst_height = _unified_grid(base_raster, raster, same_extent)
 
-        # If we unify without clipping, things are more complicated and we need to
-        # calculate corner coordinates, width and height, and snap the grid to nearest corner
-        if not same_extent:
-            dst_transform, dst_width, dst_height = warp.calculate_default_transform(
-                raster.crs, dst_crs, raster.width, raster.height, *raster.bounds, resolution=dst_resolution
-            )
-            # The created transform might not be aligned with the base raster grid, so
-            # we still need to snap/align the transformation to closest grid corner
-            x_distance_to_grid = dst_transform.c % dst_resolution[0]
-            y_distance_to_grid = dst_transform.f % dst_resolution[1]
-
-            if x_distance_to_grid > dst_resolution[0] / 2:  # Snap towards right
-                c = dst_transform.c - x_distance_to_grid + dst_resolution[0]
-            else:  # Snap towards left
-                c = dst_transform.c - x_distance_to_grid
-
-            if y_distance_to_grid > dst_resolution[1] / 2:  # Snap towards up
-                f = dst_transform.f - y_distance_to_grid + dst_resolution[1]
-            else:  # Snap towards bottom
-                f = dst_transform.f - y_distance_to_grid
-
-            # Create new transform with updated corner coordinates
-            dst_transform = warp.Affine(
-                dst_transform.a,  # Pixel size x
-                dst_transform.b,  # Shear parameter
-                c,  # Up-left corner x-coordinate
-                dst_transform.d,  # Shear parameter
-                dst_transform.e,  # Pixel size y
-                f,  # Up-left corner y-coordinate
-            )
-
-            out_meta["transform"] = dst_transform
-            out_meta["width"] = dst_width
-            out_meta["height"] = dst_height
+        out_meta = base_raster.meta.copy()
+        out_meta["transform"] = dst_transform
+        out_meta["width"] = dst_width
+        out_meta["height"] = dst_height
 
         # Initialize output raster arrary
         dst_array = np.empty((base_raster.count, dst_height, dst_width))
@@ -85,6 +100,59 @@ def _unify_raster_grids(
     return out_rasters
 
 
+def _unified_nodata(base_raster: rasterio.io.DatasetReader, raster: rasterio.io.DatasetReader) -> Optional[Number]:
+    """Get the nodata of a unified raster: its own, else the base raster nodata if its data type can hold it."""
+    if raster.nodata is not None:
+        return raster.nodata
+    if base_raster.nodata is not None and in_dtype_range(base_raster.nodata, raster.dtypes[0]):
+        return base_raster.nodata
+    return None
+
+
+def _unify_raster_to_file(
+    base_raster: rasterio.io.DatasetReader,
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    resampling_method: Resampling,
+    same_extent: bool,
+    num_threads: int,
+    warp_mem_limit: int,
+) -> dict:
+    dst_transform, dst_width, dst_height = _unified_grid(base_raster, raster, same_extent)
+
+    out_profile = get_block_output_profile(raster, count=raster.count, dtype=raster.dtypes[0])
+    out_profile.update(
+        {
+            "crs": base_raster.crs,
+            "transform": dst_transform,
+            "width": dst_width,
+            "height": dst_height,
+            "nodata": _unified_nodata(base_raster, raster),
+        }
+    )
+    if dst_height >= TILE_SIZE and dst_width >= TILE_SIZE:
+        out_profile.update({"tiled": True, "blockxsize": TILE_SIZE, "blockysize": TILE_SIZE})
+    else:
+        out_profile.update({"tiled": False})
+        out_profile.pop("blockxsize", None)
+        out_profile.pop("blockysize", None)
+
+    # With bands as source and destination, GDAL warps the data in chunks straight between the files.
+    # The warp threads also compress the output tiles.
+    with rasterio.open(output_raster, "w", num_threads=num_threads, **out_profile) as dst:
+        warp.reproject(
+            source=rasterio.band(raster, raster.indexes),
+            destination=rasterio.band(dst, dst.indexes),
+            src_nodata=raster.nodata,
+            dst_nodata=out_profile["nodata"],
+            resampling=resampling_method,
+            num_threads=num_threads,
+            warp_mem_limit=warp_mem_limit,
+        )
+
+    return out_profile
+
+
 @beartype
 def unify_raster_grids(
     base_raster: rasterio.io.DatasetReader,
@@ -115,3 +183,77 @@ def unify_raster_grids(
     method = RESAMPLE_METHOD_MAP[resampling_method]
     out_rasters = _unify_raster_grids(base_raster, rasters_to_unify, method, same_extent)
     return out_rasters
+
+
+@beartype
+def unify_raster_grids_windowed(
+    base_raster: rasterio.io.DatasetReader,
+    rasters_to_unify: Sequence[rasterio.io.DatasetReader],
+    output_rasters: Sequence[Path],
+    resampling_method: Literal["nearest", "bilinear", "cubic", "average", "gauss", "max", "min"] = "nearest",
+    same_extent: bool = False,
+    num_threads: int = 1,
+    warp_mem_limit: int = 0,
+    n_workers: Optional[int] = None,
+) -> List[dict]:
+    """Unifies given rasters relative to base raster, streaming each result to a tiled GeoTIFF.
+
+    The grids are unified as in `unify_raster_grids`, but GDAL warps each raster in chunks straight from the
+    source to the output file, so the rasters are never read into memory. The outputs keep the data types
+    of the source rasters and their nodata value, or the base raster nodata if the source has none and the
+    data type can hold it.
+
+    Args:
+        base_raster: The base raster to determine target raster grid properties.
+        rasters_to_unify: Rasters to be unified with the base raster.
+        output_rasters: Paths of the output GeoTIFFs, one for each raster to unify.
+        resampling_method: Resampling method. Most suitable
+            method depends on the dataset and context. Nearest, bilinear and cubic are some
+            common choices. This parameter defaults to nearest.
+        same_extent: If the unified rasters will be forced to have the same extent/bounds
+            as the base raster. Expands smaller rasters with nodata cells. Defaults to False.
+        num_threads: Number of GDAL warp threads for each raster. Defaults to 1.
+        warp_mem_limit: Memory for the GDAL warp chunks of each raster in MB. Defaults to 0,
+            which uses the GDAL default of 64 MB.
+        n_workers: Number of worker threads unifying rasters concurrently. Each thread opens its own handles
+            to the base raster and the raster it unifies, so the rasters need to be readable again by their
+            name. Defaults to None, which unifies the rasters one after another through the given datasets.
+
+    Returns:
+        Profiles of the written output rasters.
+
+    Raises:
+        InvalidParameterValueException: Rasters to unify is empty or the number of threads or workers
+            is not positive.
+        NonMatchingParameterLengthsException: Rasters to unify and output rasters have different lengths.
+    """
+    if len(rasters_to_unify) == 0:
+        raise InvalidParameterValueException("Rasters to unify is empty.")
+
+    if len(rasters_to_unify) != len(output_rasters):
+        raise NonMatchingParameterLengthsException("Rasters to unify and output rasters have different lengths.")
+
+    if num_threads < 1:
+        raise InvalidParameterValueException("Number of threads must be a positive integer.")
+
+    if n_workers is not None and n_workers < 1:
+        raise InvalidParameterValueException("Number of workers must be a positive integer.")
+
+    method = RESAMPLE_METHOD_MAP[resampling_method]
+
+    def _unify(raster_index: int, base: rasterio.io.DatasetReader, raster: rasterio.io.DatasetReader) -> dict:
+        return _unify_raster_to_file(
+            base, raster, output_rasters[raster_index], method, same_extent, num_threads, warp_mem_limit
+        )
+
+    def _unify_reopened(raster_index: int) -> dict:
+        # Datasets are not safe to share between threads, so each worker warps through its own handles
+        with rasterio.open(base_raster.name) as base, rasterio.open(rasters_to_unify[raster_index].name) as raster:
+            return _unify(raster_index, base, raster)
+
+    # GDAL releases the GIL while warping, so rasters are unified in parallel threads
+    if n_workers is None or n_workers == 1:
+        return [_unify(raster_index, base_raster, raster) for raster_index, raster in enumerate(rasters_to_unify)]
+
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(_unify_reopened, range(len(rasters_to_unify))))
@@ -1,40 +1,104 @@
+from pathlib import Path
+
 import numpy as np
 import rasterio
 from beartype import beartype
-from beartype.typing import Sequence, Tuple
+from beartype.typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+from rasterio.windows import Window
 
 from eis_toolkit.exceptions import InvalidParameterValueException, NonMatchingRasterMetadataException
+from eis_toolkit.utilities.blockwise import get_block_output_profile, get_block_windows, write_raster_by_blocks
 from eis_toolkit.utilities.checks.raster import check_raster_grids
+from eis_toolkit.utilities.raster_stack import RasterStack
+
+# Packed combination keys are renumbered before the number of possible keys exceeds this
+MAX_PACKED_KEYS = 2**62
+
+
+def _column_codes(column: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Get integer codes for the values of a column that sort like the values, and the number of codes.
+
+    Integers with a range smaller than the column are offset by their minimum, other values are ranked.
+    """
+    if np.issubdtype(column.dtype, np.integer) and column.size > 0:
+        minimum, maximum = int(column.min()), int(column.max())
+        if maximum - minimum < column.size:
+            return column.astype(np.int64) - minimum, maximum - minimum + 1
+
+    unique_values, codes = np.unique(column, return_inverse=True)
+    return codes.reshape(-1).astype(np.int64), len(unique_values)
+
+
+def _factorize_rows(columns: Sequence[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Give ids to the distinct rows formed by the columns in lexicographic order, like np.unique(axis=0).
+
+    The column codes are packed into one integer key per row, first column most significant, so the keys
+    sort like the rows and a single 1D sort replaces sorting the rows. The packed keys are renumbered
+    before they would overflow, which keeps their order.
+
+    Returns the row ids from 0 and the index of a row with each id.
+    """
+    keys, key_count = np.zeros(len(columns[0]), dtype=np.int64), 1
+    for column in columns:
+        codes, code_count = _column_codes(column)
+        if key_count * code_count > MAX_PACKED_KEYS:
+            unique_keys, keys = np.unique(keys, return_inverse=True)
+            key_count = len(unique_keys)
+        keys = keys * code_count + codes
+        key_count *= code_count
+
+    unique_keys, ids = np.unique(keys, return_inverse=True)
+    ids = ids.reshape(-1)
+
+    row_indices = np.empty(len(unique_keys), dtype=np.int64)
+    row_indices[ids] = np.arange(len(ids))
+    return ids, row_indices
 
 
 def _unique_combinations(
     bands: Sequence[np.ndarray],
 ) -> np.ndarray:
 
-    combined_array = np.stack(bands, axis=-1)
-
-    combined_array_2d = combined_array.reshape(-1, len(bands))
-
-    _, unique_indices, inverse_indices = np.unique(combined_array_2d, axis=0, return_index=True, return_inverse=True)
+    ids, _ = _factorize_rows([band.reshape(-1) for band in bands])
 
-    unique_combinations = inverse_indices.reshape(bands[0].shape)
+    unique_combinations = ids.reshape(bands[0].shape)
 
     unique_combinations += 1
 
     return unique_combinations
 
 
+def _read_combination_columns(rasters: Sequence[rasterio.io.DatasetReader], window: Window) -> List[np.ndarray]:
+    return [band.reshape(-1) for raster in rasters for band in raster.read(window=window)]
+
+
+def _merge_combinations(combinations: List[np.ndarray], columns: List[np.ndarray]) -> List[np.ndarray]:
+    """Add the distinct rows of the columns to the combination table, keeping it in lexicographic order."""
+    merged = [np.concatenate([table_column, column]) for table_column, column in zip(combinations, columns)]
+    _, row_indices = _factorize_rows(merged)
+    return [merged_column[row_indices] for merged_column in merged]
+
+
+def _combination_ids(combinations: List[np.ndarray], columns: List[np.ndarray], shape: Tuple[int, int]) -> np.ndarray:
+    """Look up the combination ids of a block, factorizing it together with the table of all combinations."""
+    ids, _ = _factorize_rows(
+        [np.concatenate([table_column, column]) for table_column, column in zip(combinations, columns)]
+    )
+    return ids[len(combinations[0]) :].reshape(shape) + 1  # noqa: E203
+
+
 @beartype
 def unique_combinations(  # type: ignore[no-any-unimported]
-    raster_list: Sequence[rasterio.io.DatasetReader],
+    raster_list: Union[Sequence[rasterio.io.DatasetReader], RasterStack],
 ) -> Tuple[np.ndarray, dict]:
     """Get combinations of raster values between rasters.
 
-    All bands in all rasters are used for analysis.
-    The first band of the first raster is used for reference when making the output.
+    All bands in all rasters are used for analysis, or the selected bands if a raster stack is given.
+    The first band of the first raster is used for reference when making the output. Combinations are
+    numbered from 1 in the lexicographic order of their band values.
 
     Args:
-        raster_list: Rasters to be used for finding combinations.
+        raster_list: Rasters or a raster stack to be used for finding combinations.
 
     Returns:
         Combinations of rasters.
@@ -44,6 +108,14 @@ def unique_combinations(  # type: ignore[no-any-unimported]
         InvalidParameterValueException: Input rasters don't have enough bands to perform
             the operation or input rasters are of different shape.
     """
+    if isinstance(raster_list, RasterStack):
+        if raster_list.count == 1:
+            raise InvalidParameterValueException("Expected to have more bands than 1")
+
+        out_meta = raster_list.meta
+        out_meta["count"] = 1
+        return _unique_combinations(list(raster_list.read(nodata_to_nan=False))), out_meta
+
     bands = []
     out_meta = raster_list[0].meta
     out_meta["count"] = 1
@@ -62,3 +134,71 @@ def unique_combinations(  # type: ignore[no-any-unimported]
 
     out_image = _unique_combinations(bands)
     return out_image, out_meta
+
+
+def _iterate_combination_tasks(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    combinations: List[np.ndarray],
+    windows: List[Tuple[Window, Window]],
+) -> Iterator[Tuple[Callable[..., np.ndarray], Tuple[Any, ...], Window]]:
+    for _, window in windows:
+        columns = _read_combination_columns(rasters, window)
+        yield _combination_ids, (combinations, columns, (int(window.height), int(window.width))), window
+
+
+@beartype
+def unique_combinations_windowed(
+    raster_list: Sequence[rasterio.io.DatasetReader],
+    output_raster: Path,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> Tuple[np.ndarray, dict]:
+    """Get combinations of raster values between rasters block by block and write the ids to a GeoTIFF.
+
+    All bands in all rasters are used for analysis. The ids are the same as from `unique_combinations`:
+    combinations are numbered from 1 in the lexicographic order of their band values. The combinations are
+    collected in a first pass over the blocks and the ids are looked up in a second pass, so peak memory
+    depends on the block size and the number of combinations, not the raster size.
+
+    Args:
+        raster_list: Rasters to be used for finding combinations.
+        output_raster: Path of the output GeoTIFF with the combination ids.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for the second pass. Defaults to None, which processes
+            the blocks sequentially.
+
+    Returns:
+        The combination table with one row of band values for each combination id, starting from 1.
+        The profile of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: Input rasters don't have enough bands to perform the operation,
+            block size is not positive or the number of workers is not positive.
+        NonMatchingRasterMetadataException: Input rasters don't have the same grid properties and extent.
+    """
+    if sum(raster.count for raster in raster_list) < 2:
+        raise InvalidParameterValueException("Expected to have more bands than 1")
+
+    if not check_raster_grids([raster.profile for raster in raster_list], same_extent=True):
+        raise NonMatchingRasterMetadataException("Expected raster grids to be have the same grid properties.")
+
+    windows = get_block_windows(raster_list[0].height, raster_list[0].width, block_size)
+
+    combinations = None
+    for _, window in windows:
+        columns = _read_combination_columns(raster_list, window)
+        if combinations is None:
+            _, row_indices = _factorize_rows(columns)
+            combinations = [column[row_indices] for column in columns]
+        else:
+            combinations = _merge_combinations(combinations, columns)
+
+    dtype = "int32" if len(combinations[0]) < np.iinfo(np.int32).max else "int64"
+    out_profile = get_block_output_profile(raster_list[0], count=1, dtype=dtype)
+    out_profile["nodata"] = None
+
+    out_profile = write_raster_by_blocks(
+        output_raster, out_profile, _iterate_combination_tasks(raster_list, combinations, windows), n_workers
+    )
+
+    return np.column_stack(combinations), out_profile
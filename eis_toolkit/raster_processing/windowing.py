@@ -1,13 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
 from numbers import Number
+from pathlib import Path
 
+import geopandas as gpd
 import numpy as np
 import rasterio
 from beartype import beartype
-from beartype.typing import Tuple
+from beartype.typing import Callable, Optional, Sequence, Tuple
 from rasterio import transform
 from rasterio.windows import Window
 
-from eis_toolkit.exceptions import CoordinatesOutOfBoundsException, InvalidParameterValueException
+from eis_toolkit.exceptions import (
+    CoordinatesOutOfBoundsException,
+    InvalidParameterValueException,
+    NonMatchingRasterMetadataException,
+)
+from eis_toolkit.utilities.checks.raster import check_raster_grids
 
 
 def _extract_window(
@@ -121,3 +129,198 @@ def extract_window(
     out_image, out_meta = _extract_window(raster, center_coords, height, width)
 
     return out_image, out_meta
+
+
+def _window_offsets(
+    raster: rasterio.io.DatasetReader, x: np.ndarray, y: np.ndarray, height: int, width: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the top left rows and columns of the windows around the center points, as in _extract_window."""
+    center_rows, center_cols = transform.rowcol(raster.transform, x, y)
+    center_rows = np.asarray(center_rows, dtype=np.int64).reshape(-1)
+    center_cols = np.asarray(center_cols, dtype=np.int64).reshape(-1)
+
+    top_left_rows = center_rows - int(height / 2)
+    top_left_cols = center_cols - int(width / 2)
+
+    if height % 2 == 0 or width % 2 == 0:
+        px_x, px_y = transform.xy(raster.transform, center_rows, center_cols)
+        if height % 2 == 0:
+            top_left_rows += y < np.asarray(px_y)
+        if width % 2 == 0:
+            top_left_cols += x > np.asarray(px_x)
+
+    return top_left_rows, top_left_cols
+
+
+def _read_padded(raster: rasterio.io.DatasetReader, window: Window) -> np.ndarray:
+    """Read a window that may extend outside the raster, padding with the raster nodata value like a boundless read."""
+    out_image = np.full(
+        (raster.count, int(window.height), int(window.width)),
+        raster.nodata if raster.nodata is not None else 0,
+        dtype=raster.dtypes[0],
+    )
+
+    row_start, col_start = max(window.row_off, 0), max(window.col_off, 0)
+    row_end = min(window.row_off + window.height, raster.height)
+    col_end = min(window.col_off + window.width, raster.width)
+
+    if row_start < row_end and col_start < col_end:
+        rows = slice(row_start - window.row_off, row_end - window.row_off)
+        cols = slice(col_start - window.col_off, col_end - window.col_off)
+        out_image[:, rows, cols] = raster.read(
+            window=Window(col_start, row_start, col_end - col_start, row_end - row_start)
+        )
+
+    return out_image
+
+
+def _extract_raster_windows(
+    raster: rasterio.io.DatasetReader,
+    x: np.ndarray,
+    y: np.ndarray,
+    height: int,
+    width: int,
+    block_size: int,
+    write_windows: Callable[[np.ndarray, np.ndarray], None],
+) -> None:
+    """Extract the windows around the points from a raster, reading each block with window centers once.
+
+    The points are sorted by the block their window falls in. The windows of each block are cut from a
+    single read covering all of them.
+    """
+    top_left_rows, top_left_cols = _window_offsets(raster, x, y, height, width)
+
+    blocks = (top_left_rows // block_size) * (raster.width // block_size + 2) + top_left_cols // block_size
+    order = np.argsort(blocks, kind="stable")
+    block_starts = np.flatnonzero(np.diff(blocks[order], prepend=blocks.min() - 1))
+
+    for points in np.split(order, block_starts[1:]):
+        rows, cols = top_left_rows[points], top_left_cols[points]
+        row_off, col_off = rows.min(), cols.min()
+        block = _read_padded(
+            raster, Window(col_off, row_off, cols.max() - col_off + width, rows.max() - row_off + height)
+        )
+
+        row_index = (rows - row_off)[:, np.newaxis] + np.arange(height)
+        col_index = (cols - col_off)[:, np.newaxis] + np.arange(width)
+        windows = block[:, row_index[:, :, np.newaxis], col_index[:, np.newaxis, :]]
+        write_windows(points, np.moveaxis(windows, 0, 1))
+
+
+@beartype
+def extract_windows(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    points: gpd.GeoDataFrame,
+    height: int,
+    width: int,
+    output_file: Optional[Path] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> Optional[np.ndarray]:
+    """Extract windows around many center points from a list of rasters.
+
+    The windows are placed and padded with the raster nodata value the same way as in `extract_window`.
+    The bands of all rasters are stacked in the order of the rasters. The points are sorted by raster block
+    and the windows around the points of each block are cut from a single read.
+
+    The windows can be written to a NumPy .npy file through a memory map or to an HDF5 file (.h5 or .hdf5)
+    as a dataset named "windows", so that they are never held in memory as a whole.
+
+    Args:
+        rasters: Source rasters with the same grid properties.
+        points: Center points of the windows. The coordinates should be in the rasters' CRS.
+        height: Window height in pixels.
+        width: Window width in pixels.
+        output_file: File to write the windows to, either .npy or .h5/.hdf5. Defaults to None,
+            in which case the windows are returned in memory.
+        block_size: Height and width of the raster blocks the points are grouped by in pixels. Defaults to 1024.
+        n_workers: Number of worker threads reading the rasters. Each thread opens its own handle to the
+            raster it reads, so the rasters need to be readable again by their name. Defaults to None,
+            which reads the rasters sequentially through the given datasets.
+
+    Returns:
+        Array of the windows with shape (points, bands, height, width), memory-mapped if written to
+        a .npy file. None if the windows were written to an HDF5 file.
+
+    Raises:
+        InvalidParameterValueException: Window size, block size or number of workers is not positive,
+            no rasters are given or the output file type is not supported.
+        NonMatchingRasterMetadataException: The rasters do not have the same grid properties.
+        CoordinatesOutOfBoundException: Window center coordinates are out of raster bounds.
+    """
+    if height < 1 or width < 1:
+        raise InvalidParameterValueException(f"Window size is too small: {height}, {width}.")
+
+    if block_size < 1:
+        raise InvalidParameterValueException("Block size must be a positive integer.")
+
+    if n_workers is not None and n_workers < 1:
+        raise InvalidParameterValueException("Number of workers must be a positive integer.")
+
+    if len(rasters) == 0:
+        raise InvalidParameterValueException("At least one raster is needed.")
+
+    if output_file is not None and output_file.suffix.lower() not in (".npy", ".h5", ".hdf5"):
+        raise InvalidParameterValueException("Output file should be a .npy or an HDF5 (.h5, .hdf5) file.")
+
+    if not check_raster_grids([raster.profile for raster in rasters]):
+        raise NonMatchingRasterMetadataException("Input rasters should have the same grid properties.")
+
+    x = points.geometry.x.to_numpy()
+    y = points.geometry.y.to_numpy()
+
+    for raster in rasters:
+        bounds = raster.bounds
+        if np.any((x < bounds.left) | (x > bounds.right) | (y < bounds.bottom) | (y > bounds.top)):
+            raise CoordinatesOutOfBoundsException("Window center coordinates are out of raster bounds.")
+
+    band_offsets = np.cumsum([0] + [raster.count for raster in rasters])
+    shape = (len(x), int(band_offsets[-1]), height, width)
+    dtype = np.result_type(*[raster.dtypes[0] for raster in rasters])
+
+    hdf5_file = None
+    if output_file is None:
+        out_windows = np.empty(shape, dtype=dtype)
+    elif output_file.suffix.lower() == ".npy":
+        out_windows = np.lib.format.open_memmap(output_file, mode="w+", dtype=dtype, shape=shape)
+    else:
+        import h5py
+
+        hdf5_file = h5py.File(output_file, "w")
+        out_windows = hdf5_file.create_dataset("windows", shape=shape, dtype=dtype)
+
+    def _extract(raster_index: int, raster: rasterio.io.DatasetReader) -> None:
+        bands = slice(band_offsets[raster_index], band_offsets[raster_index + 1])
+
+        def _write_windows(point_indices: np.ndarray, windows: np.ndarray) -> None:
+            if hdf5_file is None:
+                out_windows[point_indices, bands] = windows
+            else:
+                # HDF5 datasets only take increasing indices, so the windows are written one by one
+                for point_index, window in zip(point_indices, windows):
+                    out_windows[point_index, bands] = window
+
+        _extract_raster_windows(raster, x, y, height, width, block_size, _write_windows)
+
+    def _extract_reopened(raster_index: int) -> None:
+        # Datasets are not safe to share between threads, so each worker reads through its own handle
+        with rasterio.open(rasters[raster_index].name) as raster:
+            _extract(raster_index, raster)
+
+    try:
+        if len(x) > 0:
+            if n_workers is None or n_workers == 1:
+                for raster_index, raster in enumerate(rasters):
+                    _extract(raster_index, raster)
+            else:
+                with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                    list(executor.map(_extract_reopened, range(len(rasters))))
+    finally:
+        if hdf5_file is not None:
+            hdf5_file.close()
+
+    if hdf5_file is not None:
+        return None
+    if isinstance(out_windows, np.memmap):
+        out_windows.flush()
+    return out_windows
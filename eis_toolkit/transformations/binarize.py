@@ -1,4 +1,6 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import rasterio
@@ -6,6 +8,7 @@ from beartype import beartype
 from beartype.typing import Optional, Sequence, Tuple
 
 from eis_toolkit.exceptions import InvalidRasterBandException, NonMatchingParameterLengthsException
+from eis_toolkit.utilities.blockwise import get_block_output_profile, process_raster_bands_by_blocks
 from eis_toolkit.utilities.checks.parameter import check_parameter_length
 from eis_toolkit.utilities.checks.raster import check_raster_bands
 from eis_toolkit.utilities.miscellaneous import cast_scalar_to_int, check_dtype_for_int, expand_and_zip
@@ -21,6 +24,34 @@ def _binarize(
     return out_array
 
 
+def _check_binarize_parameters(
+    raster: rasterio.io.DatasetReader,
+    thresholds: Sequence[Number],
+    bands: Optional[Sequence[int]],
+    nodata: Optional[Number],
+) -> Tuple[Sequence[int], Number, Sequence[Number]]:
+    bands = list(range(1, raster.count + 1)) if bands is None else bands
+    nodata = cast_scalar_to_int(raster.nodata if nodata is None else nodata)
+
+    if check_raster_bands(raster, bands) is False:
+        raise InvalidRasterBandException("Invalid band selection.")
+
+    if check_parameter_length(bands, thresholds) is False:
+        raise NonMatchingParameterLengthsException("Invalid threshold length.")
+
+    expanded_args = expand_and_zip(bands, thresholds)
+    thresholds = [element[1] for element in expanded_args]
+
+    return bands, nodata, thresholds
+
+
+def _binarize_block(band_array: np.ndarray, nodata: Number, threshold: Number) -> np.ndarray:
+    band_mask = np.isin(band_array, nodata)
+    band_array = _binarize(band_array, threshold=threshold)
+
+    return np.where(band_mask, nodata, band_array)
+
+
 @beartype
 def binarize(  # type: ignore[no-any-unimported]
     raster: rasterio.io.DatasetReader,
@@ -55,17 +86,7 @@ def binarize(  # type: ignore[no-any-unimported]
         InvalidRasterBandException: The input contains invalid band numbers.
         NonMatchingParameterLengthsException: The input does not match the number of selected bands.
     """
-    bands = list(range(1, raster.count + 1)) if bands is None else bands
-    nodata = cast_scalar_to_int(raster.nodata if nodata is None else nodata)
-
-    if check_raster_bands(raster, bands) is False:
-        raise InvalidRasterBandException("Invalid band selection.")
-
-    if check_parameter_length(bands, thresholds) is False:
-        raise NonMatchingParameterLengthsException("Invalid threshold length.")
-
-    expanded_args = expand_and_zip(bands, thresholds)
-    thresholds = [element[1] for element in expanded_args]
+    bands, nodata, thresholds = _check_binarize_parameters(raster, thresholds, bands, nodata)
 
     out_settings = {}
 
@@ -102,3 +123,66 @@ def binarize(  # type: ignore[no-any-unimported]
     out_meta.update({"count": len(bands), "nodata": nodata, "dtype": out_array.dtype.name})
 
     return out_array, out_meta, out_settings
+
+
+@beartype
+def binarize_windowed(  # type: ignore[no-any-unimported]
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    thresholds: Sequence[Number],
+    bands: Optional[Sequence[int]] = None,
+    nodata: Optional[Number] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> Tuple[dict, dict]:
+    """
+    Binarize data based on a given threshold block by block and write the result to a GeoTIFF.
+
+    The raster is read and written window by window, so only one block is in memory at a time.
+    Otherwise works like binarize.
+
+    Args:
+        raster: Data object to be transformed.
+        output_raster: Path of the output GeoTIFF.
+        thresholds: Threshold values for transformation.
+        bands: Selection of bands to be transformed.
+        nodata: Nodata value to be considered.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel. Defaults to None,
+            which processes the blocks sequentially.
+
+    Returns:
+        out_profile: The profile of the written output raster.
+        out_settings: Log of input settings and calculated statistics if available.
+
+    Raises:
+        InvalidRasterBandException: The input contains invalid band numbers.
+        NonMatchingParameterLengthsException: The input does not match the number of selected bands.
+        InvalidParameterValueException: The block size or number of workers is not positive.
+    """
+    bands, nodata, thresholds = _check_binarize_parameters(raster, thresholds, bands, nodata)
+
+    out_settings = {}
+    band_functions = []
+
+    for i in range(0, len(bands)):
+        band_functions.append(partial(_binarize_block, nodata=nodata, threshold=thresholds[i]))
+
+        current_transform = f"transformation {i + 1}"
+        current_settings = {
+            "band_origin": bands[i],
+            "threshold": thresholds[i],
+            "nodata": nodata,
+        }
+
+        out_settings[current_transform] = current_settings
+
+    out_dtype = raster.dtypes[0] if not check_dtype_for_int(nodata) else np.min_scalar_type(nodata).name
+    out_profile = get_block_output_profile(raster, count=len(bands), dtype=out_dtype)
+    out_profile.update({"nodata": nodata})
+
+    out_profile = process_raster_bands_by_blocks(
+        raster, output_raster, bands, band_functions, out_profile, block_size, n_workers
+    )
+
+    return out_profile, out_settings
@@ -1,4 +1,6 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import rasterio
@@ -10,6 +12,7 @@ from eis_toolkit.exceptions import (
     InvalidRasterBandException,
     NonMatchingParameterLengthsException,
 )
+from eis_toolkit.utilities.blockwise import get_block_output_profile, process_raster_bands_by_blocks
 from eis_toolkit.utilities.checks.parameter import check_minmax_position, check_parameter_length
 from eis_toolkit.utilities.checks.raster import check_raster_bands
 from eis_toolkit.utilities.miscellaneous import (
@@ -39,6 +42,44 @@ def _clip_transform(  # type: ignore[no-any-unimported]
     return out_array
 
 
+def _check_clip_parameters(
+    raster: rasterio.io.DatasetReader,
+    limits: Sequence[Tuple[Optional[Number], Optional[Number]]],
+    bands: Optional[Sequence[int]],
+    nodata: Optional[Number],
+) -> Tuple[Sequence[int], Optional[Number], Sequence[Tuple[Optional[Number], Optional[Number]]]]:
+    bands = list(range(1, raster.count + 1)) if bands is None else bands
+    nodata = raster.nodata if nodata is None else nodata
+
+    if check_raster_bands(raster, bands) is False:
+        raise InvalidRasterBandException("Invalid band selection")
+
+    if check_parameter_length(bands, limits) is False:
+        raise NonMatchingParameterLengthsException("Invalid limit length.")
+
+    for item in limits:
+        if item.count(None) == len(item):
+            raise InvalidParameterValueException(f"Limit values all None: {item}.")
+
+        if not check_minmax_position(item):
+            raise InvalidParameterValueException(f"Invalid min-max values provided: {item}.")
+
+    expanded_args = expand_and_zip(bands, limits)
+    limits = [element[1] for element in expanded_args]
+
+    return bands, nodata, limits
+
+
+def _clip_transform_block(
+    band_array: np.ndarray, nodata: Optional[Number], limits: Tuple[Optional[Number], Optional[Number]]
+) -> np.ndarray:
+    band_array = cast_array_to_float(band_array, cast_int=True)
+    if nodata is not None:
+        band_array = nodata_to_nan(band_array, nodata_value=nodata)
+
+    return _clip_transform(band_array, limits=limits)
+
+
 @beartype
 def clip_transform(  # type: ignore[no-any-unimported]
     raster: rasterio.io.DatasetReader,
@@ -73,24 +114,7 @@ def clip_transform(  # type: ignore[no-any-unimported]
         NonMatchingParameterLengthsException: The input does not match the number of selected bands.
         InvalidParameterValueException: The input does not match the requirements (values, order of values).
     """
-    bands = list(range(1, raster.count + 1)) if bands is None else bands
-    nodata = raster.nodata if nodata is None else nodata
-
-    if check_raster_bands(raster, bands) is False:
-        raise InvalidRasterBandException("Invalid band selection")
-
-    if check_parameter_length(bands, limits) is False:
-        raise NonMatchingParameterLengthsException("Invalid limit length.")
-
-    for item in limits:
-        if item.count(None) == len(item):
-            raise InvalidParameterValueException(f"Limit values all None: {item}.")
-
-        if not check_minmax_position(item):
-            raise InvalidParameterValueException(f"Invalid min-max values provided: {item}.")
-
-    expanded_args = expand_and_zip(bands, limits)
-    limits = [element[1] for element in expanded_args]
+    bands, nodata, limits = _check_clip_parameters(raster, limits, bands, nodata)
 
     out_settings = {}
 
@@ -127,3 +151,67 @@ def clip_transform(  # type: ignore[no-any-unimported]
     out_meta.update({"count": len(bands), "nodata": nodata, "dtype": out_array.dtype.name})
 
     return out_array, out_meta, out_settings
+
+
+@beartype
+def clip_transform_windowed(  # type: ignore[no-any-unimported]
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    limits: Sequence[Tuple[Optional[Number], Optional[Number]]],
+    bands: Optional[Sequence[int]] = None,
+    nodata: Optional[Number] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> Tuple[dict, dict]:
+    """
+    Clip data based on specified upper and lower limits block by block and write the result to a GeoTIFF.
+
+    The raster is read and written window by window, so only one block is in memory at a time.
+    Otherwise works like clip_transform. The output keeps the data type of the raster.
+
+    Args:
+        raster: Data object to be transformed.
+        output_raster: Path of the output GeoTIFF.
+        limits: Lower and upper limits (lower, upper) as real values.
+        bands: Selection of bands to be transformed.
+        nodata: Nodata value to be considered.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel. Defaults to None,
+            which processes the blocks sequentially.
+
+    Returns:
+        out_profile: The profile of the written output raster.
+        out_settings: Log of input settings and calculated statistics if available.
+
+    Raises:
+        InvalidRasterBandException: The input contains invalid band numbers.
+        NonMatchingParameterLengthsException: The input does not match the number of selected bands.
+        InvalidParameterValueException: The input does not match the requirements (values, order of values),
+            or the block size or number of workers is not positive.
+    """
+    bands, nodata, limits = _check_clip_parameters(raster, limits, bands, nodata)
+
+    out_settings = {}
+    band_functions = []
+
+    for i in range(0, len(bands)):
+        band_functions.append(partial(_clip_transform_block, nodata=nodata, limits=limits[i]))
+
+        current_transform = f"transformation {i + 1}"
+        current_settings = {
+            "band_origin": bands[i],
+            "limit_lower": cast_scalar_to_int(limits[i][0]),
+            "limit_upper": cast_scalar_to_int(limits[i][1]),
+            "nodata": cast_scalar_to_int(nodata),
+        }
+
+        out_settings[current_transform] = current_settings
+
+    out_profile = get_block_output_profile(raster, count=len(bands), dtype=raster.dtypes[0])
+    out_profile.update({"nodata": nodata})
+
+    out_profile = process_raster_bands_by_blocks(
+        raster, output_raster, bands, band_functions, out_profile, block_size, n_workers
+    )
+
+    return out_profile, out_settings
@@ -1,12 +1,20 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import rasterio
 from beartype import beartype
 from beartype.typing import Optional, Sequence
 
 from eis_toolkit.exceptions import InvalidColumnException, NumericValueSignException
-from eis_toolkit.utilities.aitchison_geometry import _closure
+from eis_toolkit.utilities.aitchison_geometry import (
+    _check_part_bands,
+    _closure,
+    _count_parts,
+    _transform_composition_raster,
+)
 from eis_toolkit.utilities.checks.compositional import check_in_simplex_sample_space
 from eis_toolkit.utilities.miscellaneous import rename_columns_by_pattern
 
@@ -18,6 +26,56 @@ def _alr_transform(df: pd.DataFrame, columns: Sequence[str], denominator_column:
     return np.log(ratios)
 
 
+def _alr_transform_array(values: np.ndarray, parts: Sequence[int], denominator_part: int) -> np.ndarray:
+
+    return np.log(values[..., parts] / values[..., [denominator_part]])
+
+
+@beartype
+def alr_transform_raster(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    output_raster: Path,
+    denominator_band: Optional[int] = None,
+    keep_denominator_band: bool = False,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Perform an additive logratio transformation on raster data block by block and write the result to a GeoTIFF.
+
+    The parts of the composition are the bands of the input rasters in order, so the input can be a single
+    multiband raster or several single band rasters on the same grid. Bands are numbered from 1 across all
+    the rasters. Cells with nodata in any part are written as nodata. Only one block is in memory at a time.
+
+    Args:
+        rasters: The rasters of compositional data.
+        output_raster: Path of the output GeoTIFF, with one band per transformed part.
+        denominator_band: The number of the band to be used as the denominator. Defaults to the last band.
+        keep_denominator_band: Whether to include the denominator band in the result. If True, the output has
+            as many bands as there are parts. Defaults to False.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: No rasters are given or the block size or number of workers is not positive.
+        InvalidRasterBandException: The denominator band is not found in the rasters.
+        NonMatchingRasterMetadataException: The rasters do not have the same grid properties and extent.
+        NumericValueSignException: Data contains zeros or negative values.
+    """
+    n_parts = _count_parts(rasters)
+    denominator_band = denominator_band if denominator_band is not None else n_parts
+    _check_part_bands(rasters, [denominator_band])
+
+    parts = [part for part in range(n_parts) if keep_denominator_band or part != denominator_band - 1]
+    transform = partial(_alr_transform_array, parts=parts, denominator_part=denominator_band - 1)
+
+    return _transform_composition_raster(rasters, output_raster, transform, len(parts), block_size, n_workers)
+
+
 @beartype
 def alr_transform(
     df: pd.DataFrame, column: Optional[str] = None, keep_denominator_column: bool = False
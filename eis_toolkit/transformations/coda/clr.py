@@ -1,30 +1,31 @@
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import rasterio
 from beartype import beartype
 from beartype.typing import Optional, Sequence
-from scipy.stats import gmean
 
 from eis_toolkit.exceptions import NumericValueSignException
-from eis_toolkit.utilities.aitchison_geometry import _closure
+from eis_toolkit.utilities.aitchison_geometry import _closure, _count_parts, _transform_composition_raster
 from eis_toolkit.utilities.checks.compositional import check_in_simplex_sample_space
 from eis_toolkit.utilities.miscellaneous import rename_columns, rename_columns_by_pattern
 
 
-@beartype
-def _centered_ratio(row: pd.Series) -> pd.Series:
+def _clr_transform_array(values: np.ndarray) -> np.ndarray:
 
-    return row / gmean(row)
+    # The log of the geometric mean is the mean of the logs
+    log_values = np.log(values)
+    return log_values - log_values.mean(axis=-1, keepdims=True)
 
 
 @beartype
 def _clr_transform(df: pd.DataFrame) -> pd.DataFrame:
 
-    dfc = df.copy()
-    dfc = dfc.apply(_centered_ratio, axis=1)
+    clr_values = _clr_transform_array(df.to_numpy(dtype=np.float64))
 
-    return np.log(dfc)
+    return pd.DataFrame(clr_values, index=df.index, columns=df.columns)
 
 
 @beartype
@@ -46,6 +47,40 @@ def clr_transform(df: pd.DataFrame) -> pd.DataFrame:
     return rename_columns_by_pattern(_clr_transform(df))
 
 
+@beartype
+def clr_transform_raster(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    output_raster: Path,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Perform a centered logratio transformation on raster data block by block and write the result to a GeoTIFF.
+
+    The parts of the composition are the bands of the input rasters in order, so the input can be a single
+    multiband raster or several single band rasters on the same grid. Cells with nodata in any part are
+    written as nodata. Only one block is in memory at a time.
+
+    Args:
+        rasters: The rasters of compositional data.
+        output_raster: Path of the output GeoTIFF, with one band per part.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: No rasters are given or the block size or number of workers is not positive.
+        NonMatchingRasterMetadataException: The rasters do not have the same grid properties and extent.
+        NumericValueSignException: Data contains zeros or negative values.
+    """
+    return _transform_composition_raster(
+        rasters, output_raster, _clr_transform_array, _count_parts(rasters), block_size, n_workers
+    )
+
+
 @beartype
 def _inverse_clr(df: pd.DataFrame, colnames: Optional[Sequence[str]] = None, scale: Number = 1.0) -> pd.DataFrame:
     inverse = _closure(np.exp(df), scale)
@@ -1,10 +1,14 @@
+from functools import partial
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
+import rasterio
 from beartype import beartype
-from beartype.typing import Sequence
-from scipy.stats import gmean
+from beartype.typing import Optional, Sequence
 
 from eis_toolkit.exceptions import InvalidColumnException, InvalidCompositionException, InvalidParameterValueException
+from eis_toolkit.utilities.aitchison_geometry import _check_part_bands, _transform_composition_raster
 from eis_toolkit.utilities.checks.compositional import check_in_simplex_sample_space
 from eis_toolkit.utilities.checks.dataframe import check_columns_valid
 from eis_toolkit.utilities.checks.parameter import check_lists_overlap, check_numeric_value_sign
@@ -31,14 +35,18 @@ def _calculate_ilr_scaling_factor(c1: int, c2: int) -> np.float64:
     return np.sqrt((c1 * c2) / np.float64(c1 + c2))
 
 
-@beartype
-def _geometric_mean_logratio(
-    row: pd.Series, subcomposition_1: Sequence[str], subcomposition_2: Sequence[str]
-) -> np.float64:
+def _single_ilr_transform_array(
+    values: np.ndarray, subcomposition_1: Sequence[int], subcomposition_2: Sequence[int]
+) -> np.ndarray:
+
+    c1 = len(subcomposition_1)
+    c2 = len(subcomposition_2)
+
+    # The logratio of the geometric means is the difference of the mean logs
+    numerator = np.log(values[..., subcomposition_1]).mean(axis=-1, keepdims=True)
+    denominator = np.log(values[..., subcomposition_2]).mean(axis=-1, keepdims=True)
 
-    numerator = gmean(row[subcomposition_1])
-    denominator = gmean(row[subcomposition_2])
-    return np.log(numerator / denominator)
+    return _calculate_ilr_scaling_factor(c1, c2) * (numerator - denominator)
 
 
 @beartype
@@ -46,20 +54,13 @@ def _single_ilr_transform(
     df: pd.DataFrame, subcomposition_1: Sequence[str], subcomposition_2: Sequence[str]
 ) -> pd.Series:
 
-    dfc = df.copy()
-
-    c1 = len(subcomposition_1)
-    c2 = len(subcomposition_2)
-
-    # A Series to hold the transformed rows
-    ilr_values = pd.Series([0.0] * df.shape[0])
-
-    for idx, row in dfc.iterrows():
-        ilr_values[idx] = _geometric_mean_logratio(row, subcomposition_1, subcomposition_2)
-
-    ilr_values = _calculate_ilr_scaling_factor(c1, c2) * ilr_values
+    ilr_values = _single_ilr_transform_array(
+        df.to_numpy(dtype=np.float64),
+        list(df.columns.get_indexer(subcomposition_1)),
+        list(df.columns.get_indexer(subcomposition_2)),
+    )
 
-    return ilr_values
+    return pd.Series(ilr_values[:, 0], index=df.index)
 
 
 @beartype
@@ -98,3 +99,59 @@ def single_ilr_transform(
         raise InvalidCompositionException("The subcompositions overlap.")
 
     return _single_ilr_transform(df, subcomposition_1, subcomposition_2)
+
+
+@beartype
+def single_ilr_transform_raster(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    output_raster: Path,
+    subcomposition_1: Sequence[int],
+    subcomposition_2: Sequence[int],
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Perform a single isometric logratio transformation on raster data block by block and write it to a GeoTIFF.
+
+    The parts of the composition are the bands of the input rasters in order, so the input can be a single
+    multiband raster or several single band rasters on the same grid. Bands are numbered from 1 across all
+    the rasters. Cells with nodata in any part are written as nodata. Only one block is in memory at a time.
+
+    Args:
+        rasters: The rasters of compositional data.
+        output_raster: Path of the single band output GeoTIFF.
+        subcomposition_1: Numbers of the bands in the numerator part of the ratio.
+        subcomposition_2: Numbers of the bands in the denominator part of the ratio.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        InvalidCompositionException: One or more bands are found in both subcompositions.
+        InvalidParameterValueException: At least one subcomposition provided was empty, or the block size or
+            number of workers is not positive.
+        InvalidRasterBandException: One or more subcomposition bands are not found in the rasters.
+        NonMatchingRasterMetadataException: The rasters do not have the same grid properties and extent.
+        NumericValueSignException: Data contains zeros or negative values.
+    """
+    if not (subcomposition_1 and subcomposition_2):
+        raise InvalidParameterValueException("A subcomposition should contain at least one band.")
+
+    _check_part_bands(rasters, [*subcomposition_1, *subcomposition_2])
+
+    if set(subcomposition_1) & set(subcomposition_2):
+        raise InvalidCompositionException("The subcompositions overlap.")
+
+    # Only the bands of the subcompositions are passed to the transform, in order
+    c1 = len(subcomposition_1)
+    transform = partial(
+        _single_ilr_transform_array,
+        subcomposition_1=list(range(c1)),
+        subcomposition_2=list(range(c1, c1 + len(subcomposition_2))),
+    )
+    parts = [band - 1 for band in [*subcomposition_1, *subcomposition_2]]
+
+    return _transform_composition_raster(rasters, output_raster, transform, 1, block_size, n_workers, parts)
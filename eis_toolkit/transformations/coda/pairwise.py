@@ -1,10 +1,15 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import rasterio
 from beartype import beartype
+from beartype.typing import Optional, Sequence
 
 from eis_toolkit.exceptions import InvalidColumnException, InvalidParameterValueException
+from eis_toolkit.utilities.aitchison_geometry import _check_part_bands, _transform_composition_raster
 from eis_toolkit.utilities.checks.dataframe import check_dataframe_contains_zeros
 
 
@@ -71,3 +76,50 @@ def pairwise_logratio(df: pd.DataFrame, numerator_column: str, denominator_colum
         raise InvalidParameterValueException("The input columns contain at least one zero value.")
 
     return _pairwise_logratio(df, numerator_column, denominator_column)
+
+
+def _pairwise_logratio_array(values: np.ndarray, numerator_part: int, denominator_part: int) -> np.ndarray:
+
+    return np.log(values[..., [numerator_part]] / values[..., [denominator_part]])
+
+
+@beartype
+def pairwise_logratio_raster(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    output_raster: Path,
+    numerator_band: int,
+    denominator_band: int,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Perform a pairwise logratio transformation on the given raster bands block by block and write it to a GeoTIFF.
+
+    Bands are numbered from 1 across all the input rasters, so the input can be a single multiband raster or
+    several single band rasters on the same grid. Cells with nodata in either band are written as nodata.
+    Only one block is in memory at a time.
+
+    Args:
+        rasters: The rasters containing the bands to use in the transformation.
+        output_raster: Path of the single band output GeoTIFF.
+        numerator_band: The number of the band to use as the numerator.
+        denominator_band: The number of the band to use as the denominator.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: No rasters are given or the block size or number of workers is not positive.
+        InvalidRasterBandException: One or both of the bands are not found in the rasters.
+        NonMatchingRasterMetadataException: The rasters do not have the same grid properties and extent.
+        NumericValueSignException: Data contains zeros or negative values.
+    """
+    _check_part_bands(rasters, [numerator_band, denominator_band])
+
+    transform = partial(_pairwise_logratio_array, numerator_part=0, denominator_part=1)
+    parts = [numerator_band - 1, denominator_band - 1]
+
+    return _transform_composition_raster(rasters, output_raster, transform, 1, block_size, n_workers, parts)
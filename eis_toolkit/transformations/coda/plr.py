@@ -1,9 +1,13 @@
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
+import rasterio
 from beartype import beartype
-from scipy.stats import gmean
+from beartype.typing import Optional, Sequence
 
 from eis_toolkit.exceptions import InvalidColumnException, InvalidParameterValueException
+from eis_toolkit.utilities.aitchison_geometry import _count_parts, _transform_composition_raster
 from eis_toolkit.utilities.checks.compositional import check_in_simplex_sample_space
 from eis_toolkit.utilities.checks.parameter import check_numeric_value_sign
 from eis_toolkit.utilities.miscellaneous import rename_columns_by_pattern
@@ -32,20 +36,15 @@ def _calculate_plr_scaling_factor(c: int) -> np.float64:
 @beartype
 def _single_plr_transform_by_index(df: pd.DataFrame, column_ind: int) -> pd.Series:
 
-    dfc = df.copy()
     # The denominator is a subcomposition of all the parts "to the right" of the column:
-    columns = [col for col in df.columns]
-    subcomposition = [columns[i] for i in range(len(columns)) if i > column_ind]
-    c = len(subcomposition)
+    log_values = np.log(df.to_numpy(dtype=np.float64))
+    c = log_values.shape[1] - column_ind - 1
     scaling_factor = _calculate_plr_scaling_factor(c)
 
-    # A series to hold the transformed rows
-    plr_values = pd.Series([0.0] * df.shape[0])
-
-    for idx, row in dfc.iterrows():
-        plr_values[idx] = scaling_factor * np.log(row.iloc[column_ind] / gmean(row[subcomposition]))
+    denominator_start = column_ind + 1
+    plr_values = scaling_factor * (log_values[:, column_ind] - log_values[:, denominator_start:].mean(axis=1))
 
-    return plr_values
+    return pd.Series(plr_values, index=df.index)
 
 
 @beartype
@@ -92,17 +91,22 @@ def single_plr_transform(df: pd.DataFrame, column: str) -> pd.Series:
     return _single_plr_transform(df, column)
 
 
-@beartype
-def _plr_transform(df: pd.DataFrame) -> pd.DataFrame:
-    dfc = df.copy()
+def _plr_transform_array(values: np.ndarray) -> np.ndarray:
+    log_values = np.log(values)
 
-    # A dataframe to hold the transformed values
-    plr_values = pd.DataFrame(0.0, index=dfc.index, columns=dfc.columns[:-1])
+    # Sums of the logs of the parts to the right of each part, accumulated from the last part
+    tail_sums = np.cumsum(log_values[..., :0:-1], axis=-1)[..., ::-1]
+    c = np.arange(log_values.shape[-1] - 1, 0, -1)
+    scaling_factors = np.sqrt(c / (1.0 + c))
 
-    for i in range(len(df.columns) - 1):
-        plr_values.iloc[:, i] = _single_plr_transform_by_index(dfc, i)
+    return scaling_factors * (log_values[..., :-1] - tail_sums / c)
 
-    return plr_values
+
+@beartype
+def _plr_transform(df: pd.DataFrame) -> pd.DataFrame:
+    plr_values = _plr_transform_array(df.to_numpy(dtype=np.float64))
+
+    return pd.DataFrame(plr_values, index=df.index, columns=df.columns[:-1])
 
 
 @beartype
@@ -124,3 +128,40 @@ def plr_transform(df: pd.DataFrame) -> pd.DataFrame:
     check_in_simplex_sample_space(df)
 
     return rename_columns_by_pattern(_plr_transform(df))
+
+
+@beartype
+def plr_transform_raster(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    output_raster: Path,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Perform a pivot logratio transformation on raster data block by block and write the result to a GeoTIFF.
+
+    The parts of the composition are the bands of the input rasters in order, so the input can be a single
+    multiband raster or several single band rasters on the same grid. Band order matters. Cells with nodata
+    in any part are written as nodata. Only one block is in memory at a time.
+
+    Args:
+        rasters: The rasters of compositional data.
+        output_raster: Path of the output GeoTIFF, with one band less than there are parts.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel.
+            Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: There are less than two parts or the block size or number of workers
+            is not positive.
+        NonMatchingRasterMetadataException: The rasters do not have the same grid properties and extent.
+        NumericValueSignException: Data contains zeros or negative values.
+    """
+    parts = _count_parts(rasters)
+    if parts < 2:
+        raise InvalidParameterValueException("Expected at least two bands in the composition.")
+
+    return _transform_composition_raster(rasters, output_raster, _plr_transform_array, parts - 1, block_size, n_workers)
@@ -1,4 +1,6 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import rasterio
@@ -10,6 +12,7 @@ from eis_toolkit.exceptions import (
     InvalidRasterBandException,
     NonMatchingParameterLengthsException,
 )
+from eis_toolkit.utilities.blockwise import get_block_output_profile, process_raster_bands_by_blocks
 from eis_toolkit.utilities.checks.parameter import check_minmax_position, check_parameter_length
 from eis_toolkit.utilities.checks.raster import check_raster_bands
 from eis_toolkit.utilities.miscellaneous import (
@@ -20,14 +23,17 @@ from eis_toolkit.utilities.miscellaneous import (
     truncate_decimal_places,
 )
 from eis_toolkit.utilities.nodata import nan_to_nodata
+from eis_toolkit.utilities.streaming_statistics import raster_band_statistics
 
 
 @beartype
 def _z_score_normalization(  # type: ignore[no-any-unimported]
     in_array: np.ndarray,
+    mean: Optional[Number] = None,
+    sd: Optional[Number] = None,
 ) -> Tuple[np.ndarray, Number, Number]:
-    mean = np.nanmean(in_array)
-    sd = np.nanstd(in_array)
+    mean = np.nanmean(in_array) if mean is None else mean
+    sd = np.nanstd(in_array) if sd is None else sd
 
     out_array = (in_array - mean) / sd
 
@@ -38,9 +44,11 @@ def _z_score_normalization(  # type: ignore[no-any-unimported]
 def _min_max_scaling(  # type: ignore[no-any-unimported]
     in_array: np.ndarray,
     new_range: Tuple[Number, Number],
+    array_min: Optional[Number] = None,
+    array_max: Optional[Number] = None,
 ) -> np.ndarray:
-    array_min = np.nanmin(in_array)
-    array_max = np.nanmax(in_array)
+    array_min = np.nanmin(in_array) if array_min is None else array_min
+    array_max = np.nanmax(in_array) if array_max is None else array_max
     scaled_min, scaled_max = new_range[0], new_range[1]
 
     scaler = (in_array - array_min) / (array_max - array_min)
@@ -49,6 +57,75 @@ def _min_max_scaling(  # type: ignore[no-any-unimported]
     return out_array
 
 
+def _check_z_score_parameters(
+    raster: rasterio.io.DatasetReader, bands: Optional[Sequence[int]], nodata: Optional[Number]
+) -> Tuple[Sequence[int], Optional[Number]]:
+    bands = list(range(1, raster.count + 1)) if bands is None else bands
+    nodata = raster.nodata if nodata is None else nodata
+
+    if check_raster_bands(raster, bands) is False:
+        raise InvalidRasterBandException("Invalid band selection.")
+
+    return bands, nodata
+
+
+def _check_min_max_parameters(
+    raster: rasterio.io.DatasetReader,
+    bands: Optional[Sequence[int]],
+    new_range: Sequence[Tuple[Number, Number]],
+    nodata: Optional[Number],
+) -> Tuple[Sequence[int], Optional[Number], Sequence[Tuple[Number, Number]]]:
+    bands = list(range(1, raster.count + 1)) if bands is None else bands
+    nodata = raster.nodata if nodata is None else nodata
+
+    if check_raster_bands(raster, bands) is False:
+        raise InvalidRasterBandException("Invalid band selection")
+
+    if check_parameter_length(bands, new_range) is False:
+        raise NonMatchingParameterLengthsException("Invalid new_range length")
+
+    for item in new_range:
+        if not check_minmax_position(item):
+            raise InvalidParameterValueException(f"Invalid min-max values provided: {item}")
+
+    expanded_args = expand_and_zip(bands, new_range)
+    new_range = [element[1] for element in expanded_args]
+
+    return bands, nodata, new_range
+
+
+def _prepare_band_block(band_array: np.ndarray, nodata: Optional[Number]) -> np.ndarray:
+    band_array = cast_array_to_float(band_array, cast_int=True)
+    band_array = replace_values(band_array, values_to_replace=[nodata, np.inf], replace_value=np.nan)
+    return band_array.astype(np.float64)
+
+
+def _finish_band_block(band_array: np.ndarray, nodata: Optional[Number], out_decimals: int) -> np.ndarray:
+    band_array = truncate_decimal_places(band_array, decimal_places=out_decimals)
+    return band_array if nodata is None else nan_to_nodata(band_array, nodata_value=nodata)
+
+
+def _z_score_normalization_block(
+    band_array: np.ndarray, nodata: Optional[Number], mean: Number, sd: Number, out_decimals: int
+) -> np.ndarray:
+    band_array, _, _ = _z_score_normalization(_prepare_band_block(band_array, nodata), mean=mean, sd=sd)
+    return _finish_band_block(band_array, nodata, out_decimals)
+
+
+def _min_max_scaling_block(
+    band_array: np.ndarray,
+    nodata: Optional[Number],
+    new_range: Tuple[Number, Number],
+    array_min: Number,
+    array_max: Number,
+    out_decimals: int,
+) -> np.ndarray:
+    band_array = _min_max_scaling(
+        _prepare_band_block(band_array, nodata), new_range=new_range, array_min=array_min, array_max=array_max
+    )
+    return _finish_band_block(band_array, nodata, out_decimals)
+
+
 @beartype
 def z_score_normalization(  # type: ignore[no-any-unimported]
     raster: rasterio.io.DatasetReader,
@@ -78,11 +155,7 @@ def z_score_normalization(  # type: ignore[no-any-unimported]
         InvalidRasterBandException: The input contains invalid band numbers.
         NonMatchingParameterLengthsException: The input does not match the number of selected bands.
     """
-    bands = list(range(1, raster.count + 1)) if bands is None else bands
-    nodata = raster.nodata if nodata is None else nodata
-
-    if check_raster_bands(raster, bands) is False:
-        raise InvalidRasterBandException("Invalid band selection.")
+    bands, nodata = _check_z_score_parameters(raster, bands, nodata)
 
     out_settings = {}
     out_decimals = set_max_precision()
@@ -155,21 +228,7 @@ def min_max_scaling(  # type: ignore[no-any-unimported]
         NonMatchingParameterLengthsException: The input does not match the number of selected bands.
         InvalidParameterValueException: The input does not match the requirements (values, order of values).
     """
-    bands = list(range(1, raster.count + 1)) if bands is None else bands
-    nodata = raster.nodata if nodata is None else nodata
-
-    if check_raster_bands(raster, bands) is False:
-        raise InvalidRasterBandException("Invalid band selection")
-
-    if check_parameter_length(bands, new_range) is False:
-        raise NonMatchingParameterLengthsException("Invalid new_range length")
-
-    for item in new_range:
-        if not check_minmax_position(item):
-            raise InvalidParameterValueException(f"Invalid min-max values provided: {item}")
-
-    expanded_args = expand_and_zip(bands, new_range)
-    new_range = [element[1] for element in expanded_args]
+    bands, nodata, new_range = _check_min_max_parameters(raster, bands, new_range, nodata)
 
     out_settings = {}
     out_decimals = set_max_precision()
@@ -207,3 +266,147 @@ def min_max_scaling(  # type: ignore[no-any-unimported]
     out_meta.update({"count": len(bands), "nodata": nodata, "dtype": out_array.dtype.name})
 
     return out_array, out_meta, out_settings
+
+
+@beartype
+def z_score_normalization_windowed(  # type: ignore[no-any-unimported]
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    bands: Optional[Sequence[int]] = None,
+    nodata: Optional[Number] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> Tuple[dict, dict]:
+    """
+    Normalize data based on mean and standard deviation block by block and write the result to a GeoTIFF.
+
+    The mean and standard deviation of the bands are computed in a first windowed pass over the raster and
+    the normalization is applied in a second one, so only one block is in memory at a time. Otherwise works
+    like z_score_normalization. The output is written as float32.
+
+    Args:
+        raster: Data object to be transformed.
+        output_raster: Path of the output GeoTIFF.
+        bands: Selection of bands to be transformed.
+        nodata: Nodata value to be considered.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for the second pass. Defaults to None, which processes
+            the blocks sequentially.
+
+    Returns:
+        out_profile: The profile of the written output raster.
+        out_settings: Log of input settings and calculated statistics if available.
+
+    Raises:
+        InvalidRasterBandException: The input contains invalid band numbers.
+        InvalidParameterValueException: The block size or number of workers is not positive.
+    """
+    bands, nodata = _check_z_score_parameters(raster, bands, nodata)
+
+    out_settings = {}
+    out_decimals = set_max_precision()
+    band_statistics = raster_band_statistics(raster, bands, nodata, block_size)
+    band_functions = []
+
+    for i in range(0, len(bands)):
+        mean, sd = band_statistics[i]["mean"], band_statistics[i]["std"]
+        band_functions.append(
+            partial(_z_score_normalization_block, nodata=nodata, mean=mean, sd=sd, out_decimals=out_decimals)
+        )
+
+        current_transform = f"transformation {i + 1}"
+        current_settings = {
+            "band_origin": bands[i],
+            "original_mean": truncate_decimal_places(mean, decimal_places=out_decimals),
+            "original_sd": truncate_decimal_places(sd, decimal_places=out_decimals),
+            "nodata": nodata,
+            "decimal_places": out_decimals,
+        }
+
+        out_settings[current_transform] = current_settings
+
+    out_profile = get_block_output_profile(raster, count=len(bands), dtype="float32")
+    out_profile.update({"nodata": nodata})
+
+    out_profile = process_raster_bands_by_blocks(
+        raster, output_raster, bands, band_functions, out_profile, block_size, n_workers
+    )
+
+    return out_profile, out_settings
+
+
+@beartype
+def min_max_scaling_windowed(  # type: ignore[no-any-unimported]
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    bands: Optional[Sequence[int]] = None,
+    new_range: Sequence[Tuple[Number, Number]] = [(0, 1)],
+    nodata: Optional[Number] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> Tuple[dict, dict]:
+    """
+    Normalize data based on a specified new range block by block and write the result to a GeoTIFF.
+
+    The minimum and maximum of the bands are computed in a first windowed pass over the raster and the
+    scaling is applied in a second one, so only one block is in memory at a time. Otherwise works like
+    min_max_scaling. The output is written as float32.
+
+    Args:
+        raster: Data object to be transformed.
+        output_raster: Path of the output GeoTIFF.
+        bands: Selection of bands to be transformed.
+        new_range: The new interval data will be transformed into. First value corresponds to min, second to max.
+        nodata: Nodata value to be considered.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for the second pass. Defaults to None, which processes
+            the blocks sequentially.
+
+    Returns:
+        out_profile: The profile of the written output raster.
+        out_settings: Log of input settings and calculated statistics if available.
+
+    Raises:
+        InvalidRasterBandException: The input contains invalid band numbers.
+        NonMatchingParameterLengthsException: The input does not match the number of selected bands.
+        InvalidParameterValueException: The input does not match the requirements (values, order of values),
+            or the block size or number of workers is not positive.
+    """
+    bands, nodata, new_range = _check_min_max_parameters(raster, bands, new_range, nodata)
+
+    out_settings = {}
+    out_decimals = set_max_precision()
+    band_statistics = raster_band_statistics(raster, bands, nodata, block_size)
+    band_functions = []
+
+    for i in range(0, len(bands)):
+        band_functions.append(
+            partial(
+                _min_max_scaling_block,
+                nodata=nodata,
+                new_range=new_range[i],
+                array_min=band_statistics[i]["min"],
+                array_max=band_statistics[i]["max"],
+                out_decimals=out_decimals,
+            )
+        )
+
+        current_transform = f"transformation {i + 1}"
+        current_settings = {
+            "band_origin": bands[i],
+            "scaled_min": new_range[i][0],
+            "scaled_max": new_range[i][1],
+            "nodata": nodata,
+            "decimal_places": out_decimals,
+        }
+
+        out_settings[current_transform] = current_settings
+
+    out_profile = get_block_output_profile(raster, count=len(bands), dtype="float32")
+    out_profile.update({"nodata": nodata})
+
+    out_profile = process_raster_bands_by_blocks(
+        raster, output_raster, bands, band_functions, out_profile, block_size, n_workers
+    )
+
+    return out_profile, out_settings
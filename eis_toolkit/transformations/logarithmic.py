@@ -1,4 +1,6 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import rasterio
@@ -10,6 +12,7 @@ from eis_toolkit.exceptions import (
     InvalidRasterBandException,
     NonMatchingParameterLengthsException,
 )
+from eis_toolkit.utilities.blockwise import get_block_output_profile, process_raster_bands_by_blocks
 from eis_toolkit.utilities.checks.parameter import check_parameter_length
 from eis_toolkit.utilities.checks.raster import check_raster_bands
 from eis_toolkit.utilities.miscellaneous import (
@@ -46,6 +49,49 @@ def _log_transform_log10(  # type: ignore[no-any-unimported]
     return np.log10(in_array)
 
 
+def _check_log_transform_parameters(
+    raster: rasterio.io.DatasetReader,
+    bands: Optional[Sequence[int]],
+    log_transform: Sequence[str],
+    nodata: Optional[Number],
+) -> Tuple[Sequence[int], Optional[Number], Sequence[str]]:
+    bands = list(range(1, raster.count + 1)) if bands is None else bands
+    nodata = raster.nodata if nodata is None else nodata
+
+    if check_raster_bands(raster, bands) is False:
+        raise InvalidRasterBandException("Invalid band selection")
+
+    if check_parameter_length(bands, log_transform) is False:
+        raise NonMatchingParameterLengthsException("Invalid length for log-base values.")
+
+    for item in log_transform:
+        if not (item == "ln" or item == "log2" or item == "log10"):
+            raise InvalidParameterValueException(f"Invalid method: {item}.")
+
+    expanded_args = expand_and_zip(bands, log_transform)
+    log_transform = [element[1] for element in expanded_args]
+
+    return bands, nodata, log_transform
+
+
+def _log_transform_block(
+    band_array: np.ndarray, nodata: Optional[Number], log_transform: str, out_decimals: int
+) -> np.ndarray:
+    band_array = cast_array_to_float(band_array, cast_int=True)
+    band_array = replace_values(band_array, values_to_replace=[nodata, np.inf], replace_value=np.nan)
+    band_array[band_array <= 0] = np.nan
+
+    if log_transform == "ln":
+        band_array = _log_transform_ln(band_array.astype(np.float64))
+    elif log_transform == "log2":
+        band_array = _log_transform_log2(band_array.astype(np.float64))
+    elif log_transform == "log10":
+        band_array = _log_transform_log10(band_array.astype(np.float64))
+
+    band_array = truncate_decimal_places(band_array, decimal_places=out_decimals)
+    return band_array if nodata is None else nan_to_nodata(band_array, nodata_value=nodata)
+
+
 @beartype
 def log_transform(  # type: ignore[no-any-unimported]
     raster: rasterio.io.DatasetReader,
@@ -79,40 +125,14 @@ def log_transform(  # type: ignore[no-any-unimported]
         NonMatchingParameterLengthsException: The input does not match the number of selected bands
         InvalidParameterValueException: The input does not match the requirements (values, order of values)
     """
-    bands = list(range(1, raster.count + 1)) if bands is None else bands
-    nodata = raster.nodata if nodata is None else nodata
-
-    if check_raster_bands(raster, bands) is False:
-        raise InvalidRasterBandException("Invalid band selection")
-
-    if check_parameter_length(bands, log_transform) is False:
-        raise NonMatchingParameterLengthsException("Invalid length for log-base values.")
-
-    for item in log_transform:
-        if not (item == "ln" or item == "log2" or item == "log10"):
-            raise InvalidParameterValueException(f"Invalid method: {item}.")
-
-    expanded_args = expand_and_zip(bands, log_transform)
-    log_transform = [element[1] for element in expanded_args]
+    bands, nodata, log_transform = _check_log_transform_parameters(raster, bands, log_transform, nodata)
 
     out_settings = {}
     out_decimals = set_max_precision()
 
     for i in range(0, len(bands)):
         band_array = raster.read(bands[i])
-        band_array = cast_array_to_float(band_array, cast_int=True)
-        band_array = replace_values(band_array, values_to_replace=[nodata, np.inf], replace_value=np.nan)
-        band_array[band_array <= 0] = np.nan
-
-        if log_transform[i] == "ln":
-            band_array = _log_transform_ln(band_array.astype(np.float64))
-        elif log_transform[i] == "log2":
-            band_array = _log_transform_log2(band_array.astype(np.float64))
-        elif log_transform[i] == "log10":
-            band_array = _log_transform_log10(band_array.astype(np.float64))
-
-        band_array = truncate_decimal_places(band_array, decimal_places=out_decimals)
-        band_array = nan_to_nodata(band_array, nodata_value=nodata)
+        band_array = _log_transform_block(band_array, nodata, log_transform[i], out_decimals)
         band_array = cast_array_to_float(band_array, scalar=nodata, cast_float=True)
 
         band_array = np.expand_dims(band_array, axis=0)
@@ -136,3 +156,70 @@ def log_transform(  # type: ignore[no-any-unimported]
     out_meta.update({"count": len(bands), "nodata": nodata, "dtype": out_array.dtype.name})
 
     return out_array, out_meta, out_settings
+
+
+@beartype
+def log_transform_windowed(  # type: ignore[no-any-unimported]
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    bands: Optional[Sequence[int]] = None,
+    log_transform: Sequence[str] = ["log2"],
+    nodata: Optional[Number] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> Tuple[dict, dict]:
+    """
+    Perform a logarithmic transformation block by block and write the result to a GeoTIFF.
+
+    The raster is read and written window by window, so only one block is in memory at a time.
+    Otherwise works like log_transform. The output is written as float32.
+
+    Args:
+        raster: Data object to be transformed.
+        output_raster: Path of the output GeoTIFF.
+        bands: Selection of bands to be transformed.
+        log_transform: The base for logarithmic transformation. Valid values 'ln', 'log2' and 'log10'.
+        nodata: Nodata value to be considered.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel. Defaults to None,
+            which processes the blocks sequentially.
+
+    Returns:
+        out_profile: The profile of the written output raster.
+        out_settings: Log of input settings and calculated statistics if available.
+
+    Raises:
+        InvalidRasterBandException: The input contains invalid band numbers.
+        NonMatchingParameterLengthsException: The input does not match the number of selected bands
+        InvalidParameterValueException: The input does not match the requirements (values, order of values),
+            or the block size or number of workers is not positive.
+    """
+    bands, nodata, log_transform = _check_log_transform_parameters(raster, bands, log_transform, nodata)
+
+    out_settings = {}
+    out_decimals = set_max_precision()
+    band_functions = []
+
+    for i in range(0, len(bands)):
+        band_functions.append(
+            partial(_log_transform_block, nodata=nodata, log_transform=log_transform[i], out_decimals=out_decimals)
+        )
+
+        current_transform = f"transformation {i + 1}"
+        current_settings = {
+            "band_origin": bands[i],
+            "log_transform": log_transform[i],
+            "nodata": nodata,
+            "decimal_places": out_decimals,
+        }
+
+        out_settings[current_transform] = current_settings
+
+    out_profile = get_block_output_profile(raster, count=len(bands), dtype="float32")
+    out_profile.update({"nodata": nodata})
+
+    out_profile = process_raster_bands_by_blocks(
+        raster, output_raster, bands, band_functions, out_profile, block_size, n_workers
+    )
+
+    return out_profile, out_settings
@@ -1,4 +1,6 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import rasterio
@@ -10,6 +12,7 @@ from eis_toolkit.exceptions import (
     InvalidRasterBandException,
     NonMatchingParameterLengthsException,
 )
+from eis_toolkit.utilities.blockwise import get_block_output_profile, process_raster_bands_by_blocks
 from eis_toolkit.utilities.checks.parameter import check_minmax_position, check_parameter_length
 from eis_toolkit.utilities.checks.raster import check_raster_bands
 from eis_toolkit.utilities.miscellaneous import (
@@ -20,6 +23,7 @@ from eis_toolkit.utilities.miscellaneous import (
     truncate_decimal_places,
 )
 from eis_toolkit.utilities.nodata import nan_to_nodata
+from eis_toolkit.utilities.streaming_statistics import raster_band_statistics
 
 
 @beartype
@@ -28,17 +32,64 @@ def _sigmoid_transform(  # type: ignore[no-any-unimported]
     bounds: Tuple[Number, Number],
     slope: Number,
     center: bool,
+    mean: Optional[Number] = None,
 ) -> np.ndarray:
     lower, upper = bounds[0], bounds[1]
 
     if center is True:
-        in_array = in_array - np.nanmean(in_array)
+        in_array = in_array - (np.nanmean(in_array) if mean is None else mean)
 
     out_array = lower + (upper - lower) * (1 / (1 + np.exp(-slope * (in_array))))
 
     return out_array
 
 
+def _check_sigmoid_parameters(
+    raster: rasterio.io.DatasetReader,
+    bands: Optional[Sequence[int]],
+    bounds: Sequence[Tuple[Number, Number]],
+    slope: Sequence[Number],
+    nodata: Optional[Number],
+) -> Tuple[Sequence[int], Optional[Number], Sequence[Tuple[Number, Number]], Sequence[Number]]:
+    bands = list(range(1, raster.count + 1)) if bands is None else bands
+    nodata = raster.nodata if nodata is None else nodata
+
+    if check_raster_bands(raster, bands) is False:
+        raise InvalidRasterBandException("Invalid band selection")
+
+    for parameter_name, parameter in [("bounds", bounds), ("slope", slope)]:
+        if check_parameter_length(bands, parameter) is False:
+            raise NonMatchingParameterLengthsException(f"Invalid length for {parameter_name}.")
+
+    for item in bounds:
+        if check_minmax_position(item) is False:
+            raise InvalidParameterValueException(f"Invalid min-max values provided: {item}.")
+
+    expanded_args = expand_and_zip(bands, bounds, slope)
+    bounds = [element[1] for element in expanded_args]
+    slope = [element[2] for element in expanded_args]
+
+    return bands, nodata, bounds, slope
+
+
+def _sigmoid_transform_block(
+    band_array: np.ndarray,
+    nodata: Optional[Number],
+    bounds: Tuple[Number, Number],
+    slope: Number,
+    center: bool,
+    mean: Number,
+    out_decimals: int,
+) -> np.ndarray:
+    band_array = cast_array_to_float(band_array, cast_int=True)
+    band_array = replace_values(band_array, values_to_replace=[nodata, np.inf], replace_value=np.nan)
+
+    band_array = _sigmoid_transform(band_array.astype(np.float64), bounds=bounds, slope=slope, center=center, mean=mean)
+
+    band_array = truncate_decimal_places(band_array, decimal_places=out_decimals)
+    return band_array if nodata is None else nan_to_nodata(band_array, nodata_value=nodata)
+
+
 @beartype
 def sigmoid_transform(  # type: ignore[no-any-unimported]
     raster: rasterio.io.DatasetReader,
@@ -76,23 +127,7 @@ def sigmoid_transform(  # type: ignore[no-any-unimported]
         NonMatchingParameterLengthsException: The input does not match the number of selected bands.
         InvalidParameterValueException: The input does not match the requirements (values, order of values)
     """
-    bands = list(range(1, raster.count + 1)) if bands is None else bands
-    nodata = raster.nodata if nodata is None else nodata
-
-    if check_raster_bands(raster, bands) is False:
-        raise InvalidRasterBandException("Invalid band selection")
-
-    for parameter_name, parameter in [("bounds", bounds), ("slope", slope)]:
-        if check_parameter_length(bands, parameter) is False:
-            raise NonMatchingParameterLengthsException(f"Invalid length for {parameter_name}.")
-
-    for item in bounds:
-        if check_minmax_position(item) is False:
-            raise InvalidParameterValueException(f"Invalid min-max values provided: {item}.")
-
-    expanded_args = expand_and_zip(bands, bounds, slope)
-    bounds = [element[1] for element in expanded_args]
-    slope = [element[2] for element in expanded_args]
+    bands, nodata, bounds, slope = _check_sigmoid_parameters(raster, bands, bounds, slope, nodata)
 
     out_settings = {}
     out_decimals = set_max_precision()
@@ -132,3 +167,87 @@ def sigmoid_transform(  # type: ignore[no-any-unimported]
     out_meta.update({"count": len(bands), "nodata": nodata, "dtype": out_array.dtype.name})
 
     return out_array, out_meta, out_settings
+
+
+@beartype
+def sigmoid_transform_windowed(  # type: ignore[no-any-unimported]
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    bands: Optional[Sequence[int]] = None,
+    bounds: Sequence[Tuple[Number, Number]] = [(0, 1)],
+    slope: Sequence[Number] = [1],
+    center: bool = True,
+    nodata: Optional[Number] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> Tuple[dict, dict]:
+    """
+    Transform data into a sigmoid-shape block by block and write the result to a GeoTIFF.
+
+    If the data is centered, the means of the bands are computed in a first windowed pass over the raster and
+    the transformation is applied in a second one, so only one block is in memory at a time. Otherwise works
+    like sigmoid_transform. The output is written as float32.
+
+    Args:
+        raster: Data object to be transformed.
+        output_raster: Path of the output GeoTIFF.
+        bands: Selection of bands to be transformed.
+        bounds: Boundaries for the calculation of the sigmoid function (lower, upper).
+        slope: Value which modifies the slope of the resulting sigmoid-curve.
+        center: Center array values around mean = 0 before sigmoid transformation.
+        nodata: Nodata value to be considered.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel. Defaults to None,
+            which processes the blocks sequentially.
+
+    Returns:
+        out_profile: The profile of the written output raster.
+        out_settings: Log of input settings and calculated statistics if available.
+
+    Raises:
+        InvalidRasterBandException: The input contains invalid band numbers.
+        NonMatchingParameterLengthsException: The input does not match the number of selected bands.
+        InvalidParameterValueException: The input does not match the requirements (values, order of values),
+            or the block size or number of workers is not positive.
+    """
+    bands, nodata, bounds, slope = _check_sigmoid_parameters(raster, bands, bounds, slope, nodata)
+
+    out_settings = {}
+    out_decimals = set_max_precision()
+    band_statistics = raster_band_statistics(raster, bands, nodata, block_size) if center else None
+    band_functions = []
+
+    for i in range(0, len(bands)):
+        band_functions.append(
+            partial(
+                _sigmoid_transform_block,
+                nodata=nodata,
+                bounds=bounds[i],
+                slope=slope[i],
+                center=center,
+                mean=band_statistics[i]["mean"] if center else 0,
+                out_decimals=out_decimals,
+            )
+        )
+
+        current_transform = f"transformation {i + 1}"
+        current_settings = {
+            "band_origin": bands[i],
+            "bound_lower": truncate_decimal_places(bounds[i][0], decimal_places=out_decimals),
+            "bound_upper": truncate_decimal_places(bounds[i][1], decimal_places=out_decimals),
+            "slope": slope[i],
+            "center": center,
+            "nodata": nodata,
+            "decimal_places": out_decimals,
+        }
+
+        out_settings[current_transform] = current_settings
+
+    out_profile = get_block_output_profile(raster, count=len(bands), dtype="float32")
+    out_profile.update({"nodata": nodata})
+
+    out_profile = process_raster_bands_by_blocks(
+        raster, output_raster, bands, band_functions, out_profile, block_size, n_workers
+    )
+
+    return out_profile, out_settings
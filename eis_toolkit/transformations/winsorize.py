@@ -1,15 +1,18 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import rasterio
 from beartype import beartype
-from beartype.typing import Optional, Sequence, Tuple
+from beartype.typing import Callable, Optional, Sequence, Tuple
 
 from eis_toolkit.exceptions import (
     InvalidParameterValueException,
     InvalidRasterBandException,
     NonMatchingParameterLengthsException,
 )
+from eis_toolkit.utilities.blockwise import get_block_output_profile, process_raster_bands_by_blocks
 from eis_toolkit.utilities.checks.parameter import check_parameter_length
 from eis_toolkit.utilities.checks.raster import check_raster_bands
 from eis_toolkit.utilities.miscellaneous import (
@@ -19,6 +22,7 @@ from eis_toolkit.utilities.miscellaneous import (
     expand_and_zip,
 )
 from eis_toolkit.utilities.nodata import nan_to_nodata, nodata_to_nan
+from eis_toolkit.utilities.streaming_statistics import raster_band_statistics, sketch_percentile
 
 
 @beartype
@@ -26,7 +30,31 @@ def _winsorize(  # type: ignore[no-any-unimported]
     in_array: np.ndarray,
     percentiles: Tuple[Optional[Number], Optional[Number]],
     inside: bool,
+    limits: Optional[Tuple[Optional[Number], Optional[Number]]] = None,
 ) -> Tuple[np.ndarray, Optional[Number], Optional[Number]]:
+    if limits is None:
+        clean_array = np.extract(np.isfinite(in_array), in_array)
+        percentile_function = partial(np.percentile, clean_array)
+        calculated_lower, calculated_upper = _winsorize_limits(percentile_function, percentiles, inside)
+    else:
+        calculated_lower, calculated_upper = limits
+
+    out_array = in_array
+
+    if calculated_lower is not None:
+        out_array = np.where(out_array < calculated_lower, calculated_lower, out_array)
+
+    if calculated_upper is not None:
+        out_array = np.where(out_array > calculated_upper, calculated_upper, out_array)
+
+    return out_array, calculated_lower, calculated_upper
+
+
+def _winsorize_limits(
+    percentile_function: Callable[..., Number],
+    percentiles: Tuple[Optional[Number], Optional[Number]],
+    inside: bool,
+) -> Tuple[Optional[Number], Optional[Number]]:
     percentile_lower, percentile_upper = percentiles[0], percentiles[1]
     calculated_lower, calculated_upper = None, None
 
@@ -37,18 +65,59 @@ def _winsorize(  # type: ignore[no-any-unimported]
         method_lower = "higher"
         method_upper = "lower"
 
-    out_array = in_array
-    clean_array = np.extract(np.isfinite(in_array), in_array)
-
     if percentile_lower is not None:
-        calculated_lower = np.percentile(clean_array, percentile_lower, method=method_lower)
-        out_array = np.where(out_array < calculated_lower, calculated_lower, out_array)
+        calculated_lower = percentile_function(percentile_lower, method=method_lower)
 
     if percentile_upper is not None:
-        calculated_upper = np.percentile(clean_array, 100 - percentile_upper, method=method_upper)
-        out_array = np.where(out_array > calculated_upper, calculated_upper, out_array)
+        calculated_upper = percentile_function(100 - percentile_upper, method=method_upper)
 
-    return out_array, calculated_lower, calculated_upper
+    return calculated_lower, calculated_upper
+
+
+def _check_winsorize_parameters(
+    raster: rasterio.io.DatasetReader,
+    percentiles: Sequence[Tuple[Optional[Number], Optional[Number]]],
+    bands: Optional[Sequence[int]],
+    nodata: Optional[Number],
+) -> Tuple[Sequence[int], Optional[Number], Sequence[Tuple[Optional[Number], Optional[Number]]]]:
+    bands = list(range(1, raster.count + 1)) if bands is None else bands
+    nodata = raster.nodata if nodata is None else nodata
+
+    if check_raster_bands(raster, bands) is False:
+        raise InvalidRasterBandException("Invalid band selection")
+
+    if check_parameter_length(bands, percentiles) is False:
+        raise NonMatchingParameterLengthsException("Invalid length for percentiles.")
+
+    for item in percentiles:
+        if item.count(None) == len(item):
+            raise InvalidParameterValueException(f"Percentile values all None: {item}.")
+
+        if None not in item and sum(item) >= 100:
+            raise InvalidParameterValueException(f"Sum >= 100: {item}.")
+
+        if item[0] is not None and not (0 < item[0] < 100):
+            raise InvalidParameterValueException(f"Invalid lower percentile value: {item}.")
+
+        if item[1] is not None and not (0 < item[1] < 100):
+            raise InvalidParameterValueException(f"Invalid upper percentile value: {item}.")
+
+    expanded_args = expand_and_zip(bands, percentiles)
+    percentiles = [element[1] for element in expanded_args]
+
+    return bands, nodata, percentiles
+
+
+def _winsorize_block(
+    band_array: np.ndarray, nodata: Optional[Number], limits: Tuple[Optional[Number], Optional[Number]]
+) -> np.ndarray:
+    band_array = cast_array_to_float(band_array, cast_int=True)
+    if nodata is not None:
+        band_array = nodata_to_nan(band_array, nodata_value=nodata)
+
+    band_array, _, _ = _winsorize(band_array, percentiles=(None, None), inside=False, limits=limits)
+
+    return band_array
 
 
 @beartype
@@ -97,30 +166,7 @@ def winsorize(  # type: ignore[no-any-unimported]
         NonMatchingParameterLengthsException: The input does not match the number of selected bands.
         InvalidParameterValueException: The input does not match the requirements (values, order of values)
     """
-    bands = list(range(1, raster.count + 1)) if bands is None else bands
-    nodata = raster.nodata if nodata is None else nodata
-
-    if check_raster_bands(raster, bands) is False:
-        raise InvalidRasterBandException("Invalid band selection")
-
-    if check_parameter_length(bands, percentiles) is False:
-        raise NonMatchingParameterLengthsException("Invalid length for percentiles.")
-
-    for item in percentiles:
-        if item.count(None) == len(item):
-            raise InvalidParameterValueException(f"Percentile values all None: {item}.")
-
-        if None not in item and sum(item) >= 100:
-            raise InvalidParameterValueException(f"Sum >= 100: {item}.")
-
-        if item[0] is not None and not (0 < item[0] < 100):
-            raise InvalidParameterValueException(f"Invalid lower percentile value: {item}.")
-
-        if item[1] is not None and not (0 < item[1] < 100):
-            raise InvalidParameterValueException(f"Invalid upper percentile value: {item}.")
-
-    expanded_args = expand_and_zip(bands, percentiles)
-    percentiles = [element[1] for element in expanded_args]
+    bands, nodata, percentiles = _check_winsorize_parameters(raster, percentiles, bands, nodata)
 
     out_settings = {}
 
@@ -161,3 +207,76 @@ def winsorize(  # type: ignore[no-any-unimported]
     out_meta.update({"count": len(bands), "nodata": nodata, "dtype": out_array.dtype.name})
 
     return out_array, out_meta, out_settings
+
+
+@beartype
+def winsorize_windowed(  # type: ignore[no-any-unimported]
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    percentiles: Sequence[Tuple[Optional[Number], Optional[Number]]],
+    bands: Optional[Sequence[int]] = None,
+    inside: bool = False,
+    nodata: Optional[Number] = None,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> Tuple[dict, dict]:
+    """
+    Winsorize data based on specified percentile values block by block and write the result to a GeoTIFF.
+
+    The percentiles of the bands are computed from a quantile sketch in a first windowed pass over the raster
+    and the data is winsorized in a second one, so only one block is in memory at a time. The percentiles
+    are exact for bands with up to 16384 valid values and approximate for larger ones, see
+    `raster_band_statistics`. Otherwise works like winsorize. The output keeps the data type of the raster.
+
+    Args:
+        raster: Data object to be transformed.
+        output_raster: Path of the output GeoTIFF.
+        percentiles: Lower and upper percentile values (lower, upper) between [0, 100].
+        bands: Selection of bands to be transformed.
+        inside: Whether to use the value for replacement from the left or right of the calculated percentile.
+        nodata: Nodata value to be considered.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes for processing the blocks in parallel. Defaults to None,
+            which processes the blocks sequentially.
+
+    Returns:
+        out_profile: The profile of the written output raster.
+        out_settings: Log of input settings and calculated statistics if available.
+
+    Raises:
+        InvalidRasterBandException: The input contains invalid band numbers.
+        NonMatchingParameterLengthsException: The input does not match the number of selected bands.
+        InvalidParameterValueException: The input does not match the requirements (values, order of values),
+            or the block size or number of workers is not positive.
+    """
+    bands, nodata, percentiles = _check_winsorize_parameters(raster, percentiles, bands, nodata)
+
+    out_settings = {}
+    band_statistics = raster_band_statistics(raster, bands, nodata, block_size)
+    band_functions = []
+
+    for i in range(0, len(bands)):
+        percentile_function = partial(sketch_percentile, band_statistics[i])
+        calculated_lower, calculated_upper = _winsorize_limits(percentile_function, percentiles[i], inside)
+        band_functions.append(partial(_winsorize_block, nodata=nodata, limits=(calculated_lower, calculated_upper)))
+
+        current_transform = f"transformation {i + 1}"
+        current_settings = {
+            "band_origin": bands[i],
+            "percentile_lower": cast_scalar_to_int(percentiles[i][0]),
+            "percentile_upper": cast_scalar_to_int(percentiles[i][1]),
+            "calculated_lower": cast_scalar_to_int(calculated_lower),
+            "calculated_upper": cast_scalar_to_int(calculated_upper),
+            "nodata": cast_scalar_to_int(nodata),
+        }
+
+        out_settings[current_transform] = current_settings
+
+    out_profile = get_block_output_profile(raster, count=len(bands), dtype=raster.dtypes[0])
+    out_profile.update({"nodata": nodata})
+
+    out_profile = process_raster_bands_by_blocks(
+        raster, output_raster, bands, band_functions, out_profile, block_size, n_workers
+    )
+
+    return out_profile, out_settings
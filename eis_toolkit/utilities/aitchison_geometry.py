@@ -1,26 +1,15 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import rasterio
 from beartype import beartype
-from beartype.typing import Optional
+from beartype.typing import Callable, Optional, Sequence
 
-
-@beartype
-def _normalize(row: pd.Series, sum_value: Number = 1.0) -> pd.Series:
-    """
-    Normalize the series to a given value.
-
-    If no value is provided, normalize to 1.
-
-    Args:
-        row: The series to normalize.
-
-    Returns:
-        A series containing the normalized values.
-    """
-    scale = np.float64(np.sum(row)) / sum_value
-    return np.divide(row, scale)
+from eis_toolkit.exceptions import InvalidRasterBandException, NumericValueSignException
+from eis_toolkit.utilities.blockwise import process_raster_stack_by_blocks
 
 
 @beartype
@@ -37,9 +26,51 @@ def _closure(df: pd.DataFrame, scale: Optional[Number] = None) -> pd.DataFrame:
         A new dataframe of shape (N, D) where each row has been normalized to 1.
     """
 
-    dfc = df.copy()
+    values = df.to_numpy(dtype=np.float64)
+    sum_value = scale if scale is not None else 1.0
+    row_scales = values.sum(axis=1, keepdims=True) / sum_value
+
+    return pd.DataFrame(values / row_scales, index=df.index, columns=df.columns)
+
 
-    for idx, row in df.iterrows():
-        dfc.iloc[idx] = _normalize(row, scale) if scale is not None else _normalize(row)
+def _count_parts(rasters: Sequence[rasterio.io.DatasetReader]) -> int:
+    """Count the bands of a raster stack, each band being one part of the composition."""
+    return sum(raster.count for raster in rasters)
+
+
+def _check_part_bands(rasters: Sequence[rasterio.io.DatasetReader], bands: Sequence[int]) -> None:
+    """Check that the 1-based band numbers are found in the raster stack."""
+    parts = _count_parts(rasters)
+    if any(band < 1 or band > parts for band in bands):
+        raise InvalidRasterBandException(f"Band numbers should be between 1 and {parts}.")
+
+
+def _transform_composition_block(
+    block: np.ndarray, transform: Callable[[np.ndarray], np.ndarray], parts: Optional[Sequence[int]] = None
+) -> np.ndarray:
+    """Apply a transform with the parts on the last axis to a (bands, rows, cols) block of compositions."""
+    if parts is not None:
+        block = block[parts]
+
+    if np.any(block <= 0):
+        raise NumericValueSignException("Data contains zeros or negative values.")
+
+    return np.moveaxis(transform(np.moveaxis(block, 0, -1)), -1, 0)
+
+
+def _transform_composition_raster(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    output_raster: Path,
+    transform: Callable[[np.ndarray], np.ndarray],
+    count: int,
+    block_size: int,
+    n_workers: Optional[int],
+    parts: Optional[Sequence[int]] = None,
+) -> dict:
+    """Apply a compositional transform on a raster stack block by block and write the result to a GeoTIFF.
+
+    If parts are given, only those 0-based bands are passed to the transform, in the given order.
+    """
+    block_function = partial(_transform_composition_block, transform=transform, parts=parts)
 
-    return dfc
+    return process_raster_stack_by_blocks(rasters, output_raster, block_function, count, block_size, n_workers)
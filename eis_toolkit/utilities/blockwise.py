@@ -0,0 +1,416 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import rasterio
+from beartype import beartype
+from beartype.typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+from rasterio.windows import Window
+
+from eis_toolkit.exceptions import InvalidParameterValueException, NonMatchingRasterMetadataException
+from eis_toolkit.utilities.checks.raster import check_raster_grids
+from eis_toolkit.utilities.nodata import nan_to_nodata, nodata_to_nan
+
+TILE_SIZE = 256
+
+
+@beartype
+def get_block_windows(height: int, width: int, block_size: int = 1024, halo: int = 0) -> List[Tuple[Window, Window]]:
+    """
+    Split a raster grid into square blocks and expand each block with a halo.
+
+    The halo is clipped to the raster bounds, so blocks on the raster edges get a smaller halo on that side.
+
+    Args:
+        height: Height of the raster in pixels.
+        width: Width of the raster in pixels.
+        block_size: Height and width of the blocks in pixels. Defaults to 1024.
+        halo: Number of extra pixels read around each block. Defaults to 0.
+
+    Returns:
+        List of (read window, write window) pairs in row-major order.
+        The read window covers the block and its halo, the write window only the block.
+
+    Raises:
+        InvalidParameterValueException: Block size is not positive or halo is negative.
+    """
+    if block_size < 1:
+        raise InvalidParameterValueException("Block size must be a positive integer.")
+    if halo < 0:
+        raise InvalidParameterValueException("Halo must be a non-negative integer.")
+
+    windows = []
+    for row_off in range(0, height, block_size):
+        block_height = min(block_size, height - row_off)
+        read_row_off = max(row_off - halo, 0)
+        read_row_end = min(row_off + block_height + halo, height)
+
+        for col_off in range(0, width, block_size):
+            block_width = min(block_size, width - col_off)
+            read_col_off = max(col_off - halo, 0)
+            read_col_end = min(col_off + block_width + halo, width)
+
+            write_window = Window(col_off, row_off, block_width, block_height)
+            read_window = Window(read_col_off, read_row_off, read_col_end - read_col_off, read_row_end - read_row_off)
+            windows.append((read_window, write_window))
+
+    return windows
+
+
+@beartype
+def crop_halo(block: np.ndarray, read_window: Window, write_window: Window) -> np.ndarray:
+    """
+    Crop the halo away from a processed block.
+
+    Args:
+        block: Block data covering the read window. The last two dimensions are rows and columns.
+        read_window: The window the block was read with.
+        write_window: The window the cropped block is written to.
+
+    Returns:
+        The part of the block covering the write window.
+    """
+    row_start = int(write_window.row_off - read_window.row_off)
+    col_start = int(write_window.col_off - read_window.col_off)
+    row_end = row_start + int(write_window.height)
+    col_end = col_start + int(write_window.width)
+
+    return block[..., row_start:row_end, col_start:col_end]
+
+
+@beartype
+def get_block_output_profile(
+    raster: rasterio.io.DatasetReader, count: int = 1, dtype: Optional[str] = None, compress: str = "lzw"
+) -> dict:
+    """
+    Create the profile of a tiled and compressed GeoTIFF for block-wise output.
+
+    Args:
+        raster: The input raster defining the output grid.
+        count: Number of bands in the output. Defaults to 1.
+        dtype: Data type of the output. Defaults to float64 for float64 input and float32 otherwise.
+        compress: GeoTIFF compression method. Defaults to "lzw".
+
+    Returns:
+        The output raster profile.
+    """
+    if dtype is None:
+        dtype = "float64" if np.dtype(raster.dtypes[0]) == np.float64 else "float32"
+
+    out_profile = dict(raster.profile)
+    out_profile.update({"driver": "GTiff", "count": count, "dtype": dtype, "compress": compress})
+
+    if raster.height >= TILE_SIZE and raster.width >= TILE_SIZE:
+        out_profile.update({"tiled": True, "blockxsize": TILE_SIZE, "blockysize": TILE_SIZE})
+    else:
+        out_profile.update({"tiled": False})
+        out_profile.pop("blockxsize", None)
+        out_profile.pop("blockysize", None)
+
+    return out_profile
+
+
+def _read_block(raster: rasterio.io.DatasetReader, read_window: Window) -> np.ndarray:
+    block = raster.read(window=read_window)
+    block = block[0] if block.shape[0] == 1 else block
+
+    if raster.nodata is not None:
+        return nodata_to_nan(block, raster.nodata)
+    return block.astype(np.float64) if np.issubdtype(block.dtype, np.integer) else block
+
+
+def _process_block(
+    block_function: Callable[[np.ndarray], np.ndarray], block: np.ndarray, read_window: Window, write_window: Window
+) -> np.ndarray:
+    return crop_halo(block_function(block), read_window, write_window)
+
+
+def _write_block(dst: rasterio.io.DatasetWriter, out_block: np.ndarray, write_window: Window, out_profile: dict):
+    if out_profile.get("nodata") is not None:
+        out_block = nan_to_nodata(out_block, out_profile["nodata"])
+    out_block = out_block.astype(out_profile["dtype"])
+
+    if out_block.ndim == 2:
+        dst.write(out_block, 1, window=write_window)
+    else:
+        dst.write(out_block, window=write_window)
+
+
+@beartype
+def write_raster_by_blocks(
+    output_raster: Path,
+    out_profile: dict,
+    block_tasks: Iterable[Tuple[Callable[..., np.ndarray], Tuple[Any, ...], Window]],
+    n_workers: Optional[int] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> dict:
+    """
+    Compute raster blocks and write them straight to a GeoTIFF.
+
+    Each block task is a (function, arguments, write window) tuple. The function is called with the
+    arguments and must return the data for the write window, either 2D or 3D (bands, rows, cols), with
+    np.nan marking nodata. The tasks are consumed lazily, so they can be produced by a generator.
+
+    With several workers, the functions are called in a process pool. At most two tasks per worker are in
+    flight at a time and the blocks are written in task order, so the output does not depend on the number
+    of workers. The functions and arguments need to be picklable in this case. Large read-only state can be
+    passed once per process with an initializer instead of with the arguments of every task.
+
+    If computing or writing a block raises an exception, the partially written output raster is removed
+    before the exception is passed on.
+
+    Args:
+        output_raster: Path of the output GeoTIFF.
+        out_profile: Profile of the output raster.
+        block_tasks: The (function, arguments, write window) tuples of the blocks.
+        n_workers: Number of worker processes. Defaults to None, which computes the blocks sequentially
+            in the calling process.
+        initializer: Function called with initargs once in each worker process before any block, or once
+            in the calling process when the blocks are computed sequentially. Defaults to None.
+        initargs: Arguments of the initializer. Defaults to ().
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: The number of workers is not positive.
+    """
+    if n_workers is not None and n_workers < 1:
+        raise InvalidParameterValueException("Number of workers must be a positive integer.")
+
+    try:
+        with rasterio.open(output_raster, "w", **out_profile) as dst:
+            if n_workers is None or n_workers == 1:
+                if initializer is not None:
+                    initializer(*initargs)
+                for function, args, write_window in block_tasks:
+                    _write_block(dst, function(*args), write_window, out_profile)
+            else:
+                with ProcessPoolExecutor(max_workers=n_workers, initializer=initializer, initargs=initargs) as executor:
+                    pending: deque = deque()
+                    for function, args, write_window in block_tasks:
+                        if len(pending) >= 2 * n_workers:
+                            future, pending_window = pending.popleft()
+                            _write_block(dst, future.result(), pending_window, out_profile)
+
+                        pending.append((executor.submit(function, *args), write_window))
+
+                    while pending:
+                        future, pending_window = pending.popleft()
+                        _write_block(dst, future.result(), pending_window, out_profile)
+    except BaseException:
+        # Do not leave a partially written raster behind
+        Path(output_raster).unlink(missing_ok=True)
+        raise
+
+    return out_profile
+
+
+def _iterate_block_tasks(
+    raster: rasterio.io.DatasetReader,
+    block_function: Callable[[np.ndarray], np.ndarray],
+    windows: List[Tuple[Window, Window]],
+) -> Iterator[Tuple[Callable[..., np.ndarray], Tuple[Any, ...], Window]]:
+    for read_window, write_window in windows:
+        block = _read_block(raster, read_window)
+        yield _process_block, (block_function, block, read_window, write_window), write_window
+
+
+@beartype
+def process_raster_by_blocks(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    block_function: Callable[[np.ndarray], np.ndarray],
+    halo: int = 0,
+    block_size: int = 1024,
+    out_profile: Optional[dict] = None,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a raster operation block by block and write the results straight to a GeoTIFF.
+
+    Each block is read with a halo so that neighborhood operations get the same result as for the full array.
+    Nodata is converted to np.nan before calling the block function and back afterwards. Single band blocks
+    are passed to the block function as 2D arrays, multiband blocks as 3D (bands, rows, cols) arrays.
+    Peak memory depends on the block size and halo, not the raster size.
+
+    With several workers, the blocks are read and written by the calling process and processed in a
+    process pool. At most two blocks per worker are in flight at a time and the blocks are written in
+    row-major order, so the output does not depend on the number of workers. The block function needs to
+    be picklable in this case, e.g. a module level function or a functools.partial of one.
+
+    Args:
+        raster: The input raster.
+        output_raster: Path of the output GeoTIFF.
+        block_function: Function processing one block. Must return an array with the same number of rows
+            and columns as the input block, either 2D or 3D (bands, rows, cols).
+        halo: Number of extra pixels each block needs around it, e.g. the kernel radius. Defaults to 0.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        out_profile: Profile of the output raster. Defaults to a single band float GeoTIFF on the input grid.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially
+            in the calling process.
+        initializer: Function called with initargs once in each worker process before any block, or once
+            in the calling process when the blocks are computed sequentially. Defaults to None.
+        initargs: Arguments of the initializer. Defaults to ().
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: Block size is not positive, halo is negative or
+            the number of workers is not positive.
+    """
+    if n_workers is not None and n_workers < 1:
+        raise InvalidParameterValueException("Number of workers must be a positive integer.")
+
+    if out_profile is None:
+        out_profile = get_block_output_profile(raster)
+
+    windows = get_block_windows(raster.height, raster.width, block_size, halo)
+
+    return write_raster_by_blocks(
+        output_raster, out_profile, _iterate_block_tasks(raster, block_function, windows), n_workers
+    )
+
+
+def _read_stack_block(rasters: Sequence[rasterio.io.DatasetReader], read_window: Window) -> np.ndarray:
+    blocks = []
+    for raster in rasters:
+        block = raster.read(window=read_window).astype(np.float64)
+        if raster.nodata is not None:
+            block[block == raster.nodata] = np.nan
+        blocks.append(block)
+
+    return np.concatenate(blocks, axis=0)
+
+
+def _iterate_stack_block_tasks(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    block_function: Callable[[np.ndarray], np.ndarray],
+    windows: List[Tuple[Window, Window]],
+) -> Iterator[Tuple[Callable[..., np.ndarray], Tuple[Any, ...], Window]]:
+    for read_window, write_window in windows:
+        block = _read_stack_block(rasters, read_window)
+        yield block_function, (block,), write_window
+
+
+@beartype
+def process_raster_stack_by_blocks(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    output_raster: Path,
+    block_function: Callable[[np.ndarray], np.ndarray],
+    count: int = 1,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply an operation on a stack of raster bands block by block and write the results straight to a GeoTIFF.
+
+    The bands of all input rasters are stacked in order into a float64 (bands, rows, cols) block, so the
+    stack can be a single multiband raster or several single band rasters on the same grid. Nodata of each
+    raster is converted to np.nan before calling the block function and np.nan in the result is written as
+    the nodata of the first raster. Peak memory depends on the block size, not the raster size.
+
+    With several workers, the blocks are processed in a process pool as in `process_raster_by_blocks`.
+
+    Args:
+        rasters: The input rasters.
+        output_raster: Path of the output GeoTIFF.
+        block_function: Function processing one block. Must return a 3D (bands, rows, cols) array with
+            count bands and the same number of rows and columns as the input block.
+        count: Number of bands in the output. Defaults to 1.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially
+            in the calling process.
+        initializer: Function called with initargs once in each worker process before any block, or once
+            in the calling process when the blocks are computed sequentially. Defaults to None.
+        initargs: Arguments of the initializer. Defaults to ().
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: No input rasters are given, block size is not positive or
+            the number of workers is not positive.
+        NonMatchingRasterMetadataException: The input rasters do not have the same grid and extent.
+    """
+    if len(rasters) == 0:
+        raise InvalidParameterValueException("At least one input raster is required.")
+    if not check_raster_grids([raster.profile for raster in rasters], same_extent=True):
+        raise NonMatchingRasterMetadataException("Input rasters should have the same grid properties and extent.")
+
+    dtype = "float64" if any(np.dtype(raster.dtypes[0]) == np.float64 for raster in rasters) else "float32"
+    out_profile = get_block_output_profile(rasters[0], count=count, dtype=dtype)
+    windows = get_block_windows(rasters[0].height, rasters[0].width, block_size)
+
+    return write_raster_by_blocks(
+        output_raster, out_profile, _iterate_stack_block_tasks(rasters, block_function, windows), n_workers
+    )
+
+
+def _apply_band_functions(
+    block: np.ndarray, band_functions: Sequence[Callable[[np.ndarray], np.ndarray]]
+) -> np.ndarray:
+    return np.stack([band_function(band_block) for band_function, band_block in zip(band_functions, block)])
+
+
+def _iterate_band_tasks(
+    raster: rasterio.io.DatasetReader,
+    bands: Sequence[int],
+    band_functions: Sequence[Callable[[np.ndarray], np.ndarray]],
+    windows: List[Tuple[Window, Window]],
+) -> Iterator[Tuple[Callable[..., np.ndarray], Tuple[Any, ...], Window]]:
+    for _, window in windows:
+        block = raster.read(list(bands), window=window)
+        yield _apply_band_functions, (block, band_functions), window
+
+
+@beartype
+def process_raster_bands_by_blocks(
+    raster: rasterio.io.DatasetReader,
+    output_raster: Path,
+    bands: Sequence[int],
+    band_functions: Sequence[Callable[[np.ndarray], np.ndarray]],
+    out_profile: dict,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Apply a function to each selected raster band block by block and write the results straight to a GeoTIFF.
+
+    Output band i is the result of band_functions[i] on input band bands[i]. The band functions get the raw
+    2D band blocks, nodata included, and handle nodata themselves. np.nan in the results is written as the
+    nodata of the output profile. Peak memory depends on the block size, not the raster size.
+
+    With several workers, the blocks are processed in a process pool as in `process_raster_by_blocks`.
+
+    Args:
+        raster: The input raster.
+        output_raster: Path of the output GeoTIFF.
+        bands: Numbers of the input bands.
+        band_functions: Function processing the blocks of each band. Must return an array of the same shape.
+        out_profile: Profile of the output raster, with one band per selected input band.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 1024.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially
+            in the calling process.
+        initializer: Function called with initargs once in each worker process before any block, or once
+            in the calling process when the blocks are computed sequentially. Defaults to None.
+        initargs: Arguments of the initializer. Defaults to ().
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        InvalidParameterValueException: Bands and band functions have different lengths, block size is
+            not positive or the number of workers is not positive.
+    """
+    if len(bands) != len(band_functions):
+        raise InvalidParameterValueException("Expected one band function for each band.")
+
+    windows = get_block_windows(raster.height, raster.width, block_size)
+
+    return write_raster_by_blocks(
+        output_raster, out_profile, _iterate_band_tasks(raster, bands, band_functions, windows), n_workers
+    )
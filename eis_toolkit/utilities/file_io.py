@@ -8,7 +8,7 @@ from beartype import beartype
 from beartype.typing import Literal, Sequence, Tuple, Union
 
 from eis_toolkit import exceptions
-from eis_toolkit.utilities.checks.raster import check_raster_grids
+from eis_toolkit.utilities.raster_stack import RasterStack
 
 
 @beartype
@@ -76,6 +76,7 @@ def read_and_stack_rasters(
     Read multiple raster files and stack all their bands into a single 3D array.
 
     Checks that all rasters have the same grid properties. If there are any differences, exception is raised.
+    The grids are checked before any pixels are read and the bands are read straight into the stacked array.
 
     Args:
         raster_files: List of paths to raster files.
@@ -91,36 +92,21 @@ def read_and_stack_rasters(
         NonMatchingRasterMetadataException: If input rasters do not have same grid properties or nodata_handling
             is set to raise exception and mismatching nodata is encountered.
     """
-    bands = []
-    nodata_values = []
-    profiles = []
-
-    for raster_file in raster_files:
-        with rasterio.open(raster_file) as raster:
-            # Read all bands from each raster
-            profile = raster.profile
-            for i in range(1, raster.count + 1):
-                band_data = raster.read(i)
-
-                if nodata_handling == "convert_to_nan":
-                    band_data[band_data == profile["nodata"]] = np.nan
-                elif nodata_handling == "unify":
-                    band_data[band_data == profile["nodata"]] = -9999
-                    profile["nodata"] = -9999
-                elif nodata_handling == "raise_exception":
-                    nodata_values.append(profile["nodata"])
-                    if len(set(nodata_values)) > 1:
-                        raise exceptions.NonMatchingRasterMetadataException("Input rasters have varying nodata values.")
-                elif nodata_handling == "none":
-                    pass
-                bands.append(band_data)
-            profiles.append(profile)
-
-    if not check_raster_grids(profiles, same_extent=True):
-        raise exceptions.NonMatchingRasterMetadataException("Input rasters should have the same properties.")
-
-    # Stack all bands into a single 3D array
-    stacked_arrays = np.stack(bands, axis=0)
+    with RasterStack(raster_files) as stack:
+        profiles = stack.profiles
+
+        if nodata_handling == "raise_exception" and len(set(stack.nodata)) > 1:
+            raise exceptions.NonMatchingRasterMetadataException("Input rasters have varying nodata values.")
+
+        # Bands are read straight into the stacked array
+        stacked_arrays = stack.read(nodata_to_nan=nodata_handling == "convert_to_nan")
+
+        if nodata_handling == "unify":
+            for band_data, nodata in zip(stacked_arrays, stack.nodata):
+                band_data[band_data == nodata] = -9999
+            for profile in profiles:
+                profile["nodata"] = -9999
+
     return stacked_arrays, profiles
 
 
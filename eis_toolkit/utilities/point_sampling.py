@@ -0,0 +1,52 @@
+import numpy as np
+import rasterio
+from beartype import beartype
+from beartype.typing import Optional, Sequence
+from rasterio.windows import Window
+
+
+@beartype
+def sample_raster_points(
+    raster: rasterio.io.DatasetReader,
+    x: np.ndarray,
+    y: np.ndarray,
+    block_size: int,
+    indexes: Optional[Sequence[int]] = None,
+) -> np.ndarray:
+    """Sample raster bands at point coordinates reading each raster block with points only once.
+
+    The points are grouped by the raster block they fall in and each block is read limited to the bounding
+    box of its points. Points outside the raster get the nodata value, or 0 if there is none, like with
+    raster.sample.
+
+    Args:
+        raster: Raster to sample.
+        x: X coordinates of the points in the raster's CRS.
+        y: Y coordinates of the points in the raster's CRS.
+        block_size: Height and width of the raster blocks the points are grouped by in pixels.
+        indexes: Band indexes to sample. Defaults to None, which samples all bands.
+
+    Returns:
+        Array of the sampled values with shape (number of bands, number of points).
+    """
+    indexes = list(range(1, raster.count + 1)) if indexes is None else list(indexes)
+    rows, cols = rasterio.transform.rowcol(raster.transform, x, y)
+    rows, cols = np.asarray(rows, dtype=np.int64).reshape(-1), np.asarray(cols, dtype=np.int64).reshape(-1)
+
+    values = np.full((len(indexes), len(rows)), raster.nodata or 0, dtype=raster.dtypes[indexes[0] - 1])
+
+    inside = np.flatnonzero((rows >= 0) & (rows < raster.height) & (cols >= 0) & (cols < raster.width))
+    blocks = (rows[inside] // block_size) * (raster.width // block_size + 1) + cols[inside] // block_size
+    order = np.argsort(blocks, kind="stable")
+    inside, blocks = inside[order], blocks[order]
+    block_starts = np.flatnonzero(np.diff(blocks, prepend=-1))
+
+    for points in np.split(inside, block_starts[1:]):
+        if len(points) == 0:
+            continue
+        point_rows, point_cols = rows[points], cols[points]
+        row_off, col_off = point_rows.min(), point_cols.min()
+        window = Window(col_off, row_off, point_cols.max() - col_off + 1, point_rows.max() - row_off + 1)
+        values[:, points] = raster.read(indexes, window=window)[:, point_rows - row_off, point_cols - col_off]
+
+    return values
@@ -0,0 +1,269 @@
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import rasterio
+from beartype import beartype
+from beartype.typing import Iterator, List, Optional, Sequence, Tuple, Union
+from rasterio.windows import Window
+
+from eis_toolkit.exceptions import (
+    InvalidParameterValueException,
+    InvalidRasterBandException,
+    NonMatchingRasterMetadataException,
+)
+from eis_toolkit.utilities.blockwise import get_block_windows
+from eis_toolkit.utilities.checks.raster import check_raster_grids
+
+
+class RasterStack:
+    """
+    Lazy stack of the bands of rasters sharing the same grid.
+
+    Opening a stack opens the datasets and checks their grids from the profiles without reading any pixels.
+    The bands are numbered from 1 in the order of the rasters and their bands. Pixels are only read on
+    request, either as a whole, window by window or into a memory-mapped array on a scratch file, so the
+    stacked data never has to be held in memory twice.
+
+    Rasters given as paths are opened by the stack and closed with `close` or when leaving a `with` block.
+    Rasters given as open datasets are left for the caller to close.
+    """
+
+    @beartype
+    def __init__(
+        self,
+        rasters: Sequence[Union[str, os.PathLike, rasterio.io.DatasetReader]],
+        bands: Optional[Sequence[int]] = None,
+    ):
+        """
+        Open the rasters and check that they have the same grid and extent.
+
+        Args:
+            rasters: Paths to the rasters or open rasters to stack.
+            bands: Selection of stack bands to include, numbered from 1. Defaults to all bands.
+
+        Raises:
+            InvalidParameterValueException: No rasters are given.
+            InvalidRasterBandException: The band selection is invalid.
+            NonMatchingRasterMetadataException: The rasters do not have the same grid properties and extent.
+        """
+        if len(rasters) == 0:
+            raise InvalidParameterValueException("At least one raster is needed for a raster stack.")
+
+        self._datasets = []
+        self._opened = []
+        try:
+            for raster in rasters:
+                if isinstance(raster, rasterio.io.DatasetReader):
+                    self._datasets.append(raster)
+                else:
+                    dataset = rasterio.open(raster)
+                    self._datasets.append(dataset)
+                    self._opened.append(dataset)
+
+            if not check_raster_grids([dataset.profile for dataset in self._datasets], same_extent=True):
+                raise NonMatchingRasterMetadataException(
+                    "Input rasters should have the same grid properties and extent."
+                )
+        except Exception:
+            self.close()
+            raise
+
+        all_bands = [(dataset, band) for dataset in self._datasets for band in range(1, dataset.count + 1)]
+        if bands is None:
+            self._bands = all_bands
+        else:
+            if len(bands) == 0 or not all(band in range(1, len(all_bands) + 1) for band in bands):
+                self.close()
+                raise InvalidRasterBandException("Invalid band selection.")
+            self._bands = [all_bands[band - 1] for band in bands]
+
+    def __enter__(self) -> "RasterStack":
+        """Use the stack as a context manager closing the rasters it opened."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the rasters opened by the stack."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Get the number of bands in the stack."""
+        return self.count
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """Read the stack with nodata converted to NaN when converted to a NumPy array."""
+        array = self.read()
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def close(self) -> None:
+        """Close the rasters opened by the stack."""
+        for dataset in self._opened:
+            dataset.close()
+        self._opened = []
+
+    @property
+    def count(self) -> int:
+        """Number of bands in the stack."""
+        return len(self._bands)
+
+    @property
+    def height(self) -> int:
+        """Height of the stack in pixels."""
+        return self._datasets[0].height
+
+    @property
+    def width(self) -> int:
+        """Width of the stack in pixels."""
+        return self._datasets[0].width
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Shape of the stacked data as (bands, height, width)."""
+        return (self.count, self.height, self.width)
+
+    @property
+    def profile(self) -> rasterio.profiles.Profile:
+        """Profile of the first raster, to be used as the reference grid."""
+        return self._datasets[0].profile
+
+    @property
+    def meta(self) -> dict:
+        """Metadata of the first raster."""
+        return self._datasets[0].meta
+
+    @property
+    def profiles(self) -> List[rasterio.profiles.Profile]:
+        """Profiles of the stacked rasters."""
+        return [dataset.profile for dataset in self._datasets]
+
+    @property
+    def nodata(self) -> List[Optional[float]]:
+        """Nodata value of each band in the stack."""
+        return [dataset.nodata for dataset, _ in self._bands]
+
+    @property
+    def dtypes(self) -> List[str]:
+        """Data type of each band in the stack."""
+        return [dataset.dtypes[band - 1] for dataset, band in self._bands]
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type holding the values of all bands in the stack."""
+        return np.result_type(*self.dtypes)
+
+    @beartype
+    def select(self, bands: Sequence[int]) -> "RasterStack":
+        """
+        Get a stack of a selection of the bands.
+
+        The selection shares the rasters of this stack and is valid for as long as this stack is open.
+
+        Args:
+            bands: The bands to select, numbered from 1.
+
+        Returns:
+            The stack of the selected bands.
+
+        Raises:
+            InvalidRasterBandException: The band selection is invalid.
+        """
+        if len(bands) == 0 or not all(band in range(1, self.count + 1) for band in bands):
+            raise InvalidRasterBandException("Invalid band selection.")
+
+        selection = RasterStack.__new__(RasterStack)
+        selection._datasets = self._datasets
+        selection._opened = []
+        selection._bands = [self._bands[band - 1] for band in bands]
+        return selection
+
+    def _output_dtype(self, nodata_to_nan: bool) -> np.dtype:
+        if nodata_to_nan:
+            return np.result_type(self.dtype, np.float32)
+        return self.dtype
+
+    def _read_into(self, out: np.ndarray, window: Optional[Window], nodata_to_nan: bool) -> None:
+        for i, (dataset, band) in enumerate(self._bands):
+            band_data = dataset.read(band, window=window)
+            out[i] = band_data
+            if nodata_to_nan and dataset.nodata is not None and not np.isnan(dataset.nodata):
+                out[i][band_data == dataset.nodata] = np.nan
+
+    @beartype
+    def read(self, window: Optional[Window] = None, nodata_to_nan: bool = True) -> np.ndarray:
+        """
+        Read the stacked bands.
+
+        The bands are read one at a time straight into the output array.
+
+        Args:
+            window: The window to read. Defaults to the whole grid.
+            nodata_to_nan: If nodata values are converted to NaN. The data is then returned as floats.
+                Defaults to True.
+
+        Returns:
+            3D array with shape (bands, height, width).
+        """
+        height, width = (self.height, self.width) if window is None else (int(window.height), int(window.width))
+        out = np.empty((self.count, height, width), dtype=self._output_dtype(nodata_to_nan))
+        self._read_into(out, window, nodata_to_nan)
+        return out
+
+    @beartype
+    def read_blocks(self, block_size: int = 1024, nodata_to_nan: bool = True) -> Iterator[Tuple[Window, np.ndarray]]:
+        """
+        Read the stacked bands lazily block by block.
+
+        Args:
+            block_size: Height and width of the blocks in pixels. Defaults to 1024.
+            nodata_to_nan: If nodata values are converted to NaN. Defaults to True.
+
+        Yields:
+            The window of each block and the block data with shape (bands, block height, block width).
+
+        Raises:
+            InvalidParameterValueException: Block size is not positive.
+        """
+        for window, _ in get_block_windows(self.height, self.width, block_size):
+            yield window, self.read(window=window, nodata_to_nan=nodata_to_nan)
+
+    @beartype
+    def to_memmap(
+        self, scratch_file: Optional[Path] = None, nodata_to_nan: bool = True, block_size: int = 1024
+    ) -> np.memmap:
+        """
+        Read the stacked bands into a memory-mapped array backed by a scratch file.
+
+        The array is filled block by block, so only one block is held in memory while reading. The result is
+        a regular NumPy array for all other functions, with pages loaded from the scratch file on access.
+
+        Args:
+            scratch_file: The file backing the array. It is overwritten and left in place for the caller.
+                Defaults to an anonymous temporary file deleted once the array is released.
+            nodata_to_nan: If nodata values are converted to NaN. Defaults to True.
+            block_size: Height and width of the blocks read at a time in pixels. Defaults to 1024.
+
+        Returns:
+            Memory-mapped 3D array with shape (bands, height, width).
+
+        Raises:
+            InvalidParameterValueException: Block size is not positive.
+        """
+        windows = get_block_windows(self.height, self.width, block_size)
+        dtype = self._output_dtype(nodata_to_nan)
+
+        if scratch_file is None:
+            with tempfile.TemporaryFile() as file:
+                out = np.memmap(file, dtype=dtype, mode="w+", shape=self.shape)
+        else:
+            out = np.memmap(scratch_file, dtype=dtype, mode="w+", shape=self.shape)
+
+        for window, _ in windows:
+            rows = slice(window.row_off, window.row_off + window.height)
+            cols = slice(window.col_off, window.col_off + window.width)
+            block = np.empty((self.count, window.height, window.width), dtype=dtype)
+            self._read_into(block, window, nodata_to_nan)
+            out[:, rows, cols] = block
+
+        out.flush()
+        return out
@@ -0,0 +1,196 @@
+from numbers import Number
+
+import numpy as np
+import rasterio
+from beartype import beartype
+from beartype.typing import List, Literal, Optional, Sequence, Tuple
+
+from eis_toolkit.exceptions import InvalidParameterValueException, InvalidRasterBandException
+from eis_toolkit.utilities.blockwise import get_block_windows
+from eis_toolkit.utilities.checks.raster import check_raster_bands
+
+# Number of values kept on each level of the quantile sketch, quantiles are exact up to this many values
+SKETCH_LEVEL_SIZE = 2**14
+
+
+def _empty_statistics() -> dict:
+    return {
+        "count": 0,
+        "mean": 0.0,
+        "m2": 0.0,
+        "min": np.inf,
+        "max": -np.inf,
+        "sketch_levels": [np.empty(0)],
+        "sketch_compactions": [0],
+    }
+
+
+def _compact_sketch(statistics: dict, sketch_level_size: int) -> None:
+    """Halve the sketch levels holding too many values, promoting every other sorted value to the next level.
+
+    A value on level h stands for 2**h values of the data, so the total weight of the sketch stays equal to
+    the number of values. The kept half alternates between compactions to avoid biasing the quantiles.
+    """
+    levels, compactions = statistics["sketch_levels"], statistics["sketch_compactions"]
+
+    level = 0
+    while level < len(levels):
+        if len(levels[level]) > sketch_level_size:
+            values = np.sort(levels[level])
+            even_length = len(values) - len(values) % 2
+            left_behind, values = values[even_length:], values[:even_length]
+            offset = compactions[level] % 2
+
+            if level + 1 == len(levels):
+                levels.append(np.empty(0))
+                compactions.append(0)
+
+            levels[level + 1] = np.concatenate([levels[level + 1], values[offset::2]])
+            levels[level] = left_behind
+            compactions[level] += 1
+        level += 1
+
+
+def _update_statistics(statistics: dict, values: np.ndarray, sketch_level_size: int) -> None:
+    """Add a block of finite values to the statistics, merging the moments with the Chan et al. formulas."""
+    if values.size == 0:
+        return
+
+    block_count = values.size
+    block_mean = np.mean(values)
+    block_m2 = np.sum((values - block_mean) ** 2)
+
+    count = statistics["count"] + block_count
+    delta = block_mean - statistics["mean"]
+    statistics["mean"] += delta * block_count / count
+    statistics["m2"] += block_m2 + delta**2 * statistics["count"] * block_count / count
+    statistics["count"] = count
+    statistics["min"] = min(statistics["min"], np.min(values))
+    statistics["max"] = max(statistics["max"], np.max(values))
+
+    statistics["sketch_levels"][0] = np.concatenate([statistics["sketch_levels"][0], values])
+    _compact_sketch(statistics, sketch_level_size)
+
+
+@beartype
+def raster_band_statistics(
+    raster: rasterio.io.DatasetReader,
+    bands: Optional[Sequence[int]] = None,
+    nodata: Optional[Number] = None,
+    block_size: int = 1024,
+    sketch_level_size: int = SKETCH_LEVEL_SIZE,
+) -> List[dict]:
+    """
+    Compute statistics of raster bands in a single windowed pass.
+
+    The count, mean, population variance and standard deviation, minimum and maximum are accumulated block by
+    block with Welford's method. Quantiles are answered from a mergeable KLL-style sketch with
+    `sketch_percentile`. The sketch is exact until a band has more than sketch_level_size valid values and
+    approximate after that, with a rank error of a fraction of a percent. Nodata and non-finite values are
+    left out. Only one block is in memory at a time.
+
+    Args:
+        raster: The input raster.
+        bands: Selection of bands to compute the statistics for. Defaults to all bands.
+        nodata: Nodata value to be left out. Defaults to the nodata value of the raster.
+        block_size: Height and width of the blocks read at a time in pixels. Defaults to 1024.
+        sketch_level_size: Number of values kept on each level of the quantile sketch. Defaults to 16384.
+
+    Returns:
+        The statistics of each selected band as dictionaries with keys "count", "mean", "variance", "std",
+        "min" and "max", plus the quantile sketch. Statistics of bands without valid values are NaN.
+
+    Raises:
+        InvalidRasterBandException: The input contains invalid band numbers.
+        InvalidParameterValueException: Block size or sketch level size is not positive.
+    """
+    bands = list(range(1, raster.count + 1)) if bands is None else list(bands)
+    nodata = raster.nodata if nodata is None else nodata
+
+    if check_raster_bands(raster, bands) is False:
+        raise InvalidRasterBandException("Invalid band selection.")
+
+    if sketch_level_size < 2:
+        raise InvalidParameterValueException("Sketch level size must be at least 2.")
+
+    band_statistics = [_empty_statistics() for _ in bands]
+
+    for _, window in get_block_windows(raster.height, raster.width, block_size):
+        block = raster.read(bands, window=window)
+        for statistics, band_block in zip(band_statistics, block):
+            valid = np.isfinite(band_block)
+            if nodata is not None:
+                valid &= band_block != nodata
+            _update_statistics(statistics, band_block[valid].astype(np.float64), sketch_level_size)
+
+    for statistics in band_statistics:
+        if statistics["count"] == 0:
+            statistics.update({"mean": np.nan, "min": np.nan, "max": np.nan, "variance": np.nan, "std": np.nan})
+        else:
+            statistics["variance"] = statistics["m2"] / statistics["count"]
+            statistics["std"] = np.sqrt(statistics["variance"])
+
+    return band_statistics
+
+
+@beartype
+def sketch_weighted_values(statistics: dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the values held by the quantile sketch of band statistics with the number of data values each stands for.
+
+    The weights sum up to the number of valid values in the band. While the sketch is exact, the values are
+    the band values and all weights are one.
+
+    Args:
+        statistics: Statistics of a band from `raster_band_statistics`.
+
+    Returns:
+        The sorted sketch values and their weights.
+    """
+    levels = statistics["sketch_levels"]
+    values = np.concatenate(levels)
+    weights = np.concatenate([np.full(len(level_values), 2**level) for level, level_values in enumerate(levels)])
+
+    order = np.argsort(values, kind="stable")
+    return values[order], weights[order]
+
+
+@beartype
+def sketch_percentile(
+    statistics: dict, percentile: Number, method: Literal["linear", "lower", "higher"] = "linear"
+) -> Number:
+    """
+    Get a percentile from the quantile sketch of band statistics.
+
+    The methods follow np.percentile: "lower" and "higher" give the data values on either side of the
+    percentile position and "linear" interpolates between them.
+
+    Args:
+        statistics: Statistics of a band from `raster_band_statistics`.
+        percentile: The percentile between 0 and 100.
+        method: The method for percentiles falling between two data values. Defaults to "linear".
+
+    Returns:
+        The percentile, or NaN if the band has no valid values.
+
+    Raises:
+        InvalidParameterValueException: The percentile is not between 0 and 100.
+    """
+    if not 0 <= percentile <= 100:
+        raise InvalidParameterValueException("Percentile must be between 0 and 100.")
+
+    if statistics["count"] == 0:
+        return np.nan
+
+    values, weights = sketch_weighted_values(statistics)
+    cumulative_weights = np.cumsum(weights)
+
+    position = percentile / 100 * (statistics["count"] - 1)
+    lower_value = values[np.searchsorted(cumulative_weights, np.floor(position), side="right")]
+    higher_value = values[np.searchsorted(cumulative_weights, np.ceil(position), side="right")]
+
+    if method == "lower":
+        return lower_value
+    if method == "higher":
+        return higher_value
+    return lower_value + (higher_value - lower_value) * (position - np.floor(position))
@@ -1,13 +1,88 @@
+from numbers import Number
+
 import geopandas
 import numpy as np
 import pandas as pd
 import rasterio
 from beartype import beartype
-from beartype.typing import Optional
+from beartype.typing import Optional, Tuple
 
-from eis_toolkit.exceptions import GeometryTypeException, NonMatchingCrsException
+from eis_toolkit.exceptions import GeometryTypeException, InvalidParameterValueException, NonMatchingCrsException
+from eis_toolkit.utilities.blockwise import get_block_windows
 from eis_toolkit.utilities.checks.geometry import check_geometry_types
 from eis_toolkit.utilities.checks.raster import check_matching_crs
+from eis_toolkit.utilities.point_sampling import sample_raster_points
+
+
+def _count_at_or_above(values: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """Count the values at or above each threshold.
+
+    The values are sorted once and the thresholds looked up with a binary search, so the cost hardly grows
+    with the number of thresholds. NaN values sort last and are not counted, as in direct comparisons.
+    """
+    values = np.sort(values, axis=None)
+    valid_count = values.size
+    if np.issubdtype(values.dtype, np.floating):
+        valid_count -= np.count_nonzero(np.isnan(values))
+
+    return valid_count - np.searchsorted(values, thresholds, side="left")
+
+
+def _points_within_bounds(raster: rasterio.io.DatasetReader, points: geopandas.GeoDataFrame) -> geopandas.GeoDataFrame:
+    return points.cx[
+        raster.bounds.left : raster.bounds.right,  # noqa: E203
+        raster.bounds.bottom : raster.bounds.top,  # noqa: E203
+    ]
+
+
+def _point_scores(
+    raster: rasterio.io.DatasetReader,
+    points: geopandas.GeoDataFrame,
+    band: int,
+    data_array: Optional[np.ndarray],
+    block_size: Optional[int],
+) -> np.ndarray:
+    """Get the raster values at the points within the raster bounds.
+
+    If the data is not in memory, the points are grouped by raster block and each block is read once.
+    """
+    points = _points_within_bounds(raster, points)
+
+    if data_array is not None:
+        rows, cols = rasterio.transform.rowcol(raster.transform, points.geometry.x, points.geometry.y)
+        return data_array[rows, cols]
+
+    x, y = points.geometry.x.to_numpy(), points.geometry.y.to_numpy()
+    return sample_raster_points(raster, x, y, block_size, [band])[0]
+
+
+def _raster_threshold_counts(
+    raster: rasterio.io.DatasetReader, band: int, thresholds: np.ndarray, block_size: int
+) -> Tuple[np.ndarray, Number, int, Number, int]:
+    """Count the raster values at or above the thresholds block by block.
+
+    Returns the counts, the maximum and how many times it occurs, the minimum and the number of cells.
+    The maximum and minimum are NaN if the raster contains NaN values, like np.max and np.min.
+    """
+    counts = np.zeros(len(thresholds), dtype=np.int64)
+    maximum, maximum_count, minimum = -np.inf, 0, np.inf
+
+    for window, _ in get_block_windows(raster.height, raster.width, block_size):
+        block = raster.read(band, window=window)
+        counts += _count_at_or_above(block, thresholds)
+
+        block_maximum, block_minimum = block.max(), block.min()
+        if np.isnan(block_maximum) or np.isnan(maximum):
+            maximum = minimum = np.nan
+        elif block_maximum > maximum:
+            maximum, maximum_count = block_maximum, (block == block_maximum).sum()
+        elif block_maximum == maximum:
+            maximum_count += (block == block_maximum).sum()
+
+        if not np.isnan(minimum):
+            minimum = min(minimum, block_minimum)
+
+    return counts, maximum, maximum_count, minimum, raster.height * raster.width
 
 
 def _calculate_base_metrics(
@@ -15,56 +90,43 @@ def _calculate_base_metrics(
     deposits: geopandas.GeoDataFrame,
     band: int,
     negatives: geopandas.GeoDataFrame,
+    block_size: Optional[int] = None,
 ) -> pd.DataFrame:
-    data_array = raster.read(band)
+    data_array = raster.read(band) if block_size is None else None
 
-    # Select only deposits that are within raster bounds
-    deposits = deposits.cx[
-        raster.bounds.left : raster.bounds.right,  # noqa: E203
-        raster.bounds.bottom : raster.bounds.top,  # noqa: E203
-    ]
-
-    deposit_rows, deposit_cols = rasterio.transform.rowcol(raster.transform, deposits.geometry.x, deposits.geometry.y)
-    deposit_scores = data_array[deposit_rows, deposit_cols]
+    deposit_scores = _point_scores(raster, deposits, band, data_array, block_size)
     threshold_values = np.flip(np.unique(deposit_scores))
 
-    if threshold_values.max() < data_array.max():
-        threshold_values = np.concatenate(([data_array.max()], threshold_values))
-
-    if threshold_values.min() > data_array.min():
-        threshold_values = np.concatenate((threshold_values, [data_array.min()]))
+    if data_array is not None:
+        area_counts = _count_at_or_above(data_array, threshold_values)
+        maximum, minimum, size = data_array.max(), data_array.min(), data_array.size
+        maximum_count = (data_array == maximum).sum()
+    else:
+        area_counts, maximum, maximum_count, minimum, size = _raster_threshold_counts(
+            raster, band, threshold_values, block_size
+        )
 
-    true_positive_rate_values = []
-    proportion_of_area_values_values = []
+    if threshold_values.max() < maximum:
+        threshold_values = np.concatenate(([maximum], threshold_values))
+        area_counts = np.concatenate(([maximum_count], area_counts))
 
-    for threshold_value in threshold_values:
-        true_positive_rate_values.append((deposit_scores >= threshold_value).sum() / deposit_scores.size)
-        proportion_of_area_values_values.append((data_array >= threshold_value).sum() / data_array.size)
+    if threshold_values.min() > minimum:
+        threshold_values = np.concatenate((threshold_values, [minimum]))
+        area_counts = np.concatenate((area_counts, [size]))
 
     base_metrics = pd.DataFrame(
         {
-            "true_positive_rate_values": true_positive_rate_values,
-            "proportion_of_area_values": proportion_of_area_values_values,
+            "true_positive_rate_values": _count_at_or_above(deposit_scores, threshold_values) / deposit_scores.size,
+            "proportion_of_area_values": area_counts / size,
             "threshold_values": threshold_values,
         }
     )
 
     if negatives is not None:
-        # Select only negatives that are within raster bounds
-        negatives = negatives.cx[
-            raster.bounds.left : raster.bounds.right,  # noqa: E203
-            raster.bounds.bottom : raster.bounds.top,  # noqa: E203
-        ]
-        negatives_rows, negatives_cols = rasterio.transform.rowcol(
-            raster.transform, negatives.geometry.x, negatives.geometry.y
+        negatives_scores = _point_scores(raster, negatives, band, data_array, block_size)
+        base_metrics["false_positive_rate_values"] = (
+            _count_at_or_above(negatives_scores, threshold_values) / negatives_scores.size
         )
-        negatives_scores = data_array[negatives_rows, negatives_cols]
-
-        false_positive_rate_values = []
-        for threshold_values in threshold_values:
-            false_positive_rate_values.append((negatives_scores >= threshold_values).sum() / negatives_scores.size)
-
-        base_metrics["false_positive_rate_values"] = false_positive_rate_values
 
     return base_metrics
 
@@ -75,6 +137,7 @@ def calculate_base_metrics(
     deposits: geopandas.GeoDataFrame,
     band: int = 1,
     negatives: Optional[geopandas.GeoDataFrame] = None,
+    block_size: Optional[int] = None,
 ) -> pd.DataFrame:
     """Calculate true positive rate, proportion of area and false positive rate values for different thresholds.
 
@@ -82,11 +145,17 @@ def calculate_base_metrics(
     which are determined from inputted deposit locations and mineral prospectivity map. Note that calculation of false
     positive rate is optional and is only done if negative point locations are provided.
 
+    The raster values are sorted once and the cells at or above each threshold are found with a binary search.
+    If block size is given, the raster is read block by block and the point scores are read once per block
+    holding points, so the raster is never loaded into memory as a whole.
+
     Args:
         raster: Mineral prospectivity map or evidence layer.
         deposits: Mineral deposit locations as points.
         band: Band index of the mineral prospectivity map. Defaults to 1.
         negatives: Negative locations as points.
+        block_size: Height and width of the blocks read at a time in pixels. Defaults to None,
+            in which case the band is read into memory as a whole.
 
     Returns:
         DataFrame containing true positive rate, proportion of area, threshold values and false positive
@@ -95,6 +164,7 @@ def calculate_base_metrics(
     Raises:
         NonMatchingCrsException: The raster and point data are not in the same CRS.
         GeometryTypeException: The input geometries contain non-point features.
+        InvalidParameterValueException: Block size is not positive.
     """
     if negatives is not None:
         geometries = pd.concat([deposits, negatives]).geometry
@@ -112,6 +182,11 @@ def calculate_base_metrics(
     ):
         raise GeometryTypeException("The input geometries contain non-point features.")
 
-    base_metrics = _calculate_base_metrics(raster=raster, deposits=deposits, band=band, negatives=negatives)
+    if block_size is not None and block_size < 1:
+        raise InvalidParameterValueException("Block size must be a positive integer.")
+
+    base_metrics = _calculate_base_metrics(
+        raster=raster, deposits=deposits, band=band, negatives=negatives, block_size=block_size
+    )
 
     return base_metrics
@@ -9,7 +9,7 @@ import rasterio
 from beartype import beartype
 from beartype.typing import List, Optional, Tuple, Union
 from shapely import wkt
-from shapely.geometry import Point, Polygon
+from shapely.geometry import Polygon
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidColumnException, InvalidParameterValueException
 
@@ -167,7 +167,8 @@ def _init_from_vector_data(
     tmp = join_grid[["geometry"]].copy(deep=True)
 
     # Saving results in attributes
-    cba = gpd.GeoDataFrame(pd.concat([tmp.groupby(tmp.index).first(), indicators], axis=1))
+    cells = tmp[~tmp.index.duplicated(keep="first")].sort_index()
+    cba = gpd.GeoDataFrame(pd.concat([cells, indicators], axis=1))
     cba = cba.set_crs(grid.crs, allow_override=True)
     cba = cba.astype("int32", errors="ignore")
 
@@ -379,13 +380,9 @@ def _get_disc(geodata: gpd.GeoDataFrame, grid: gpd.GeoDataFrame, buff_radius: Un
         intersection.
     """
 
-    # Deletion of cells that do not intersect shapefile geometries
+    # Deletion of cells that do not intersect shapefile geometries, keeping each cell once
     cells_w_bound = gpd.sjoin(grid, geodata, how="inner", predicate="intersects")
-    cells_w_bound["index"] = cells_w_bound.index
-    cells_w_bound = cells_w_bound.dissolve(by="index")
-    drop_list = geodata.columns
-    drop_list = drop_list.drop("geometry")
-    cells_w_bound = cells_w_bound.drop(drop_list, axis="columns")
+    cells_w_bound = cells_w_bound[~cells_w_bound.index.duplicated(keep="first")].sort_index()
 
     # Creation of the centroids of the mesh
     centX = cells_w_bound.centroid.x
@@ -419,29 +416,27 @@ def _get_grid(working_map: gpd.GeoDataFrame, cell_width: int, cell_height: int)
     xmin, ymin, xmax, ymax = working_map.total_bounds
     rows = int(np.ceil((ymax - ymin) / cell_height))
     cols = int(np.ceil((xmax - xmin) / cell_width))
-    x_left_origin = xmin
-    x_right_origin = xmin + cell_width
-    y_top_origin = ymax
-    y_bottom_origin = ymax - cell_height
-    data = []
-    for i in range(cols):
-        y_top = y_top_origin
-        y_bottom = y_bottom_origin
-        for j in range(rows):
-            polygon = Polygon(
-                [
-                    (x_left_origin, y_top),
-                    (x_right_origin, y_top),
-                    (x_right_origin, y_bottom),
-                    (x_left_origin, y_bottom),
-                ]
-            )
-            data += [[i + j * cols, i, j, polygon]]
-            y_top = y_top - cell_height
-            y_bottom = y_bottom - cell_height
-        x_left_origin = x_left_origin + cell_width
-        x_right_origin = x_right_origin + cell_width
-    result = pd.DataFrame(data, columns=["cell_id", "x", "y", "geometry"])
+
+    # Cell edges accumulated cell by cell from the origin, column by column
+    x_left = np.cumsum(np.concatenate([[xmin], np.full(cols - 1, cell_width)]))
+    x_right = np.cumsum(np.concatenate([[xmin + cell_width], np.full(cols - 1, cell_width)]))
+    y_top = np.cumsum(np.concatenate([[ymax], np.full(rows - 1, -cell_height)]))
+    y_bottom = np.cumsum(np.concatenate([[ymax - cell_height], np.full(rows - 1, -cell_height)]))
+
+    x_index, y_index = np.meshgrid(np.arange(cols), np.arange(rows), indexing="ij")
+    x_index, y_index = x_index.ravel(), y_index.ravel()
+    corners = np.stack(
+        [
+            np.column_stack([x_left[x_index], y_top[y_index]]),
+            np.column_stack([x_right[x_index], y_top[y_index]]),
+            np.column_stack([x_right[x_index], y_bottom[y_index]]),
+            np.column_stack([x_left[x_index], y_bottom[y_index]]),
+        ],
+        axis=1,
+    )
+    polygons = [Polygon(cell_corners) for cell_corners in corners]
+
+    result = pd.DataFrame({"cell_id": x_index + y_index * cols, "x": x_index, "y": y_index, "geometry": polygons})
     result.set_index("cell_id", inplace=True)
 
     return gpd.GeoDataFrame(result, geometry="geometry", crs=working_map.crs)
@@ -558,23 +553,13 @@ def _to_raster(cba: gpd.GeoDataFrame, output_path: str, nan_val: int = -9999) ->
     width = round((max_x - min_x) / x_resolution)
     height = round((max_y - min_y) / y_resolution)
 
-    x_values = [x[0]]
-    for i in range(0, (width - 1), 1):
-        new_val = x_values[i] + x_resolution
-        x_values = np.append(x_values, new_val)
-    y_values = [y[0]]
-    for i in range(0, (height - 1), 1):
-        new_val = y_values[i] - y_resolution
-        y_values = np.append(y_values, new_val)
-    X, Y = np.meshgrid(x_values, y_values)
-
-    points = pd.DataFrame({"X": np.ravel(X), "Y": np.ravel(Y)})
-    points["coords"] = list(zip(points["X"], points["Y"]))
-    points["coords"] = points["coords"].apply(Point)
-    points_grid = gpd.GeoDataFrame(points, geometry="coords", crs=cba.crs)
-    points_grid = points_grid.sjoin(cba, how="left")
-    points_grid = points_grid.fillna(nan_val)
-    col_name = list(points_grid.drop(["X", "Y", "coords", "index_right"], axis=1).columns)
+    # Position of each cell on the raster lattice, cells missing from the matrix are nodata
+    cols = np.rint((geometries.centroid.x - x[0]) / x_resolution).astype(int)
+    rows = np.rint((y[0] - geometries.centroid.y) / y_resolution).astype(int)
+    col_name = list(cba.columns.drop("geometry"))
+
+    bands = np.full((count, height, width), nan_val, dtype="int32")
+    bands[:, rows, cols] = cba[col_name].to_numpy(dtype="int32").T
 
     transform = rasterio.transform.from_bounds(min_x, min_y, max_x, max_y, width=width, height=height)
 
@@ -590,9 +575,6 @@ def _to_raster(cba: gpd.GeoDataFrame, output_path: str, nan_val: int = -9999) ->
         transform=transform,
         nodata=nan_val,
     ) as new_dataset:
-        z = 1
-        for i in col_name:
-            new_dataset.write(points_grid.pivot(index="Y", columns="X", values=i).sort_index(ascending=False).values, z)
+        new_dataset.write(bands)
+        for z, i in enumerate(col_name, start=1):
             new_dataset.set_band_description(z, i)
-            z = z + 1
-    new_dataset.close()
@@ -1,32 +1,64 @@
 import geopandas as gpd
 import numpy as np
 from beartype import beartype
-from beartype.typing import Union
-from rasterio import profiles, transform
+from beartype.typing import Iterator, Literal, Union
+from rasterio import features, profiles, transform
+from scipy.ndimage import distance_transform_edt
+from shapely.geometry import LinearRing, LineString, Point, Polygon
 from shapely.geometry.base import BaseGeometry, BaseMultipartGeometry
 
-from eis_toolkit.exceptions import EmptyDataFrameException, NonMatchingCrsException
+from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException, NonMatchingCrsException
 from eis_toolkit.utilities.checks.raster import check_raster_profile
 from eis_toolkit.utilities.miscellaneous import row_points
 
+# Number of raster rows refined at a time in the distance transform method
+REFINEMENT_CHUNK_ROWS = 512
+# Number of geometry segments kept for each raster cell in the distance transform method
+SEGMENTS_PER_CELL = 4
+# Largest size of the distance transform grid relative to the raster before falling back to the vector method
+MAX_GRID_SIZE_FACTOR = 4
+
 
 @beartype
-def distance_computation(raster_profile: Union[profiles.Profile, dict], geometries: gpd.GeoDataFrame) -> np.ndarray:
+def distance_computation(
+    raster_profile: Union[profiles.Profile, dict],
+    geometries: gpd.GeoDataFrame,
+    method: Literal["vector", "transform"] = "vector",
+) -> np.ndarray:
     """Calculate distance from raster cell to nearest geometry.
 
+    The vector method computes the exact distance from each cell center to the geometries, one cell at a time.
+    The transform method rasterizes the geometries onto the raster grid and runs a Euclidean distance
+    transform, then refines each distance with the exact distances to the geometry segments in the nearest
+    geometry cells. It is orders of magnitude faster for large rasters. The distances are never shorter than
+    the exact ones and exceed them by less than one cell diagonal, typically by much less. Distances next to
+    the geometries and distances to sparse points are exact. Geometries outside the raster extent enlarge
+    the grid the transform is computed on, as far as they can be the nearest geometry of some raster cell.
+    If that would make the grid more than four times the size of the raster, the distances are computed with
+    the vector method instead.
+
     Args:
         raster_profile: The raster profile of the raster in which the distances
             to the nearest geometry are determined.
         geometries: The geometries to determine distance to.
+        method: The method used for computing the distances, either "vector" or "transform".
+            Defaults to "vector".
 
     Returns:
         A 2D numpy array with the distances computed.
 
+    Raises:
+        NonMatchingCrsException: The raster and geometries have different coordinate systems.
+        EmptyDataFrameException: The input GeoDataFrame or all of its geometries are empty.
+        InvalidParameterValueException: The raster profile is invalid or, for the transform method,
+            the raster is rotated.
     """
     if raster_profile.get("crs") != geometries.crs:
         raise NonMatchingCrsException("Expected coordinate systems to match between raster and geometries. ")
     if geometries.shape[0] == 0:
         raise EmptyDataFrameException("Expected GeoDataFrame to not be empty.")
+    if (geometries.geometry.isna() | geometries.geometry.is_empty).all():
+        raise EmptyDataFrameException("Expected GeoDataFrame to have non-empty geometries.")
 
     check_raster_profile(raster_profile=raster_profile)
 
@@ -34,6 +66,17 @@ def distance_computation(raster_profile: Union[profiles.Profile, dict], geometri
     raster_height = raster_profile.get("height")
     raster_transform = raster_profile.get("transform")
 
+    if method == "transform":
+        if raster_transform.b != 0 or raster_transform.d != 0:
+            raise InvalidParameterValueException("The transform method does not support rotated rasters.")
+
+        return _distance_computation_transform(
+            raster_width=raster_width,
+            raster_height=raster_height,
+            raster_transform=raster_transform,
+            geometries=geometries,
+        )
+
     return _distance_computation(
         raster_width=raster_width, raster_height=raster_height, raster_transform=raster_transform, geometries=geometries
     )
@@ -73,3 +116,165 @@ def _distance_computation(
     )
 
     return distance_matrix
+
+
+def _iterate_simple_geometries(geometry: BaseGeometry) -> Iterator[BaseGeometry]:
+    if geometry is None or geometry.is_empty:
+        return
+    if isinstance(geometry, BaseMultipartGeometry):
+        for part in geometry.geoms:
+            yield from _iterate_simple_geometries(part)
+    else:
+        yield geometry
+
+
+def _densify_line(coords: np.ndarray, spacing: float) -> np.ndarray:
+    segment_lengths = np.hypot(*np.diff(coords, axis=0).T)
+    n_steps = np.maximum(np.ceil(segment_lengths / spacing).astype(int), 1)
+
+    segment_index = np.repeat(np.arange(len(segment_lengths)), n_steps)
+    step_fraction = (np.arange(n_steps.sum()) - np.repeat(np.cumsum(n_steps) - n_steps, n_steps)) / np.repeat(
+        n_steps, n_steps
+    )
+
+    start, end = coords[segment_index], coords[segment_index + 1]
+    densified = start + (end - start) * step_fraction[:, np.newaxis]
+
+    return np.vstack([densified, coords[-1:]])
+
+
+def _geometry_segments(geometries: gpd.GeoSeries, spacing: float) -> np.ndarray:
+    """Split the geometries into an (n, 4) array of x0, y0, x1, y1 segments no longer than spacing.
+
+    Points become zero-length segments and polygons are represented by their boundaries.
+    """
+    lines = []
+    for geometry in geometries:
+        for part in _iterate_simple_geometries(geometry):
+            if isinstance(part, Point):
+                lines.append(np.array([[part.x, part.y], [part.x, part.y]]))
+            elif isinstance(part, (LineString, LinearRing)):
+                lines.append(np.asarray(part.coords)[:, :2])
+            elif isinstance(part, Polygon):
+                lines.extend(np.asarray(ring.coords)[:, :2] for ring in [part.exterior, *part.interiors])
+
+    segments = []
+    for line in lines:
+        vertices = _densify_line(line, spacing)
+        segments.append(np.hstack([vertices[:-1], vertices[1:]]))
+
+    return np.vstack(segments)
+
+
+def _segment_distances(x: np.ndarray, y: np.ndarray, segments: np.ndarray) -> np.ndarray:
+    x0, y0, x1, y1 = segments[..., 0], segments[..., 1], segments[..., 2], segments[..., 3]
+    dx, dy = x1 - x0, y1 - y0
+    squared_length = dx**2 + dy**2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(squared_length > 0, ((x - x0) * dx + (y - y0) * dy) / squared_length, 0.0)
+    t = np.clip(t, 0.0, 1.0)
+
+    return np.hypot(x - (x0 + t * dx), y - (y0 + t * dy))
+
+
+def _distance_computation_transform(
+    raster_width: int, raster_height: int, raster_transform: transform.Affine, geometries: gpd.GeoDataFrame
+) -> np.ndarray:
+    cell_width, cell_height = abs(raster_transform.a), abs(raster_transform.e)
+    spacing = min(cell_width, cell_height) / 2
+    segments = _geometry_segments(geometries.geometry, spacing=spacing)
+    midpoints_x = (segments[:, 0] + segments[:, 2]) / 2
+    midpoints_y = (segments[:, 1] + segments[:, 3]) / 2
+
+    # Drop the segments farther from the raster than the largest distance a raster cell can have to its
+    # nearest segment. That distance is at most the distance from the farthest raster corner to any segment.
+    left, top = raster_transform * (0, 0)
+    right, bottom = raster_transform * (raster_width, raster_height)
+    x_min, x_max, y_min, y_max = min(left, right), max(left, right), min(top, bottom), max(top, bottom)
+
+    farthest_corner_distances = np.hypot(
+        np.maximum(midpoints_x - x_min, x_max - midpoints_x), np.maximum(midpoints_y - y_min, y_max - midpoints_y)
+    )
+    raster_distances = np.hypot(
+        np.maximum.reduce([x_min - midpoints_x, midpoints_x - x_max, np.zeros_like(midpoints_x)]),
+        np.maximum.reduce([y_min - midpoints_y, midpoints_y - y_max, np.zeros_like(midpoints_y)]),
+    )
+    relevant = raster_distances <= farthest_corner_distances.min() + spacing
+    segments, midpoints_x, midpoints_y = segments[relevant], midpoints_x[relevant], midpoints_y[relevant]
+
+    # Grid cells of the segments, with the grid enlarged to cover the segments outside the raster
+    segment_cols = np.floor((midpoints_x - raster_transform.c) / raster_transform.a).astype(np.int64)
+    segment_rows = np.floor((midpoints_y - raster_transform.f) / raster_transform.e).astype(np.int64)
+
+    pad_top, pad_left = max(0, -segment_rows.min()), max(0, -segment_cols.min())
+    grid_height = pad_top + max(raster_height, segment_rows.max() + 1)
+    grid_width = pad_left + max(raster_width, segment_cols.max() + 1)
+
+    if grid_height * grid_width > MAX_GRID_SIZE_FACTOR * raster_height * raster_width:
+        return _distance_computation(
+            raster_width=raster_width,
+            raster_height=raster_height,
+            raster_transform=raster_transform,
+            geometries=geometries,
+        )
+
+    grid_transform = raster_transform * transform.Affine.translation(-pad_left, -pad_top)
+
+    segment_cells = (segment_rows + pad_top) * grid_width + segment_cols + pad_left
+    cell_x_centers, cell_y_centers = grid_transform * (
+        (segment_cells % grid_width) + 0.5,
+        (segment_cells // grid_width) + 0.5,
+    )
+
+    # Keep the segments closest to the cell center for each cell covered by the geometries
+    center_distances = _segment_distances(cell_x_centers, cell_y_centers, segments)
+    order = np.lexsort((center_distances, segment_cells))
+    sorted_cells = segment_cells[order]
+    seed_cells, first_index = np.unique(sorted_cells, return_index=True)
+    rank = np.arange(len(sorted_cells)) - np.repeat(first_index, np.diff(np.append(first_index, len(sorted_cells))))
+
+    kept = rank < SEGMENTS_PER_CELL
+    seed_segments = np.full((len(seed_cells), SEGMENTS_PER_CELL, 4), np.nan)
+    seed_segments[np.searchsorted(seed_cells, sorted_cells[kept]), rank[kept]] = segments[order][kept]
+
+    not_seed = np.ones((grid_height, grid_width), dtype=bool)
+    not_seed.flat[seed_cells] = False
+
+    nearest_seed = np.empty((2, grid_height, grid_width), dtype=np.int32)
+    distance_transform_edt(
+        not_seed, sampling=(cell_height, cell_width), return_distances=False, return_indices=True, indices=nearest_seed
+    )
+    del not_seed
+
+    # Refine with the exact distances to the segments of the nearest geometry cells. The nearest cells of the
+    # neighbouring cells are checked too, since the cell with the nearest center does not always hold the
+    # nearest segment.
+    distance_matrix = np.full((raster_height, raster_width), np.inf)
+    cols = np.arange(raster_width)
+
+    for row_start in range(0, raster_height, REFINEMENT_CHUNK_ROWS):
+        row_end = min(row_start + REFINEMENT_CHUNK_ROWS, raster_height)
+        x_centers, y_centers = raster_transform * np.meshgrid(cols + 0.5, np.arange(row_start, row_end) + 0.5)
+        chunk_distances = distance_matrix[row_start:row_end]
+
+        for row_offset in (-1, 0, 1):
+            for col_offset in (-1, 0, 1):
+                grid_rows = np.clip(np.arange(row_start, row_end) + pad_top + row_offset, 0, grid_height - 1)
+                grid_cols = np.clip(cols + pad_left + col_offset, 0, grid_width - 1)
+                neighbour_seeds = nearest_seed[:, grid_rows[:, np.newaxis], grid_cols]
+                seed_index = np.searchsorted(
+                    seed_cells, neighbour_seeds[0].astype(np.int64) * grid_width + neighbour_seeds[1]
+                )
+
+                for segment in range(SEGMENTS_PER_CELL):
+                    segment_distances = _segment_distances(x_centers, y_centers, seed_segments[seed_index, segment])
+                    np.fmin(chunk_distances, segment_distances, out=chunk_distances)
+
+    # Cells with their center inside a polygon are at zero distance
+    polygons = [geometry for geometry in geometries.geometry if geometry is not None and geometry.area > 0]
+    if len(polygons) > 0:
+        interior = features.rasterize(polygons, out_shape=(raster_height, raster_width), transform=raster_transform)
+        distance_matrix[interior == 1] = 0.0
+
+    return distance_matrix
@@ -1,25 +1,24 @@
 import geopandas as gpd
+import numpy as np
 from beartype import beartype
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException
 
 
 def _extract_shared_lines(polygons: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
-    shared_lines_list = []
-
-    # Used to make sure that same polygon couples are not examined together multiple times
-    reversed_couples = set()
-
-    for i, poly1 in polygons.iterrows():
-        for j, poly2 in polygons.iterrows():
-            if i < j and (i, j) not in reversed_couples:
-                reversed_couples.add((i, j))
-                if i != j:
-                    shared_line = poly1["geometry"].intersection(poly2["geometry"])
-                    if not shared_line.is_empty and (
-                        shared_line.geom_type == "MultiLineString" or shared_line.geom_type == "LineString"
-                    ):
-                        shared_lines_list.append(shared_line)
+    geometries = polygons.geometry.values
+    labels = polygons.index.to_numpy()
+
+    # Candidate polygon couples from the spatial index, each couple examined once in row order
+    first, second = polygons.sindex.query_bulk(geometries, predicate="intersects")
+    couples = labels[first] < labels[second]
+    first, second = first[couples], second[couples]
+    order = np.lexsort((second, first))
+    first, second = first[order], second[order]
+
+    shared_lines = geometries[first].intersection(geometries[second])
+    is_line = np.isin(shared_lines.geom_type, ["LineString", "MultiLineString"])
+    shared_lines_list = list(shared_lines[is_line & ~shared_lines.is_empty])
 
     shared_lines_gdf = gpd.GeoDataFrame(geometry=shared_lines_list)
     shared_lines_gdf["ID"] = shared_lines_gdf.reset_index().index
@@ -31,6 +30,8 @@ def _extract_shared_lines(polygons: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
 def extract_shared_lines(polygons: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """Extract shared lines/borders/edges between polygons.
 
+    Only polygon couples found intersecting through the spatial index of the geodataframe are intersected.
+
     Args:
         polygons: The geodataframe that contains the polygon geometries to be examined
             for shared lines.
@@ -5,9 +5,13 @@ import numpy as np
 from beartype import beartype
 from beartype.typing import Optional, Tuple
 from rasterio import transform
+from scipy.spatial import cKDTree
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException
 
+# Approximate number of cell and input point pairs handled at a time with the neighbour search
+IDW_CHUNK_PAIRS = 2**22
+
 
 @beartype
 def _idw_interpolation(
@@ -16,6 +20,8 @@ def _idw_interpolation(
     resolution: Tuple[Number, Number],
     power: Number,
     extent: Optional[Tuple[Number, Number, Number, Number]],
+    search_radius: Optional[Number] = None,
+    n_neighbors: Optional[int] = None,
 ) -> Tuple[np.ndarray, dict]:
 
     points = np.array(geodataframe.geometry.apply(lambda geom: (geom.x, geom.y)).tolist())
@@ -35,7 +41,10 @@ def _idw_interpolation(
     y = np.linspace(y_min, y_max, num_points_y)
     y = y[::-1].reshape(-1, 1)
 
-    interpolated_values = _idw_core(points[:, 0], points[:, 1], values, x, y, power)
+    if search_radius is None and n_neighbors is None:
+        interpolated_values = _idw_core(points[:, 0], points[:, 1], values, x, y, power)
+    else:
+        interpolated_values = _idw_neighbors(points, values, x, y.ravel(), power, search_radius, n_neighbors)
     interpolated_values = interpolated_values.reshape(num_points_y, num_points_x)
 
     out_meta = {
@@ -65,6 +74,70 @@ def _idw_core(x, y, z, xi, yi: np.ndarray, power: Number) -> np.ndarray:
     return interpolated_values
 
 
+def _idw_weighted_mean(
+    distances: np.ndarray, neighbor_values: np.ndarray, power: Number, n_cells: int, cell_index: np.ndarray
+) -> np.ndarray:
+    # Same epsilon as in _idw_core to avoid division by zero
+    weights = 1.0 / np.where(distances == 0, 1e-12, distances) ** power
+
+    over = np.bincount(cell_index, weights=weights * neighbor_values, minlength=n_cells)
+    under = np.bincount(cell_index, weights=weights, minlength=n_cells)
+
+    with np.errstate(invalid="ignore"):
+        return np.where(under > 0, over / under, np.nan)
+
+
+def _expected_neighbors(points: np.ndarray, search_radius: Optional[Number], n_neighbors: Optional[int]) -> int:
+    expected_neighbors = len(points) if n_neighbors is None else min(n_neighbors, len(points))
+
+    if search_radius is not None:
+        # Assume the points are evenly spread over their bounding box
+        width, height = np.ptp(points, axis=0)
+        bounds_area = max(width, search_radius) * max(height, search_radius)
+        expected_neighbors = min(expected_neighbors, int(len(points) * np.pi * search_radius**2 / bounds_area) + 1)
+
+    return expected_neighbors
+
+
+def _idw_neighbors(
+    points: np.ndarray,
+    values: np.ndarray,
+    xi: np.ndarray,
+    yi: np.ndarray,
+    power: Number,
+    search_radius: Optional[Number],
+    n_neighbors: Optional[int],
+) -> np.ndarray:
+    tree = cKDTree(points)
+    values = values.astype(np.float64)
+    chunk_rows = max(1, IDW_CHUNK_PAIRS // (len(xi) * _expected_neighbors(points, search_radius, n_neighbors)))
+    interpolated_values = np.empty((len(yi), len(xi)))
+
+    for row_start in range(0, len(yi), chunk_rows):
+        row_end = min(row_start + chunk_rows, len(yi))
+        grid_x, grid_y = np.meshgrid(xi, yi[row_start:row_end])
+        cells = np.column_stack([grid_x.ravel(), grid_y.ravel()])
+
+        if n_neighbors is not None:
+            k = min(n_neighbors, len(points))
+            upper_bound = np.inf if search_radius is None else search_radius
+            distances, indices = tree.query(cells, k=[i + 1 for i in range(k)], distance_upper_bound=upper_bound)
+
+            # Neighbours outside the search radius are marked with an infinite distance
+            found = np.isfinite(distances)
+            cell_index = np.nonzero(found)[0]
+            distances, neighbor_values = distances[found], values[indices[found]]
+        else:
+            # All cell and point pairs within the search radius as flat arrays
+            pairs = cKDTree(cells).sparse_distance_matrix(tree, search_radius, output_type="ndarray")
+            cell_index, distances, neighbor_values = pairs["i"], pairs["v"], values[pairs["j"]]
+
+        chunk_values = _idw_weighted_mean(distances, neighbor_values, power, len(cells), cell_index)
+        interpolated_values[row_start:row_end] = chunk_values.reshape(grid_x.shape)
+
+    return interpolated_values
+
+
 @beartype
 def idw(
     geodataframe: gpd.GeoDataFrame,
@@ -72,9 +145,16 @@ def idw(
     resolution: Tuple[Number, Number],
     extent: Optional[Tuple[Number, Number, Number, Number]] = None,
     power: Number = 2,
+    search_radius: Optional[Number] = None,
+    n_neighbors: Optional[int] = None,
 ) -> Tuple[np.ndarray, dict]:
     """Calculate inverse distance weighted (IDW) interpolation.
 
+    By default, every output cell is interpolated from all input points. If search_radius or n_neighbors
+    is given, each cell is only interpolated from the nearest input points found with a KD-tree and the
+    output grid is processed in chunks of rows. This keeps time and memory use manageable for large
+    point sets and grids. Cells with no input points within the search radius are set to np.nan.
+
     Args:
         geodataframe: The vector dataframe to be interpolated.
         target_column: The column name with values for each geometry.
@@ -84,13 +164,17 @@ def idw(
         power: The value for determining the rate at which the weights decrease.
             As power increases, the weights for distant points decrease rapidly.
             Defaults to 2.
+        search_radius: Maximum distance of the input points used for each cell.
+            Defaults to None, which does not limit the distance.
+        n_neighbors: Maximum number of nearest input points used for each cell.
+            Defaults to None, which does not limit the number of points.
 
     Returns:
         Rasterized vector data and metadata.
 
     Raises:
         EmptyDataFrameException: The input GeoDataFrame is empty.
-        InvalidParameterValueException: Invalid resolution or target_column.
+        InvalidParameterValueException: Invalid resolution, target_column, search_radius or n_neighbors.
     """
 
     if geodataframe.shape[0] == 0:
@@ -104,6 +188,14 @@ def idw(
     if resolution[0] <= 0 or resolution[1] <= 0:
         raise InvalidParameterValueException("Expected height and width greater than zero.")
 
-    interpolated_values, out_meta = _idw_interpolation(geodataframe, target_column, resolution, power, extent)
+    if search_radius is not None and search_radius <= 0:
+        raise InvalidParameterValueException("Expected search radius to be greater than zero.")
+
+    if n_neighbors is not None and n_neighbors < 1:
+        raise InvalidParameterValueException("Expected number of neighbors to be at least one.")
+
+    interpolated_values, out_meta = _idw_interpolation(
+        geodataframe, target_column, resolution, power, extent, search_radius, n_neighbors
+    )
 
     return interpolated_values, out_meta
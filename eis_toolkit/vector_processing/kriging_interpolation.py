@@ -1,14 +1,51 @@
+from functools import partial
 from numbers import Number
+from pathlib import Path
 
 import geopandas as gpd
 import numpy as np
 from beartype import beartype
-from beartype.typing import Literal, Optional, Tuple
+from beartype.typing import Callable, Iterator, List, Literal, Optional, Tuple
+from pykrige.core import great_circle_distance
 from pykrige.ok import OrdinaryKriging
 from pykrige.uk import UniversalKriging
 from rasterio import transform
+from rasterio.windows import Window
+from scipy.spatial import cKDTree
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException
+from eis_toolkit.utilities.blockwise import TILE_SIZE, get_block_windows, write_raster_by_blocks
+
+# Maximum number of grid cells kriged at a time with the moving window
+KRIGING_CHUNK_CELLS = 4096
+
+# Read-only state of kriging_windowed, set once in each process that krige blocks
+_kriging_state: dict = {}
+
+
+def _kriging_grid(
+    data: gpd.GeoDataFrame, resolution: Tuple[Number, Number], extent: Optional[Tuple[Number, Number, Number, Number]]
+) -> Tuple[np.ndarray, np.ndarray, dict]:
+    if extent is None:
+        grid_x_min = data.geometry.total_bounds[0]
+        grid_x_max = data.geometry.total_bounds[2]
+        grid_y_min = data.geometry.total_bounds[1]
+        grid_y_max = data.geometry.total_bounds[3]
+
+    else:
+        grid_x_min, grid_x_max, grid_y_min, grid_y_max = extent
+
+    grid_x = np.arange(grid_x_min, grid_x_max + resolution[0], resolution[0])
+    grid_y = np.arange(grid_y_min, grid_y_max + resolution[1], resolution[1])
+
+    out_meta = {
+        "crs": data.crs,
+        "width": len(grid_x),
+        "height": len(grid_y),
+        "transform": transform.from_bounds(grid_x_min, grid_y_min, grid_x_max, grid_y_max, len(grid_x), len(grid_y)),
+    }
+
+    return grid_x, grid_y, out_meta
 
 
 def _kriging(
@@ -25,17 +62,7 @@ def _kriging(
     y = data.geometry.y
     z = data[target_column].values
 
-    if extent is None:
-        grid_x_min = data.geometry.total_bounds[0]
-        grid_x_max = data.geometry.total_bounds[2]
-        grid_y_min = data.geometry.total_bounds[1]
-        grid_y_max = data.geometry.total_bounds[3]
-
-    else:
-        grid_x_min, grid_x_max, grid_y_min, grid_y_max = extent
-
-    grid_x = np.arange(grid_x_min, grid_x_max + resolution[0], resolution[0])
-    grid_y = np.arange(grid_y_min, grid_y_max + resolution[1], resolution[1])
+    grid_x, grid_y, out_meta = _kriging_grid(data, resolution, extent)
 
     if method == "universal":
         universal_kriging = UniversalKriging(x, y, z, variogram_model=variogram_model, drift_terms=["regional_linear"])
@@ -45,16 +72,132 @@ def _kriging(
         ordinary_kriging = OrdinaryKriging(x, y, z, variogram_model=variogram_model, coordinates_type=coordinates_type)
         z_interpolated, _ = ordinary_kriging.execute("grid", grid_x, grid_y)
 
-    out_meta = {
-        "crs": data.crs,
-        "width": len(grid_x),
-        "height": len(grid_y),
-        "transform": transform.from_bounds(grid_x_min, grid_y_min, grid_x_max, grid_y_max, len(grid_x), len(grid_y)),
-    }
-
     return z_interpolated, out_meta
 
 
+def _check_kriging_parameters(data: gpd.GeoDataFrame, target_column: str, resolution: Tuple[Number, Number]) -> None:
+    if data.empty:
+        raise EmptyDataFrameException("The input GeoDataFrame is empty.")
+
+    if target_column not in data.columns:
+        raise InvalidParameterValueException(
+            f"Expected target_column ({target_column}) to be contained in geodataframe columns."
+        )
+
+    if resolution[0] <= 0 or resolution[1] <= 0:
+        raise InvalidParameterValueException("The resolution must be greater than zero.")
+
+
+def _unit_sphere_coordinates(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    lon, lat = np.radians(lon), np.radians(lat)
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+def _pairwise_distances(
+    x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray, coordinates_type: str
+) -> np.ndarray:
+    if coordinates_type == "geographic":
+        return great_circle_distance(x1, y1, x2, y2)
+    return np.hypot(x1 - x2, y1 - y2)
+
+
+def _krige_local(
+    cell_x: np.ndarray,
+    cell_y: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    neighbors: np.ndarray,
+    variogram: Callable[[np.ndarray], np.ndarray],
+    coordinates_type: str,
+    method: str,
+) -> np.ndarray:
+    n_cells, n_neighbors = neighbors.shape
+    neighbor_x, neighbor_y = x[neighbors], y[neighbors]
+    n_drift = 2 if method == "universal" else 0
+    size = n_neighbors + 1 + n_drift
+
+    # Semivariances between the neighbors and from the neighbors to the cell, zero at zero distance
+    # like in PyKrige so that the data points are honored exactly
+    neighbor_distances = _pairwise_distances(
+        neighbor_x[:, :, np.newaxis],
+        neighbor_y[:, :, np.newaxis],
+        neighbor_x[:, np.newaxis, :],
+        neighbor_y[:, np.newaxis, :],
+        coordinates_type,
+    )
+    cell_distances = _pairwise_distances(
+        neighbor_x, neighbor_y, cell_x[:, np.newaxis], cell_y[:, np.newaxis], coordinates_type
+    )
+    eps = 1e-10
+
+    a = np.zeros((n_cells, size, size))
+    a[:, :n_neighbors, :n_neighbors] = np.where(neighbor_distances <= eps, 0.0, variogram(neighbor_distances))
+    a[:, :n_neighbors, n_neighbors] = 1.0
+    a[:, n_neighbors, :n_neighbors] = 1.0
+
+    b = np.zeros((n_cells, size))
+    b[:, :n_neighbors] = np.where(cell_distances <= eps, 0.0, variogram(cell_distances))
+    b[:, n_neighbors] = 1.0
+
+    if method == "universal":
+        # Regional linear drift, relative to the cell for better conditioning
+        drift = np.stack([neighbor_x - cell_x[:, np.newaxis], neighbor_y - cell_y[:, np.newaxis]], axis=-1)
+        a[:, :n_neighbors, n_neighbors + 1 :] = drift  # noqa: E203
+        a[:, n_neighbors + 1 :, :n_neighbors] = drift.transpose(0, 2, 1)  # noqa: E203
+
+    try:
+        weights = np.linalg.solve(a, b[..., np.newaxis])[..., 0]
+    except np.linalg.LinAlgError:
+        weights = np.einsum("nij,nj->ni", np.linalg.pinv(a), b)
+
+    return np.einsum("ni,ni->n", weights[:, :n_neighbors], z[neighbors])
+
+
+def _init_kriging_state(state: dict) -> None:
+    _kriging_state.clear()
+    _kriging_state.update(state)
+
+
+def _krige_block(write_window: Window) -> np.ndarray:
+    grid_x, grid_y = _kriging_state["grid_x"], _kriging_state["grid_y"]
+    x, y, z, tree = _kriging_state["x"], _kriging_state["y"], _kriging_state["z"], _kriging_state["tree"]
+    n_closest_points, variogram = _kriging_state["n_closest_points"], _kriging_state["variogram"]
+    coordinates_type, method = _kriging_state["coordinates_type"], _kriging_state["method"]
+
+    rows, cols = np.meshgrid(
+        np.arange(write_window.row_off, write_window.row_off + write_window.height),
+        np.arange(write_window.col_off, write_window.col_off + write_window.width),
+        indexing="ij",
+    )
+    # Raster rows run from north to south, while grid_y ascends from south to north
+    cell_x, cell_y = grid_x[cols.ravel()], grid_y[len(grid_y) - 1 - rows.ravel()]
+    block = np.empty(cell_x.shape)
+
+    for start in range(0, len(block), KRIGING_CHUNK_CELLS):
+        end = min(start + KRIGING_CHUNK_CELLS, len(block))
+        if coordinates_type == "geographic":
+            query_points = _unit_sphere_coordinates(cell_x[start:end], cell_y[start:end])
+        else:
+            query_points = np.column_stack([cell_x[start:end], cell_y[start:end]])
+        _, neighbors = tree.query(query_points, k=n_closest_points)
+        neighbors = neighbors.reshape(end - start, n_closest_points)
+
+        block[start:end] = _krige_local(
+            cell_x[start:end], cell_y[start:end], x, y, z, neighbors, variogram, coordinates_type, method
+        )
+
+    return block.reshape(rows.shape)
+
+
+def _iterate_kriging_tasks(
+    windows: List[Tuple[Window, Window]]
+) -> Iterator[Tuple[Callable[..., np.ndarray], Tuple[Window], Window]]:
+    # Only the window is sent with each task, the rest of the state is set once per process
+    for _, write_window in windows:
+        yield _krige_block, (write_window,), write_window
+
+
 @beartype
 def kriging(
     data: gpd.GeoDataFrame,
@@ -88,19 +231,129 @@ def kriging(
         InvalidParameterValueException: Target column name is invalid or resolution is not greater than zero.
     """
 
-    if data.empty:
-        raise EmptyDataFrameException("The input GeoDataFrame is empty.")
-
-    if target_column not in data.columns:
-        raise InvalidParameterValueException(
-            f"Expected target_column ({target_column}) to be contained in geodataframe columns."
-        )
-
-    if resolution[0] <= 0 or resolution[1] <= 0:
-        raise InvalidParameterValueException("The resolution must be greater than zero.")
+    _check_kriging_parameters(data, target_column, resolution)
 
     data_interpolated, out_meta = _kriging(
         data, target_column, resolution, extent, variogram_model, coordinates_type, method
     )
 
     return data_interpolated, out_meta
+
+
+@beartype
+def kriging_windowed(
+    data: gpd.GeoDataFrame,
+    target_column: str,
+    resolution: Tuple[Number, Number],
+    output_raster: Path,
+    extent: Optional[Tuple[Number, Number, Number, Number]] = None,
+    variogram_model: Literal["linear", "power", "gaussian", "spherical", "exponential"] = "linear",
+    coordinates_type: Literal["euclidean", "geographic"] = "geographic",
+    method: Literal["ordinary", "universal"] = "ordinary",
+    n_closest_points: int = 16,
+    variogram_sample_size: Optional[int] = None,
+    random_state: Optional[int] = None,
+    block_size: int = TILE_SIZE,
+    n_workers: Optional[int] = None,
+) -> dict:
+    """
+    Perform moving window Kriging interpolation and write the result to a GeoTIFF block by block.
+
+    The variogram model is fitted with PyKrige like in kriging. Each grid cell is then kriged only from its
+    n_closest_points nearest data points, found with a KD-tree, so no kriging system larger than
+    n_closest_points + 3 is solved. The grid is processed in blocks that are written straight to the output
+    raster, optionally in parallel. The rows of the output raster run from north to south like its transform,
+    so with n_closest_points at least the number of data points, the result equals the result of kriging
+    flipped upside down, as kriging returns the rows from south to north.
+
+    Fitting the variogram compares all pairs of data points. For large data sets, fit it to a random sample
+    of the points with variogram_sample_size.
+
+    Args:
+        data: GeoDataFrame containing the input data.
+        target_column: The column name with values for each geometry.
+        resolution: The resolution i.e. cell size of the output raster as (pixel_size_x, pixel_size_y).
+        output_raster: Path of the output GeoTIFF.
+        extent: The extent of the output raster as (x_min, x_max, y_min, y_max).
+            If None, calculate extent from the input vector data.
+        variogram_model: Variogram model to be used.
+            Either 'linear', 'power', 'gaussian', 'spherical' or 'exponential'. Defaults to 'linear'.
+        coordinates_type: Determines are coordinates on a plane ('euclidean') or a sphere ('geographic').
+            Used only in ordinary kriging. Defaults to 'geographic'.
+        method: Ordinary or universal kriging. Defaults to 'ordinary'.
+        n_closest_points: Number of nearest data points used for each grid cell. Defaults to 16.
+        variogram_sample_size: Number of randomly sampled data points the variogram model is fitted to.
+            Defaults to None, which uses all data points.
+        random_state: Seed for sampling the data points for the variogram. Defaults to None.
+        block_size: Height and width of the processed blocks in pixels. Defaults to 256.
+        n_workers: Number of worker processes. Defaults to None, which processes the blocks sequentially.
+
+    Returns:
+        The profile of the written output raster.
+
+    Raises:
+        EmptyDataFrameException: The input GeoDataFrame is empty.
+        InvalidParameterValueException: Target column name is invalid, resolution is not greater than zero,
+            n_closest_points or variogram_sample_size is less than two or n_workers is not positive.
+    """
+    _check_kriging_parameters(data, target_column, resolution)
+
+    if n_closest_points < 2:
+        raise InvalidParameterValueException("Expected n_closest_points to be at least two.")
+
+    if variogram_sample_size is not None and variogram_sample_size < 2:
+        raise InvalidParameterValueException("Expected variogram_sample_size to be at least two.")
+
+    if method == "universal":
+        coordinates_type = "euclidean"
+
+    x = data.geometry.x.to_numpy(dtype=np.float64)
+    y = data.geometry.y.to_numpy(dtype=np.float64)
+    z = data[target_column].to_numpy(dtype=np.float64)
+
+    sample = np.arange(len(z))
+    if variogram_sample_size is not None and variogram_sample_size < len(z):
+        sample = np.random.default_rng(random_state).choice(len(z), size=variogram_sample_size, replace=False)
+
+    variogram_kriging = OrdinaryKriging(
+        x[sample], y[sample], z[sample], variogram_model=variogram_model, coordinates_type=coordinates_type
+    )
+    variogram = partial(variogram_kriging.variogram_function, variogram_kriging.variogram_model_parameters)
+
+    if coordinates_type == "geographic":
+        tree = cKDTree(_unit_sphere_coordinates(x, y))
+    else:
+        tree = cKDTree(np.column_stack([x, y]))
+
+    grid_x, grid_y, out_meta = _kriging_grid(data, resolution, extent)
+
+    out_profile = {**out_meta, "driver": "GTiff", "count": 1, "dtype": "float32", "nodata": None, "compress": "lzw"}
+    if out_meta["width"] >= TILE_SIZE and out_meta["height"] >= TILE_SIZE:
+        out_profile.update({"tiled": True, "blockxsize": TILE_SIZE, "blockysize": TILE_SIZE})
+
+    state = {
+        "grid_x": grid_x,
+        "grid_y": grid_y,
+        "x": x,
+        "y": y,
+        "z": z,
+        "tree": tree,
+        "n_closest_points": min(n_closest_points, len(z)),
+        "variogram": variogram,
+        "coordinates_type": coordinates_type,
+        "method": method,
+    }
+    windows = get_block_windows(out_meta["height"], out_meta["width"], block_size)
+
+    try:
+        return write_raster_by_blocks(
+            output_raster,
+            out_profile,
+            _iterate_kriging_tasks(windows),
+            n_workers,
+            initializer=_init_kriging_state,
+            initargs=(state,),
+        )
+    finally:
+        # The sequential path sets the state in this process, do not keep the data alive after the call
+        _kriging_state.clear()
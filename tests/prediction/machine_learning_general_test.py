@@ -3,8 +3,9 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+import rasterio
 from sklearn.datasets import load_iris
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 
 from eis_toolkit.exceptions import InvalidParameterValueException, NonMatchingParameterLengthsException
 from eis_toolkit.prediction.machine_learning_general import (
@@ -12,9 +13,13 @@ from eis_toolkit.prediction.machine_learning_general import (
     evaluate_model,
     load_model,
     predict,
+    predict_raster,
+    prepare_data_for_ml,
+    reshape_predictions,
     save_model,
     split_data,
 )
+from tests.raster_processing.clip_test import raster_path as SMALL_RASTER_PATH
 
 TEST_DIR = Path(__file__).parent.parent
 
@@ -172,3 +177,59 @@ def test_invalid_split_size():
         _train_and_validate_sklearn_model(
             X_IRIS, Y_IRIS, model=RF_MODEL, validation_method="split", metrics=CLF_METRICS, split_size=0.0
         )
+
+
+@pytest.fixture
+def feature_rasters(tmp_path):
+    """Two feature rasters on the same grid, the second with two bands."""
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        data = raster.read(1)
+        profile = raster.profile
+    data[:3, :5] = profile["nodata"]
+
+    first_path, second_path = tmp_path / "feature_1.tif", tmp_path / "feature_2.tif"
+    with rasterio.open(first_path, "w", **profile) as dst:
+        dst.write(data, 1)
+    with rasterio.open(second_path, "w", **{**profile, "count": 2}) as dst:
+        dst.write(np.stack([np.where(data == profile["nodata"], data, data**2), np.flipud(data)]))
+
+    return [first_path, second_path]
+
+
+@pytest.mark.parametrize("predict_probabilities", [False, True])
+def test_predict_raster(tmp_path, feature_rasters, predict_probabilities):
+    """Test that block-wise prediction to a raster matches predicting all data at once."""
+    X, _, reference_profile, nodata_mask = prepare_data_for_ml(feature_rasters)
+    y = (X[:, 0] > np.median(X[:, 0])).astype(int)
+    model = RandomForestClassifier(n_estimators=5, random_state=42).fit(X, y)
+
+    output_raster = tmp_path / "predictions.tif"
+    out_profile = predict_raster(
+        model,
+        feature_rasters,
+        output_raster,
+        predict_probabilities=predict_probabilities,
+        block_size=16,
+        batch_size=100,
+    )
+
+    predictions = model.predict_proba(X)[:, 1] if predict_probabilities else predict(X, model)
+    expected = reshape_predictions(
+        predictions.astype(np.float32), reference_profile["height"], reference_profile["width"], nodata_mask
+    )
+
+    with rasterio.open(output_raster) as raster:
+        result = raster.read(1, masked=True).filled(np.nan)
+
+    assert out_profile["count"] == 1
+    assert np.isnan(result[:3, :5]).all()
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_predict_raster_invalid_probabilities(tmp_path, feature_rasters):
+    """Test that predicting probabilities with a regressor raises the correct exception."""
+    X, _, _, _ = prepare_data_for_ml(feature_rasters)
+    model = RandomForestRegressor(n_estimators=5, random_state=42).fit(X, X[:, 0])
+
+    with pytest.raises(InvalidParameterValueException):
+        predict_raster(model, feature_rasters, tmp_path / "predictions.tif", predict_probabilities=True)
@@ -2,11 +2,20 @@ from pathlib import Path
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import pytest
 import rasterio
 
-from eis_toolkit.exceptions import ClassificationFailedException, InvalidColumnException
-from eis_toolkit.prediction.weights_of_evidence import weights_of_evidence_calculate_weights
+from eis_toolkit.exceptions import (
+    ClassificationFailedException,
+    InvalidColumnException,
+    NonMatchingParameterLengthsException,
+)
+from eis_toolkit.prediction.weights_of_evidence import (
+    weights_of_evidence_batch,
+    weights_of_evidence_calculate_responses,
+    weights_of_evidence_calculate_weights,
+)
 
 test_dir = Path(__file__).parent.parent
 EVIDENCE_PATH = test_dir.joinpath("../tests/data/remote/wofe/wofe_evidence_raster.tif")
@@ -26,6 +35,40 @@ def test_weights_of_evidence():
     np.testing.assert_equal(raster_meta, evidence_raster.meta)
 
 
+def test_weights_of_evidence_unique_weights():
+    """Test unique weights and the generated arrays against known values."""
+    df, rasters, _, nr_of_deposits, nr_of_pixels = weights_of_evidence_calculate_weights(evidence_raster, deposits)
+
+    np.testing.assert_array_equal(df["Class"], [1, 2, 3, 5, 6, 8, 10, 13])
+    np.testing.assert_array_equal(df["Pixel count"], [275, 11, 396, 43, 1, 43, 2, 10])
+    np.testing.assert_array_equal(df["Deposit count"], [9, 0, 5, 1, 0, 0, 1, 0])
+    np.testing.assert_array_equal(df["W+"], [0.481, 0, -0.492, 0.1296, 0, 0, 3.8673, 0])
+    np.testing.assert_equal((nr_of_deposits, nr_of_pixels), (16, 781))
+
+    evidence = evidence_raster.read(1)
+    class_10_mask = evidence == 10
+    np.testing.assert_array_equal(rasters["W+"][class_10_mask], 3.8673)
+    np.testing.assert_array_equal(np.isnan(rasters["Class"]), ~np.isin(evidence, df["Class"]))
+
+
+def test_weights_of_evidence_cumulative_weights():
+    """Test that cumulative weights are calculated from the cumulative class counts."""
+    df, rasters, _, _, _ = weights_of_evidence_calculate_weights(evidence_raster, deposits, weights_type="ascending")
+
+    np.testing.assert_array_equal(df["Pixel count"], [275, 286, 682, 725, 726, 769, 771, 781])
+    np.testing.assert_array_equal(df["Deposit count"], [9, 9, 14, 15, 15, 15, 16, 16])
+    np.testing.assert_array_equal(df["Generalized class"], [2, 1, 1, 1, 1, 1, 1, 1])
+    np.testing.assert_array_equal(
+        np.unique(rasters["Generalized W+"][~np.isnan(rasters["Generalized W+"])]), [-0.3994, 0.481]
+    )
+
+    descending_df, _, _, _, _ = weights_of_evidence_calculate_weights(
+        evidence_raster, deposits, weights_type="descending", studentized_contrast_threshold=0.5
+    )
+    np.testing.assert_array_equal(descending_df["Class"], [13, 10, 8, 6, 5, 3, 2, 1])
+    np.testing.assert_array_equal(descending_df["Pixel count"], [10, 12, 55, 56, 99, 495, 506, 781])
+
+
 def test_too_high_studentized_contrast_threshold():
     """Tests that too high studentized contrast threshold for reclassification raises the correct exception."""
     with pytest.raises(ClassificationFailedException):
@@ -38,3 +81,34 @@ def test_invalid_choice_in_rasters_to_generate():
     """Tests that invalid metric/column in rasters to generate raises the correct exception."""
     with pytest.raises(InvalidColumnException):
         weights_of_evidence_calculate_weights(evidence_raster, deposits, arrays_to_generate=["invalid_metric"])
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_weights_of_evidence_batch(n_workers):
+    """Test that the batch calculation matches separate weights and responses calculations."""
+    weights_types = ["unique", "ascending"]
+    weights_dfs, arrays_dicts, raster_meta, posterior, posterior_std, confidence = weights_of_evidence_batch(
+        [evidence_raster, evidence_raster], deposits, weights_types=weights_types, n_workers=n_workers
+    )
+
+    expected_arrays_dicts = []
+    for weights_df, arrays_dict, weights_type in zip(weights_dfs, arrays_dicts, weights_types):
+        expected_df, expected_arrays, _, nr_of_deposits, nr_of_pixels = weights_of_evidence_calculate_weights(
+            evidence_raster, deposits, weights_type=weights_type
+        )
+        pd.testing.assert_frame_equal(weights_df, expected_df)
+        assert arrays_dict.keys() == expected_arrays.keys()
+        for metric in arrays_dict:
+            np.testing.assert_array_equal(arrays_dict[metric], expected_arrays[metric])
+        expected_arrays_dicts.append(expected_arrays)
+
+    expected_responses = weights_of_evidence_calculate_responses(expected_arrays_dicts, nr_of_deposits, nr_of_pixels)
+    for result, expected in zip((posterior, posterior_std, confidence), expected_responses):
+        np.testing.assert_array_equal(result, expected)
+    np.testing.assert_equal(raster_meta, evidence_raster.meta)
+
+
+def test_weights_of_evidence_batch_invalid_weights_types():
+    """Tests that a wrong number of weights types raises the correct exception."""
+    with pytest.raises(NonMatchingParameterLengthsException):
+        weights_of_evidence_batch([evidence_raster, evidence_raster], deposits, weights_types=["unique"])
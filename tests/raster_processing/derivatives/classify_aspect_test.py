@@ -5,8 +5,8 @@ import pytest
 import rasterio
 
 from eis_toolkit.exceptions import InvalidParameterValueException, InvalidRasterBandException
-from eis_toolkit.raster_processing.derivatives.classification import classify_aspect
-from eis_toolkit.raster_processing.derivatives.parameters import first_order
+from eis_toolkit.raster_processing.derivatives.classification import classify_aspect, classify_aspect_windowed
+from eis_toolkit.raster_processing.derivatives.parameters import first_order, first_order_windowed
 
 parent_dir = Path(__file__).parent.parent
 raster_path_single = parent_dir.joinpath("../data/remote/small_raster.tif")
@@ -128,3 +128,30 @@ def test_number_classes():
     with rasterio.open(raster_path_single) as raster:
         with pytest.raises(InvalidParameterValueException):
             classify_aspect(raster, num_classes=7)
+
+
+@pytest.mark.parametrize("num_classes", [8, 16])
+def test_aspect_classification_windowed(tmp_path, num_classes: int):
+    """Test that the windowed aspect classification matches the in-memory one."""
+    aspect_raster = tmp_path / "aspect.tif"
+    output_raster = tmp_path / "classes.tif"
+
+    with rasterio.open(raster_path_single) as raster:
+        first_order_windowed(
+            raster, aspect_raster, parameters=["A"], slope_tolerance=5, slope_direction_unit="degrees", block_size=16
+        )
+
+    with rasterio.open(aspect_raster) as aspect:
+        classification_array, classification_mapping, _ = classify_aspect(
+            aspect, num_classes=num_classes, unit="degrees"
+        )
+        windowed_mapping, out_profile = classify_aspect_windowed(
+            aspect, output_raster, num_classes=num_classes, unit="degrees", block_size=16, n_workers=2
+        )
+
+    assert windowed_mapping == classification_mapping
+    assert out_profile["nodata"] == -9999
+    with rasterio.open(output_raster) as result:
+        assert result.dtypes[0] == classification_array.dtype.name
+        np.testing.assert_array_equal(result.read(1), classification_array)
+    assert np.any(classification_array == -1)
@@ -9,7 +9,7 @@ from eis_toolkit.exceptions import (
     InvalidRasterBandException,
     NonSquarePixelSizeException,
 )
-from eis_toolkit.raster_processing.derivatives.parameters import first_order
+from eis_toolkit.raster_processing.derivatives.parameters import first_order, first_order_windowed
 
 parent_dir = Path(__file__).parent.parent
 raster_path_single = parent_dir.joinpath("../data/remote/small_raster.tif")
@@ -109,3 +109,31 @@ def test_scaling():
         parameters = ["A", "G"]
         with pytest.raises(InvalidParameterValueException):
             first_order(raster, parameters=parameters, scaling_factor=0)
+
+
+@pytest.mark.parametrize("method", ["Horn", "Zevenbergen"])
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_first_order_windowed(tmp_path, method: str, n_workers):
+    """Test that the windowed first order derivatives match the in-memory ones."""
+    output_raster = tmp_path / "first_order.tif"
+
+    with rasterio.open(raster_path_single) as raster:
+        deriv = first_order(
+            raster, parameters=["G", "A"], slope_tolerance=5, slope_direction_unit="degrees", method=method
+        )
+        first_order_windowed(
+            raster,
+            output_raster,
+            parameters=["G", "A"],
+            slope_tolerance=5,
+            slope_direction_unit="degrees",
+            method=method,
+            block_size=16,
+            n_workers=n_workers,
+        )
+
+    with rasterio.open(output_raster) as result:
+        assert result.descriptions == ("G", "A")
+        assert result.nodata == -9999
+        np.testing.assert_array_equal(result.read(1), deriv["G"][0])
+        np.testing.assert_array_equal(result.read(2), deriv["A"][0])
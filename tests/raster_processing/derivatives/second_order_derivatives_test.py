@@ -9,7 +9,11 @@ from eis_toolkit.exceptions import (
     InvalidRasterBandException,
     NonSquarePixelSizeException,
 )
-from eis_toolkit.raster_processing.derivatives.parameters import first_order, second_order_basic_set
+from eis_toolkit.raster_processing.derivatives.parameters import (
+    first_order,
+    second_order_basic_set,
+    second_order_basic_set_windowed,
+)
 
 parent_dir = Path(__file__).parent.parent
 raster_path_single = parent_dir.joinpath("../data/remote/small_raster.tif")
@@ -105,3 +109,18 @@ def test_scaling():
         parameters = ["planc"]
         with pytest.raises(InvalidParameterValueException):
             second_order_basic_set(raster, parameters=parameters, scaling_factor=0)
+
+
+@pytest.mark.parametrize("method", ["Evans", "Young", "Zevenbergen"])
+def test_second_order_basic_set_windowed(tmp_path, method: str):
+    """Test that the windowed second order derivatives match the in-memory ones."""
+    output_raster = tmp_path / "second_order.tif"
+    parameters = ["planc", "profc", "rot", "K"]
+
+    with rasterio.open(raster_path_single) as raster:
+        deriv = second_order_basic_set(raster, parameters=parameters, method=method)
+        second_order_basic_set_windowed(raster, output_raster, parameters=parameters, method=method, block_size=16)
+
+    with rasterio.open(output_raster) as result:
+        assert result.descriptions == tuple(parameters)
+        np.testing.assert_array_equal(result.read(), np.stack([deriv[parameter][0] for parameter in parameters]))
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import rasterio
+
+from eis_toolkit.exceptions import InvalidParameterValueException
+from eis_toolkit.raster_processing.derivatives.parameters import first_order, second_order_basic_set, surface_parameters
+from tests.raster_processing.derivatives.first_order_derivatives_test import raster_path_single
+
+SECOND_ORDER_PARAMETERS = ["planc", "profc", "profc_min", "profc_max", "longc", "crosc", "rot", "K", "genc", "tangc"]
+
+
+@pytest.mark.parametrize("method", ["Evans", "Young", "Zevenbergen"])
+@pytest.mark.parametrize("slope_tolerance", [0, 5])
+def test_surface_parameters(method: str, slope_tolerance: int):
+    """Test that the fused attributes match the separate first and second order functions."""
+    with rasterio.open(raster_path_single) as raster:
+        out_array, out_meta = surface_parameters(
+            raster,
+            parameters=["A", *SECOND_ORDER_PARAMETERS, "G"],
+            slope_tolerance=slope_tolerance,
+            slope_gradient_unit="degrees",
+            slope_direction_unit="degrees",
+            method=method,
+        )
+        first_order_results = first_order(
+            raster,
+            parameters=["A", "G"],
+            slope_tolerance=slope_tolerance,
+            slope_gradient_unit="degrees",
+            slope_direction_unit="degrees",
+            method=method,
+        )
+        second_order_results = second_order_basic_set(
+            raster, parameters=SECOND_ORDER_PARAMETERS, slope_tolerance=slope_tolerance, method=method
+        )
+
+    assert out_array.shape == (12, raster.height, raster.width)
+    assert out_meta["count"] == 12 and out_meta["nodata"] == -9999
+
+    expected = [first_order_results["A"][0]]
+    expected += [second_order_results[parameter][0] for parameter in SECOND_ORDER_PARAMETERS]
+    expected += [first_order_results["G"][0]]
+    np.testing.assert_array_equal(out_array, np.stack(expected))
+
+
+def test_surface_parameters_horn():
+    """Test that the Horn method works for first order attributes and raises for second order ones."""
+    with rasterio.open(raster_path_single) as raster:
+        out_array, _ = surface_parameters(raster, parameters=["G"], method="Horn")
+        np.testing.assert_array_equal(out_array[0], first_order(raster, parameters=["G"])["G"][0])
+
+        with pytest.raises(InvalidParameterValueException):
+            surface_parameters(raster, parameters=["G", "planc"], method="Horn")
+
+
+def test_surface_parameters_empty():
+    """Test that an empty parameter list raises the correct exception."""
+    with rasterio.open(raster_path_single) as raster:
+        with pytest.raises(InvalidParameterValueException):
+            surface_parameters(raster, parameters=[])
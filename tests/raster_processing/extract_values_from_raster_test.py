@@ -1,16 +1,18 @@
 from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pytest
 import rasterio
 from pandas.testing import assert_series_equal
 
-from eis_toolkit.exceptions import NonMatchingParameterLengthsException
+from eis_toolkit.exceptions import InvalidParameterValueException, NonMatchingParameterLengthsException
 from eis_toolkit.raster_processing.extract_values_from_raster import extract_values_from_raster
 from tests.raster_processing.clip_test import raster_path as SMALL_RASTER_PATH
 
 test_dir = Path(__file__).parent.parent
+multiband_raster_path = test_dir.joinpath("data/remote/small_raster_multiband.tif")
 gdf_path = test_dir.joinpath("data/remote/extract_raster_values/extract_raster_values_points.shp")
 
 
@@ -80,3 +82,43 @@ def test_extract_values_from_raster_nonmatching_parameter_lengths():
 
     with pytest.raises(NonMatchingParameterLengthsException):
         extract_values_from_raster(raster_list=raster_list, geodataframe=gdf, raster_column_names=raster_column_names)
+
+
+def test_extract_values_from_raster_blocks_match_sample():
+    """Test that sampling block by block in parallel matches sampling point by point."""
+    rng = np.random.default_rng(0)
+    with rasterio.open(multiband_raster_path) as raster:
+        x = rng.uniform(raster.bounds.left - 10, raster.bounds.right + 10, 200)
+        y = rng.uniform(raster.bounds.bottom - 10, raster.bounds.top + 10, 200)
+        gdf = gpd.GeoDataFrame(geometry=gpd.points_from_xy(x, y), crs=raster.crs)
+
+        expected = np.array(list(raster.sample(zip(x, y))))
+        with rasterio.open(SMALL_RASTER_PATH) as single_band_raster:
+            data_frame = extract_values_from_raster(
+                raster_list=[raster, single_band_raster],
+                geodataframe=gdf,
+                raster_column_names=["multiband", "singleband"],
+                block_size=8,
+                n_workers=2,
+            )
+
+    assert list(data_frame.columns) == [
+        "x",
+        "y",
+        "multiband_1",
+        "multiband_2",
+        "multiband_3",
+        "multiband_4",
+        "singleband",
+    ]
+    np.testing.assert_array_equal(data_frame[["multiband_1", "multiband_2", "multiband_3", "multiband_4"]], expected)
+
+
+def test_extract_values_from_raster_invalid_parameters():
+    """Test that invalid block size and number of workers raise the correct exception."""
+    gdf = gpd.read_file(gdf_path)
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        with pytest.raises(InvalidParameterValueException):
+            extract_values_from_raster(raster_list=[raster], geodataframe=gdf, block_size=0)
+        with pytest.raises(InvalidParameterValueException):
+            extract_values_from_raster(raster_list=[raster], geodataframe=gdf, n_workers=0)
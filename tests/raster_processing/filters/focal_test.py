@@ -5,7 +5,7 @@ import pytest
 import rasterio
 
 from eis_toolkit.exceptions import InvalidParameterValueException, InvalidRasterBandException
-from eis_toolkit.raster_processing.filters.focal import focal_filter
+from eis_toolkit.raster_processing.filters.focal import focal_filter, focal_filter_windowed
 
 parent_dir = Path(__file__).parent.parent
 raster_path_single = parent_dir.joinpath("../data/remote/small_raster.tif")
@@ -55,3 +55,19 @@ def test_window_size():
 
             # Even number
             focal_filter(raster, size=4)
+
+
+def test_focal_filter_windowed(tmp_path):
+    """Test that the block-wise focal filter matches the in-memory result."""
+    with rasterio.open(raster_path_single) as raster:
+        for method, shape in [("mean", "circle"), ("median", "square")]:
+            expected, _ = focal_filter(raster, size=5, method=method, shape=shape)
+
+            output_path = tmp_path / f"focal_{method}.tif"
+            out_meta = focal_filter_windowed(raster, output_path, size=5, method=method, shape=shape, block_size=16)
+
+            with rasterio.open(output_path) as result_raster:
+                result = result_raster.read(1)
+
+            assert out_meta["height"] == raster.height and out_meta["width"] == raster.width
+            np.testing.assert_allclose(result, expected, rtol=1e-6)
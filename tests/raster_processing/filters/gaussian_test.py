@@ -5,7 +5,7 @@ import pytest
 import rasterio
 
 from eis_toolkit.exceptions import InvalidParameterValueException, InvalidRasterBandException
-from eis_toolkit.raster_processing.filters.focal import gaussian_filter
+from eis_toolkit.raster_processing.filters.focal import gaussian_filter, gaussian_filter_windowed
 
 parent_dir = Path(__file__).parent.parent
 raster_path_single = parent_dir.joinpath("../data/remote/small_raster.tif")
@@ -56,3 +56,22 @@ def test_window_size():
 
             # Even number
             gaussian_filter(raster, size=4)
+
+
+def test_gaussian_filter_windowed(tmp_path):
+    """Test that the block-wise gaussian filter matches the in-memory result."""
+    with rasterio.open(raster_path_single) as raster:
+        expected, _ = gaussian_filter(raster, sigma=1, truncate=4)
+
+        output_path = tmp_path / "gaussian.tif"
+        gaussian_filter_windowed(raster, output_path, sigma=1, truncate=4, block_size=10, n_workers=2)
+
+        with rasterio.open(output_path) as result_raster:
+            np.testing.assert_allclose(result_raster.read(1), expected, rtol=1e-6)
+
+
+def test_gaussian_filter_windowed_block_size(tmp_path):
+    """Test that an invalid block size raises the correct exception."""
+    with rasterio.open(raster_path_single) as raster:
+        with pytest.raises(InvalidParameterValueException):
+            gaussian_filter_windowed(raster, tmp_path / "gaussian.tif", block_size=0)
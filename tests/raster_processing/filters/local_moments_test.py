@@ -0,0 +1,43 @@
+import numpy as np
+from scipy.ndimage import generic_filter
+
+from eis_toolkit.raster_processing.filters.kernels import _basic_kernel
+from eis_toolkit.raster_processing.filters.utilities import _iterate_kernel_offsets, _local_moments
+
+rng = np.random.default_rng(0)
+test_array = rng.gamma(2.0, 2.0, (40, 50))
+test_array[rng.random(test_array.shape) < 0.05] = np.nan
+test_array[10:15, 10:15] = 3.0
+
+
+def test_local_moments():
+    """Test that the vectorized local moments match the moving window statistics."""
+    for size in [3, 5]:
+        for shape in ["square", "circle"]:
+            kernel = _basic_kernel(size, shape)
+            local_mean, local_var = _local_moments(test_array, kernel)
+
+            expected_mean = generic_filter(test_array, np.nanmean, footprint=kernel)
+            expected_var = generic_filter(test_array, np.nanvar, footprint=kernel)
+
+            assert local_mean.shape == test_array.shape
+            np.testing.assert_allclose(local_mean, expected_mean, rtol=1e-10, atol=1e-12)
+            np.testing.assert_allclose(local_var, expected_var, rtol=1e-10, atol=1e-12)
+
+
+def test_local_moments_constant_window():
+    """Test that windows with constant values have exactly zero variance."""
+    _, local_var = _local_moments(test_array, np.ones((3, 3)))
+    assert np.all(local_var[11:14, 11:14] == 0)
+
+
+def test_iterate_kernel_offsets():
+    """Test that the shifted arrays reproduce the moving window values."""
+    kernel = np.ones((3, 3))
+    neighbours = np.stack(list(_iterate_kernel_offsets(test_array, kernel)))
+
+    assert neighbours.shape == (9, *test_array.shape)
+    np.testing.assert_array_equal(neighbours[4], test_array)
+
+    expected_max = generic_filter(test_array, np.max, footprint=kernel)
+    np.testing.assert_array_equal(np.max(neighbours, axis=0), expected_max)
@@ -5,7 +5,7 @@ import pytest
 import rasterio
 
 from eis_toolkit.exceptions import InvalidParameterValueException, InvalidRasterBandException
-from eis_toolkit.raster_processing.filters.focal import mexican_hat_filter
+from eis_toolkit.raster_processing.filters.focal import mexican_hat_filter, mexican_hat_filter_windowed
 
 parent_dir = Path(__file__).parent.parent
 raster_path_single = parent_dir.joinpath("../data/remote/small_raster.tif")
@@ -56,3 +56,17 @@ def test_window_size():
 
             # Even number
             mexican_hat_filter(raster, size=4)
+
+
+def test_mexican_hat_filter_windowed(tmp_path):
+    """Test that the block-wise mexican hat filter matches the in-memory result."""
+    with rasterio.open(raster_path_single) as raster:
+        expected, _ = mexican_hat_filter(raster, sigma=2, truncate=4, size=5, direction="rectangular")
+
+        output_path = tmp_path / "mexican_hat.tif"
+        mexican_hat_filter_windowed(
+            raster, output_path, sigma=2, truncate=4, size=5, direction="rectangular", block_size=8
+        )
+
+        with rasterio.open(output_path) as result_raster:
+            np.testing.assert_allclose(result_raster.read(1), expected, rtol=1e-6)
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import rasterio
+
+from eis_toolkit.raster_processing.filters.speckle import (
+    frost_filter,
+    frost_filter_windowed,
+    gamma_filter,
+    gamma_filter_windowed,
+    kuan_filter,
+    kuan_filter_windowed,
+    lee_additive_multiplicative_noise_filter,
+    lee_additive_multiplicative_noise_filter_windowed,
+    lee_additive_noise_filter,
+    lee_additive_noise_filter_windowed,
+    lee_enhanced_filter,
+    lee_enhanced_filter_windowed,
+    lee_multiplicative_noise_filter,
+    lee_multiplicative_noise_filter_windowed,
+)
+
+parent_dir = Path(__file__).parent.parent
+raster_path_single = parent_dir.joinpath("../data/remote/small_raster.tif")
+
+
+@pytest.mark.parametrize(
+    "filter_fn, windowed_filter_fn, parameters, n_workers",
+    [
+        (lee_additive_noise_filter, lee_additive_noise_filter_windowed, {"add_noise_var": 0.1}, None),
+        (lee_multiplicative_noise_filter, lee_multiplicative_noise_filter_windowed, {"n_looks": 5}, None),
+        (lee_additive_multiplicative_noise_filter, lee_additive_multiplicative_noise_filter_windowed, {}, None),
+        (lee_enhanced_filter, lee_enhanced_filter_windowed, {"n_looks": 500, "damping_factor": 1}, 2),
+        (gamma_filter, gamma_filter_windowed, {"n_looks": 1}, None),
+        (frost_filter, frost_filter_windowed, {"damping_factor": 1}, 2),
+        (kuan_filter, kuan_filter_windowed, {"n_looks": 1}, None),
+    ],
+)
+def test_speckle_filter_windowed(tmp_path, filter_fn, windowed_filter_fn, parameters, n_workers):
+    """Test that the block-wise filters match the in-memory results."""
+    with rasterio.open(raster_path_single) as raster:
+        expected, _ = filter_fn(raster, size=5, **parameters)
+
+        output_path = tmp_path / "speckle_filter.tif"
+        windowed_filter_fn(raster, output_path, size=5, **parameters, block_size=16, n_workers=n_workers)
+
+        with rasterio.open(output_path) as result_raster:
+            np.testing.assert_allclose(result_raster.read(1), expected, rtol=1e-5)
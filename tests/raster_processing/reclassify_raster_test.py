@@ -1,3 +1,4 @@
+import mapclassify as mc
 import numpy as np
 import pytest
 import rasterio
@@ -245,3 +246,134 @@ def test_reclassify_with_standard_deviation_invalid_number_of_intervals():
     with pytest.raises(InvalidParameterValueException):
         with rasterio.open(SMALL_RASTER_PATH) as raster:
             reclassify.reclassify_with_standard_deviation(raster=raster, number_of_intervals=1)
+
+
+def _read_windowed_result(output_raster, raster):
+    """Read a windowed reclassification and the valid input values."""
+    with rasterio.open(output_raster) as result:
+        out_band = result.read(1)
+
+    band = raster.read(1)
+    valid = band != raster.nodata
+    np.testing.assert_array_equal(out_band[~valid], reclassify.RECLASSIFY_NODATA)
+
+    return out_band[valid], band[valid]
+
+
+@pytest.mark.parametrize(
+    "windowed_function, reclassify_function, number",
+    [
+        (reclassify.reclassify_with_defined_intervals_windowed, reclassify._reclassify_with_defined_intervals, 5),
+        (reclassify.reclassify_with_equal_intervals_windowed, reclassify._reclassify_with_equal_intervals, 5),
+        (reclassify.reclassify_with_quantiles_windowed, reclassify._reclassify_with_quantiles, 4),
+        (reclassify.reclassify_with_standard_deviation_windowed, reclassify._reclassify_with_standard_deviation, 4),
+    ],
+)
+def test_reclassify_windowed(tmp_path, windowed_function, reclassify_function, number):
+    """Test that the windowed reclassifications match the in-memory ones on the valid pixels."""
+    output_raster = tmp_path / "reclassified.tif"
+
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        out_profile = windowed_function(raster, output_raster, number, block_size=16, n_workers=2)
+        out_values, valid_values = _read_windowed_result(output_raster, raster)
+
+    assert out_profile["dtype"] == "int32"
+    np.testing.assert_array_equal(out_values, reclassify_function(valid_values, number))
+
+
+def test_reclassify_with_geometrical_intervals_windowed(tmp_path):
+    """Test that the windowed geometrical intervals match the in-memory ones on the valid pixels."""
+    output_raster = tmp_path / "reclassified.tif"
+
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        reclassify.reclassify_with_geometrical_intervals_windowed(
+            raster, output_raster, number_of_classes=10, block_size=16, n_workers=2
+        )
+        out_values, _ = _read_windowed_result(output_raster, raster)
+        band = raster.read(1)
+        expected = reclassify._reclassify_with_geometrical_intervals(band, 10, raster.nodata)
+
+    np.testing.assert_array_equal(out_values, expected[band != raster.nodata])
+
+
+def test_reclassify_with_geometrical_intervals_small_end_tail():
+    """Test geometrical intervals of data with the longer tail below the median."""
+    result = reclassify._reclassify_with_geometrical_intervals(-TEST_ARRAY, 10, -9999)
+
+    expected_output = np.array([[9, 9, 9, 9], [8, 6, 6, 4], [-4, -4, -6, -6], [-8, -8, -8, -8]])
+
+    np.testing.assert_allclose(result, expected_output)
+
+
+def test_reclassify_with_manual_breaks_windowed(tmp_path):
+    """Test that the windowed manual breaks match the in-memory ones on the valid pixels."""
+    output_raster = tmp_path / "reclassified.tif"
+
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        reclassify.reclassify_with_manual_breaks_windowed(raster, output_raster, breaks=[2, 5, 9], block_size=16)
+        out_values, valid_values = _read_windowed_result(output_raster, raster)
+
+    np.testing.assert_array_equal(out_values, reclassify._reclassify_with_manual_breaks(valid_values, [2, 5, 9]))
+
+
+def test_reclassify_with_natural_breaks_windowed_exact(tmp_path):
+    """Test that bands with few distinct values are classified by the optimal classes of the values."""
+    rounded_raster = tmp_path / "rounded.tif"
+    output_raster = tmp_path / "reclassified.tif"
+
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        band = raster.read(1)
+        with rasterio.open(rounded_raster, "w", **raster.profile) as dst:
+            dst.write(np.where(band == raster.nodata, band, np.round(band, 1)), 1)
+
+    with rasterio.open(rounded_raster) as raster:
+        reclassify.reclassify_with_natural_breaks_windowed(raster, output_raster, number_of_classes=4, block_size=16)
+        out_values, valid_values = _read_windowed_result(output_raster, raster)
+
+    unique_values, counts = np.unique(valid_values, return_counts=True)
+    breaks = unique_values[reclassify._fisher_jenks(unique_values, counts.astype(float), 4)]
+    np.testing.assert_array_equal(out_values, np.digitize(valid_values, breaks))
+
+
+def test_reclassify_with_natural_breaks_windowed_histogram(tmp_path):
+    """Test that bands with many distinct values are classified by histogram bins."""
+    output_raster = tmp_path / "reclassified.tif"
+
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        reclassify.reclassify_with_natural_breaks_windowed(
+            raster, output_raster, number_of_classes=4, number_of_bins=64, block_size=16
+        )
+        out_values, valid_values = _read_windowed_result(output_raster, raster)
+
+    # The class bounds are bin edges, so the classes differ from the exact ones only close to the breaks
+    exact_breaks = np.array([3.871, 5.322, 7.264, 9.67])  # mapclassify FisherJenks bins of the valid values
+    bin_width = (valid_values.max() - valid_values.min()) / 64
+    changed = out_values != np.digitize(valid_values, exact_breaks)
+    distances = np.min(np.abs(valid_values[changed, np.newaxis] - exact_breaks), axis=1)
+
+    assert np.all(distances <= 2 * bin_width)
+    assert np.unique(out_values).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_fisher_jenks():
+    """Test the Fisher-Jenks classes of weighted values against mapclassify."""
+    values = np.array([1.0, 2.0, 3.0, 10.0, 11.0, 20.0])
+    weights = np.array([1.0, 5.0, 1.0, 2.0, 2.0, 1.0])
+    expanded = np.repeat(values, weights.astype(int))
+
+    class_ends = reclassify._fisher_jenks(values, weights, 3)
+    np.testing.assert_array_equal(values[class_ends], mc.FisherJenks(expanded, 3).bins)
+    np.testing.assert_array_equal(reclassify._fisher_jenks(values, weights, 10), np.arange(6))
+
+
+def test_reclassify_windowed_invalid_parameters(tmp_path):
+    """Test that invalid parameters of the windowed reclassifications raise the correct exceptions."""
+    output_raster = tmp_path / "reclassified.tif"
+
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        with pytest.raises(InvalidRasterBandException):
+            reclassify.reclassify_with_quantiles_windowed(raster, output_raster, 4, bands=[2])
+        with pytest.raises(InvalidParameterValueException):
+            reclassify.reclassify_with_quantiles_windowed(raster, output_raster, 1)
+        with pytest.raises(InvalidParameterValueException):
+            reclassify.reclassify_with_natural_breaks_windowed(raster, output_raster, 4, number_of_bins=3)
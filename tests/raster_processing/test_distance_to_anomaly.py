@@ -318,3 +318,35 @@ def test_distance_to_anomaly_nodata_handling(
 
     # Result should not be same as without nodata addition
     assert not np.isclose(np.mean(out_image), expected_mean_without_nodata)
+
+
+@pytest.mark.parametrize(
+    "raster_transform",
+    [
+        pytest.param(SMALL_RASTER_PROFILE["transform"], id="small_raster_transform"),
+        pytest.param(rasterio.Affine(2.0, 0.0, 384744.0, 0.0, -5.0, 6671384.0), id="non_square_cells"),
+        pytest.param(SMALL_RASTER_PROFILE["transform"] * rasterio.Affine.rotation(30), id="rotated"),
+        pytest.param(SMALL_RASTER_PROFILE["transform"] * rasterio.Affine.shear(20, 0), id="sheared"),
+    ],
+)
+def test_distance_to_anomaly_matches_point_distances(raster_transform):
+    """Test that the distance transform gives the same distances as the anomalous cell center points."""
+    anomaly_raster_profile = {**SMALL_RASTER_PROFILE, "transform": raster_transform}
+    data_fits_criteria = distance_to_anomaly._fits_criteria(
+        threshold_criteria_value=5.0,
+        threshold_criteria="higher",
+        anomaly_raster_data=SMALL_RASTER_DATA,
+        nodata_value=anomaly_raster_profile.get("nodata"),
+    )
+
+    out_image, _ = distance_to_anomaly.distance_to_anomaly(
+        anomaly_raster_profile=anomaly_raster_profile,
+        anomaly_raster_data=SMALL_RASTER_DATA,
+        threshold_criteria_value=5.0,
+        threshold_criteria="higher",
+    )
+    expected = distance_to_anomaly._distance_to_anomaly_points(
+        anomaly_raster_profile=anomaly_raster_profile, data_fits_criteria=data_fits_criteria
+    )
+
+    np.testing.assert_allclose(out_image, expected, atol=1e-6)
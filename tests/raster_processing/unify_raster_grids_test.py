@@ -1,10 +1,11 @@
 from pathlib import Path
 
+import numpy as np
 import pytest
 import rasterio
 
-from eis_toolkit.exceptions import InvalidParameterValueException
-from eis_toolkit.raster_processing.unifying import unify_raster_grids
+from eis_toolkit.exceptions import InvalidParameterValueException, NonMatchingParameterLengthsException
+from eis_toolkit.raster_processing.unifying import unify_raster_grids, unify_raster_grids_windowed
 
 test_dir = Path(__file__).parent.parent
 
@@ -85,3 +86,47 @@ def test_unify_raster_grids_empty_raster_list():
     with pytest.raises(InvalidParameterValueException):
         with rasterio.open(base_raster_path_1) as base_raster:
             _ = unify_raster_grids(base_raster, [])
+
+
+@pytest.mark.parametrize(
+    "base_raster_path,raster_to_unify_path,resampling_method,same_extent",
+    [
+        (base_raster_path_1, raster_to_unify_path_1, "nearest", False),
+        (base_raster_path_2, raster_to_unify_path_2, "bilinear", True),
+    ],
+)
+def test_unify_raster_grids_windowed(tmp_path, base_raster_path, raster_to_unify_path, resampling_method, same_extent):
+    """Test that rasters streamed to files match the in-memory unification."""
+    output_rasters = [tmp_path / "unified_1.tif", tmp_path / "unified_2.tif"]
+
+    with rasterio.open(raster_to_unify_path) as raster_to_unify:
+        source_dtype = raster_to_unify.dtypes[0]
+        with rasterio.open(base_raster_path) as base_raster:
+            out_image, out_meta = unify_raster_grids(base_raster, [raster_to_unify], resampling_method, same_extent)[1]
+            # The workers open their own handles, so the same dataset can be listed twice
+            out_profiles = unify_raster_grids_windowed(
+                base_raster,
+                [raster_to_unify, raster_to_unify],
+                output_rasters,
+                resampling_method,
+                same_extent,
+                num_threads=2,
+                n_workers=2,
+            )
+
+    assert len(out_profiles) == 2
+    for output_raster in output_rasters:
+        with rasterio.open(output_raster) as result:
+            assert result.crs == out_meta["crs"]
+            assert result.transform == out_meta["transform"]
+            assert result.dtypes[0] == source_dtype
+            np.testing.assert_array_equal(result.read(), out_image)
+
+
+def test_unify_raster_grids_windowed_invalid_parameters(tmp_path):
+    """Test that empty raster list and missing output paths raise the correct exceptions."""
+    with rasterio.open(base_raster_path_1) as base_raster, rasterio.open(raster_to_unify_path_1) as raster:
+        with pytest.raises(InvalidParameterValueException):
+            unify_raster_grids_windowed(base_raster, [], [])
+        with pytest.raises(NonMatchingParameterLengthsException):
+            unify_raster_grids_windowed(base_raster, [raster], [])
@@ -1,8 +1,13 @@
+import numpy as np
 import pytest
 import rasterio
 
 from eis_toolkit.exceptions import InvalidParameterValueException
-from eis_toolkit.raster_processing.unique_combinations import unique_combinations
+from eis_toolkit.raster_processing.unique_combinations import (
+    _factorize_rows,
+    unique_combinations,
+    unique_combinations_windowed,
+)
 from tests.raster_processing.clip_test import raster_path as SMALL_RASTER_PATH
 
 expected_1st_row = [
@@ -125,3 +130,46 @@ def test_unique_combinations_invalid_parameter():
     with pytest.raises(InvalidParameterValueException):
         with rasterio.open(SMALL_RASTER_PATH) as raster:
             unique_combinations([raster])
+
+
+def test_factorize_rows_matches_numpy_unique():
+    """Test that packed keys number the rows like np.unique, also when the keys have to be renumbered."""
+    rng = np.random.default_rng(0)
+    small_range = [rng.integers(0, 4, 5000).astype(np.uint8), rng.integers(-3, 3, 5000).astype(np.int16)]
+    large_range = [rng.choice(rng.integers(0, 2**40, 20), 5000) for _ in range(3)]
+    floats = [np.round(rng.normal(size=5000), 1)]
+
+    for columns in [small_range + floats, large_range, small_range + large_range]:
+        ids, row_indices = _factorize_rows(columns)
+        rows = np.column_stack(columns)
+        unique_rows, expected_ids = np.unique(rows, axis=0, return_inverse=True)
+
+        np.testing.assert_array_equal(ids, expected_ids.reshape(-1))
+        np.testing.assert_array_equal(rows[row_indices], unique_rows)
+
+
+def test_unique_combinations_windowed(tmp_path):
+    """Test that block-wise unique combinations match the in-memory ids and return the combination table."""
+    output_raster = tmp_path / "unique_combinations.tif"
+    with rasterio.open(SMALL_RASTER_PATH) as raster_1, rasterio.open(SMALL_RASTER_PATH) as raster_2:
+        out_image, _ = unique_combinations([raster_1, raster_2])
+        combinations, out_profile = unique_combinations_windowed(
+            [raster_1, raster_2], output_raster, block_size=16, n_workers=2
+        )
+        data = raster_1.read(1)
+
+    with rasterio.open(output_raster) as result:
+        ids = result.read(1)
+
+    assert out_profile["dtype"] == "int32"
+    np.testing.assert_array_equal(ids, out_image)
+    assert combinations.shape == (out_image.max(), 2)
+    np.testing.assert_array_equal(combinations[ids - 1, 0], data)
+    np.testing.assert_array_equal(combinations[ids - 1, 1], data)
+
+
+def test_unique_combinations_windowed_invalid_parameter(tmp_path):
+    """Test that a single band raises the correct exception in block-wise unique combinations."""
+    with pytest.raises(InvalidParameterValueException):
+        with rasterio.open(SMALL_RASTER_PATH) as raster:
+            unique_combinations_windowed([raster], tmp_path / "unique_combinations.tif")
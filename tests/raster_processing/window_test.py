@@ -1,9 +1,11 @@
+import geopandas as gpd
+import h5py
 import numpy as np
 import pytest
 import rasterio
 
 from eis_toolkit.exceptions import CoordinatesOutOfBoundsException, InvalidParameterValueException
-from eis_toolkit.raster_processing.windowing import extract_window
+from eis_toolkit.raster_processing.windowing import extract_window, extract_windows
 from tests.raster_processing.clip_test import raster_path as SMALL_RASTER_PATH
 
 raster = rasterio.open(SMALL_RASTER_PATH)
@@ -78,3 +80,50 @@ def test_extract_window_out_of_bounds_coordinates():
     """Test that out of bound coordinates raises correct exception."""
     with pytest.raises(CoordinatesOutOfBoundsException):
         extract_window(raster=raster, center_coords=(100, 100), height=1, width=1)
+
+
+def test_extract_windows():
+    """Test that batch extraction matches extracting the windows one by one."""
+    easting = [case1_easting, case2_easting, case3_easting, 384780.0]
+    northing = [case1_northing, case2_northing, case3_northing, 6671300.0]
+    points = gpd.GeoDataFrame(geometry=gpd.points_from_xy(easting, northing), crs=raster.crs)
+
+    # The workers open their own handles, so the same dataset can be listed twice
+    windows = extract_windows([raster, raster], points, height=3, width=2, block_size=8, n_workers=2)
+
+    assert windows.shape == (4, 2, 3, 2)
+    for window, center_coords in zip(windows, zip(easting, northing)):
+        expected, _ = extract_window(raster=raster, center_coords=center_coords, height=3, width=2)
+        np.testing.assert_array_equal(window[:1], expected)
+        np.testing.assert_array_equal(window[1:], expected)
+    np.testing.assert_array_equal(windows[2, :1], case3_reference_data)
+
+
+def test_extract_windows_to_file(tmp_path):
+    """Test that the windows are written to .npy and HDF5 files."""
+    points = gpd.GeoDataFrame(
+        geometry=gpd.points_from_xy([case1_easting, case2_easting], [case1_northing, case2_northing]), crs=raster.crs
+    )
+    windows = extract_windows([raster], points, height=3, width=3)
+
+    npy_windows = extract_windows([raster], points, height=3, width=3, output_file=tmp_path / "windows.npy")
+    np.testing.assert_array_equal(np.load(tmp_path / "windows.npy"), windows)
+    np.testing.assert_array_equal(npy_windows, windows)
+
+    assert extract_windows([raster], points, height=3, width=3, output_file=tmp_path / "windows.h5") is None
+    with h5py.File(tmp_path / "windows.h5", "r") as hdf5_file:
+        np.testing.assert_array_equal(hdf5_file["windows"][:], windows)
+    np.testing.assert_array_equal(windows[0], case1_reference_data)
+
+
+def test_extract_windows_invalid_parameters(tmp_path):
+    """Test that invalid parameters and out of bound coordinates raise the correct exceptions."""
+    points = gpd.GeoDataFrame(geometry=gpd.points_from_xy([case1_easting], [case1_northing]), crs=raster.crs)
+    with pytest.raises(InvalidParameterValueException):
+        extract_windows([raster], points, height=0, width=1)
+    with pytest.raises(InvalidParameterValueException):
+        extract_windows([raster], points, height=1, width=1, output_file=tmp_path / "windows.tif")
+
+    out_of_bounds = gpd.GeoDataFrame(geometry=gpd.points_from_xy([100], [100]), crs=raster.crs)
+    with pytest.raises(CoordinatesOutOfBoundsException):
+        extract_windows([raster], out_of_bounds, height=1, width=1)
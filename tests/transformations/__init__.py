@@ -1,4 +1,5 @@
 import numpy as np
+import rasterio
 
 
 # Test output shapes and types
@@ -26,3 +27,21 @@ def check_transformation_outputs(out_array, out_meta, out_settings, raster, noda
                 np.ma.masked_less_equal(test_array, 0).mask,
             ),
         )
+
+
+# Test windowed outputs against the in-memory transformation
+def check_windowed_outputs(output_raster, out_array, out_settings, windowed_settings, nodata, atol=0):
+    """Check that a windowed transformation wrote the same data and settings as the in-memory one."""
+    with rasterio.open(output_raster) as windowed_raster:
+        windowed_array = windowed_raster.read()
+        windowed_nodata = windowed_raster.nodata
+
+    out_array = out_array.astype(windowed_array.dtype)
+    nodata = windowed_array.dtype.type(nodata)
+
+    assert windowed_nodata == nodata
+
+    assert windowed_array.shape == out_array.shape
+    np.testing.assert_array_equal(windowed_array == nodata, out_array == nodata)
+    np.testing.assert_allclose(windowed_array, out_array, rtol=1e-6, atol=atol)
+    assert windowed_settings.keys() == out_settings.keys()
@@ -5,8 +5,8 @@ import pytest
 import rasterio
 
 from eis_toolkit.exceptions import InvalidRasterBandException, NonMatchingParameterLengthsException
-from eis_toolkit.transformations.binarize import _binarize, binarize
-from tests.transformations import check_transformation_outputs
+from eis_toolkit.transformations.binarize import _binarize, binarize, binarize_windowed
+from tests.transformations import check_transformation_outputs, check_windowed_outputs
 
 parent_dir = Path(__file__).parent
 raster_path = parent_dir.joinpath("../data/remote/small_raster_multiband.tif")
@@ -49,3 +49,16 @@ def test_binarize_parameter_length():
             # Invalid Threshold
             binarize(raster=raster, bands=[1, 2, 3], thresholds=[1, 2], nodata=None)
             binarize(raster=raster, bands=[1, 2], thresholds=[1, 2, 3], nodata=None)
+
+
+def test_binarize_windowed(tmp_path):
+    """Test that the windowed transformation matches the in-memory one."""
+    nodata = 3.748
+    output_raster = tmp_path / "binarize.tif"
+
+    with rasterio.open(raster_path) as raster:
+        out_array, _, out_settings = binarize(raster=raster, thresholds=[2], nodata=nodata)
+        _, windowed_settings = binarize_windowed(raster, output_raster, thresholds=[2], nodata=nodata, block_size=16)
+
+    check_windowed_outputs(output_raster, out_array, out_settings, windowed_settings, nodata)
+    assert windowed_settings == out_settings
@@ -9,8 +9,8 @@ from eis_toolkit.exceptions import (
     InvalidRasterBandException,
     NonMatchingParameterLengthsException,
 )
-from eis_toolkit.transformations.clip import _clip_transform, clip_transform
-from tests.transformations import check_transformation_outputs
+from eis_toolkit.transformations.clip import _clip_transform, clip_transform, clip_transform_windowed
+from tests.transformations import check_transformation_outputs, check_windowed_outputs
 
 parent_dir = Path(__file__).parent
 raster_path = parent_dir.joinpath("../data/remote/small_raster_multiband.tif")
@@ -70,3 +70,18 @@ def test_clip_transform_min_max_position():
             # Invalid position of minimum and maximum values for limits
             clip_transform(raster=raster, bands=None, limits=[(1, 0)], nodata=None)
             clip_transform(raster=raster, bands=[1, 2, 3], limits=[(0, 0), (1, 0), (2, 0)], nodata=None)
+
+
+def test_clip_transform_windowed(tmp_path):
+    """Test that the windowed transformation matches the in-memory one."""
+    nodata = 3.748
+    output_raster = tmp_path / "clip.tif"
+
+    with rasterio.open(raster_path) as raster:
+        out_array, _, out_settings = clip_transform(raster=raster, limits=[(-1, 1)], nodata=nodata)
+        _, windowed_settings = clip_transform_windowed(
+            raster, output_raster, limits=[(-1, 1)], nodata=nodata, block_size=16
+        )
+
+    check_windowed_outputs(output_raster, out_array, out_settings, windowed_settings, nodata)
+    assert windowed_settings == out_settings
@@ -1,9 +1,15 @@
 import numpy as np
 import pandas as pd
 import pytest
+import rasterio
 
-from eis_toolkit.exceptions import InvalidColumnException, NumericValueSignException
-from eis_toolkit.transformations.coda.alr import alr_transform, inverse_alr
+from eis_toolkit.exceptions import InvalidColumnException, InvalidRasterBandException, NumericValueSignException
+from eis_toolkit.transformations.coda.alr import _alr_transform, alr_transform, alr_transform_raster, inverse_alr
+from tests.transformations.coda.clr_test import (
+    read_composition_dataframe,
+    read_transformed_raster,
+    write_composition_rasters,
+)
 
 sample_array = np.array([[65, 12, 18, 5], [63, 16, 15, 6]])
 SAMPLE_DATAFRAME = pd.DataFrame(sample_array, columns=["a", "b", "c", "d"])
@@ -92,3 +98,25 @@ def test_inverse_alr_with_invalid_scale_value():
         inverse_alr(df, "d", 0)
     with pytest.raises(NumericValueSignException):
         inverse_alr(df, "d", -7)
+
+
+@pytest.mark.parametrize("keep_denominator_band", [False, True])
+def test_alr_transform_raster(tmp_path, keep_denominator_band):
+    """Test that the raster ALR transform matches the dataframe transform."""
+    paths = write_composition_rasters(tmp_path)
+    output_raster = tmp_path / "alr.tif"
+    with rasterio.open(paths[0]) as raster:
+        alr_transform_raster([raster], output_raster, 2, keep_denominator_band, block_size=8)
+
+    df = read_composition_dataframe(paths)
+    columns = ["a", "b", "c"] if keep_denominator_band else ["a", "c"]
+    expected = _alr_transform(df, columns, "b").to_numpy()
+    np.testing.assert_allclose(read_transformed_raster(output_raster), expected, rtol=1e-6)
+
+
+def test_alr_transform_raster_invalid_band(tmp_path):
+    """Test that a denominator band outside the composition raises the correct exception."""
+    paths = write_composition_rasters(tmp_path)
+    with rasterio.open(paths[0]) as raster:
+        with pytest.raises(InvalidRasterBandException):
+            alr_transform_raster([raster], tmp_path / "alr.tif", 4)
@@ -1,9 +1,14 @@
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import pytest
+import rasterio
+from beartype.typing import List
 
-from eis_toolkit.exceptions import NumericValueSignException
-from eis_toolkit.transformations.coda.clr import clr_transform, inverse_clr
+from eis_toolkit.exceptions import NonMatchingRasterMetadataException, NumericValueSignException
+from eis_toolkit.transformations.coda.clr import _clr_transform, clr_transform, clr_transform_raster, inverse_clr
+from tests.raster_processing.clip_test import raster_path as SMALL_RASTER_PATH
 
 sample_array = np.array([[65, 12, 18, 5], [63, 16, 15, 6]], dtype=np.float64)
 SAMPLE_DATAFRAME = pd.DataFrame(sample_array, columns=["a", "b", "c", "d"])
@@ -48,3 +53,100 @@ def test_inverse_clr_with_invalid_scale_value():
         inverse_clr(clr, scale=0)
     with pytest.raises(NumericValueSignException):
         inverse_clr(clr, scale=-1)
+
+
+COMPOSITION_NODATA = -9999
+
+
+def write_composition_rasters(directory: Path, single_band: bool = False) -> List[Path]:
+    """Write a 3-part composition with one nodata cell as a multiband raster or as single band rasters."""
+    values = np.random.default_rng(0).uniform(1, 100, (3, 20, 30))
+    values[0, 2, 3] = COMPOSITION_NODATA
+    profile = {
+        "driver": "GTiff",
+        "height": 20,
+        "width": 30,
+        "count": 3,
+        "dtype": "float64",
+        "crs": "EPSG:3067",
+        "transform": rasterio.transform.from_origin(0, 20, 1, 1),
+        "nodata": COMPOSITION_NODATA,
+    }
+    if not single_band:
+        paths = [directory / "composition.tif"]
+        with rasterio.open(paths[0], "w", **profile) as dst:
+            dst.write(values)
+        return paths
+
+    paths = []
+    profile.update(count=1)
+    for band in range(3):
+        paths.append(directory / f"composition_{band + 1}.tif")
+        with rasterio.open(paths[-1], "w", **profile) as dst:
+            dst.write(values[band], 1)
+    return paths
+
+
+def read_composition_dataframe(paths: List[Path]) -> pd.DataFrame:
+    """Read the composition rasters into a dataframe with one row per cell and nodata as NaN."""
+    bands = []
+    for path in paths:
+        with rasterio.open(path) as raster:
+            bands.append(raster.read())
+    values = np.concatenate(bands).reshape(3, -1).T
+    values[values == COMPOSITION_NODATA] = np.nan
+    return pd.DataFrame(values, columns=["a", "b", "c"])
+
+
+def read_transformed_raster(path: Path) -> np.ndarray:
+    """Read a transformed raster into an array with one row per cell and nodata as NaN."""
+    with rasterio.open(path) as raster:
+        values = raster.read().astype(np.float64)
+        values[values == raster.nodata] = np.nan
+    return values.reshape(raster.count, -1).T
+
+
+@pytest.mark.parametrize("single_band", [False, True])
+def test_clr_transform_raster(tmp_path, single_band):
+    """Test that the raster CLR transform matches the dataframe transform and keeps the nodata cell."""
+    paths = write_composition_rasters(tmp_path, single_band)
+    output_raster = tmp_path / "clr.tif"
+    rasters = [rasterio.open(path) for path in paths]
+    profile = clr_transform_raster(rasters, output_raster, block_size=8)
+    [raster.close() for raster in rasters]
+
+    result = read_transformed_raster(output_raster)
+    expected = _clr_transform(read_composition_dataframe(paths)).to_numpy()
+    assert profile["count"] == 3
+    assert np.all(np.isnan(result[2 * 30 + 3]))
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
+def test_clr_transform_raster_invalid_data(tmp_path):
+    """Test that non-positive data and mismatching grids raise the correct exceptions."""
+    path = write_composition_rasters(tmp_path)[0]
+    with rasterio.open(path, "r+") as raster:
+        raster.write(np.zeros((20, 30)), 2)
+
+    with rasterio.open(path) as raster:
+        with pytest.raises(NumericValueSignException):
+            clr_transform_raster([raster], tmp_path / "clr.tif")
+
+    with rasterio.open(SMALL_RASTER_PATH) as small_raster, rasterio.open(path) as raster:
+        with pytest.raises(NonMatchingRasterMetadataException):
+            clr_transform_raster([raster, small_raster], tmp_path / "clr.tif")
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_clr_transform_raster_removes_partial_output(tmp_path, n_workers):
+    """Test that invalid data found after the first blocks leaves no partial output raster."""
+    path = write_composition_rasters(tmp_path)[0]
+    with rasterio.open(path, "r+") as raster:
+        raster.write(np.zeros((4, 30)), 2, window=rasterio.windows.Window(0, 16, 30, 4))
+
+    output_raster = tmp_path / "clr.tif"
+    with rasterio.open(path) as raster:
+        with pytest.raises(NumericValueSignException):
+            clr_transform_raster([raster], output_raster, block_size=8, n_workers=n_workers)
+
+    assert not output_raster.exists()
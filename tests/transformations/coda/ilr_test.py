@@ -1,9 +1,20 @@
 import numpy as np
 import pandas as pd
 import pytest
+import rasterio
 
 from eis_toolkit.exceptions import InvalidColumnException, InvalidCompositionException, InvalidParameterValueException
-from eis_toolkit.transformations.coda.ilr import _calculate_ilr_scaling_factor, single_ilr_transform
+from eis_toolkit.transformations.coda.ilr import (
+    _calculate_ilr_scaling_factor,
+    _single_ilr_transform,
+    single_ilr_transform,
+    single_ilr_transform_raster,
+)
+from tests.transformations.coda.clr_test import (
+    read_composition_dataframe,
+    read_transformed_raster,
+    write_composition_rasters,
+)
 
 
 def test_calculate_scaling_factor():
@@ -59,3 +70,22 @@ def test_ilr_transform_with_empty_subcomposition():
         arr = np.array([[65, 12, 18, 5], [63, 16, 15, 6]])
         df = pd.DataFrame(arr, columns=["a", "b", "c", "d"])
         single_ilr_transform(df, ["a", "b"], [])
+
+
+def test_single_ilr_transform_raster(tmp_path):
+    """Test that the raster ILR transform matches the dataframe transform."""
+    paths = write_composition_rasters(tmp_path)
+    output_raster = tmp_path / "ilr.tif"
+    with rasterio.open(paths[0]) as raster:
+        single_ilr_transform_raster([raster], output_raster, [3, 1], [2], block_size=8)
+
+    expected = _single_ilr_transform(read_composition_dataframe(paths), ["c", "a"], ["b"]).to_numpy()
+    np.testing.assert_allclose(read_transformed_raster(output_raster)[:, 0], expected, rtol=1e-6)
+
+
+def test_single_ilr_transform_raster_overlapping_subcompositions(tmp_path):
+    """Test that overlapping subcompositions raise the correct exception."""
+    paths = write_composition_rasters(tmp_path)
+    with rasterio.open(paths[0]) as raster:
+        with pytest.raises(InvalidCompositionException):
+            single_ilr_transform_raster([raster], tmp_path / "ilr.tif", [1, 2], [2])
@@ -1,9 +1,19 @@
 import numpy as np
 import pandas as pd
 import pytest
+import rasterio
 
 from eis_toolkit.exceptions import InvalidColumnException, InvalidParameterValueException
-from eis_toolkit.transformations.coda.pairwise import pairwise_logratio, single_pairwise_logratio
+from eis_toolkit.transformations.coda.pairwise import (
+    pairwise_logratio,
+    pairwise_logratio_raster,
+    single_pairwise_logratio,
+)
+from tests.transformations.coda.clr_test import (
+    read_composition_dataframe,
+    read_transformed_raster,
+    write_composition_rasters,
+)
 
 
 def test_single_pairwise_logratio():
@@ -47,3 +57,16 @@ def test_pairwise_logratio_with_zero_values():
         arr = np.array([[65, 23, 0, 12], [63, 21, 1, 17]])
         df = pd.DataFrame(arr, columns=["a", "b", "c", "d"])
         pairwise_logratio(df, "b", "c")
+
+
+def test_pairwise_logratio_raster(tmp_path):
+    """Test that the raster pairwise logratio matches the logratio of the bands."""
+    paths = write_composition_rasters(tmp_path, single_band=True)
+    output_raster = tmp_path / "pairwise.tif"
+    rasters = [rasterio.open(path) for path in paths]
+    pairwise_logratio_raster(rasters, output_raster, 3, 1, block_size=8)
+    [raster.close() for raster in rasters]
+
+    df = read_composition_dataframe(paths)
+    expected = np.log(df["c"] / df["a"]).to_numpy()
+    np.testing.assert_allclose(read_transformed_raster(output_raster)[:, 0], expected, rtol=1e-6)
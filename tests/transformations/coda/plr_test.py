@@ -1,9 +1,21 @@
 import numpy as np
 import pandas as pd
 import pytest
+import rasterio
 
 from eis_toolkit.exceptions import InvalidColumnException
-from eis_toolkit.transformations.coda.plr import _single_plr_transform_by_index, plr_transform, single_plr_transform
+from eis_toolkit.transformations.coda.plr import (
+    _plr_transform,
+    _single_plr_transform_by_index,
+    plr_transform,
+    plr_transform_raster,
+    single_plr_transform,
+)
+from tests.transformations.coda.clr_test import (
+    read_composition_dataframe,
+    read_transformed_raster,
+    write_composition_rasters,
+)
 
 
 def test_single_plr_transform_with_single_composition():
@@ -48,3 +60,28 @@ def test_plr_transform():
     assert len(result.columns) == len(df.columns) - 1
     expected = pd.DataFrame(np.array([[1.60, 0.19, 0.91], [1.49, 0.43, 0.65]]), columns=["V1", "V2", "V3"])
     pd.testing.assert_frame_equal(result, expected, atol=1e-2)
+
+
+def test_plr_transform_matches_single_transforms():
+    """Test that the full PLR transform equals the single transforms of each column, keeping the index."""
+    arr = np.array([[65, 12, 18, 5], [63, 16, 15, 6], [40, 30, 20, 10]])
+    df = pd.DataFrame(arr, columns=["a", "b", "c", "d"], index=[10, 20, 30])
+    result = plr_transform(df)
+    for i in range(len(df.columns) - 1):
+        expected = _single_plr_transform_by_index(df, i)
+        np.testing.assert_allclose(result.iloc[:, i], expected)
+        assert result.index.equals(expected.index)
+
+
+def test_plr_transform_raster(tmp_path):
+    """Test that the raster PLR transform of single band rasters matches the dataframe transform."""
+    paths = write_composition_rasters(tmp_path, single_band=True)
+    output_raster = tmp_path / "plr.tif"
+    rasters = [rasterio.open(path) for path in paths]
+    profile = plr_transform_raster(rasters, output_raster, block_size=8, n_workers=2)
+    [raster.close() for raster in rasters]
+
+    result = read_transformed_raster(output_raster)
+    expected = _plr_transform(read_composition_dataframe(paths)).to_numpy()
+    assert profile["count"] == 2
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
@@ -13,9 +13,11 @@ from eis_toolkit.transformations.linear import (
     _min_max_scaling,
     _z_score_normalization,
     min_max_scaling,
+    min_max_scaling_windowed,
     z_score_normalization,
+    z_score_normalization_windowed,
 )
-from tests.transformations import check_transformation_outputs
+from tests.transformations import check_transformation_outputs, check_windowed_outputs
 
 parent_dir = Path(__file__).parent
 raster_path = parent_dir.joinpath("../data/remote/small_raster_multiband.tif")
@@ -115,3 +117,32 @@ def test_linear_min_max_position():
             # Invalid position of minimum and maximum values for new_range
             min_max_scaling(raster=raster, bands=None, new_range=[(1, 0)], nodata=None)
             min_max_scaling(raster=raster, bands=[1, 2, 3], new_range=[(0, 0), (1, 0), (2, 0)], nodata=None)
+
+
+def test_z_score_normalization_windowed(tmp_path):
+    """Test that the windowed transformation matches the in-memory one."""
+    nodata = 3.748
+    output_raster = tmp_path / "z_score.tif"
+
+    with rasterio.open(raster_path) as raster:
+        out_array, _, out_settings = z_score_normalization(raster=raster, nodata=nodata)
+        _, windowed_settings = z_score_normalization_windowed(raster, output_raster, nodata=nodata, block_size=16)
+
+    check_windowed_outputs(output_raster, out_array, out_settings, windowed_settings, nodata, atol=1e-5)
+    for transform in out_settings:
+        assert windowed_settings[transform]["original_mean"] == pytest.approx(out_settings[transform]["original_mean"])
+        assert windowed_settings[transform]["original_sd"] == pytest.approx(out_settings[transform]["original_sd"])
+
+
+def test_min_max_scaling_windowed(tmp_path):
+    """Test that the windowed transformation matches the in-memory one."""
+    nodata = 3.748
+    output_raster = tmp_path / "min_max.tif"
+
+    with rasterio.open(raster_path) as raster:
+        out_array, _, out_settings = min_max_scaling(raster=raster, bands=[1, 3], new_range=[(0, 10)], nodata=nodata)
+        _, windowed_settings = min_max_scaling_windowed(
+            raster, output_raster, bands=[1, 3], new_range=[(0, 10)], nodata=nodata, block_size=16, n_workers=2
+        )
+
+    check_windowed_outputs(output_raster, out_array, out_settings, windowed_settings, nodata)
@@ -14,8 +14,9 @@ from eis_toolkit.transformations.logarithmic import (
     _log_transform_log2,
     _log_transform_log10,
     log_transform,
+    log_transform_windowed,
 )
-from tests.transformations import check_transformation_outputs
+from tests.transformations import check_transformation_outputs, check_windowed_outputs
 
 parent_dir = Path(__file__).parent
 raster_path = parent_dir.joinpath("../data/remote/small_raster_multiband.tif")
@@ -97,3 +98,17 @@ def test_log_transform_method():
         with rasterio.open(raster_path) as raster:
             # Invalid method
             log_transform(raster=raster, bands=None, log_transform=["python"], nodata=None)
+
+
+def test_log_transform_windowed(tmp_path):
+    """Test that the windowed transformation matches the in-memory one."""
+    output_raster = tmp_path / "log.tif"
+
+    with rasterio.open(raster_path) as raster:
+        out_array, _, out_settings = log_transform(raster=raster, log_transform=["ln", "log10"], bands=[1, 2])
+        _, windowed_settings = log_transform_windowed(
+            raster, output_raster, log_transform=["ln", "log10"], bands=[1, 2], block_size=16
+        )
+
+    check_windowed_outputs(output_raster, out_array, out_settings, windowed_settings, raster.nodata)
+    assert windowed_settings == out_settings
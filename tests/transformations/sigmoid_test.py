@@ -9,8 +9,8 @@ from eis_toolkit.exceptions import (
     InvalidRasterBandException,
     NonMatchingParameterLengthsException,
 )
-from eis_toolkit.transformations.sigmoid import _sigmoid_transform, sigmoid_transform
-from tests.transformations import check_transformation_outputs
+from eis_toolkit.transformations.sigmoid import _sigmoid_transform, sigmoid_transform, sigmoid_transform_windowed
+from tests.transformations import check_transformation_outputs, check_windowed_outputs
 
 parent_dir = Path(__file__).parent
 raster_path = parent_dir.joinpath("../data/remote/small_raster_multiband.tif")
@@ -87,3 +87,19 @@ def test_sigmoid_min_max_position():
             # Invalid position of minimum and maximum values for new_range
             sigmoid_transform(raster=raster, bands=None, bounds=[(0, 0)], slope=[1], center=True, nodata=None)
             sigmoid_transform(raster=raster, bands=None, bounds=[(1, 0)], slope=[1], center=True, nodata=None)
+
+
+@pytest.mark.parametrize("center", [True, False])
+def test_sigmoid_transform_windowed(tmp_path, center):
+    """Test that the windowed transformation matches the in-memory one."""
+    nodata = 3.748
+    output_raster = tmp_path / "sigmoid.tif"
+
+    with rasterio.open(raster_path) as raster:
+        out_array, _, out_settings = sigmoid_transform(raster=raster, slope=[2], center=center, nodata=nodata)
+        _, windowed_settings = sigmoid_transform_windowed(
+            raster, output_raster, slope=[2], center=center, nodata=nodata, block_size=16
+        )
+
+    check_windowed_outputs(output_raster, out_array, out_settings, windowed_settings, nodata, atol=1e-5)
+    assert windowed_settings == out_settings
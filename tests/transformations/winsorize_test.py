@@ -9,8 +9,8 @@ from eis_toolkit.exceptions import (
     InvalidRasterBandException,
     NonMatchingParameterLengthsException,
 )
-from eis_toolkit.transformations.winsorize import _winsorize, winsorize
-from tests.transformations import check_transformation_outputs
+from eis_toolkit.transformations.winsorize import _winsorize, winsorize, winsorize_windowed
+from tests.transformations import check_transformation_outputs, check_windowed_outputs
 
 parent_dir = Path(__file__).parent
 raster_path = parent_dir.joinpath("../data/remote/small_raster_multiband.tif")
@@ -79,3 +79,19 @@ def test_winsorize_percentile_parameter():
 
             # Invalid upper value
             winsorize(raster=raster, bands=None, percentiles=[(None, 100)], inside=False, nodata=None)
+
+
+@pytest.mark.parametrize("inside", [True, False])
+def test_winsorize_windowed(tmp_path, inside):
+    """Test that the windowed transformation matches the in-memory one."""
+    nodata = 3.748
+    output_raster = tmp_path / "winsorize.tif"
+
+    with rasterio.open(raster_path) as raster:
+        out_array, _, out_settings = winsorize(raster=raster, percentiles=[(10, 20)], inside=inside, nodata=nodata)
+        _, windowed_settings = winsorize_windowed(
+            raster, output_raster, percentiles=[(10, 20)], inside=inside, nodata=nodata, block_size=16
+        )
+
+    check_windowed_outputs(output_raster, out_array, out_settings, windowed_settings, nodata)
+    assert windowed_settings == out_settings
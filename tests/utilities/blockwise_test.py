@@ -0,0 +1,157 @@
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pytest
+import rasterio
+
+from eis_toolkit.exceptions import InvalidParameterValueException
+from eis_toolkit.utilities.blockwise import (
+    crop_halo,
+    get_block_output_profile,
+    get_block_windows,
+    process_raster_bands_by_blocks,
+    process_raster_by_blocks,
+    write_raster_by_blocks,
+)
+
+test_dir = Path(__file__).parent.parent
+raster_path = test_dir.joinpath("data/remote/small_raster.tif")
+
+_initialized_values: dict = {}
+
+
+def _set_fill_value(fill_value):
+    _initialized_values["fill"] = fill_value
+
+
+def _fill_block(shape):
+    return np.full(shape, _initialized_values["fill"])
+
+
+def test_get_block_windows():
+    """Test that the blocks cover the grid exactly once and the halos stay inside the grid."""
+    windows = get_block_windows(56, 46, block_size=16, halo=2)
+    coverage = np.zeros((56, 46), dtype=int)
+
+    for read_window, write_window in windows:
+        coverage[write_window.toslices()] += 1
+        assert read_window.row_off >= 0 and read_window.col_off >= 0
+        assert read_window.row_off + read_window.height <= 56
+        assert read_window.col_off + read_window.width <= 46
+
+    assert len(windows) == 4 * 3
+    assert np.all(coverage == 1)
+
+
+def test_get_block_windows_invalid_parameters():
+    """Test that invalid block size and halo raise the correct exception."""
+    with pytest.raises(InvalidParameterValueException):
+        get_block_windows(10, 10, block_size=0)
+    with pytest.raises(InvalidParameterValueException):
+        get_block_windows(10, 10, halo=-1)
+
+
+def test_crop_halo():
+    """Test that cropping returns the block without the halo."""
+    data = np.arange(100).reshape(10, 10)
+    (read_window, write_window) = get_block_windows(10, 10, block_size=4, halo=1)[4]
+    block = data[read_window.toslices()]
+
+    np.testing.assert_array_equal(crop_halo(block, read_window, write_window), data[write_window.toslices()])
+
+
+def test_process_raster_by_blocks(tmp_path):
+    """Test that block-wise processing keeps nodata and writes the expected values."""
+    output_path = tmp_path / "blockwise.tif"
+
+    with rasterio.open(raster_path) as raster:
+        expected = raster.read(1)
+        out_profile = process_raster_by_blocks(raster, output_path, lambda block: block * 2, block_size=10)
+
+    with rasterio.open(output_path) as result_raster:
+        result = result_raster.read(1)
+
+    assert out_profile["nodata"] == -999.999
+    nodata_mask = expected == -999.999
+    np.testing.assert_array_equal(result[nodata_mask], expected[nodata_mask])
+    np.testing.assert_allclose(result[~nodata_mask], expected[~nodata_mask] * 2)
+
+
+def test_process_raster_by_blocks_parallel(tmp_path):
+    """Test that processing the blocks in worker processes gives the same result as sequential processing."""
+    sequential_path = tmp_path / "sequential.tif"
+    parallel_path = tmp_path / "parallel.tif"
+    block_function = partial(np.multiply, 2)
+
+    with rasterio.open(raster_path) as raster:
+        process_raster_by_blocks(raster, sequential_path, block_function, block_size=8)
+        process_raster_by_blocks(raster, parallel_path, block_function, block_size=8, n_workers=2)
+
+    with rasterio.open(sequential_path) as sequential, rasterio.open(parallel_path) as parallel:
+        np.testing.assert_array_equal(sequential.read(), parallel.read())
+
+
+def test_process_raster_by_blocks_invalid_workers(tmp_path):
+    """Test that an invalid number of workers raises the correct exception."""
+    with rasterio.open(raster_path) as raster:
+        with pytest.raises(InvalidParameterValueException):
+            process_raster_by_blocks(raster, tmp_path / "blockwise.tif", np.negative, n_workers=0)
+
+
+def test_write_raster_by_blocks(tmp_path):
+    """Test writing blocks computed without an input raster."""
+    out_profile = {"driver": "GTiff", "height": 5, "width": 7, "count": 1, "dtype": "float32", "nodata": -1.0}
+    block_tasks = [
+        (np.full, ((write_window.height, write_window.width), index), write_window)
+        for index, (_, write_window) in enumerate(get_block_windows(5, 7, block_size=4))
+    ]
+    block_tasks[-1] = (np.full, ((1, 3), np.nan), block_tasks[-1][2])
+
+    write_raster_by_blocks(tmp_path / "blocks.tif", out_profile, block_tasks)
+
+    with rasterio.open(tmp_path / "blocks.tif") as raster:
+        result = raster.read(1)
+
+    expected = np.array([[0, 0, 0, 0, 1, 1, 1]] * 4 + [[2, 2, 2, 2, -1, -1, -1]])
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_write_raster_by_blocks_initializer(tmp_path, n_workers):
+    """Test that the initializer sets the state the blocks are computed from, also in worker processes."""
+    out_profile = {"driver": "GTiff", "height": 5, "width": 7, "count": 1, "dtype": "float32", "nodata": -1.0}
+    block_tasks = [
+        (_fill_block, ((write_window.height, write_window.width),), write_window)
+        for _, write_window in get_block_windows(5, 7, block_size=4)
+    ]
+
+    write_raster_by_blocks(
+        tmp_path / "blocks.tif", out_profile, block_tasks, n_workers, initializer=_set_fill_value, initargs=(3.0,)
+    )
+
+    with rasterio.open(tmp_path / "blocks.tif") as raster:
+        np.testing.assert_array_equal(raster.read(1), np.full((5, 7), 3.0))
+
+
+def test_process_raster_bands_by_blocks(tmp_path):
+    """Test that each selected band is processed with its own function."""
+    output_raster = tmp_path / "bands.tif"
+
+    with rasterio.open(test_dir.joinpath("data/remote/small_raster_multiband.tif")) as raster:
+        out_profile = get_block_output_profile(raster, count=2, dtype="float64")
+        process_raster_bands_by_blocks(
+            raster, output_raster, [3, 1], [partial(np.multiply, 2), np.negative], out_profile, block_size=16
+        )
+        expected = np.stack([raster.read(3) * 2, -raster.read(1)])
+
+    with rasterio.open(output_raster) as result:
+        np.testing.assert_array_equal(result.read(), expected)
+
+
+def test_process_raster_bands_by_blocks_mismatching_functions(tmp_path):
+    """Test that a band function missing for a band raises the correct exception."""
+    with rasterio.open(raster_path) as raster:
+        out_profile = get_block_output_profile(raster, count=1, dtype="float32")
+        with pytest.raises(InvalidParameterValueException):
+            process_raster_bands_by_blocks(raster, tmp_path / "bands.tif", [1], [], out_profile)
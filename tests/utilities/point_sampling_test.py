@@ -0,0 +1,26 @@
+from pathlib import Path
+
+import numpy as np
+import rasterio
+
+from eis_toolkit.utilities.point_sampling import sample_raster_points
+
+test_dir = Path(__file__).parent.parent
+raster_path = test_dir.joinpath("data/remote/small_raster_multiband.tif")
+
+
+def test_sample_raster_points():
+    """Test that the block-wise sampling matches raster.sample, also for points outside the raster."""
+    with rasterio.open(raster_path) as raster:
+        rng = np.random.default_rng(0)
+        left, bottom, right, top = raster.bounds
+        x = rng.uniform(left - 10, right + 10, size=200)
+        y = rng.uniform(bottom - 10, top + 10, size=200)
+
+        values = sample_raster_points(raster, x, y, block_size=4)
+        expected = np.array(list(raster.sample(zip(x, y)))).T
+
+        band_values = sample_raster_points(raster, x, y, block_size=4, indexes=[3])
+
+    np.testing.assert_array_equal(values, expected)
+    np.testing.assert_array_equal(band_values, expected[[2]])
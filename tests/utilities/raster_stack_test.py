@@ -0,0 +1,139 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.windows import Window
+
+from eis_toolkit.exceptions import (
+    InvalidParameterValueException,
+    InvalidRasterBandException,
+    NonMatchingRasterMetadataException,
+)
+from eis_toolkit.prediction.fuzzy_overlay import and_overlay
+from eis_toolkit.raster_processing.unique_combinations import unique_combinations
+from eis_toolkit.utilities.raster_stack import RasterStack
+
+test_dir = Path(__file__).parent.parent
+raster_path = test_dir.joinpath("data/remote/small_raster.tif")
+multiband_path = test_dir.joinpath("data/remote/small_raster_multiband.tif")
+smaller_raster_path = test_dir.joinpath("data/remote/smaller_raster.tif")
+
+
+def _expected_stack(nodata_to_nan=True):
+    with rasterio.open(raster_path) as raster, rasterio.open(multiband_path) as multiband:
+        bands = [raster.read(1)] + [band for band in multiband.read()]
+        nodata = raster.nodata
+    expected = np.stack(bands)
+    if nodata_to_nan:
+        expected[expected == nodata] = np.nan
+    return expected
+
+
+def test_raster_stack_properties():
+    """Test that the stack exposes the grid and bands of the rasters without reading them."""
+    with RasterStack([raster_path, multiband_path]) as stack:
+        assert stack.count == len(stack) == 5
+        assert stack.shape == (5, 56, 46)
+        assert stack.nodata == [-999.999] * 5
+        assert stack.dtype == np.float64
+        assert len(stack.profiles) == 2
+        assert stack.profile["transform"] == stack.profiles[1]["transform"]
+
+
+def test_raster_stack_read():
+    """Test that reading the stack matches stacking the bands in memory."""
+    with RasterStack([raster_path, multiband_path]) as stack:
+        np.testing.assert_array_equal(stack.read(), _expected_stack())
+        np.testing.assert_array_equal(stack.read(nodata_to_nan=False), _expected_stack(nodata_to_nan=False))
+        np.testing.assert_array_equal(np.asarray(stack), _expected_stack())
+
+
+def test_raster_stack_windowed_reads():
+    """Test that window and block reads cover the matching parts of the stack."""
+    expected = _expected_stack()
+    with RasterStack([raster_path, multiband_path]) as stack:
+        window = Window(5, 10, 20, 30)
+        np.testing.assert_array_equal(stack.read(window=window), expected[:, 10:40, 5:25])
+
+        result = np.full(expected.shape, -1.0)
+        for block_window, block in stack.read_blocks(block_size=16):
+            result[(slice(None),) + block_window.toslices()] = block
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_raster_stack_band_selection():
+    """Test that band selection picks the stack bands in the given order."""
+    expected = _expected_stack()
+    with RasterStack([raster_path, multiband_path], bands=[4, 1]) as stack:
+        np.testing.assert_array_equal(stack.read(), expected[[3, 0]])
+
+        selection = stack.select([2])
+        assert selection.shape == (1, 56, 46)
+        np.testing.assert_array_equal(selection.read(), expected[[0]])
+
+
+def test_raster_stack_memmap(tmp_path):
+    """Test that the memory-mapped array holds the stacked data."""
+    expected = _expected_stack()
+    with RasterStack([raster_path, multiband_path]) as stack:
+        anonymous = stack.to_memmap(block_size=16)
+        scratch_file = tmp_path / "stack.dat"
+        backed = stack.to_memmap(scratch_file=scratch_file, block_size=16)
+
+    assert isinstance(anonymous, np.memmap)
+    np.testing.assert_array_equal(anonymous, expected)
+    np.testing.assert_array_equal(backed, expected)
+    assert scratch_file.stat().st_size == expected.nbytes
+
+
+def test_raster_stack_open_rasters():
+    """Test that rasters given as datasets are left open for the caller."""
+    with rasterio.open(raster_path) as raster:
+        with RasterStack([raster, multiband_path]) as stack:
+            assert stack.count == 5
+        assert not raster.closed
+
+
+def test_raster_stack_non_matching_grids():
+    """Test that rasters with different grids raise the correct exception."""
+    with pytest.raises(NonMatchingRasterMetadataException):
+        RasterStack([raster_path, smaller_raster_path])
+
+
+def test_raster_stack_invalid_parameters():
+    """Test that invalid rasters and bands raise the correct exceptions."""
+    with pytest.raises(InvalidParameterValueException):
+        RasterStack([])
+    with pytest.raises(InvalidRasterBandException):
+        RasterStack([raster_path], bands=[2])
+    with RasterStack([raster_path, multiband_path]) as stack:
+        with pytest.raises(InvalidRasterBandException):
+            stack.select([0])
+
+
+def test_raster_stack_as_input(tmp_path):
+    """Test that functions taking stacked data accept a raster stack."""
+    with rasterio.open(multiband_path) as multiband:
+        out_image, out_meta = unique_combinations([multiband])
+    with RasterStack([multiband_path]) as stack:
+        stack_image, stack_meta = unique_combinations(stack)
+    np.testing.assert_array_equal(stack_image, out_image)
+    assert stack_meta == out_meta
+
+    memberships = np.random.default_rng(0).random((3, 20, 20)).astype(np.float32)
+    membership_path = tmp_path / "memberships.tif"
+    with rasterio.open(
+        membership_path,
+        "w",
+        driver="GTiff",
+        count=3,
+        height=20,
+        width=20,
+        dtype="float32",
+        crs="EPSG:3067",
+        transform=rasterio.transform.from_origin(0, 20, 1, 1),
+    ) as dst:
+        dst.write(memberships)
+    with RasterStack([membership_path]) as stack:
+        np.testing.assert_array_equal(and_overlay(stack), and_overlay(memberships))
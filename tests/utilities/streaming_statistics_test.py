@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import rasterio
+
+from eis_toolkit.exceptions import InvalidParameterValueException, InvalidRasterBandException
+from eis_toolkit.utilities.streaming_statistics import raster_band_statistics, sketch_percentile
+
+test_dir = Path(__file__).parent.parent
+raster_path = test_dir.joinpath("data/remote/small_raster_multiband.tif")
+
+
+def _write_random_raster(path, shape=(300, 300)):
+    values = np.random.default_rng(0).normal(10, 3, size=shape).astype(np.float32)
+    profile = {"driver": "GTiff", "height": shape[0], "width": shape[1], "count": 1, "dtype": "float32"}
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(values, 1)
+    return values
+
+
+def test_raster_band_statistics():
+    """Test that the streamed statistics match the statistics of the whole bands."""
+    with rasterio.open(raster_path) as raster:
+        statistics = raster_band_statistics(raster, bands=[1, 3], nodata=3.748, block_size=16)
+        data = raster.read([1, 3])
+
+    for band_statistics, band_data in zip(statistics, data):
+        valid = band_data[(band_data != 3.748) & (band_data != raster.nodata)]
+        assert band_statistics["count"] == valid.size
+        assert band_statistics["mean"] == pytest.approx(np.mean(valid))
+        assert band_statistics["std"] == pytest.approx(np.std(valid))
+        assert band_statistics["min"] == np.min(valid)
+        assert band_statistics["max"] == np.max(valid)
+
+
+@pytest.mark.parametrize("method", ["linear", "lower", "higher"])
+def test_sketch_percentile_exact(method):
+    """Test that percentiles are exact while the sketch holds all the values."""
+    with rasterio.open(raster_path) as raster:
+        statistics = raster_band_statistics(raster, bands=[2], block_size=16)[0]
+        data = raster.read(2)
+
+    valid = data[data != raster.nodata]
+    for percentile in [0, 7.5, 50, 93, 100]:
+        assert sketch_percentile(statistics, percentile, method) == np.percentile(valid, percentile, method=method)
+
+
+def test_sketch_percentile_approximate(tmp_path):
+    """Test that percentiles stay close to the exact ones once the sketch is compacted."""
+    values = _write_random_raster(tmp_path / "random.tif")
+
+    with rasterio.open(tmp_path / "random.tif") as raster:
+        statistics = raster_band_statistics(raster, block_size=64, sketch_level_size=1024)[0]
+
+    assert sum(len(level) for level in statistics["sketch_levels"]) < values.size / 10
+    for percentile in [1, 25, 50, 75, 99]:
+        estimate = sketch_percentile(statistics, percentile)
+        assert np.mean(values < estimate) * 100 == pytest.approx(percentile, abs=1)
+
+
+def test_raster_band_statistics_invalid_parameters():
+    """Test that invalid bands, sketch size and percentiles raise the correct exceptions."""
+    with rasterio.open(raster_path) as raster:
+        with pytest.raises(InvalidRasterBandException):
+            raster_band_statistics(raster, bands=[5])
+        with pytest.raises(InvalidParameterValueException):
+            raster_band_statistics(raster, sketch_level_size=1)
+        statistics = raster_band_statistics(raster, bands=[1])[0]
+
+    with pytest.raises(InvalidParameterValueException):
+        sketch_percentile(statistics, 101)
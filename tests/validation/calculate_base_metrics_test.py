@@ -5,7 +5,7 @@ import pandas as pd
 import pytest
 import rasterio
 
-from eis_toolkit.exceptions import GeometryTypeException, NonMatchingCrsException
+from eis_toolkit.exceptions import GeometryTypeException, InvalidParameterValueException, NonMatchingCrsException
 from eis_toolkit.validation.calculate_base_metrics import calculate_base_metrics
 
 test_dir = Path(__file__).parent.parent
@@ -41,6 +41,31 @@ def test_calculate_base_metrics():
     assert reference_metrics.equals(metrics)
 
 
+def test_calculate_base_metrics_windowed():
+    """Test that block-wise calculation gives the same metrics as the in-memory calculation."""
+    deposits = gpd.GeoDataFrame(
+        geometry=gpd.points_from_xy([384829.33, 384829.33, 384790.1], [6671310.87, 6671308.70, 6671290.3]),
+        crs="EPSG:3067",
+    )
+    negatives = gpd.GeoDataFrame(
+        geometry=gpd.points_from_xy([384760.9, 384771.4], [6671319.5, 6671352.1]), crs="EPSG:3067"
+    )
+
+    with rasterio.open(raster_path) as raster:
+        metrics = calculate_base_metrics(raster=raster, deposits=deposits, negatives=negatives)
+        windowed_metrics = calculate_base_metrics(raster=raster, deposits=deposits, negatives=negatives, block_size=16)
+
+    assert windowed_metrics.equals(metrics)
+
+
+def test_calculate_base_metrics_invalid_block_size():
+    """Test that a non-positive block size raises the correct exception."""
+    deposits = gpd.GeoDataFrame(geometry=gpd.points_from_xy([384829.33], [6671310.87]), crs="EPSG:3067")
+    with pytest.raises(InvalidParameterValueException):
+        with rasterio.open(raster_path) as raster:
+            calculate_base_metrics(raster=raster, deposits=deposits, block_size=0)
+
+
 def test_calculate_base_metrics_wrong_geometry_type():
     """Tests that non-polygon geometry raises the correct exception."""
     with pytest.raises(GeometryTypeException):
@@ -19,6 +19,7 @@ points_path = str(parent_dir.joinpath("data/remote/Test_Occ.geojson"))
 lines_path = str(parent_dir.joinpath("data/remote/Test_Faults.geojson"))
 matrix_path = str(parent_dir.joinpath("data/remote/Test_CBA_matrix.geojson"))
 raster_path = str(parent_dir.joinpath("data/remote/Test_CBA_matrix_check.tif"))
+matrix_raster_path = str(parent_dir.joinpath("data/remote/Test_CBA_matrix.tif"))
 
 vector_file = gpd.GeoDataFrame.from_file(vector_path)
 points_file = gpd.GeoDataFrame.from_file(points_path)
@@ -44,6 +45,33 @@ def test_gridding():
     assert (cba_grid.index == shp_cba_grid.index).all()
 
 
+def test_grid_geometry():
+    """Test that the grid cells have the same corner coordinates as the stored matrix cells."""
+    grid = cba._get_grid(vector_file, 4000, 4000).sort_index()
+    shp_cba_grid = cba._from_vector_file(matrix_path)
+    assert (grid.index == shp_cba_grid.index).all()
+    for cell, shp_cell in zip(grid.geometry, shp_cba_grid.geometry):
+        numpy.testing.assert_array_equal(cell.exterior.coords, shp_cell.geoms[0].exterior.coords)
+
+
+def test_to_raster():
+    """Test that the matrix cells are written to their raster cells and missing cells to nodata."""
+    shp_cba_grid = cba._from_vector_file(matrix_path)
+    missing_cells = [16, 17, 112]
+    cba._to_raster(shp_cba_grid.drop(index=missing_cells), str(output_file) + "_matrix")
+
+    with rasterio.open(matrix_raster_path, "r") as one:
+        with rasterio.open(str(output_file) + "_matrix.tif", "r") as two:
+            one_array = one.read()
+            two_array = two.read()
+            assert one.transform == two.transform
+            assert one.descriptions == two.descriptions
+
+    rows, cols = numpy.divmod(missing_cells, one_array.shape[2])
+    one_array[:, rows, cols] = -9999
+    numpy.testing.assert_equal(one_array, two_array)
+
+
 def test_code_envs():
     """Test that binary code produced are coherent."""
     names = list(vector_file.Litho.unique())
@@ -7,7 +7,7 @@ import pytest
 import rasterio
 from shapely.geometry import LineString, Point, box
 
-from eis_toolkit.exceptions import InvalidParameterValueException
+from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException
 from eis_toolkit.vector_processing.distance_computation import distance_computation
 from tests.raster_processing.clip_test import raster_path as SMALL_RASTER_PATH
 
@@ -118,3 +118,59 @@ def test_distance_computation(raster_profile, geometries, expected_error):
         result = distance_computation(raster_profile=raster_profile, geometries=geometries)
         assert isinstance(result, np.ndarray)
         assert len(result.shape) == 2
+
+
+@pytest.mark.parametrize(
+    "geometries",
+    [
+        pytest.param(POINT_GEOMETRIES_WITHIN_SMALL_RASTER, id="point_geometries_within_small_raster"),
+        pytest.param(LINE_GEOMETRIES_WITHIN_SMALL_RASTER, id="line_geometries_within_small_raster"),
+        pytest.param(POLYGON_GEOMETRIES_WITHIN_SMALL_RASTER, id="polygon_geometries_within_small_raster"),
+        pytest.param(
+            geodataframe_with_raster_crs(geometry=[LineString([(384600.0, 6671200.0), (384900.0, 6671500.0)])]),
+            id="line_geometry_crossing_small_raster",
+        ),
+        pytest.param(
+            geodataframe_with_raster_crs(geometry=[Point(384745.0, 6671375.0), Point(1.0e7, 6671375.0)]),
+            id="distant_point_geometry_dropped",
+        ),
+        pytest.param(
+            geodataframe_with_raster_crs(geometry=[Point(1.0e7, 6671375.0)]),
+            id="distant_point_geometry_only",
+        ),
+    ],
+)
+def test_distance_computation_transform_method(geometries):
+    """Test that the transform method matches the vector method within one cell diagonal."""
+    expected = distance_computation(raster_profile=SMALL_RASTER_PROFILE, geometries=geometries, method="vector")
+    result = distance_computation(raster_profile=SMALL_RASTER_PROFILE, geometries=geometries, method="transform")
+
+    cell_diagonal = np.hypot(SMALL_RASTER_PROFILE["transform"].a, SMALL_RASTER_PROFILE["transform"].e)
+
+    assert result.shape == EXPECTED_SMALL_RASTER_SHAPE
+    assert np.all(result >= expected - 1e-9)
+    assert np.all(result - expected < cell_diagonal)
+    assert np.isclose(result.min(), expected.min())
+
+
+def test_distance_computation_transform_method_rotated_raster():
+    """Test that the transform method raises an exception for rotated rasters."""
+    rotated_transform = SMALL_RASTER_PROFILE["transform"] * rasterio.Affine.rotation(30)
+
+    with pytest.raises(InvalidParameterValueException):
+        distance_computation(
+            raster_profile={**SMALL_RASTER_PROFILE, "transform": rotated_transform},
+            geometries=POINT_GEOMETRIES_WITHIN_SMALL_RASTER,
+            method="transform",
+        )
+
+
+@pytest.mark.parametrize("method", ["vector", "transform"])
+def test_distance_computation_empty_geometries(method):
+    """Test that geometries that are all None or empty raise the correct exception."""
+    with pytest.raises(EmptyDataFrameException):
+        distance_computation(
+            raster_profile=SMALL_RASTER_PROFILE,
+            geometries=geodataframe_with_raster_crs(geometry=[None, LineString()]),
+            method=method,
+        )
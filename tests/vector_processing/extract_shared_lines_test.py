@@ -58,3 +58,19 @@ def test_not_enough_polygons(example_not_enough_polygons):
     """Test not enough polygons raises an exception."""
     with pytest.raises(InvalidParameterValueException):
         extract_shared_lines(example_not_enough_polygons)
+
+
+def test_shared_lines_skip_point_contacts_and_far_polygons():
+    """Test that polygons touching at a corner or far apart give no lines, regardless of the index order."""
+    poly1 = Polygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+    poly2 = Polygon([(1, 1), (1, 2), (2, 2), (2, 1)])
+    poly3 = Polygon([(0, 1), (0, 2), (1, 2), (1, 1)])
+    poly4 = Polygon([(5, 5), (5, 6), (6, 6), (6, 5)])
+    gdf = gpd.GeoDataFrame({"geometry": [poly1, poly2, poly3, poly4]}, index=[7, 3, 5, 1])
+
+    result = extract_shared_lines(gdf)
+
+    assert len(result) == 2
+    assert result.geometry[0].equals(LineString([(1, 1), (1, 2)]))
+    assert result.geometry[1].equals(LineString([(0, 1), (1, 1)]))
+    assert result["ID"].to_list() == [0, 1]
@@ -142,3 +142,57 @@ def test_invalid_resolution(test_points):
 
     with pytest.raises(InvalidParameterValueException):
         idw(geodataframe=test_points, target_column=target_column, resolution=resolution, extent=extent, power=power)
+
+
+def test_neighbor_search_with_all_points(validated_points):
+    """Test that the neighbor search gives the same result as IDW with all points when no points are excluded."""
+    target_column = "random_number"
+    resolution = (0.0049, 0.0047)
+
+    expected_values, _ = idw(geodataframe=validated_points, target_column=target_column, resolution=resolution)
+    knn_values, knn_meta = idw(
+        geodataframe=validated_points, target_column=target_column, resolution=resolution, n_neighbors=4
+    )
+    radius_values, _ = idw(
+        geodataframe=validated_points, target_column=target_column, resolution=resolution, search_radius=10
+    )
+
+    assert knn_meta["width"] == expected_values.shape[1]
+    np.testing.assert_allclose(knn_values, expected_values)
+    np.testing.assert_allclose(radius_values, expected_values)
+
+
+def test_neighbor_search(test_points):
+    """Test IDW limited to the nearest points and to a search radius."""
+    target_column = "value1"
+    resolution = (1, 1)
+
+    nearest_values, _ = idw(geodataframe=test_points, target_column=target_column, resolution=resolution, n_neighbors=1)
+    radius_values, _ = idw(
+        geodataframe=test_points, target_column=target_column, resolution=resolution, search_radius=1.5
+    )
+
+    expected_nearest_values = np.array([[3, 4, 4, 5], [2, 3, 4, 4], [2, 2, 3, 4], [1, 2, 2, 3]])
+    expected_radius_values = np.array(
+        [
+            [np.nan, np.nan, 4.38461538, 5],
+            [np.nan, 3, 3.8, 4.38461538],
+            [1.61538462, 2.2, 3, np.nan],
+            [1, 1.61538462, np.nan, np.nan],
+        ]
+    )
+    np.testing.assert_allclose(nearest_values, expected_nearest_values)
+    np.testing.assert_allclose(radius_values, expected_radius_values, rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize("search_radius,n_neighbors", [(0, None), (-1.5, None), (None, 0)])
+def test_invalid_neighbor_search(test_points, search_radius, n_neighbors):
+    """Test invalid search radius and number of neighbors."""
+    with pytest.raises(InvalidParameterValueException):
+        idw(
+            geodataframe=test_points,
+            target_column="value1",
+            resolution=(1, 1),
+            search_radius=search_radius,
+            n_neighbors=n_neighbors,
+        )
@@ -2,10 +2,11 @@ import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pytest
+import rasterio
 from beartype.roar import BeartypeCallHintParamViolation
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException
-from eis_toolkit.vector_processing.kriging_interpolation import kriging
+from eis_toolkit.vector_processing.kriging_interpolation import _kriging_state, kriging, kriging_windowed
 
 np.random.seed(0)
 x = np.random.uniform(0, 5, size=(10, 1))
@@ -95,3 +96,94 @@ def test_invalid_method():
     """Test that invalid kriging method raises the correct exception."""
     with pytest.raises(BeartypeCallHintParamViolation):
         kriging(data=gdf, target_column=target_column, resolution=resolution, extent=extent, method="invalid_method")
+
+
+@pytest.mark.parametrize("method", ["ordinary", "universal"])
+def test_kriging_windowed_with_all_points(tmp_path, method):
+    """Test that moving window kriging with all data points matches kriging."""
+    expected, expected_meta = kriging(
+        data=gdf, target_column=target_column, resolution=resolution, extent=extent, method=method
+    )
+
+    output_raster = tmp_path / "kriging_windowed.tif"
+    out_profile = kriging_windowed(
+        data=gdf,
+        target_column=target_column,
+        resolution=resolution,
+        output_raster=output_raster,
+        extent=extent,
+        method=method,
+        n_closest_points=10,
+        block_size=4,
+    )
+
+    with rasterio.open(output_raster) as raster:
+        result = raster.read(1)
+        assert raster.transform == expected_meta["transform"]
+
+    assert out_profile["width"] == expected_shape[1]
+    np.testing.assert_allclose(result, np.flipud(expected), rtol=1e-5, atol=1e-6)
+
+
+def test_kriging_windowed_orientation(tmp_path):
+    """Test that the output raster sampled through its transform gives the values at the data points."""
+    grid_points = np.array([(x, y) for x in np.arange(0, 5, 1.0) for y in np.arange(0, 5, 1.0)])
+    trend_gdf = gpd.GeoDataFrame(
+        {"value": grid_points[:, 1]}, geometry=gpd.points_from_xy(grid_points[:, 0], grid_points[:, 1])
+    )
+
+    output_raster = tmp_path / "kriging_windowed.tif"
+    kriging_windowed(
+        data=trend_gdf,
+        target_column="value",
+        resolution=(0.5, 0.5),
+        output_raster=output_raster,
+        extent=(0, 4.5, 0, 4.5),
+        coordinates_type="euclidean",
+        n_closest_points=8,
+        block_size=4,
+    )
+
+    with rasterio.open(output_raster) as raster:
+        result = raster.read(1)
+        for x, y in [(1.0, 4.0), (3.0, 1.0), (4.0, 3.0)]:
+            row, col = raster.index(x, y)
+            np.testing.assert_allclose(result[row, col], y, atol=1e-3)
+
+
+@pytest.mark.parametrize("coordinates_type", ["euclidean", "geographic"])
+def test_kriging_windowed_parallel(tmp_path, coordinates_type):
+    """Test that moving window kriging gives the same result with several workers."""
+    parameters = dict(
+        data=gdf,
+        target_column=target_column,
+        resolution=resolution,
+        coordinates_type=coordinates_type,
+        n_closest_points=4,
+        block_size=3,
+    )
+    kriging_windowed(output_raster=tmp_path / "sequential.tif", **parameters)
+    kriging_windowed(output_raster=tmp_path / "parallel.tif", n_workers=2, **parameters)
+
+    with rasterio.open(tmp_path / "sequential.tif") as sequential, rasterio.open(tmp_path / "parallel.tif") as parallel:
+        sequential_result = sequential.read(1)
+        np.testing.assert_array_equal(sequential_result, parallel.read(1))
+
+    assert np.all(np.isfinite(sequential_result))
+    assert not _kriging_state
+
+
+@pytest.mark.parametrize(
+    "n_closest_points,variogram_sample_size", [(1, None), (4, 1)], ids=["n_closest_points", "variogram_sample_size"]
+)
+def test_kriging_windowed_invalid_parameters(tmp_path, n_closest_points, variogram_sample_size):
+    """Test that invalid moving window parameters raise the correct exception."""
+    with pytest.raises(InvalidParameterValueException):
+        kriging_windowed(
+            data=gdf,
+            target_column=target_column,
+            resolution=resolution,
+            output_raster=tmp_path / "kriging_windowed.tif",
+            n_closest_points=n_closest_points,
+            variogram_sample_size=variogram_sample_size,
+        )